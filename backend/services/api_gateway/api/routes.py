@@ -7,6 +7,7 @@ Routes external requests to internal microservices.
 """
 
 import logging
+import os
 from datetime import datetime
 from typing import Dict, Any
 
@@ -30,7 +31,9 @@ app = FastAPI(
 
 
 # Global state
-proxy: ServiceProxy = ServiceProxy()
+proxy: ServiceProxy = ServiceProxy(
+    streaming=os.getenv("GATEWAY_STREAMING_PROXY", "false").lower() == "true"
+)
 
 
 @app.on_event("shutdown")
@@ -59,6 +62,9 @@ async def gateway_proxy(service_name: str, path: str, request: Request) -> Any:
     """
     Forward requests to backend services.
 
+    Set GATEWAY_STREAMING_PROXY=true to stream bodies and pass upstream
+    status codes, headers and content types through unchanged.
+
     Args:
         service_name: Name of the target service
         path: Path to forward
@@ -67,7 +73,7 @@ async def gateway_proxy(service_name: str, path: str, request: Request) -> Any:
     Returns:
         Response from the backend service
     """
-    return await proxy.forward_request(service_name, path, request)
+    return await proxy.handle(service_name, path, request)
 
 
 @app.exception_handler(Exception)
@@ -3,16 +3,94 @@ API Gateway: Service Proxy
 ==========================
 
 Core logic for routing and forwarding requests to backend microservices.
+
+Two forwarding modes:
+- Buffered (forward_request): reads the whole response and returns its JSON
+- Streaming (stream_request): pipes request and response bodies chunk by
+  chunk, preserving status code and headers (SSE passes straight through)
+
+Each upstream gets its own keep-alive connection pool, tuned through
+UpstreamPoolConfig. HTTP/2 is negotiated (ALPN) on https upstreams when the
+``h2`` package is installed; plain http upstreams use keep-alive HTTP/1.1.
 """
 
 import logging
-from typing import Dict, Any
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import httpx
 from fastapi import Request, HTTPException
+from starlette.background import BackgroundTask
+from starlette.responses import StreamingResponse
+
+try:
+    import h2  # noqa: F401  # pylint: disable=unused-import
+    HAS_H2 = True
+except ImportError:
+    HAS_H2 = False
 
 logger = logging.getLogger(__name__)
 
+# Connection-scoped headers that must not be forwarded (RFC 9110 §7.6.1)
+HOP_BY_HOP_HEADERS = frozenset({
+    "connection",
+    "keep-alive",
+    "proxy-authenticate",
+    "proxy-authorization",
+    "proxy-connection",
+    "te",
+    "trailer",
+    "transfer-encoding",
+    "upgrade",
+})
+
+# Methods whose requests never carry a body unless the client says so
+_BODYLESS_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "DELETE"})
+
+
+@dataclass
+class UpstreamPoolConfig:
+    """
+    Connection pool settings for one upstream service.
+
+    Attributes:
+        max_connections: Maximum concurrent connections
+        max_keepalive_connections: Idle connections kept open for reuse
+        keepalive_expiry: Seconds an idle connection is kept
+        http2: Use HTTP/2 where the upstream supports it
+        connect_timeout: Seconds to establish a connection
+        read_timeout: Seconds between received chunks (None = no limit, for SSE)
+        pool_timeout: Seconds to wait for a free connection
+    """
+    max_connections: int = 100
+    max_keepalive_connections: int = 50
+    keepalive_expiry: float = 30.0
+    http2: bool = True
+    connect_timeout: float = 5.0
+    read_timeout: Optional[float] = 60.0
+    pool_timeout: float = 5.0
+
+
+def filter_headers(
+    headers: Iterable[Tuple[str, str]], drop: Iterable[str] = ()
+) -> List[Tuple[str, str]]:
+    """
+    Remove hop-by-hop headers, headers named in Connection, and ``drop``.
+
+    Args:
+        headers: (name, value) pairs (duplicates allowed)
+        drop: Extra lowercase header names to remove
+
+    Returns:
+        Headers safe to forward, in original order
+    """
+    pairs = list(headers)
+    excluded = set(HOP_BY_HOP_HEADERS) | set(drop)
+    for name, value in pairs:
+        if name.lower() == "connection":
+            excluded.update(token.strip().lower() for token in value.split(","))
+    return [(name, value) for name, value in pairs if name.lower() not in excluded]
+
 
 class ServiceProxy:
     """
@@ -21,18 +99,69 @@ class ServiceProxy:
     Manages request forwarding and response handling.
     """
 
-    def __init__(self) -> None:
-        """Initialize the proxy with service mappings."""
+    def __init__(
+        self,
+        services: Optional[Dict[str, str]] = None,
+        pool_configs: Optional[Dict[str, UpstreamPoolConfig]] = None,
+        default_pool: Optional[UpstreamPoolConfig] = None,
+        streaming: bool = False
+    ) -> None:
+        """
+        Initialize the proxy with service mappings.
+
+        Args:
+            services: Service name -> base URL (defaults to internal services)
+            pool_configs: Per-service pool settings
+            default_pool: Pool settings for services without their own
+            streaming: Route requests through stream_request
+        """
         # Map service names to their internal Docker DNS names/ports
-        self.services: Dict[str, str] = {
+        self.services: Dict[str, str] = services or {
             "meta_orchestrator": "http://meta_orchestrator:8100",
             "metacognitive_reflector": "http://metacognitive_reflector:8101",
             "episodic_memory": "http://episodic_memory:8102",
             # Add other services as they are refactored
         }
-        self.client = httpx.AsyncClient()
+        self.pool_configs: Dict[str, UpstreamPoolConfig] = pool_configs or {}
+        self.default_pool = default_pool or UpstreamPoolConfig()
+        self.streaming = streaming
+        self._clients: Dict[str, httpx.AsyncClient] = {}
         logger.info("ServiceProxy initialized with %d services", len(self.services))
 
+    def _client_for(self, service_name: str) -> httpx.AsyncClient:
+        """Pooled client for a service, created on first use."""
+        client = self._clients.get(service_name)
+        if client is None:
+            config = self.pool_configs.get(service_name, self.default_pool)
+            client = httpx.AsyncClient(
+                base_url=self.services[service_name],
+                http2=config.http2 and HAS_H2,
+                limits=httpx.Limits(
+                    max_connections=config.max_connections,
+                    max_keepalive_connections=config.max_keepalive_connections,
+                    keepalive_expiry=config.keepalive_expiry,
+                ),
+                timeout=httpx.Timeout(
+                    connect=config.connect_timeout,
+                    read=config.read_timeout,
+                    write=config.read_timeout,
+                    pool=config.pool_timeout,
+                ),
+            )
+            self._clients[service_name] = client
+        return client
+
+    def _resolve(self, service_name: str) -> httpx.AsyncClient:
+        if service_name not in self.services:
+            raise HTTPException(status_code=404, detail=f"Service '{service_name}' not found")
+        return self._client_for(service_name)
+
+    async def handle(self, service_name: str, path: str, request: Request) -> Any:
+        """Forward using the configured mode."""
+        if self.streaming:
+            return await self.stream_request(service_name, path, request)
+        return await self.forward_request(service_name, path, request)
+
     async def forward_request(self, service_name: str, path: str, request: Request) -> Any:
         """
         Forward a request to a backend service.
@@ -48,27 +177,22 @@ class ServiceProxy:
         Raises:
             HTTPException: If service not found or request fails
         """
-        base_url = self.services.get(service_name)
-        if not base_url:
-            raise HTTPException(status_code=404, detail=f"Service '{service_name}' not found")
-
-        target_url = f"{base_url}/{path}"
+        client = self._resolve(service_name)
 
         try:
             # Extract body if present
             body = await request.body()
 
             # Forward request
-            response = await self.client.request(
+            response = await client.request(
                 method=request.method,
-                url=target_url,
-                headers=request.headers,
+                url=f"/{path}",
+                headers=filter_headers(request.headers.items(), drop=("host",)),
                 content=body,
                 params=request.query_params
             )
 
-            # Return JSON response
-            # Note: For a full gateway, we'd handle other content types and streaming
+            # Return JSON response (use stream_request for other content types)
             return response.json()
 
         except httpx.RequestError as e:
@@ -78,6 +202,64 @@ class ServiceProxy:
             logger.error("Proxy error: %s", e)
             raise HTTPException(status_code=500, detail=str(e)) from e
 
+    async def stream_request(
+        self, service_name: str, path: str, request: Request
+    ) -> StreamingResponse:
+        """
+        Forward a request, streaming both bodies.
+
+        The request body is sent as it arrives from the client and the
+        upstream response is relayed undecoded, so status code, content
+        type and content encoding are preserved. The upstream connection
+        returns to the pool when the client has read the response.
+
+        Args:
+            service_name: Target service identifier
+            path: URL path to forward
+            request: Original FastAPI request
+
+        Returns:
+            StreamingResponse relaying the upstream response
+
+        Raises:
+            HTTPException: If service not found or upstream unreachable
+        """
+        client = self._resolve(service_name)
+
+        headers = filter_headers(request.headers.items(), drop=("host",))
+        has_body = (
+            request.method not in _BODYLESS_METHODS
+            or "content-length" in request.headers
+            or "transfer-encoding" in request.headers
+        )
+        upstream_request = client.build_request(
+            method=request.method,
+            url=f"/{path}",
+            headers=headers,
+            params=request.query_params,
+            content=request.stream() if has_body else None,
+        )
+
+        try:
+            response = await client.send(upstream_request, stream=True)
+        except httpx.RequestError as e:
+            logger.error("Proxy stream failed: %s", e)
+            raise HTTPException(status_code=502, detail="Upstream service unavailable") from e
+
+        streamed = StreamingResponse(
+            response.aiter_raw(),
+            status_code=response.status_code,
+            background=BackgroundTask(response.aclose),
+        )
+        # Raw pairs keep repeated headers such as Set-Cookie
+        streamed.raw_headers = [
+            (name.lower().encode("latin-1"), value.encode("latin-1"))
+            for name, value in filter_headers(response.headers.multi_items())
+        ]
+        return streamed
+
     async def shutdown(self) -> None:
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """Close all upstream connection pools."""
+        for client in self._clients.values():
+            await client.aclose()
+        self._clients.clear()
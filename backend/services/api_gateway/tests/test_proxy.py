@@ -42,5 +42,6 @@ async def test_forward_request_service_not_found():
 async def test_shutdown():
     with patch("httpx.AsyncClient.aclose", new_callable=AsyncMock) as mock_close:
         proxy = ServiceProxy()
+        proxy._client_for("meta_orchestrator")
         await proxy.shutdown()
         mock_close.assert_called_once()
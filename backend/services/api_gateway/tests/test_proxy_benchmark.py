@@ -0,0 +1,109 @@
+"""
+Load benchmark: per-request clients with buffered JSON vs pooled streaming.
+
+Runs against a local aiohttp stub upstream. Prints throughput; asserts only
+that the pooled streaming path is not slower for small requests.
+"""
+
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from fastapi import FastAPI, Request
+
+from backend.services.api_gateway.core.proxy import ServiceProxy
+
+SMALL_REQUESTS = 200
+CONCURRENCY = 50
+LARGE_PAYLOAD = b"x" * (8 * 1024 * 1024)
+
+
+async def _small(request: web.Request) -> web.Response:
+    return web.json_response({"status": "ok"})
+
+
+async def _large(request: web.Request) -> web.Response:
+    return web.Response(body=json.dumps({"blob": LARGE_PAYLOAD.decode()}).encode(),
+                        content_type="application/json")
+
+
+class _PerRequestClientProxy(ServiceProxy):
+    """Previous behaviour: new client per request, body buffered, JSON decoded."""
+
+    async def forward_request(self, service_name, path, request):
+        async with httpx.AsyncClient() as client:
+            response = await client.request(
+                method=request.method,
+                url=f"{self.services[service_name]}/{path}",
+                headers=[(k, v) for k, v in request.headers.items() if k != "host"],
+                content=await request.body(),
+            )
+            return response.json()
+
+
+@pytest_asyncio.fixture
+async def upstream():
+    app = web.Application()
+    app.router.add_get("/small", _small)
+    app.router.add_get("/large", _large)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}"
+    await runner.cleanup()
+
+
+def _gateway(proxy: ServiceProxy) -> httpx.AsyncClient:
+    app = FastAPI()
+
+    @app.get("/{service_name}/{path:path}")
+    async def route(service_name: str, path: str, request: Request):
+        return await proxy.handle(service_name, path, request)
+
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://gateway")
+
+
+async def _run_small(client: httpx.AsyncClient) -> float:
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def one() -> None:
+        async with semaphore:
+            response = await client.get("/stub/small")
+            assert response.status_code == 200
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(SMALL_REQUESTS)))
+    return SMALL_REQUESTS / (time.perf_counter() - start)
+
+
+async def _run_large(client: httpx.AsyncClient) -> float:
+    start = time.perf_counter()
+    for _ in range(3):
+        response = await client.get("/stub/large")
+        assert response.status_code == 200
+        assert len(response.content) > len(LARGE_PAYLOAD)
+    return 3 / (time.perf_counter() - start)
+
+
+@pytest.mark.asyncio
+async def test_pooled_streaming_throughput(upstream):
+    results = {}
+    for label, proxy in (
+        ("per-request buffered", _PerRequestClientProxy(services={"stub": upstream})),
+        ("pooled streaming", ServiceProxy(services={"stub": upstream}, streaming=True)),
+    ):
+        async with _gateway(proxy) as client:
+            await client.get("/stub/small")  # Warm up
+            results[label] = (await _run_small(client), await _run_large(client))
+        await proxy.shutdown()
+
+    for label, (small, large) in results.items():
+        print(f"\n{label:>22}: {small:8.0f} small req/s, {large:6.2f} 8MiB req/s")
+
+    assert results["pooled streaming"][0] >= results["per-request buffered"][0] * 0.9
@@ -0,0 +1,209 @@
+"""
+Unit tests for the streaming, pooled proxy mode.
+
+Upstreams are real aiohttp servers on localhost; the gateway app is driven
+in-process through httpx's ASGI transport.
+"""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from fastapi import FastAPI, Request
+from starlette.requests import Request as StarletteRequest
+
+from backend.services.api_gateway.core.proxy import (
+    ServiceProxy,
+    UpstreamPoolConfig,
+    filter_headers,
+)
+
+
+async def _json(request: web.Request) -> web.Response:
+    return web.json_response({"ok": True}, status=201)
+
+
+async def _headers(request: web.Request) -> web.Response:
+    return web.json_response({k.lower(): v for k, v in request.headers.items()})
+
+
+async def _echo(request: web.Request) -> web.StreamResponse:
+    response = web.StreamResponse(headers={"Content-Type": "application/octet-stream"})
+    await response.prepare(request)
+    async for chunk in request.content.iter_chunked(64 * 1024):
+        await response.write(chunk)
+    await response.write_eof()
+    return response
+
+
+async def _sse(request: web.Request) -> web.StreamResponse:
+    response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+    await response.prepare(request)
+    await response.write(b"data: first\n\n")
+    await asyncio.sleep(0.3)
+    await response.write(b"data: second\n\n")
+    await response.write_eof()
+    return response
+
+
+async def _cookies(request: web.Request) -> web.Response:
+    response = web.Response(text="plain", status=404, headers={"Connection": "keep-alive, X-Internal", "X-Internal": "1"})
+    response.headers.add("Set-Cookie", "a=1")
+    response.headers.add("Set-Cookie", "b=2")
+    return response
+
+
+@pytest_asyncio.fixture
+async def upstream():
+    app = web.Application()
+    app.router.add_get("/json", _json)
+    app.router.add_get("/headers", _headers)
+    app.router.add_post("/echo", _echo)
+    app.router.add_get("/sse", _sse)
+    app.router.add_get("/cookies", _cookies)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}"
+    await runner.cleanup()
+
+
+@pytest_asyncio.fixture
+async def gateway(upstream):
+    proxy = ServiceProxy(services={"stub": upstream}, streaming=True)
+    app = FastAPI()
+
+    @app.api_route("/{service_name}/{path:path}", methods=["GET", "POST"])
+    async def route(service_name: str, path: str, request: Request):
+        return await proxy.handle(service_name, path, request)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://gateway") as client:
+        yield proxy, client
+    await proxy.shutdown()
+
+
+def test_filter_headers_drops_hop_by_hop():
+    headers = [
+        ("Host", "gateway"),
+        ("Connection", "keep-alive, X-Trace-Hop"),
+        ("X-Trace-Hop", "1"),
+        ("Transfer-Encoding", "chunked"),
+        ("Accept", "application/json"),
+    ]
+    assert filter_headers(headers, drop=("host",)) == [("Accept", "application/json")]
+
+
+@pytest.mark.asyncio
+async def test_status_and_content_type_preserved(gateway):
+    _, client = gateway
+    response = await client.get("/stub/json")
+    assert response.status_code == 201
+    assert response.headers["content-type"].startswith("application/json")
+    assert response.json() == {"ok": True}
+
+
+@pytest.mark.asyncio
+async def test_non_json_response_and_repeated_headers(gateway):
+    _, client = gateway
+    response = await client.get("/stub/cookies")
+    assert response.status_code == 404
+    assert response.text == "plain"
+    assert response.headers.get_list("set-cookie") == ["a=1", "b=2"]
+    assert "x-internal" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_hop_by_hop_request_headers_not_forwarded(gateway):
+    _, client = gateway
+    response = await client.get(
+        "/stub/headers",
+        headers={"Proxy-Authorization": "secret", "X-Request-Id": "abc"},
+    )
+    received = response.json()
+    assert received["x-request-id"] == "abc"
+    assert "proxy-authorization" not in received
+    assert received["host"].startswith("127.0.0.1")
+
+
+@pytest.mark.asyncio
+async def test_request_body_streamed_through(gateway):
+    _, client = gateway
+    payload = bytes(range(256)) * 8192  # 2 MiB
+
+    async def chunks():
+        for start in range(0, len(payload), 256 * 1024):
+            yield payload[start:start + 256 * 1024]
+
+    response = await client.post("/stub/echo", content=chunks())
+    assert response.status_code == 200
+    assert response.content == payload
+
+
+@pytest.mark.asyncio
+async def test_sse_chunks_relayed_as_they_arrive(gateway):
+    proxy, _ = gateway
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/stub/sse",
+        "query_string": b"",
+        "headers": [(b"accept", b"text/event-stream")],
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    response = await proxy.stream_request("stub", "sse", StarletteRequest(scope, receive))
+    assert response.media_type is None
+    assert dict(response.raw_headers)[b"content-type"] == b"text/event-stream"
+
+    start = time.perf_counter()
+    arrivals = []
+    async for chunk in response.body_iterator:
+        arrivals.append((chunk, time.perf_counter() - start))
+    await response.background()
+
+    assert arrivals[0][0] == b"data: first\n\n"
+    assert arrivals[0][1] < 0.2  # Not held back until the upstream finished
+    assert b"".join(c for c, _ in arrivals) == b"data: first\n\ndata: second\n\n"
+
+
+@pytest.mark.asyncio
+async def test_unreachable_upstream_returns_502():
+    proxy = ServiceProxy(
+        services={"down": "http://127.0.0.1:9"},
+        default_pool=UpstreamPoolConfig(connect_timeout=0.5),
+        streaming=True,
+    )
+    app = FastAPI()
+
+    @app.get("/{service_name}/{path:path}")
+    async def route(service_name: str, path: str, request: Request):
+        return await proxy.handle(service_name, path, request)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://gateway") as client:
+        response = await client.get("/down/health")
+    assert response.status_code == 502
+    await proxy.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_pool_per_upstream(upstream):
+    proxy = ServiceProxy(
+        services={"a": upstream, "b": upstream},
+        pool_configs={"a": UpstreamPoolConfig(max_connections=4, http2=False)},
+    )
+    client_a = proxy._client_for("a")
+    client_b = proxy._client_for("b")
+
+    assert client_a is not client_b
+    assert proxy._client_for("a") is client_a
+    await proxy.shutdown()
+    assert client_a.is_closed and client_b.is_closed
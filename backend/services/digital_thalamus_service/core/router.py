@@ -3,12 +3,18 @@ Digital Thalamus Service - Request Router
 =========================================
 
 Core routing logic for directing requests to services.
+
+Route prefixes are compiled into a path-segment trie, so resolving a path
+walks at most one node per segment whatever the number of routes. Resolved
+paths are kept in a bounded LRU cache, cleared whenever a route is
+registered.
 """
 
 from __future__ import annotations
 
 
-from typing import Dict
+from collections import OrderedDict
+from typing import Dict, List
 
 from config import GatewaySettings
 from models.gateway import RouteConfig
@@ -16,6 +22,23 @@ from utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+DEFAULT_ROUTE_CACHE_SIZE = 4096
+
+
+def _segments(path: str) -> List[str]:
+    """Split a path into its non-empty segments."""
+    return [segment for segment in path.split("/") if segment]
+
+
+class _TrieNode:
+    """Trie node: child nodes by segment, plus the route ending here."""
+
+    __slots__ = ("children", "route")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, _TrieNode] = {}
+        self.route: RouteConfig | None = None
+
 
 class RequestRouter:
     """
@@ -28,15 +51,25 @@ class RequestRouter:
         routes: Mapping of path prefixes to service configurations
     """
 
-    def __init__(self, settings: GatewaySettings):
+    def __init__(
+        self,
+        settings: GatewaySettings,
+        route_cache_size: int = DEFAULT_ROUTE_CACHE_SIZE
+    ):
         """
         Initialize Request Router.
 
         Args:
             settings: Gateway settings
+            route_cache_size: Maximum number of resolved paths to cache
         """
         self.settings = settings
         self.routes: Dict[str, RouteConfig] = {}
+        self.route_cache_size = route_cache_size
+        self._trie = _TrieNode()
+        self._route_cache: OrderedDict[str, RouteConfig | None] = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
         self._initialize_routes()
         logger.info(
             "request_router_initialized",
@@ -74,40 +107,83 @@ class RequestRouter:
             )
         }
         self.routes.update(default_routes)
+        self._rebuild_trie()
+
+    def _rebuild_trie(self) -> None:
+        """Compile all route prefixes into a fresh trie."""
+        self._trie = _TrieNode()
+        for prefix, config in self.routes.items():
+            self._insert(prefix, config)
+
+    def _insert(self, prefix: str, config: RouteConfig) -> None:
+        """Add one prefix to the trie and drop cached lookups."""
+        node = self._trie
+        for segment in _segments(prefix):
+            node = node.children.setdefault(segment, _TrieNode())
+        node.route = config
+        self._route_cache.clear()
+
+    def _resolve(self, path: str) -> RouteConfig | None:
+        """Route of the longest registered prefix covering the path's segments."""
+        node = self._trie
+        best = node.route
+        for segment in _segments(path):
+            node = node.children.get(segment)
+            if node is None:
+                break
+            if node.route is not None:
+                best = node.route
+        return best
 
     async def find_route(self, path: str) -> RouteConfig | None:
         """
         Find route configuration for a given path.
 
+        The longest registered prefix wins. Prefixes match whole path
+        segments: "/v1/core" covers "/v1/core/x" but not "/v1/corex".
+
         Args:
             path: Request path
 
         Returns:
             Route configuration if found, None otherwise
         """
-        # Try exact match first
-        if path in self.routes:
-            return self.routes[path]
-
-        # Try prefix matching (find longest matching prefix)
-        matching_routes = [
-            (prefix, config)
-            for prefix, config in self.routes.items()
-            if path.startswith(prefix)
-        ]
-
-        if matching_routes:
-            # Return route with longest matching prefix
-            _, config = max(matching_routes, key=lambda x: len(x[0]))
-            logger.debug(
-                "route_found",
-                path=path,
-                service=config.service_name
-            )
-            return config
+        cache = self._route_cache
+        if path in cache:
+            cache.move_to_end(path)
+            self._cache_hits += 1
+            config = cache[path]
+        else:
+            self._cache_misses += 1
+            config = self._resolve(path)
+            cache[path] = config
+            if len(cache) > self.route_cache_size:
+                cache.popitem(last=False)
+
+        if config is None:
+            logger.warning("no_route_found", path=path)
+            return None
+
+        logger.debug(
+            "route_found",
+            path=path,
+            service=config.service_name
+        )
+        return config
 
-        logger.warning("no_route_found", path=path)
-        return None
+    def get_cache_stats(self) -> Dict[str, int]:
+        """
+        Get resolved-path cache statistics.
+
+        Returns:
+            Cache size, capacity, hits and misses
+        """
+        return {
+            "size": len(self._route_cache),
+            "max_size": self.route_cache_size,
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+        }
 
     async def register_route(
         self,
@@ -122,6 +198,7 @@ class RequestRouter:
             config: Route configuration
         """
         self.routes[prefix] = config
+        self._insert(prefix, config)
         logger.info(
             "route_registered",
             prefix=prefix,
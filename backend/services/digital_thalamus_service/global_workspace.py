@@ -10,6 +10,11 @@ cognitive processing.
 
 Bio-inspiration: Mimics the broadcasting mechanism of the thalamus in
 distributing sensory information to cortical areas for conscious awareness.
+
+Events are micro-batched: broadcast_event queues the event and a background
+batcher flushes everything gathered within a short linger window as one
+pipelined Redis XADD round trip plus Kafka sends awaited together. Events at
+or above the fast-lane salience skip the linger window.
 """
 
 from __future__ import annotations
@@ -18,15 +23,30 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import statistics
+import time
 import uuid
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 from aiokafka import AIOKafkaProducer
 from redis import asyncio as aioredis
 
 logger = logging.getLogger(__name__)
 
+# Number of recent events/flushes kept for latency and throughput metrics
+METRICS_WINDOW = 1024
+
+
+@dataclass
+class _PendingEvent:
+    """A queued event and the future its broadcaster awaits."""
+    event: Dict[str, Any]
+    future: asyncio.Future
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
 
 class GlobalWorkspace:
     """Global Workspace broadcaster for consciousness events.
@@ -51,6 +71,10 @@ class GlobalWorkspace:
         kafka_topic: str = "consciousness-events",
         redis_stream: str = "consciousness:hot-path",
         redis_stream_maxlen: int = 10000,  # Keep last 10k events
+        linger_ms: float = 5.0,
+        max_batch_size: int = 256,
+        max_queue_size: int = 10000,
+        fast_lane_salience: float = 0.9,
     ):
         """Initialize Global Workspace broadcaster.
 
@@ -60,12 +84,20 @@ class GlobalWorkspace:
             kafka_topic: Kafka topic for consciousness events
             redis_stream: Redis stream key for hot path
             redis_stream_maxlen: Max events to keep in Redis stream
+            linger_ms: How long the batcher waits to fill a batch
+            max_batch_size: Max events flushed in one batch
+            max_queue_size: Max queued events per lane (callers wait when full)
+            fast_lane_salience: Salience at which events skip the linger window
         """
         self.kafka_bootstrap_servers = kafka_bootstrap_servers
         self.redis_url = redis_url
         self.kafka_topic = kafka_topic
         self.redis_stream = redis_stream
         self.redis_stream_maxlen = redis_stream_maxlen
+        self.linger_ms = linger_ms
+        self.max_batch_size = max_batch_size
+        self.max_queue_size = max_queue_size
+        self.fast_lane_salience = fast_lane_salience
 
         self.kafka_producer: Optional[AIOKafkaProducer] = None
         self.redis_client: Optional[aioredis.Redis] = None
@@ -75,6 +107,18 @@ class GlobalWorkspace:
         self._kafka_errors = 0
         self._redis_errors = 0
 
+        self._fast_lane: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+        self._normal_lane: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+        self._pending = asyncio.Event()  # Something is queued
+        self._urgent = asyncio.Event()  # Flush without lingering
+        self._batcher_task: Optional[asyncio.Task] = None
+        self._closing = False
+
+        self._batches_flushed = 0
+        self._latencies: Deque[float] = deque(maxlen=METRICS_WINDOW)
+        self._batch_sizes: Deque[int] = deque(maxlen=METRICS_WINDOW)
+        self._flush_times: Deque[Tuple[float, int]] = deque(maxlen=METRICS_WINDOW)
+
         logger.info(f"🧠 Global Workspace initialized")
         logger.info(f"   Kafka: {kafka_bootstrap_servers} → {kafka_topic}")
         logger.info(f"   Redis: {redis_url} → {redis_stream}")
@@ -91,8 +135,7 @@ class GlobalWorkspace:
                 value_serializer=lambda v: json.dumps(v).encode("utf-8"),
                 compression_type="gzip",
                 acks="all",  # Wait for all replicas
-                retries=3,
-                max_in_flight_requests_per_connection=5,
+                linger_ms=self.linger_ms,
             )
             await self.kafka_producer.start()
             logger.info("✅ Kafka producer started")
@@ -107,6 +150,9 @@ class GlobalWorkspace:
             logger.info("✅ Redis client connected")
 
             self._broadcasting_enabled = True
+            self._closing = False
+            self._urgent.clear()
+            self._ensure_batcher()
             logger.info("🚀 Global Workspace broadcasting ACTIVE")
 
         except Exception as e:
@@ -121,6 +167,14 @@ class GlobalWorkspace:
         """
         logger.info("🛑 Stopping Global Workspace...")
 
+        # Flush what is already queued before closing the connections
+        if self._batcher_task and not self._batcher_task.done():
+            self._closing = True
+            self._pending.set()
+            self._urgent.set()
+            await self._batcher_task
+        self._batcher_task = None
+
         if self.kafka_producer:
             await self.kafka_producer.stop()
             logger.info("   Kafka producer stopped")
@@ -146,6 +200,10 @@ class GlobalWorkspace:
         1. Kafka: Persistent event for all consciousness services
         2. Redis Streams: Hot path for immediate awareness
 
+        The event is queued and sent with the rest of its batch; the call
+        returns once both channels have answered for it. When the queue is
+        full the call waits for room.
+
         Args:
             sensor_type: Type of sensor (visual, auditory, etc.)
             sensor_id: Unique sensor identifier
@@ -171,41 +229,19 @@ class GlobalWorkspace:
             metadata=metadata or {}
         )
 
-        event_id = event["event_id"]
-
-        # Broadcast to both channels concurrently
-        kafka_task = self._broadcast_to_kafka(event)
-        redis_task = self._broadcast_to_redis(event)
-
-        kafka_result, redis_result = await asyncio.gather(
-            kafka_task,
-            redis_task,
-            return_exceptions=True
-        )
-
-        # Track errors
-        if isinstance(kafka_result, Exception):
-            self._kafka_errors += 1
-            logger.error(f"Kafka broadcast failed: {kafka_result}")
-
-        if isinstance(redis_result, Exception):
-            self._redis_errors += 1
-            logger.error(f"Redis broadcast failed: {redis_result}")
-
-        # Consider broadcast successful if at least one channel succeeded
-        success = not (isinstance(kafka_result, Exception) and isinstance(redis_result, Exception))
+        pending = _PendingEvent(event=event, future=asyncio.get_running_loop().create_future())
+        self._ensure_batcher()
 
-        if success:
-            self._events_broadcasted += 1
+        if salience >= self.fast_lane_salience:
+            await self._fast_lane.put(pending)
+            self._urgent.set()
+        else:
+            await self._normal_lane.put(pending)
+            if self._normal_lane.qsize() >= self.max_batch_size:
+                self._urgent.set()
+        self._pending.set()
 
-        return {
-            "event_id": event_id,
-            "broadcasted": success,
-            "kafka_status": "success" if not isinstance(kafka_result, Exception) else "failed",
-            "redis_status": "success" if not isinstance(redis_result, Exception) else "failed",
-            "salience": salience,
-            "timestamp": event["timestamp"]
-        }
+        return await pending.future
 
     def _create_consciousness_event(
         self,
@@ -245,44 +281,181 @@ class GlobalWorkspace:
             }
         }
 
-    async def _broadcast_to_kafka(self, event: Dict[str, Any]) -> None:
-        """Broadcast event to Kafka topic.
+    def _ensure_batcher(self) -> None:
+        """Start the background batcher if it is not running."""
+        if self._batcher_task is None or self._batcher_task.done():
+            self._batcher_task = asyncio.create_task(self._run_batcher())
+
+    async def _run_batcher(self) -> None:
+        """Collect queued events into batches and flush them until stopped."""
+        while True:
+            if not self._closing:
+                await self._pending.wait()
+            if not self._urgent.is_set() and not self._closing:
+                try:
+                    await asyncio.wait_for(self._urgent.wait(), self.linger_ms / 1000)
+                except asyncio.TimeoutError:
+                    pass
+
+            batch = self._drain_batch()
+            if self._fast_lane.empty() and self._normal_lane.qsize() < self.max_batch_size:
+                self._urgent.clear()
+            if self._fast_lane.empty() and self._normal_lane.empty():
+                self._pending.clear()
+
+            if batch:
+                try:
+                    await self._flush(batch)
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    logger.error(f"Global Workspace flush failed: {e}")
+                    for pending in batch:
+                        if not pending.future.done():
+                            pending.future.set_exception(e)
+            elif self._closing:
+                return
+
+    def _drain_batch(self) -> List[_PendingEvent]:
+        """Take up to max_batch_size queued events, fast lane first."""
+        batch: List[_PendingEvent] = []
+        for lane in (self._fast_lane, self._normal_lane):
+            while len(batch) < self.max_batch_size and not lane.empty():
+                batch.append(lane.get_nowait())
+        return batch
+
+    async def _flush(self, batch: List[_PendingEvent]) -> None:
+        """Send a batch to both channels and resolve each event's future.
 
         Args:
-            event: Consciousness event to broadcast
+            batch: Events to broadcast
         """
-        if not self.kafka_producer:
-            raise RuntimeError("Kafka producer not initialized")
+        events = [pending.event for pending in batch]
+        kafka_results, redis_results = await asyncio.gather(
+            self._broadcast_to_kafka(events),
+            self._broadcast_to_redis(events),
+        )
 
-        # Use sensor_type as partition key for ordering
-        key = event["sensor_type"].encode("utf-8")
+        now = time.perf_counter()
+        for pending, kafka_result, redis_result in zip(batch, kafka_results, redis_results):
+            result = self._record_result(pending.event, kafka_result, redis_result)
+            self._latencies.append(now - pending.enqueued_at)
+            if not pending.future.done():
+                pending.future.set_result(result)
 
-        await self.kafka_producer.send_and_wait(
-            self.kafka_topic,
-            value=event,
-            key=key
-        )
+        self._batches_flushed += 1
+        self._batch_sizes.append(len(batch))
+        self._flush_times.append((now, len(batch)))
 
-        logger.debug(f"📤 Kafka: {event['event_id'][:8]}... (salience: {event['salience']:.2f})")
+    def _record_result(
+        self,
+        event: Dict[str, Any],
+        kafka_result: Any,
+        redis_result: Any
+    ) -> Dict[str, Any]:
+        """Count errors for one event and build its broadcast result.
 
-    async def _broadcast_to_redis(self, event: Dict[str, Any]) -> None:
-        """Broadcast event to Redis stream (hot path).
+        Args:
+            event: Broadcast event
+            kafka_result: Kafka delivery result or exception
+            redis_result: Redis XADD result or exception
+
+        Returns:
+            Dict with broadcast status and event ID
+        """
+        # Track errors
+        if isinstance(kafka_result, Exception):
+            self._kafka_errors += 1
+            logger.error(f"Kafka broadcast failed: {kafka_result}")
+
+        if isinstance(redis_result, Exception):
+            self._redis_errors += 1
+            logger.error(f"Redis broadcast failed: {redis_result}")
+
+        # Consider broadcast successful if at least one channel succeeded
+        success = not (isinstance(kafka_result, Exception) and isinstance(redis_result, Exception))
+
+        if success:
+            self._events_broadcasted += 1
+
+        return {
+            "event_id": event["event_id"],
+            "broadcasted": success,
+            "kafka_status": "success" if not isinstance(kafka_result, Exception) else "failed",
+            "redis_status": "success" if not isinstance(redis_result, Exception) else "failed",
+            "salience": event["salience"],
+            "timestamp": event["timestamp"]
+        }
+
+    async def _broadcast_to_kafka(self, events: List[Dict[str, Any]]) -> List[Any]:
+        """Broadcast a batch of events to the Kafka topic.
+
+        All events are handed to the producer first, then their deliveries
+        are awaited together.
+
+        Args:
+            events: Consciousness events to broadcast
+
+        Returns:
+            Per-event delivery metadata or exception
+        """
+        if not self.kafka_producer:
+            return [RuntimeError("Kafka producer not initialized")] * len(events)
+
+        deliveries: List[Any] = []
+        for event in events:
+            # Use sensor_type as partition key for ordering
+            key = event["sensor_type"].encode("utf-8")
+            try:
+                deliveries.append(await self.kafka_producer.send(
+                    self.kafka_topic,
+                    value=event,
+                    key=key
+                ))
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                deliveries.append(e)
+
+        async def _delivered(delivery: Any) -> Any:
+            return delivery if isinstance(delivery, Exception) else await delivery
+
+        results = await asyncio.gather(*(_delivered(d) for d in deliveries), return_exceptions=True)
+        logger.debug(f"📤 Kafka: batch of {len(events)}")
+        return results
+
+    async def _broadcast_to_redis(self, events: List[Dict[str, Any]]) -> List[Any]:
+        """Broadcast a batch of events to the Redis stream in one pipeline.
 
         Args:
-            event: Consciousness event to broadcast
+            events: Consciousness events to broadcast
+
+        Returns:
+            Per-event stream entry ID or exception
         """
         if not self.redis_client:
-            raise RuntimeError("Redis client not initialized")
-
-        # Add to stream with automatic trimming
-        await self.redis_client.xadd(
-            self.redis_stream,
-            event,
-            maxlen=self.redis_stream_maxlen,
-            approximate=True  # Approximate trimming for performance
-        )
+            return [RuntimeError("Redis client not initialized")] * len(events)
 
-        logger.debug(f"⚡ Redis: {event['event_id'][:8]}... (salience: {event['salience']:.2f})")
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for event in events:
+                    # Add to stream with automatic trimming
+                    pipe.xadd(
+                        self.redis_stream,
+                        self._stream_fields(event),
+                        maxlen=self.redis_stream_maxlen,
+                        approximate=True  # Approximate trimming for performance
+                    )
+                results = await pipe.execute(raise_on_error=False)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            return [e] * len(events)
+
+        logger.debug(f"⚡ Redis: batch of {len(events)}")
+        return results
+
+    @staticmethod
+    def _stream_fields(event: Dict[str, Any]) -> Dict[str, Any]:
+        """Stream entry fields: nested values JSON-encoded (XADD takes flat values)."""
+        return {
+            key: value if isinstance(value, (str, int, float, bytes)) else json.dumps(value)
+            for key, value in event.items()
+        }
 
     async def get_status(self) -> Dict[str, Any]:
         """Get Global Workspace status and metrics.
@@ -298,5 +471,32 @@ class GlobalWorkspace:
             "kafka_connected": self.kafka_producer is not None,
             "redis_connected": self.redis_client is not None,
             "kafka_topic": self.kafka_topic,
-            "redis_stream": self.redis_stream
+            "redis_stream": self.redis_stream,
+            "batching": self._batching_metrics()
+        }
+
+    def _batching_metrics(self) -> Dict[str, Any]:
+        """Queue depth, batch size, latency and throughput of the batcher."""
+        latencies_ms = sorted(latency * 1000 for latency in self._latencies)
+        throughput = 0.0
+        if len(self._flush_times) >= 2:
+            elapsed = self._flush_times[-1][0] - self._flush_times[0][0]
+            sent = sum(count for _, count in list(self._flush_times)[1:])
+            throughput = sent / elapsed if elapsed > 0 else 0.0
+
+        def percentile(q: float) -> float:
+            if not latencies_ms:
+                return 0.0
+            return latencies_ms[min(len(latencies_ms) - 1, int(q * len(latencies_ms)))]
+
+        return {
+            "linger_ms": self.linger_ms,
+            "max_batch_size": self.max_batch_size,
+            "fast_lane_queued": self._fast_lane.qsize(),
+            "normal_lane_queued": self._normal_lane.qsize(),
+            "batches_flushed": self._batches_flushed,
+            "avg_batch_size": statistics.fmean(self._batch_sizes) if self._batch_sizes else 0.0,
+            "latency_p50_ms": percentile(0.50),
+            "latency_p99_ms": percentile(0.99),
+            "events_per_second": throughput,
         }
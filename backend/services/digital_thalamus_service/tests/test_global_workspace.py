@@ -0,0 +1,229 @@
+"""
+Unit tests for GlobalWorkspace micro-batched broadcasting.
+"""
+
+from __future__ import annotations
+
+
+import asyncio
+import json
+import time
+from typing import Any, Dict, List
+
+import pytest
+
+from backend.services.digital_thalamus_service.global_workspace import GlobalWorkspace
+
+RTT = 0.002  # Simulated broker/server round trip in seconds
+
+
+class FakeProducer:
+    """AIOKafkaProducer stand-in: send() enqueues, the future resolves after a round trip."""
+
+    def __init__(self, fail_keys: tuple[bytes, ...] = ()) -> None:
+        self.sent: List[Dict[str, Any]] = []
+        self.fail_keys = fail_keys
+
+    async def send(self, topic: str, value: Dict[str, Any], key: bytes) -> asyncio.Future:
+        self.sent.append(value)
+        future = asyncio.get_running_loop().create_future()
+
+        def _ack() -> None:
+            if key in self.fail_keys:
+                future.set_exception(ConnectionError("broker down"))
+            else:
+                future.set_result({"topic": topic, "offset": len(self.sent)})
+
+        asyncio.get_running_loop().call_later(RTT, _ack)
+        return future
+
+    async def stop(self) -> None:
+        pass
+
+
+class FakePipeline:
+    def __init__(self, redis: "FakeRedis") -> None:
+        self.redis = redis
+        self.commands: List[Dict[str, Any]] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        pass
+
+    def xadd(self, stream: str, fields: Dict[str, Any], **kwargs: Any) -> None:
+        self.commands.append(fields)
+
+    async def execute(self, raise_on_error: bool = True) -> List[str]:
+        await asyncio.sleep(RTT)
+        self.redis.round_trips += 1
+        self.redis.entries.extend(self.commands)
+        return [f"{len(self.redis.entries)}-0" for _ in self.commands]
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.round_trips = 0
+        self.entries: List[Dict[str, Any]] = []
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+    async def close(self) -> None:
+        pass
+
+
+def _workspace(**kwargs: Any) -> GlobalWorkspace:
+    workspace = GlobalWorkspace(**kwargs)
+    workspace.kafka_producer = FakeProducer()
+    workspace.redis_client = FakeRedis()
+    workspace._broadcasting_enabled = True  # pylint: disable=protected-access
+    return workspace
+
+
+async def _broadcast(workspace: GlobalWorkspace, salience: float = 0.6, sensor: str = "visual") -> Dict[str, Any]:
+    return await workspace.broadcast_event(
+        sensor_type=sensor,
+        sensor_id="cam-1",
+        data={"frame": 1},
+        salience=salience,
+    )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_events_share_one_round_trip() -> None:
+    """Test that events within the linger window go out in one batch."""
+    workspace = _workspace(linger_ms=20)
+
+    results = await asyncio.gather(*(_broadcast(workspace) for _ in range(50)))
+
+    assert all(r["broadcasted"] for r in results)
+    assert len({r["event_id"] for r in results}) == 50
+    assert workspace.redis_client.round_trips == 1
+    assert len(workspace.kafka_producer.sent) == 50
+    status = await workspace.get_status()
+    assert status["events_broadcasted"] == 50
+    assert status["batching"]["batches_flushed"] == 1
+    assert status["batching"]["avg_batch_size"] == 50
+    await workspace.stop()
+
+
+@pytest.mark.asyncio
+async def test_batches_capped_at_max_batch_size() -> None:
+    """Test that a full batch flushes without waiting and is capped."""
+    workspace = _workspace(linger_ms=1000, max_batch_size=10)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(_broadcast(workspace) for _ in range(30)))
+
+    assert time.perf_counter() - start < 0.5
+    assert workspace.redis_client.round_trips == 3
+    await workspace.stop()
+
+
+@pytest.mark.asyncio
+async def test_fast_lane_skips_linger() -> None:
+    """Test that high-salience events are not held for the linger window."""
+    workspace = _workspace(linger_ms=500, fast_lane_salience=0.9)
+
+    start = time.perf_counter()
+    result = await _broadcast(workspace, salience=0.95)
+
+    assert result["broadcasted"]
+    assert time.perf_counter() - start < 0.2
+    await workspace.stop()
+
+
+@pytest.mark.asyncio
+async def test_fast_lane_flushed_first() -> None:
+    """Test that queued high-salience events lead the next batch."""
+    workspace = _workspace(linger_ms=50, fast_lane_salience=0.9, max_batch_size=100)
+
+    normal = [asyncio.create_task(_broadcast(workspace, salience=0.5)) for _ in range(5)]
+    await asyncio.sleep(0)
+    urgent = await _broadcast(workspace, salience=0.99)
+    await asyncio.gather(*normal)
+
+    assert workspace.redis_client.entries[0]["event_id"] == urgent["event_id"]
+    await workspace.stop()
+
+
+@pytest.mark.asyncio
+async def test_per_event_channel_failures() -> None:
+    """Test that a Kafka failure is reported for its own event only."""
+    workspace = _workspace(linger_ms=10)
+    workspace.kafka_producer.fail_keys = (b"auditory",)
+
+    ok, failed = await asyncio.gather(
+        _broadcast(workspace, sensor="visual"),
+        _broadcast(workspace, sensor="auditory"),
+    )
+
+    assert ok["kafka_status"] == "success"
+    assert failed["kafka_status"] == "failed"
+    assert failed["redis_status"] == "success"
+    assert failed["broadcasted"] is True
+    assert (await workspace.get_status())["kafka_errors"] == 1
+    await workspace.stop()
+
+
+@pytest.mark.asyncio
+async def test_stream_fields_are_flat() -> None:
+    """Test that nested event values are JSON-encoded for XADD."""
+    workspace = _workspace(linger_ms=1)
+
+    await _broadcast(workspace)
+
+    entry = workspace.redis_client.entries[0]
+    assert json.loads(entry["data"]) == {"frame": 1}
+    assert entry["salience"] == 0.6
+    await workspace.stop()
+
+
+@pytest.mark.asyncio
+async def test_stop_flushes_queued_events() -> None:
+    """Test that stop() delivers events still waiting in the queue."""
+    workspace = _workspace(linger_ms=10_000)
+
+    task = asyncio.create_task(_broadcast(workspace))
+    await asyncio.sleep(0.01)
+    await workspace.stop()
+
+    assert (await task)["broadcasted"]
+    assert len(workspace.redis_client.entries) == 1
+
+
+@pytest.mark.asyncio
+async def test_broadcast_requires_enabled() -> None:
+    """Test that broadcasting before start() is rejected."""
+    with pytest.raises(RuntimeError):
+        await _broadcast(GlobalWorkspace())
+
+
+@pytest.mark.asyncio
+async def test_batching_throughput_benchmark() -> None:
+    """Benchmark: micro-batching vs one event per round trip."""
+
+    async def run(workspace: GlobalWorkspace, n: int = 500) -> Dict[str, Any]:
+        start = time.perf_counter()
+        await asyncio.gather(*(_broadcast(workspace) for _ in range(n)))
+        elapsed = time.perf_counter() - start
+        status = await workspace.get_status()
+        await workspace.stop()
+        return {
+            "rate": n / elapsed,
+            "round_trips": workspace.redis_client.round_trips,
+            "p99_ms": status["batching"]["latency_p99_ms"],
+        }
+
+    unbatched = await run(_workspace(linger_ms=0, max_batch_size=1))
+    batched = await run(_workspace(linger_ms=5, max_batch_size=256))
+
+    for label, result in (("per-event", unbatched), ("micro-batched", batched)):
+        print(
+            f"\n{label:>14}: {result['rate']:8.0f} events/s, "
+            f"{result['round_trips']:4d} redis round trips, p99 {result['p99_ms']:.1f}ms"
+        )
+    assert batched["round_trips"] < unbatched["round_trips"] / 10
+    assert batched["rate"] > unbatched["rate"] * 3
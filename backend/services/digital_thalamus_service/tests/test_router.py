@@ -5,7 +5,10 @@ Unit tests for RequestRouter.
 from __future__ import annotations
 
 
+import time
+
 import pytest
+from structlog.testing import capture_logs
 
 from backend.services.digital_thalamus_service.config import GatewaySettings
 from backend.services.digital_thalamus_service.core.router import RequestRouter
@@ -60,3 +63,91 @@ async def test_register_route(router: RequestRouter) -> None:
     found_route = await router.find_route("/v1/test")
     assert found_route is not None
     assert found_route.service_name == "test-service"
+
+
+@pytest.mark.asyncio
+async def test_find_route_longest_prefix_wins(router: RequestRouter) -> None:
+    """Test that nested prefixes resolve to the most specific route."""
+    await router.register_route(
+        "/v1/hcl",
+        RouteConfig(service_name="hcl-gateway", base_url="http://hcl:8000")
+    )
+
+    nested = await router.find_route("/v1/hcl/planner/plans/1")
+    parent = await router.find_route("/v1/hcl/other")
+    assert nested is not None and nested.service_name == "hcl-planner-service"
+    assert parent is not None and parent.service_name == "hcl-gateway"
+
+
+@pytest.mark.asyncio
+async def test_find_route_matches_whole_segments(router: RequestRouter) -> None:
+    """Test that a prefix does not match a longer segment."""
+    assert await router.find_route("/v1/corex") is None
+    route = await router.find_route("/v1/core/")
+    assert route is not None
+    assert route.service_name == "maximus-core-service"
+
+
+@pytest.mark.asyncio
+async def test_register_route_invalidates_cache(router: RequestRouter) -> None:
+    """Test that cached lookups are dropped when routes change."""
+    assert await router.find_route("/v1/new/items") is None
+    await router.register_route(
+        "/v1/new",
+        RouteConfig(service_name="new-service", base_url="http://new:8000")
+    )
+
+    route = await router.find_route("/v1/new/items")
+    assert route is not None
+    assert route.service_name == "new-service"
+
+
+@pytest.mark.asyncio
+async def test_route_cache_is_bounded(settings: GatewaySettings) -> None:
+    """Test LRU eviction and hit counting in the resolved-path cache."""
+    router = RequestRouter(settings, route_cache_size=2)
+
+    await router.find_route("/v1/core/a")
+    await router.find_route("/v1/core/b")
+    await router.find_route("/v1/core/a")
+    await router.find_route("/v1/core/c")  # Evicts /v1/core/b
+
+    stats = router.get_cache_stats()
+    assert stats["size"] == 2
+    assert stats["hits"] == 1
+    assert stats["misses"] == 3
+    assert "/v1/core/b" not in router._route_cache  # pylint: disable=protected-access
+
+
+@pytest.mark.asyncio
+async def test_find_route_benchmark(settings: GatewaySettings) -> None:
+    """Benchmark: resolution time should not grow with the route count."""
+
+    async def timed(router: RequestRouter, paths: list[str]) -> float:
+        start = time.perf_counter()
+        for path in paths:
+            await router.find_route(path)
+        return (time.perf_counter() - start) / len(paths)
+
+    timings = {}
+    with capture_logs():  # Keep log rendering out of the measurement
+        for num_routes in (10, 2_000):
+            router = RequestRouter(settings, route_cache_size=0)
+            for i in range(num_routes):
+                await router.register_route(
+                    f"/v2/svc{i}/api",
+                    RouteConfig(service_name=f"svc-{i}", base_url=f"http://svc{i}:8000")
+                )
+            paths = [f"/v2/svc{i % 10}/api/items/{i}" for i in range(2_000)]
+            timings[num_routes] = await timed(router, paths)
+
+        cached = RequestRouter(settings)
+        await timed(cached, ["/v1/hcl/planner/plans/1"])
+        cached_time = await timed(cached, ["/v1/hcl/planner/plans/1"] * 2_000)
+
+    print(
+        f"\nfind_route: 10 routes={timings[10] * 1e6:.1f}us "
+        f"2000 routes={timings[2_000] * 1e6:.1f}us cached={cached_time * 1e6:.1f}us"
+    )
+    # 200x more routes must not mean anywhere near 200x slower lookups
+    assert timings[2_000] < timings[10] * 5
@@ -8,13 +8,18 @@ Performance:
 - L1 Cache: In-memory (0ms) - CORE + VAULT
 - L2 Hot Cache: <10ms - Recent EPISODIC + SEMANTIC
 - L3 Qdrant: <10ms - All types
+
+L1/L2 are HotTier LRU caches that rank by cosine similarity against an
+in-process float32 matrix; Qdrant is only queried when the hot tiers
+cannot fill the requested limit.
 """
 
 from __future__ import annotations
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Set, Tuple
 from datetime import datetime
 
+from core.hot_tier import HotTier
 from core.qdrant_client import QdrantClient
 from models.memory_types import (
     TypedMemory,
@@ -32,14 +37,15 @@ class MemoryHierarchy:
     6-layer memory hierarchy with caching and type-specific optimization.
 
     Cache Layers (L1 → L3):
-    - L1: In-memory dict (CRITICAL priority only)
-    - L2: Hot cache (HIGH/MEDIUM, accessed in last 24h)
+    - L1: In-memory LRU + vector search (CRITICAL priority only)
+    - L2: Hot LRU + vector search (HIGH/MEDIUM, accessed in last 24h)
     - L3: Qdrant (all memories)
 
     Features:
     - Type-specific TTL enforcement
     - Priority-based caching
-    - Automatic cache eviction
+    - O(1) LRU eviction
+    - Cosine-ranked hot-tier search, Qdrant only when needed
     - Access tracking for optimization
 
     Example:
@@ -70,18 +76,21 @@ class MemoryHierarchy:
         self.qdrant = qdrant_client
 
         # L1 Cache: CRITICAL memories (CORE + VAULT)
-        self.l1_cache: Dict[str, TypedMemory] = {}
+        self.l1_cache = HotTier(max_size=l1_max_size)
         self.l1_max_size = l1_max_size
 
         # L2 Cache: HOT memories (recently accessed)
-        self.l2_cache: Dict[str, TypedMemory] = {}
+        self.l2_cache = HotTier(max_size=l2_max_size)
         self.l2_max_size = l2_max_size
 
-        # Statistics
+        # Statistics (a lookup reaches a tier only if the tiers above missed)
         self.stats = {
             "l1_hits": 0,
             "l2_hits": 0,
             "l3_hits": 0,
+            "l1_lookups": 0,
+            "l2_lookups": 0,
+            "l3_lookups": 0,
             "total_stores": 0,
             "total_searches": 0
         }
@@ -101,6 +110,45 @@ class MemoryHierarchy:
         Args:
             memory: Typed memory to store
         """
+        config = self._prepare(memory)
+
+        # Store in L3 (Qdrant), batched by the client's write buffer
+        await self.qdrant.store_memory(
+            memory_id=memory.id,
+            embedding=memory.embedding,
+            metadata=self._payload(memory)
+        )
+
+        self._cache_stored(memory, config)
+
+    async def store_many(self, memories: List[TypedMemory]) -> int:
+        """
+        Store many memories with batched L3 upserts.
+
+        Args:
+            memories: Typed memories to store
+
+        Returns:
+            Number of memories stored
+        """
+        configs = [self._prepare(memory) for memory in memories]
+
+        await self.qdrant.store_many([
+            {
+                "id": memory.id,
+                "embedding": memory.embedding,
+                "metadata": self._payload(memory)
+            }
+            for memory in memories
+        ])
+
+        for memory, config in zip(memories, configs):
+            self._cache_stored(memory, config)
+
+        return len(memories)
+
+    def _prepare(self, memory: TypedMemory) -> MemoryTypeConfig:
+        """Apply type configuration (TTL, encryption check) before storing."""
         # Get type configuration
         config = MemoryTypeConfig.for_type(memory.type)
 
@@ -116,22 +164,23 @@ class MemoryHierarchy:
                 extra={"memory_id": memory.id}
             )
 
-        # Store in L3 (Qdrant)
-        await self.qdrant.store_memory(
-            memory_id=memory.id,
-            embedding=memory.embedding,
-            metadata={
-                "type": memory.type.value,
-                "content": memory.content,
-                "metadata": memory.metadata,
-                "timestamp": memory.timestamp.isoformat(),
-                "ttl_days": memory.ttl_days,
-                "access_count": memory.access_count,
-                "encrypted": memory.encrypted
-            }
-        )
+        return config
+
+    @staticmethod
+    def _payload(memory: TypedMemory) -> Dict[str, Any]:
+        """Qdrant payload for a memory."""
+        return {
+            "type": memory.type.value,
+            "content": memory.content,
+            "metadata": memory.metadata,
+            "timestamp": memory.timestamp.isoformat(),
+            "ttl_days": memory.ttl_days,
+            "access_count": memory.access_count,
+            "encrypted": memory.encrypted
+        }
 
-        # Cache based on priority
+    def _cache_stored(self, memory: TypedMemory, config: MemoryTypeConfig) -> None:
+        """Cache a stored memory based on priority."""
         if config.priority == MemoryPriority.CRITICAL:
             self._add_to_l1(memory)
         elif config.priority >= MemoryPriority.HIGH:
@@ -158,6 +207,9 @@ class MemoryHierarchy:
         """
         Search memories with cache optimization.
 
+        Hot tiers are ranked by cosine similarity first; Qdrant is queried
+        only if they hold fewer than ``limit`` matches above the threshold.
+
         Args:
             query_embedding: Query vector
             memory_types: Filter by memory types
@@ -165,54 +217,60 @@ class MemoryHierarchy:
             score_threshold: Minimum similarity score
 
         Returns:
-            List of matching typed memories
+            List of matching typed memories, most similar first
         """
         self.stats["total_searches"] += 1
-
-        # 1. Check L1 cache (CRITICAL only)
-        has_critical = MemoryType.CORE in memory_types if memory_types else True
-        has_vault = MemoryType.VAULT in memory_types if memory_types else True
-        if memory_types is None or has_critical or has_vault:
-            l1_results = self._search_l1(query_embedding, limit)
-            if l1_results:
+        found: Dict[str, Tuple[TypedMemory, float]] = {}
+
+        # 1. L1 cache (CRITICAL only)
+        critical = (MemoryType.CORE, MemoryType.VAULT)
+        if memory_types is None or any(t in critical for t in memory_types):
+            self.stats["l1_lookups"] += 1
+            for memory, score in self.l1_cache.search(
+                query_embedding, limit, score_threshold, memory_types
+            ):
+                found[memory.id] = (memory, score)
+            if len(found) >= limit:
                 self.stats["l1_hits"] += 1
-                logger.debug("l1_cache_hit", extra={"count": len(l1_results)})
-                return l1_results[:limit]
-
-        # 2. Check L2 cache (HOT)
-        l2_results = self._search_l2(query_embedding, memory_types, limit)
-        if len(l2_results) >= limit:
+                logger.debug("l1_cache_hit", extra={"count": len(found)})
+                return self._rank(found, limit)
+
+        # 2. L2 cache (HOT)
+        self.stats["l2_lookups"] += 1
+        for memory, score in self.l2_cache.search(
+            query_embedding, limit, score_threshold, memory_types
+        ):
+            found[memory.id] = (memory, score)
+        if len(found) >= limit:
             self.stats["l2_hits"] += 1
-            logger.debug("l2_cache_hit", extra={"count": len(l2_results)})
-            return l2_results[:limit]
-
-        # 3. Search L3 (Qdrant)
-        filter_conditions = {}
-        if memory_types:
-            # Qdrant doesn't support list filtering directly, search all then filter
-            pass
+            logger.debug("l2_cache_hit", extra={"count": len(found)})
+            return self._rank(found, limit)
 
+        # 3. Search L3 (Qdrant); list filters not supported, filter after
+        self.stats["l3_lookups"] += 1
         l3_results = await self.qdrant.search_memory(
             query_embedding=query_embedding,
             limit=limit * 2,  # Fetch extra for filtering
             score_threshold=score_threshold,
-            filter_conditions=filter_conditions
+            with_vectors=True
         )
 
-        # Convert to TypedMemory and filter by type
-        memories = []
+        type_values = [t.value for t in memory_types] if memory_types else None
+        from_l3: Set[str] = set()
         for result in l3_results:
             metadata = result["metadata"]
+            if result["id"] in found:
+                continue
 
             # Filter by type if specified
-            if memory_types and metadata.get("type") not in [t.value for t in memory_types]:
+            if type_values and metadata.get("type") not in type_values:
                 continue
 
             memory = TypedMemory(
                 id=result["id"],
                 type=MemoryType(metadata["type"]),
                 content=metadata["content"],
-                embedding=query_embedding,  # Approximate (not stored in Qdrant)
+                embedding=result.get("embedding") or query_embedding,
                 metadata=metadata.get("metadata", {}),
                 timestamp=datetime.fromisoformat(metadata["timestamp"]),
                 ttl_days=metadata.get("ttl_days"),
@@ -231,12 +289,11 @@ class MemoryHierarchy:
                 elif config.priority >= MemoryPriority.HIGH:
                     self._add_to_l2(memory)
 
-            memories.append(memory)
-
-            if len(memories) >= limit:
-                break
+            found[memory.id] = (memory, result["score"])
+            from_l3.add(memory.id)
 
         self.stats["l3_hits"] += 1
+        memories = self._rank(found, limit, from_l3)
         logger.debug(
             "l3_qdrant_search",
             extra={"count": len(memories)}
@@ -244,6 +301,21 @@ class MemoryHierarchy:
 
         return memories
 
+    def _rank(
+        self,
+        found: Dict[str, Tuple[TypedMemory, float]],
+        limit: int,
+        from_l3: Optional[Set[str]] = None
+    ) -> List[TypedMemory]:
+        """Top ``limit`` memories by score; hot-tier hits are recorded and touched."""
+        ranked = sorted(found.values(), key=lambda pair: pair[1], reverse=True)[:limit]
+        for memory, _score in ranked:
+            if from_l3 is None or memory.id not in from_l3:
+                memory.record_access()
+                if self.l1_cache.get(memory.id) is None:
+                    self.l2_cache.get(memory.id)
+        return [memory for memory, _score in ranked]
+
     async def get_by_id(self, memory_id: str) -> Optional[TypedMemory]:
         """
         Get memory by ID with cache lookup.
@@ -255,14 +327,18 @@ class MemoryHierarchy:
             Typed memory or None
         """
         # Check L1
-        if memory_id in self.l1_cache:
+        self.stats["l1_lookups"] += 1
+        memory = self.l1_cache.get(memory_id)
+        if memory is not None:
             self.stats["l1_hits"] += 1
-            return self.l1_cache[memory_id]
+            return memory
 
         # Check L2
-        if memory_id in self.l2_cache:
+        self.stats["l2_lookups"] += 1
+        memory = self.l2_cache.get(memory_id)
+        if memory is not None:
             self.stats["l2_hits"] += 1
-            return self.l2_cache[memory_id]
+            return memory
 
         # L3: Not implemented (Qdrant get_by_id)
         # Future: Add get_by_id to QdrantClient
@@ -276,8 +352,8 @@ class MemoryHierarchy:
             memory_id: Memory identifier
         """
         # Remove from caches
-        self.l1_cache.pop(memory_id, None)
-        self.l2_cache.pop(memory_id, None)
+        self.l1_cache.pop(memory_id)
+        self.l2_cache.pop(memory_id)
 
         # Remove from L3
         await self.qdrant.delete_memory(memory_id)
@@ -311,49 +387,12 @@ class MemoryHierarchy:
         return cleaned
 
     def _add_to_l1(self, memory: TypedMemory) -> None:
-        """Add memory to L1 cache (CRITICAL only)."""
-        if len(self.l1_cache) >= self.l1_max_size:
-            # Evict least recently accessed
-            lru_id = min(
-                self.l1_cache.items(),
-                key=lambda x: x[1].last_accessed or datetime.min
-            )[0]
-            self.l1_cache.pop(lru_id)
-
-        self.l1_cache[memory.id] = memory
+        """Add memory to L1 cache (CRITICAL only), evicting the LRU entry."""
+        self.l1_cache.put(memory)
 
     def _add_to_l2(self, memory: TypedMemory) -> None:
-        """Add memory to L2 cache (HOT)."""
-        if len(self.l2_cache) >= self.l2_max_size:
-            # Evict least recently accessed
-            lru_id = min(
-                self.l2_cache.items(),
-                key=lambda x: x[1].last_accessed or datetime.min
-            )[0]
-            self.l2_cache.pop(lru_id)
-
-        self.l2_cache[memory.id] = memory
-
-    def _search_l1(
-        self, _query_embedding: List[float], limit: int
-    ) -> List[TypedMemory]:
-        """Simple L1 cache search (returns all CRITICAL memories)."""
-        return list(self.l1_cache.values())[:limit]
-
-    def _search_l2(
-        self,
-        _query_embedding: List[float],
-        memory_types: Optional[List[MemoryType]],
-        limit: int
-    ) -> List[TypedMemory]:
-        """Simple L2 cache search (filter by type)."""
-        results = []
-        for memory in self.l2_cache.values():
-            if memory_types is None or memory.type in memory_types:
-                results.append(memory)
-            if len(results) >= limit:
-                break
-        return results
+        """Add memory to L2 cache (HOT), evicting the LRU entry."""
+        self.l2_cache.put(memory)
 
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -364,10 +403,16 @@ class MemoryHierarchy:
         """
         total_requests = self.stats["l1_hits"] + self.stats["l2_hits"] + self.stats["l3_hits"]
 
+        def tier_hit_rate(tier: str) -> float:
+            return self.stats[f"{tier}_hits"] / max(1, self.stats[f"{tier}_lookups"]) * 100
+
         return {
             **self.stats,
             "l1_size": len(self.l1_cache),
             "l2_size": len(self.l2_cache),
+            "l1_hit_rate": tier_hit_rate("l1"),
+            "l2_hit_rate": tier_hit_rate("l2"),
+            "l3_hit_rate": tier_hit_rate("l3"),
             "cache_hit_rate": (
                 (self.stats["l1_hits"] + self.stats["l2_hits"]) / max(1, total_requests)
             ) * 100
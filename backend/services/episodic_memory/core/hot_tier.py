@@ -0,0 +1,165 @@
+"""
+Hot Memory Tier - LRU Cache with Vector Search
+===============================================
+
+In-process cache tier for MemoryHierarchy L1/L2.
+
+- LRU order kept by an OrderedDict: O(1) touch, insert and eviction
+- Embeddings kept as unit-norm rows of one float32 matrix, so ranking the
+  whole tier against a query is a single matrix-vector product
+- Removal moves the last row into the freed slot (matrix stays dense)
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from models.memory_types import MemoryType, TypedMemory
+
+
+class HotTier:
+    """
+    Bounded LRU cache of typed memories with cosine-similarity search.
+
+    Example:
+        >>> tier = HotTier(max_size=100)
+        >>> tier.put(memory)
+        >>> tier.search(query_embedding, limit=5, score_threshold=0.7)
+        [(memory, 0.93), ...]
+    """
+
+    def __init__(self, max_size: int, initial_capacity: int = 64):
+        """
+        Initialize empty tier.
+
+        Args:
+            max_size: Maximum number of memories (LRU evicted beyond it)
+            initial_capacity: Matrix rows preallocated before the first resize
+        """
+        self.max_size = max_size
+        self._memories: "OrderedDict[str, TypedMemory]" = OrderedDict()
+        self._rows: Dict[str, int] = {}
+        self._row_ids: List[str] = []
+        self._matrix: Optional[np.ndarray] = None
+        self._initial_capacity = max(1, min(initial_capacity, max_size))
+
+    def __len__(self) -> int:
+        return len(self._memories)
+
+    def __contains__(self, memory_id: object) -> bool:
+        return memory_id in self._memories
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._memories))
+
+    def items(self) -> List[Tuple[str, TypedMemory]]:
+        """Snapshot of (id, memory) pairs, least recently used first."""
+        return list(self._memories.items())
+
+    def get(self, memory_id: str) -> Optional[TypedMemory]:
+        """Get memory and mark it most recently used."""
+        memory = self._memories.get(memory_id)
+        if memory is not None:
+            self._memories.move_to_end(memory_id)
+        return memory
+
+    def put(self, memory: TypedMemory) -> Optional[TypedMemory]:
+        """
+        Insert or refresh a memory.
+
+        Returns:
+            The evicted least recently used memory, if any
+        """
+        vector = self._normalize(memory.embedding)
+        if memory.id in self._memories:
+            self._matrix[self._rows[memory.id]] = vector
+            self._memories[memory.id] = memory
+            self._memories.move_to_end(memory.id)
+            return None
+
+        evicted = None
+        if len(self._memories) >= self.max_size:
+            lru_id = next(iter(self._memories))
+            evicted = self.pop(lru_id)
+
+        row = len(self._row_ids)
+        if row == len(self._matrix):
+            grown = np.zeros((min(2 * row, self.max_size), self._matrix.shape[1]), dtype=np.float32)
+            grown[:row] = self._matrix
+            self._matrix = grown
+        self._matrix[row] = vector
+        self._rows[memory.id] = row
+        self._row_ids.append(memory.id)
+        self._memories[memory.id] = memory
+        return evicted
+
+    def pop(self, memory_id: str) -> Optional[TypedMemory]:
+        """Remove a memory. Returns it, or None if absent."""
+        memory = self._memories.pop(memory_id, None)
+        if memory is None:
+            return None
+
+        row = self._rows.pop(memory_id)
+        last = len(self._row_ids) - 1
+        if row != last:
+            moved = self._row_ids[last]
+            self._matrix[row] = self._matrix[last]
+            self._row_ids[row] = moved
+            self._rows[moved] = row
+        self._row_ids.pop()
+        return memory
+
+    def search(
+        self,
+        query_embedding: Sequence[float],
+        limit: int,
+        score_threshold: float = 0.0,
+        memory_types: Optional[List[MemoryType]] = None,
+    ) -> List[Tuple[TypedMemory, float]]:
+        """
+        Rank cached memories by cosine similarity to the query.
+
+        Args:
+            query_embedding: Query vector
+            limit: Maximum results
+            score_threshold: Minimum cosine similarity
+            memory_types: Only return these types (None = all)
+
+        Returns:
+            (memory, score) pairs, most similar first
+        """
+        if not self._row_ids or limit <= 0:
+            return []
+        if len(query_embedding) != self._matrix.shape[1]:
+            return []
+
+        scores = self._matrix[: len(self._row_ids)] @ self._normalize(query_embedding)
+        order = np.argsort(-scores, kind="stable")
+
+        results = []
+        for row in order.tolist():
+            score = float(scores[row])
+            if score < score_threshold:
+                break
+            memory = self._memories[self._row_ids[row]]
+            if memory_types is not None and memory.type not in memory_types:
+                continue
+            results.append((memory, score))
+            if len(results) >= limit:
+                break
+        return results
+
+    def _normalize(self, embedding: Sequence[float]) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32).ravel()
+        if self._matrix is None:
+            self._matrix = np.zeros((self._initial_capacity, len(vector)), dtype=np.float32)
+        if len(vector) != self._matrix.shape[1]:
+            raise ValueError(
+                f"Embedding size {len(vector)} doesn't match "
+                f"tier dimension {self._matrix.shape[1]}"
+            )
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm > 0 else vector
@@ -0,0 +1,215 @@
+"""
+Episodic Memory: Keyword Index
+==============================
+
+Incrementally maintained inverted index used by MemoryStore.retrieve.
+
+- Each memory gets a slot number; sets of slots are Python int bitmaps
+- Postings: token -> {slot: term frequency} plus a bitmap of those slots
+- Pre-filter bitmaps per memory type and per importance decile
+- BM25 scoring over the candidate slots only, top-k via heapq
+
+Retrieval cost grows with the number of matching memories, not with the
+number of stored memories.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from models.memory import MemoryType
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _iter_bits(bitmap: int) -> Iterator[int]:
+    """Yield the set bit positions of a bitmap."""
+    while bitmap:
+        low = bitmap & -bitmap
+        yield low.bit_length() - 1
+        bitmap ^= low
+
+
+@dataclass
+class _Doc:
+    """Per-slot data needed for scoring and removal."""
+    memory_id: str
+    term_counts: Counter
+    length: int
+    importance: float
+    timestamp: datetime
+    type: MemoryType
+
+
+class KeywordIndex:
+    """
+    Inverted index with BM25 scoring and bitmap pre-filters.
+
+    Example:
+        >>> index = KeywordIndex()
+        >>> index.add("m1", "deploy failed on node 3", MemoryType.EXPERIENCE, 0.8, now)
+        >>> index.search("deploy failure", limit=5)
+        (["m1"], 1)
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        """
+        Initialize empty index.
+
+        Args:
+            k1: BM25 term-frequency saturation
+            b: BM25 document-length normalization
+        """
+        self.k1 = k1
+        self.b = b
+
+        self._docs: Dict[int, _Doc] = {}
+        self._slots: Dict[str, int] = {}
+        self._free_slots: List[int] = []
+        self._next_slot = 0
+        self._total_length = 0
+
+        self._postings: Dict[str, Dict[int, int]] = {}
+        self._posting_bits: Dict[str, int] = {}
+        self._type_bits: Dict[MemoryType, int] = {}
+        self._importance_bits: List[int] = [0] * 11  # Deciles 0.0 .. 1.0
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def add(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        memory_id: str,
+        text: str,
+        memory_type: MemoryType,
+        importance: float,
+        timestamp: datetime
+    ) -> None:
+        """Index a memory (replacing any previous entry for the id)."""
+        if memory_id in self._slots:
+            self.remove(memory_id)
+
+        slot = self._free_slots.pop() if self._free_slots else self._allocate_slot()
+        bit = 1 << slot
+        term_counts = Counter(tokenize(text))
+        length = sum(term_counts.values())
+
+        self._docs[slot] = _Doc(
+            memory_id=memory_id,
+            term_counts=term_counts,
+            length=length,
+            importance=importance,
+            timestamp=timestamp,
+            type=memory_type,
+        )
+        self._slots[memory_id] = slot
+        self._total_length += length
+
+        for term, count in term_counts.items():
+            self._postings.setdefault(term, {})[slot] = count
+            self._posting_bits[term] = self._posting_bits.get(term, 0) | bit
+        self._type_bits[memory_type] = self._type_bits.get(memory_type, 0) | bit
+        self._importance_bits[self._decile(importance)] |= bit
+
+    def remove(self, memory_id: str) -> bool:
+        """Remove a memory from the index. False if not indexed."""
+        slot = self._slots.pop(memory_id, None)
+        if slot is None:
+            return False
+
+        doc = self._docs.pop(slot)
+        mask = ~(1 << slot)
+        self._total_length -= doc.length
+
+        for term in doc.term_counts:
+            postings = self._postings[term]
+            del postings[slot]
+            if postings:
+                self._posting_bits[term] &= mask
+            else:
+                del self._postings[term]
+                del self._posting_bits[term]
+        self._type_bits[doc.type] &= mask
+        self._importance_bits[self._decile(doc.importance)] &= mask
+
+        self._free_slots.append(slot)
+        return True
+
+    def search(
+        self,
+        query_text: str,
+        limit: int,
+        memory_type: Optional[MemoryType] = None,
+        min_importance: float = 0.0
+    ) -> Tuple[List[str], int]:
+        """
+        Find memories containing any query token.
+
+        Args:
+            query_text: Free-text query
+            limit: Number of ids to return
+            memory_type: Only this type (None = all)
+            min_importance: Minimum importance
+
+        Returns:
+            (memory ids ranked by BM25 then recency, total number of matches)
+        """
+        terms = [t for t in set(tokenize(query_text)) if t in self._postings]
+        if not terms:
+            return [], 0
+
+        candidates = 0
+        for term in terms:
+            candidates |= self._posting_bits[term]
+        if memory_type is not None:
+            candidates &= self._type_bits.get(memory_type, 0)
+        if min_importance > 0.0:
+            # Whole deciles at or above the boundary one; boundary checked exactly
+            importance_bits = 0
+            for decile in range(self._decile(min_importance), 11):
+                importance_bits |= self._importance_bits[decile]
+            candidates &= importance_bits
+
+        n_docs = len(self._docs)
+        avg_length = self._total_length / n_docs if n_docs else 0.0
+        idf = {
+            term: math.log(1 + (n_docs - len(self._postings[term]) + 0.5)
+                           / (len(self._postings[term]) + 0.5))
+            for term in terms
+        }
+
+        scored = []
+        for slot in _iter_bits(candidates):
+            doc = self._docs[slot]
+            if doc.importance < min_importance:
+                continue
+            norm = self.k1 * (1 - self.b + self.b * doc.length / (avg_length or 1.0))
+            score = 0.0
+            for term in terms:
+                tf = doc.term_counts.get(term, 0)
+                if tf:
+                    score += idf[term] * tf * (self.k1 + 1) / (tf + norm)
+            scored.append((score, doc.timestamp, doc.memory_id))
+
+        top = heapq.nlargest(limit, scored)
+        return [memory_id for _, _, memory_id in top], len(scored)
+
+    def _allocate_slot(self) -> int:
+        slot = self._next_slot
+        self._next_slot += 1
+        return slot
+
+    @staticmethod
+    def _decile(importance: float) -> int:
+        return min(10, max(0, int(importance * 10)))
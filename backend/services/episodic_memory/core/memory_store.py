@@ -11,9 +11,10 @@ from __future__ import annotations
 
 import logging
 import uuid
-from typing import List, Dict, Optional, Any
+from typing import Dict, Optional, Any
 from datetime import datetime
 
+from core.keyword_index import KeywordIndex
 from models.memory import Memory, MemoryQuery, MemorySearchResult, MemoryType
 
 
@@ -24,13 +25,15 @@ class MemoryStore:
     """
     Storage engine for episodic memories.
 
-    Manages persistence and retrieval of memory objects.
+    Manages persistence and retrieval of memory objects. Keyword retrieval
+    goes through an inverted index kept in sync on store/delete.
     """
 
     def __init__(self) -> None:
         """Initialize the memory store."""
         # In-memory storage for now
         self._storage: Dict[str, Memory] = {}
+        self._index = KeywordIndex()
         logger.info("MemoryStore initialized (in-memory)")
 
     async def store(
@@ -60,6 +63,9 @@ class MemoryStore:
         )
 
         self._storage[memory_id] = memory
+        self._index.add(
+            memory_id, content, memory_type, memory.importance, memory.timestamp
+        )
         logger.info("Stored memory: %s (type=%s)", memory_id, memory_type)
         return memory
 
@@ -73,34 +79,18 @@ class MemoryStore:
         Returns:
             Search results
         """
-        results: List[Memory] = []
-
-        # Simple keyword search for now
-        query_terms = query.query_text.lower().split()
-
-        for memory in self._storage.values():
-            # Filter by type if specified
-            if query.type and memory.type != query.type:
-                continue
-
-            # Filter by importance
-            if memory.importance < query.min_importance:
-                continue
-
-            # Check content match
-            content_lower = memory.content.lower()
-            if any(term in content_lower for term in query_terms):
-                results.append(memory)
-
-        # Sort by timestamp (newest first) as a simple heuristic
-        results.sort(key=lambda x: x.timestamp, reverse=True)
-
-        # Apply limit
-        limited_results = results[:query.limit]
+        # Keyword search: memories containing any query token, BM25-ranked
+        # with newest first among equal scores
+        memory_ids, total_found = self._index.search(
+            query.query_text,
+            limit=query.limit,
+            memory_type=query.type,
+            min_importance=query.min_importance,
+        )
 
         return MemorySearchResult(
-            memories=limited_results,
-            total_found=len(results)
+            memories=[self._storage[memory_id] for memory_id in memory_ids],
+            total_found=total_found
         )
 
     async def get_memory(self, memory_id: str) -> Optional[Memory]:
@@ -127,6 +117,7 @@ class MemoryStore:
         """
         if memory_id in self._storage:
             del self._storage[memory_id]
+            self._index.remove(memory_id)
             logger.info("Deleted memory: %s", memory_id)
             return True
         return False
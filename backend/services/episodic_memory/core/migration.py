@@ -163,30 +163,47 @@ class ChromaToQdrantMigration:
 
     async def _migrate_batch(self, batch: List[Dict[str, Any]]) -> None:
         """
-        Migrate batch of memories to Qdrant.
+        Migrate batch of memories to Qdrant with a single batched upsert.
+
+        Invalid memories are counted as errors and skipped; the rest of the
+        batch is written together.
 
         Args:
             batch: List of memory dicts
         """
+        valid = []
         for memory in batch:
             try:
-                await self.qdrant.store_memory(
-                    memory_id=memory["id"],
-                    embedding=memory["embedding"],
-                    metadata=memory["metadata"]
-                )
-
-                # Store checksum for validation
-                checksum = self._calculate_checksum(memory)
-                self.checksums[memory["id"]] = checksum
-
-            except (ValueError, KeyError, RuntimeError) as e:
+                missing = [k for k in ("id", "embedding", "metadata") if k not in memory]
+                if missing:
+                    raise KeyError(f"Missing keys: {missing}")
+                if len(memory["embedding"]) != self.qdrant.vector_size:
+                    raise ValueError(
+                        f"Embedding size {len(memory['embedding'])} doesn't match "
+                        f"vector_size {self.qdrant.vector_size}"
+                    )
+                valid.append(memory)
+            except (ValueError, KeyError) as e:
                 logger.error(
                     "memory_migration_failed",
                     extra={"memory_id": memory.get("id"), "error": str(e)}
                 )
                 self.total_errors += 1
 
+        try:
+            await self.qdrant.store_many(valid)
+        except (ValueError, KeyError, RuntimeError) as e:
+            logger.error(
+                "batch_migration_failed",
+                extra={"batch_size": len(valid), "error": str(e)}
+            )
+            self.total_errors += len(valid)
+            return
+
+        # Store checksums for validation
+        for memory in valid:
+            self.checksums[memory["id"]] = self._calculate_checksum(memory)
+
     async def _validate_batch(self, batch: List[Dict[str, Any]]) -> None:
         """
         Validate batch (dry run).
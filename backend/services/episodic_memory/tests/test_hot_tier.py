@@ -0,0 +1,150 @@
+"""
+Unit tests for HotTier and hot-tier search in MemoryHierarchy.
+"""
+
+from __future__ import annotations
+
+import uuid
+
+import numpy as np
+import pytest
+
+from core.hierarchy import MemoryHierarchy
+from core.hot_tier import HotTier
+from core.qdrant_client import QdrantClient
+from models.memory_types import MemoryType, TypedMemory
+
+DIM = 16
+
+
+def _memory(embedding, memory_type=MemoryType.SEMANTIC, memory_id=None) -> TypedMemory:
+    return TypedMemory(
+        id=memory_id or str(uuid.uuid4()),
+        type=memory_type,
+        content={"text": "x"},
+        embedding=list(embedding),
+    )
+
+
+def _basis(i: int, noise: float = 0.0, seed: int = 0):
+    vector = np.zeros(DIM)
+    vector[i] = 1.0
+    return vector + np.random.default_rng(seed).normal(scale=noise, size=DIM)
+
+
+class TestHotTier:
+    def test_search_ranks_by_cosine(self):
+        tier = HotTier(max_size=10)
+        near = _memory(_basis(0, 0.05, seed=1))
+        far = _memory(_basis(1))
+        mid = _memory(_basis(0) + _basis(2))
+        for memory in (far, mid, near):
+            tier.put(memory)
+
+        results = tier.search(_basis(0), limit=3, score_threshold=0.5)
+
+        assert [m.id for m, _ in results] == [near.id, mid.id]
+        assert results[0][1] > results[1][1]
+
+    def test_lru_eviction_order(self):
+        tier = HotTier(max_size=3)
+        memories = [_memory(_basis(i)) for i in range(3)]
+        for memory in memories:
+            tier.put(memory)
+
+        tier.get(memories[0].id)  # Oldest becomes most recently used
+        evicted = tier.put(_memory(_basis(3)))
+
+        assert evicted.id == memories[1].id
+        assert memories[1].id not in tier
+        assert len(tier) == 3
+
+    def test_pop_keeps_rows_consistent(self):
+        tier = HotTier(max_size=100, initial_capacity=2)
+        vectors = np.random.default_rng(7).normal(size=(20, DIM))
+        memories = [_memory(vector) for vector in vectors]
+        for memory in memories:
+            tier.put(memory)
+
+        tier.pop(memories[3].id)
+        tier.pop(memories[0].id)
+
+        assert len(tier) == 18
+        for memory in memories[1:3] + memories[4:]:
+            assert tier.search(memory.embedding, limit=1)[0][0].id == memory.id
+
+    def test_type_filter(self):
+        tier = HotTier(max_size=10)
+        core = _memory(_basis(0), MemoryType.CORE)
+        vault = _memory(_basis(0, 0.1, seed=2), MemoryType.VAULT)
+        tier.put(core)
+        tier.put(vault)
+
+        results = tier.search(_basis(0), limit=5, memory_types=[MemoryType.VAULT])
+
+        assert [m.id for m, _ in results] == [vault.id]
+
+
+class TestHierarchySearch:
+    @pytest.fixture
+    def hierarchy(self):
+        client = QdrantClient(location=":memory:", vector_size=DIM)
+        return MemoryHierarchy(client, l1_max_size=10, l2_max_size=10)
+
+    @pytest.mark.asyncio
+    async def test_hot_tier_serves_ranked_results(self, hierarchy):
+        core_near = _memory(_basis(0, 0.05, seed=3), MemoryType.CORE)
+        core_far = _memory(_basis(5), MemoryType.CORE)
+        await hierarchy.store_many([core_far, core_near])
+
+        results = await hierarchy.search(
+            _basis(0).tolist(), memory_types=[MemoryType.CORE], limit=1
+        )
+
+        assert [m.id for m in results] == [core_near.id]
+        stats = hierarchy.get_stats()
+        assert stats["l1_hits"] == 1
+        assert stats["l3_lookups"] == 0
+        assert stats["l1_hit_rate"] == 100.0
+
+    @pytest.mark.asyncio
+    async def test_falls_through_to_qdrant_when_hot_tier_short(self, hierarchy):
+        cached = _memory(_basis(0, 0.05, seed=4), MemoryType.SEMANTIC)
+        uncached = _memory(_basis(0, 0.1, seed=5), MemoryType.EPISODIC)
+        await hierarchy.store_many([cached, uncached])
+        assert uncached.id not in hierarchy.l2_cache
+
+        results = await hierarchy.search(_basis(0).tolist(), limit=2)
+
+        assert {m.id for m in results} == {cached.id, uncached.id}
+        stats = hierarchy.get_stats()
+        assert stats["l3_hits"] == 1
+        assert stats["l2_lookups"] == 1
+        assert stats["l2_hit_rate"] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_l3_results_cached_with_stored_embedding(self, hierarchy):
+        memory = _memory(_basis(2), MemoryType.SEMANTIC)
+        await hierarchy.qdrant.store_many([{
+            "id": memory.id,
+            "embedding": memory.embedding,
+            "metadata": hierarchy._payload(memory),
+        }])
+
+        query = (_basis(2) + _basis(3) * 0.5).tolist()
+        await hierarchy.search(query, limit=1, score_threshold=0.5)
+
+        assert memory.id in hierarchy.l2_cache
+        # Cached under its own embedding, not the query's
+        cached_score = hierarchy.l2_cache.search(_basis(2).tolist(), limit=1)[0][1]
+        assert cached_score == pytest.approx(1.0, abs=1e-3)
+
+    @pytest.mark.asyncio
+    async def test_delete_removes_from_tiers(self, hierarchy):
+        memory = _memory(_basis(0), MemoryType.CORE)
+        await hierarchy.store(memory)
+
+        await hierarchy.delete(memory.id)
+
+        assert memory.id not in hierarchy.l1_cache
+        assert await hierarchy.get_by_id(memory.id) is None
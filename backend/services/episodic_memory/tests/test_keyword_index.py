@@ -0,0 +1,113 @@
+"""
+Unit tests for the MemoryStore keyword index.
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from core.keyword_index import KeywordIndex
+from core.memory_store import MemoryStore
+from models.memory import MemoryQuery, MemoryType
+
+NOW = datetime(2025, 1, 1, 12, 0, 0)
+
+
+def test_bm25_prefers_rarer_and_denser_terms():
+    index = KeywordIndex()
+    index.add("common", "the agent ran the task", MemoryType.EXPERIENCE, 0.5, NOW)
+    index.add("rare", "kafka broker outage during the task", MemoryType.EXPERIENCE, 0.5, NOW)
+    index.add("dense", "kafka kafka kafka", MemoryType.FACT, 0.5, NOW)
+    for i in range(10):
+        index.add(f"filler-{i}", f"the task number {i}", MemoryType.FACT, 0.5, NOW)
+
+    ids, total = index.search("kafka task", limit=3)
+
+    assert total == 13
+    assert ids[:2] == ["dense", "rare"]
+
+
+def test_ties_broken_by_recency():
+    index = KeywordIndex()
+    for i in range(5):
+        index.add(f"m{i}", "same words", MemoryType.FACT, 0.5, NOW + timedelta(minutes=i))
+
+    ids, _ = index.search("words", limit=2)
+
+    assert ids == ["m4", "m3"]
+
+
+def test_type_and_importance_filters():
+    index = KeywordIndex()
+    index.add("fact-low", "deploy", MemoryType.FACT, 0.2, NOW)
+    index.add("fact-edge", "deploy", MemoryType.FACT, 0.65, NOW)
+    index.add("fact-below-edge", "deploy", MemoryType.FACT, 0.61, NOW)
+    index.add("exp-high", "deploy", MemoryType.EXPERIENCE, 0.9, NOW)
+
+    ids, total = index.search("deploy", limit=10, memory_type=MemoryType.FACT, min_importance=0.65)
+
+    assert ids == ["fact-edge"]
+    assert total == 1
+
+
+def test_remove_and_slot_reuse():
+    index = KeywordIndex()
+    index.add("a", "alpha beta", MemoryType.FACT, 0.5, NOW)
+    index.add("b", "beta gamma", MemoryType.FACT, 0.5, NOW)
+
+    assert index.remove("a") is True
+    assert index.remove("a") is False
+    assert index.search("alpha", limit=5) == ([], 0)
+
+    index.add("c", "delta", MemoryType.REFLECTION, 0.5, NOW)  # Reuses a's slot
+    assert index.search("beta delta", limit=5)[1] == 2
+    assert index.search("alpha", limit=5) == ([], 0)
+
+
+def test_readding_replaces_entry():
+    index = KeywordIndex()
+    index.add("a", "old text", MemoryType.FACT, 0.5, NOW)
+    index.add("a", "new text", MemoryType.FACT, 0.5, NOW)
+
+    assert index.search("old", limit=5) == ([], 0)
+    assert index.search("new", limit=5) == (["a"], 1)
+    assert len(index) == 1
+
+
+@pytest.mark.asyncio
+async def test_store_delete_keeps_index_in_sync():
+    store = MemoryStore()
+    memory = await store.store("Redis failover drill", MemoryType.EXPERIENCE)
+
+    results = await store.retrieve(MemoryQuery(query_text="failover"))
+    assert [m.memory_id for m in results.memories] == [memory.memory_id]
+
+    await store.delete(memory.memory_id)
+    results = await store.retrieve(MemoryQuery(query_text="failover"))
+    assert results.total_found == 0
+
+
+def test_retrieval_scales_with_matches_not_size():
+    """A selective query stays fast as unrelated memories pile up."""
+
+    def timed_search(index: KeywordIndex) -> float:
+        start = time.perf_counter()
+        for _ in range(200):
+            index.search("needle", limit=5)
+        return (time.perf_counter() - start) / 200
+
+    timings = {}
+    for size in (1_000, 50_000):
+        index = KeywordIndex()
+        for i in range(size):
+            index.add(f"m{i}", f"routine log line {i} ok", MemoryType.EXPERIENCE, 0.5, NOW)
+        for i in range(20):
+            index.add(f"needle-{i}", "found the needle", MemoryType.FACT, 0.5, NOW)
+        timings[size] = timed_search(index)
+
+    print(f"\nselective query: 1k={timings[1_000] * 1e6:.0f}us 50k={timings[50_000] * 1e6:.0f}us")
+    # 50x more memories must not mean anywhere near 50x slower queries
+    assert timings[50_000] < timings[1_000] * 10
@@ -0,0 +1,229 @@
+"""
+Unit tests for batched Qdrant writes (write-behind buffer + store_many).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+
+import pytest
+
+from core.hierarchy import MemoryHierarchy
+from core.migration import ChromaToQdrantMigration
+from core.qdrant_client import QdrantClient
+from models.memory_types import MemoryType, TypedMemory
+
+DIM = 8
+
+
+def _client(**kwargs) -> QdrantClient:
+    return QdrantClient(location=":memory:", vector_size=DIM, **kwargs)
+
+
+def _vector(i: int):
+    return [float(i + 1)] + [float((i * j) % 7) for j in range(1, DIM)]
+
+
+def _memory(i: int):
+    return {"id": str(uuid.uuid4()), "embedding": _vector(i), "metadata": {"n": i}}
+
+
+@pytest.mark.asyncio
+async def test_store_memory_is_buffered_until_batch_size():
+    client = _client(write_batch_size=10, write_linger_ms=10_000)
+
+    for i in range(9):
+        await client.store_memory(str(uuid.uuid4()), _vector(i), {"n": i})
+    assert client.write_stats["upserts"] == 0
+
+    await client.store_memory(str(uuid.uuid4()), _vector(9), {"n": 9})
+    assert client.write_stats["upserts"] == 1
+    assert client.write_stats["points_written"] == 10
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_linger_flushes_partial_batch():
+    client = _client(write_batch_size=100, write_linger_ms=5)
+
+    await client.store_memory(str(uuid.uuid4()), _vector(0), {"n": 0})
+    await asyncio.sleep(0.05)
+
+    assert client.write_stats["points_written"] == 1
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_reads_see_buffered_writes():
+    client = _client(write_batch_size=100, write_linger_ms=10_000)
+    memory_id = str(uuid.uuid4())
+
+    await client.store_memory(memory_id, _vector(3), {"type": "episodic"})
+
+    assert await client.count_memories() == 1
+    results = await client.search_memory(_vector(3), limit=1, score_threshold=0.9)
+    assert results[0]["id"] == memory_id
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_store_memory_validates_size():
+    client = _client()
+    with pytest.raises(ValueError):
+        await client.store_memory("bad", [0.1, 0.2], {})
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_points_buffered():
+    client = _client(write_batch_size=100, write_linger_ms=10_000)
+    await client.store_memory(str(uuid.uuid4()), _vector(0), {})
+
+    real_upsert = client.client.upsert
+
+    async def failing_upsert(**kwargs):
+        raise RuntimeError("qdrant unavailable")
+
+    client.client.upsert = failing_upsert
+    with pytest.raises(RuntimeError):
+        await client.flush()
+    assert client.write_stats["flush_errors"] == 1
+
+    client.client.upsert = real_upsert
+    assert await client.flush() == 1
+    assert await client.count_memories() == 1
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_close_releases_client_when_flush_fails():
+    client = _client(write_batch_size=100, write_linger_ms=10_000)
+    await client.store_memory(str(uuid.uuid4()), _vector(0), {})
+    closed = []
+
+    async def failing_upsert(**kwargs):
+        raise RuntimeError("qdrant unavailable")
+
+    async def close(**kwargs):
+        closed.append(True)
+
+    client.client.upsert = failing_upsert
+    client.client.close = close
+    with pytest.raises(RuntimeError):
+        await client.close()
+    assert closed == [True]
+
+
+@pytest.mark.asyncio
+async def test_store_memory_keeps_point_when_batch_flush_fails():
+    client = _client(write_batch_size=2, write_linger_ms=10_000)
+    real_upsert = client.client.upsert
+
+    async def failing_upsert(**kwargs):
+        raise RuntimeError("qdrant unavailable")
+
+    client.client.upsert = failing_upsert
+    await client.store_memory(str(uuid.uuid4()), _vector(0), {})
+    await client.store_memory(str(uuid.uuid4()), _vector(1), {})
+    assert client.write_stats["flush_errors"] == 1
+    assert client.pending_points == 2
+
+    client.client.upsert = real_upsert
+    assert await client.flush() == 2
+    assert await client.count_memories() == 2
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_full_buffer_rejects_write_when_flush_fails():
+    client = _client(write_batch_size=2, write_linger_ms=10_000, max_buffered_points=4)
+    real_upsert = client.client.upsert
+
+    async def failing_upsert(**kwargs):
+        raise RuntimeError("qdrant unavailable")
+
+    client.client.upsert = failing_upsert
+    for i in range(4):
+        await client.store_memory(str(uuid.uuid4()), _vector(i), {})
+
+    with pytest.raises(RuntimeError):
+        await client.store_memory(str(uuid.uuid4()), _vector(4), {})
+    assert client.pending_points == 4
+
+    client.client.upsert = real_upsert
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_full_buffer_waits_for_flush():
+    client = _client(write_batch_size=100, write_linger_ms=10_000, max_buffered_points=3)
+
+    for i in range(4):
+        await client.store_memory(str(uuid.uuid4()), _vector(i), {})
+
+    assert client.write_stats["upserts"] == 1
+    assert client.pending_points == 1
+    assert await client.count_memories() == 4
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_store_many_chunks_upserts():
+    client = _client(write_batch_size=50)
+
+    stored = await client.store_many([_memory(i) for i in range(120)])
+
+    assert stored == 120
+    assert client.write_stats["upserts"] == 3
+    assert await client.count_memories() == 120
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_store_many_validates_before_writing():
+    client = _client()
+    memories = [_memory(0), {"id": "bad", "embedding": [1.0], "metadata": {}}]
+
+    with pytest.raises(ValueError):
+        await client.store_many(memories)
+    assert await client.count_memories() == 0
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_hierarchy_store_many_caches_by_priority():
+    client = _client()
+    hierarchy = MemoryHierarchy(client)
+    memories = [
+        TypedMemory(id=str(uuid.uuid4()), type=MemoryType.CORE, content={"i": 0}, embedding=_vector(0)),
+        TypedMemory(id=str(uuid.uuid4()), type=MemoryType.SEMANTIC, content={"i": 1}, embedding=_vector(1)),
+        TypedMemory(id=str(uuid.uuid4()), type=MemoryType.RESOURCE, content={"i": 2}, embedding=_vector(2)),
+    ]
+
+    assert await hierarchy.store_many(memories) == 3
+
+    assert client.write_stats["upserts"] == 1
+    assert await client.count_memories() == 3
+    assert memories[0].id in hierarchy.l1_cache
+    assert memories[1].id in hierarchy.l2_cache
+    assert memories[2].ttl_days is not None
+    assert hierarchy.stats["total_stores"] == 3
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_migration_batch_single_upsert_skips_invalid():
+    client = _client()
+    migration = ChromaToQdrantMigration(chroma_client=None, qdrant_client=client)
+    batch = [_memory(i) for i in range(20)]
+    batch.append({"id": "short", "embedding": [1.0], "metadata": {}})
+    batch.append({"id": "no-metadata", "embedding": _vector(0)})
+
+    await migration._migrate_batch(batch)
+
+    assert client.write_stats["upserts"] == 1
+    assert await client.count_memories() == 20
+    assert migration.total_errors == 2
+    assert len(migration.checksums) == 20
+    await client.close()
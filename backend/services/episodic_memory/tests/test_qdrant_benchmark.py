@@ -0,0 +1,103 @@
+"""
+Throughput benchmark: per-call upserts vs batched writes.
+
+Runs against a local in-memory Qdrant (no server needed) with 1536-d
+embeddings. Compares one upsert per memory (the previous store_memory
+behaviour) with the write-behind buffer and store_many, first with no
+request latency and then with a simulated 1ms network round trip per
+upsert request.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+import uuid
+
+import pytest
+from qdrant_client.models import PointStruct
+
+from core.qdrant_client import QdrantClient
+
+DIM = 1536
+COUNT = 1000
+
+
+def _memories(count: int):
+    rng = random.Random(7)
+    return [
+        {
+            "id": str(uuid.uuid4()),
+            "embedding": [rng.random() for _ in range(DIM)],
+            "metadata": {"type": "episodic", "n": i},
+        }
+        for i in range(count)
+    ]
+
+
+async def _run(memories, rtt_s: float):
+    """Time the three write strategies; rtt_s is added to every upsert request."""
+
+    def client_with_rtt() -> QdrantClient:
+        client = QdrantClient(location=":memory:", vector_size=DIM)
+        upsert = client.client.upsert
+
+        async def upsert_with_rtt(**kwargs):
+            await asyncio.sleep(rtt_s)
+            return await upsert(**kwargs)
+
+        client.client.upsert = upsert_with_rtt
+        return client
+
+    results = {}
+
+    # Baseline: one upsert request per memory
+    client = client_with_rtt()
+    await client._ensure_collection()
+    start = time.perf_counter()
+    for m in memories:
+        await client.client.upsert(
+            collection_name=client.collection_name,
+            points=[PointStruct(id=m["id"], vector=m["embedding"], payload=m["metadata"])],
+        )
+    results["per-call upsert"] = time.perf_counter() - start
+    await client.close()
+
+    client = client_with_rtt()
+    start = time.perf_counter()
+    for m in memories:
+        await client.store_memory(m["id"], m["embedding"], m["metadata"])
+    await client.flush()
+    results["write-behind buffer"] = time.perf_counter() - start
+    assert await client.count_memories() == len(memories)
+    await client.close()
+
+    client = client_with_rtt()
+    start = time.perf_counter()
+    await client.store_many(memories)
+    results["store_many"] = time.perf_counter() - start
+    assert await client.count_memories() == len(memories)
+    await client.close()
+
+    return results
+
+
+@pytest.mark.asyncio
+async def test_write_throughput():
+    """Memories/s with no request latency and with a 1ms simulated round trip."""
+    memories = _memories(COUNT)
+
+    print("\n" + "=" * 60)
+    print(f"QDRANT WRITE THROUGHPUT ({COUNT} x {DIM}-d, in-memory)")
+    for rtt_ms in (0.0, 1.0):
+        results = await _run(memories, rtt_ms / 1000)
+        print("=" * 60)
+        print(f"request round trip: {rtt_ms:.0f} ms")
+        for name, elapsed in results.items():
+            print(f"{name:>20}: {COUNT / elapsed:>10.0f} memories/s ({elapsed * 1000:.0f} ms)")
+    print("=" * 60)
+
+    # In-process writes cost the same either way; batching removes round trips
+    assert results["store_many"] < results["per-call upsert"] / 2
+    assert results["write-behind buffer"] < results["per-call upsert"] / 2
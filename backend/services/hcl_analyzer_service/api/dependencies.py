@@ -12,6 +12,7 @@ from typing import Generator
 
 from ..config import Settings, get_settings
 from ..core.analyzer import SystemAnalyzer
+from ..core.ml_analyzer import MLSystemAnalyzer
 from ..utils.logging_config import get_logger, setup_logging
 
 logger = get_logger(__name__)
@@ -35,6 +36,20 @@ def get_analyzer() -> Generator[SystemAnalyzer, None, None]:
     yield analyzer
 
 
+@lru_cache()
+def get_ml_analyzer() -> MLSystemAnalyzer:
+    """
+    Get the shared ML System Analyzer.
+
+    Shared across requests because it keeps per-host forecast state.
+
+    Returns:
+        MLSystemAnalyzer instance
+    """
+    settings = get_cached_settings()
+    return MLSystemAnalyzer(settings.analyzer)
+
+
 def initialize_service() -> None:
     """Initialize service dependencies."""
     settings = get_cached_settings()
@@ -49,3 +64,10 @@ def initialize_service() -> None:
             "log_level": settings.service.log_level  # pylint: disable=no-member
         }
     )
+
+
+def shutdown_service() -> None:
+    """Release service dependencies."""
+    if get_ml_analyzer.cache_info().currsize:
+        get_ml_analyzer().close()
+        get_ml_analyzer.cache_clear()
@@ -10,8 +10,16 @@ from __future__ import annotations
 from fastapi import APIRouter, Depends, HTTPException
 
 from ..core.analyzer import SystemAnalyzer
-from ..models.analysis import AnalysisResult, SystemMetrics
-from .dependencies import get_analyzer
+from ..core.ml_analyzer import MLSystemAnalyzer
+from ..models.analysis import (
+    AnalysisResult,
+    BatchAnalysisRequest,
+    BatchAnalysisResult,
+    SystemMetrics,
+    TrainingRequest,
+    TrainingResult,
+)
+from .dependencies import get_analyzer, get_ml_analyzer
 
 router = APIRouter()
 
@@ -35,3 +43,61 @@ async def analyze_metrics(
         return await analyzer.analyze_metrics(metrics)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+@router.post("/analyze/batch", response_model=BatchAnalysisResult)
+async def analyze_batch(
+    request: BatchAnalysisRequest,
+    analyzer: MLSystemAnalyzer = Depends(get_ml_analyzer)
+) -> BatchAnalysisResult:
+    """
+    Analyze metrics for many hosts collected in the same interval.
+
+    Args:
+        request: Metrics snapshot per host id
+        analyzer: Shared ML analyzer instance
+
+    Returns:
+        Analysis result per host id
+    """
+    try:
+        results = await analyzer.analyze_batch(request.hosts)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+    return BatchAnalysisResult(
+        results={host_id: result.model_dump() for host_id, result in results.items()},
+        hosts_requiring_intervention=[
+            host_id for host_id, result in results.items() if result.requires_intervention
+        ],
+    )
+
+
+@router.post("/train", response_model=TrainingResult)
+async def train_ml_analyzer(
+    request: TrainingRequest,
+    analyzer: MLSystemAnalyzer = Depends(get_ml_analyzer)
+) -> TrainingResult:
+    """
+    Train the shared ML analyzer used by /analyze/batch.
+
+    Until this succeeds, batch analysis falls back to static thresholds.
+    Training runs on the event loop so it never overlaps a batch analysis.
+
+    Args:
+        request: Historical metrics in chronological order
+        analyzer: Shared ML analyzer instance
+
+    Returns:
+        Training outcome
+    """
+    try:
+        trained = analyzer.train(request.metrics)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+    return TrainingResult(
+        trained=trained,
+        data_points=len(request.metrics),
+        mode=analyzer.get_status()["mode"],
+    )
@@ -9,11 +9,13 @@ Architecture:
 1. HybridAnomalyDetector for anomaly detection
 2. Automatic model training from historical data
 3. Online learning for continuous adaptation
+4. Batched multi-host scoring with per-host forecast state
 """
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, List, Mapping, Optional
 
 from config import AnalyzerSettings
 from models.analysis import (
@@ -59,6 +61,9 @@ class MLSystemAnalyzer:
         "error_rate",
     ]
 
+    # Samples kept per host for trend identification
+    HOST_TREND_WINDOW = 10
+
     def __init__(
         self,
         settings: AnalyzerSettings,
@@ -87,6 +92,7 @@ class MLSystemAnalyzer:
         self._detector = HybridAnomalyDetector(config)
         self._trained = False
         self._metrics_history: List[SystemMetrics] = []
+        self._host_history: "OrderedDict[str, Deque[SystemMetrics]]" = OrderedDict()
 
         logger.info(
             "ml_analyzer_initialized",
@@ -173,31 +179,14 @@ class MLSystemAnalyzer:
             anomalies = self._detect_anomalies_static(metrics)
             ml_result = None
 
-        # Calculate health score
-        health_score = self._calculate_health_score(metrics, anomalies, ml_result)
-
-        # Identify trends
-        trends = self._identify_trends(metrics)
-
-        # Generate recommendations
-        recommendations = self._generate_recommendations(anomalies, ml_result)
-
-        requires_intervention = health_score < self.settings.anomaly_threshold
-
-        result = AnalysisResult(
-            overall_health_score=health_score,
-            anomalies=anomalies,
-            trends=trends,
-            recommendations=recommendations,
-            requires_intervention=requires_intervention,
-        )
+        result = self._build_result(metrics, anomalies, ml_result, self._metrics_history)
 
         logger.info(
             "ml_analysis_complete",
-            health_score=health_score,
+            health_score=result.overall_health_score,
             anomalies_count=len(anomalies),
             ml_detected=ml_result.is_anomaly if ml_result else None,
-            requires_intervention=requires_intervention,
+            requires_intervention=result.requires_intervention,
         )
 
         # Store for history
@@ -207,6 +196,93 @@ class MLSystemAnalyzer:
 
         return result
 
+    async def analyze_batch(
+        self,
+        host_metrics: Mapping[str, SystemMetrics],
+    ) -> Dict[str, AnalysisResult]:
+        """
+        Analyze metrics for many hosts in one pass.
+
+        Feature vectors are stacked into one matrix for a single Isolation
+        Forest pass, and each host is forecast from its own SARIMA state.
+
+        Args:
+            host_metrics: Current metrics per host id
+
+        Returns:
+            Analysis result per host id
+        """
+        host_ids = list(host_metrics)
+        samples = [host_metrics[host_id] for host_id in host_ids]
+
+        if self._trained and host_ids:
+            ml_results: List[Optional[HybridAnomalyResult]] = list(
+                self._detector.detect_and_update_batch(
+                    host_ids,
+                    [m.cpu_usage for m in samples],
+                    [self._extract_features(m) for m in samples],
+                )
+            )
+        else:
+            ml_results = [None] * len(host_ids)
+
+        results: Dict[str, AnalysisResult] = {}
+        for host_id, metrics, ml_result in zip(host_ids, samples, ml_results):
+            if ml_result is not None:
+                anomalies = self._convert_ml_anomalies(ml_result, metrics)
+            else:
+                anomalies = self._detect_anomalies_static(metrics)
+
+            history = self._host_trend_history(host_id)
+            results[host_id] = self._build_result(metrics, anomalies, ml_result, list(history))
+            history.append(metrics)
+
+        logger.info(
+            "ml_batch_analysis_complete",
+            hosts=len(host_ids),
+            ml_detected=sum(1 for r in ml_results if r is not None and r.is_anomaly),
+            requires_intervention=sum(1 for r in results.values() if r.requires_intervention),
+        )
+
+        return results
+
+    def _host_trend_history(self, host_id: str) -> Deque[SystemMetrics]:
+        """Recent samples of one host (least recently seen hosts are dropped)."""
+        history = self._host_history.get(host_id)
+        if history is None:
+            history = deque(maxlen=self.HOST_TREND_WINDOW)
+            self._host_history[host_id] = history
+            if len(self._host_history) > self._detector.config.max_hosts:
+                self._host_history.popitem(last=False)
+        else:
+            self._host_history.move_to_end(host_id)
+        return history
+
+    def _build_result(
+        self,
+        metrics: SystemMetrics,
+        anomalies: List[Anomaly],
+        ml_result: Optional[HybridAnomalyResult],
+        history: List[SystemMetrics],
+    ) -> AnalysisResult:
+        """Assemble the analysis result for one sample."""
+        # Calculate health score
+        health_score = self._calculate_health_score(metrics, anomalies, ml_result)
+
+        # Identify trends
+        trends = self._identify_trends(metrics, history)
+
+        # Generate recommendations
+        recommendations = self._generate_recommendations(anomalies, ml_result)
+
+        return AnalysisResult(
+            overall_health_score=health_score,
+            anomalies=anomalies,
+            trends=trends,
+            recommendations=recommendations,
+            requires_intervention=health_score < self.settings.anomaly_threshold,
+        )
+
     def _convert_ml_anomalies(
         self,
         ml_result: HybridAnomalyResult,
@@ -286,8 +362,15 @@ class MLSystemAnalyzer:
 
         return max(0.0, min(1.0, base_score))
 
-    def _identify_trends(self, metrics: SystemMetrics) -> Dict[str, Any]:
-        """Identify trends from metrics history."""
+    def _identify_trends(
+        self,
+        metrics: SystemMetrics,
+        history: Optional[List[SystemMetrics]] = None,
+    ) -> Dict[str, Any]:
+        """Identify trends from metrics history (default: the single-stream history)."""
+        if history is None:
+            history = self._metrics_history
+
         trends = {
             "cpu_trend": "stable",
             "memory_trend": "stable",
@@ -295,8 +378,8 @@ class MLSystemAnalyzer:
         }
 
         # Calculate trends if we have history
-        if len(self._metrics_history) >= 10:
-            recent = self._metrics_history[-10:]
+        if len(history) >= 10:
+            recent = history[-10:]
 
             # CPU trend
             cpu_values = [m.cpu_usage for m in recent]
@@ -374,6 +457,10 @@ class MLSystemAnalyzer:
             "threshold": str(self.settings.anomaly_threshold),
         }
 
+    def close(self) -> None:
+        """Release detector background resources (SARIMA refit worker)."""
+        self._detector.close()
+
     async def health_check(self) -> Dict[str, Any]:
         """Check analyzer health."""
         detector_health = await self._detector.health_check()
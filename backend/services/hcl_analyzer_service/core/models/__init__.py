@@ -10,9 +10,11 @@ from __future__ import annotations
 from .sarima_forecaster import SARIMAForecaster
 from .isolation_detector import IsolationAnomalyDetector
 from .hybrid_detector import HybridAnomalyDetector
+from .host_registry import SARIMAHostRegistry
 
 __all__ = [
     "SARIMAForecaster",
     "IsolationAnomalyDetector",
     "HybridAnomalyDetector",
+    "SARIMAHostRegistry",
 ]
@@ -0,0 +1,211 @@
+"""
+SARIMA Host Registry - Per-Host Forecast State
+==============================================
+
+Keeps one SARIMA filter state per host on top of a single fitted
+SARIMAForecaster. All hosts share the model parameters; each host's state
+is advanced with its own observations, so forecasts follow the host rather
+than the series the model was trained on.
+
+A batch of hosts is forecast and updated with one matrix product over the
+stacked state vectors instead of one statsmodels call per host.
+
+A host seen for the first time is seeded from its own first observation:
+the shared state is shifted along a persistent level direction until its
+forecast equals that observation, and the sample is not scored.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .sarima_forecaster import FilterKernel, SARIMAForecaster
+
+logger = logging.getLogger(__name__)
+
+# Hosts kept before the least recently seen are evicted
+DEFAULT_MAX_HOSTS = 10000
+
+
+class SARIMAHostRegistry:
+    """
+    Registry of per-host SARIMA filter states, keyed by host id.
+
+    New hosts start from the forecaster's current state moved to the level of
+    their first observation, which scores as not anomalous. Hosts not seen
+    for the longest time are dropped once max_hosts is exceeded. States carry
+    over when the forecaster is re-fitted.
+
+    Example:
+        >>> registry = SARIMAHostRegistry(forecaster)
+        >>> expected, deviation, anomalous = registry.score(["web-1", "web-2"], [55.0, 91.0], 2.5)
+        >>> registry.update(["web-1", "web-2"], [55.0, 91.0])
+    """
+
+    def __init__(self, forecaster: SARIMAForecaster, max_hosts: int = DEFAULT_MAX_HOSTS):
+        """
+        Initialize registry.
+
+        Args:
+            forecaster: Fitted forecaster whose parameters all hosts share
+            max_hosts: Maximum number of host states kept
+        """
+        self._forecaster = forecaster
+        self.max_hosts = max_hosts
+        self._states: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._kernel: Optional[FilterKernel] = None
+        self._kernel_version: Any = None
+        self._level_shift: Optional[np.ndarray] = None
+        self.stats: Dict[str, int] = {
+            "batches": 0,
+            "observations": 0,
+            "hosts_created": 0,
+            "hosts_evicted": 0,
+        }
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def __contains__(self, host_id: object) -> bool:
+        return host_id in self._states
+
+    def score(
+        self,
+        host_ids: Sequence[str],
+        values: Sequence[float],
+        threshold_sigma: float,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Compare each host's value with its one-step forecast.
+
+        A new host's value seeds its state instead: it is its own expected
+        value, with zero deviation.
+
+        Args:
+            host_ids: Unique host ids
+            values: Observed value per host
+            threshold_sigma: Deviation (in residual std) above which a value is anomalous
+
+        Returns:
+            Tuple of (expected values, deviation scores, anomaly flags)
+        """
+        kernel = self._current_kernel()
+        observed = np.asarray(values, dtype=float)
+        states, seeded = self._gather(host_ids, kernel, observed)
+
+        expected = states @ kernel.design + kernel.obs_intercept
+        if kernel.residuals_std > 0:
+            deviation = np.abs(observed - expected) / kernel.residuals_std
+        else:
+            deviation = np.zeros_like(observed)
+        deviation[seeded] = 0.0
+        return expected, deviation, deviation > threshold_sigma
+
+    def update(self, host_ids: Sequence[str], values: Sequence[float]) -> None:
+        """
+        Filter one new observation per host into its state.
+
+        Args:
+            host_ids: Unique host ids
+            values: Observed value per host
+        """
+        kernel = self._current_kernel()
+        observed = np.asarray(values, dtype=float)
+        states, _ = self._gather(host_ids, kernel, observed)
+
+        innovation = observed - (states @ kernel.design + kernel.obs_intercept)
+        filtered = states + np.outer(innovation, kernel.gain)
+        predicted = filtered @ kernel.transition.T + kernel.state_intercept
+
+        for host_id, state in zip(host_ids, predicted):
+            self._states[host_id] = state
+        self.stats["batches"] += 1
+        self.stats["observations"] += len(host_ids)
+
+    def forget(self, host_id: str) -> None:
+        """Drop a host's state (its next observation seeds a new one)."""
+        self._states.pop(host_id, None)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get registry statistics."""
+        return {**self.stats, "hosts": len(self._states)}
+
+    def _current_kernel(self) -> FilterKernel:
+        """Filter kernel for the forecaster's current parameters."""
+        version = self._forecaster.fit_version
+        if self._kernel is None or version != self._kernel_version:
+            self._kernel = self._forecaster.get_filter_kernel()
+            self._kernel_version = version
+            self._level_shift = self._level_shift_direction(self._kernel)
+        return self._kernel
+
+    @staticmethod
+    def _level_shift_direction(kernel: FilterKernel) -> np.ndarray:
+        """
+        State direction that moves every future forecast by one unit.
+
+        Solves transition @ v = v with design @ v = 1 (a level the model
+        carries forward, e.g. the integrated state of a differenced model).
+        Models without such a level fall back to the Kalman gain direction,
+        which moves only the next forecast.
+        """
+        k_states = kernel.initial_state.shape[0]
+        system = np.vstack([kernel.transition - np.eye(k_states), kernel.design])
+        target = np.zeros(k_states + 1)
+        target[-1] = 1.0
+        direction = np.linalg.lstsq(system, target, rcond=None)[0]
+        if np.allclose(system @ direction, target, atol=1e-8):
+            return direction
+
+        scale = float(kernel.design @ kernel.gain)
+        if scale != 0.0:
+            return kernel.gain / scale
+        return np.zeros(k_states)
+
+    def _gather(
+        self,
+        host_ids: Sequence[str],
+        kernel: FilterKernel,
+        observed: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Stack host states into one (n_hosts, k_states) matrix.
+
+        Hosts without a usable state are seeded from their observed value.
+
+        Returns:
+            Tuple of (states, mask of hosts seeded in this call)
+        """
+        if len(set(host_ids)) != len(host_ids):
+            raise ValueError("Host ids in a batch must be unique")
+
+        k_states = kernel.initial_state.shape[0]
+        initial_forecast = float(kernel.initial_state @ kernel.design + kernel.obs_intercept)
+        seeded = np.zeros(len(host_ids), dtype=bool)
+        rows: List[np.ndarray] = []
+        for index, host_id in enumerate(host_ids):
+            state = self._states.get(host_id)
+            if state is None or state.shape[0] != k_states:
+                # New host, or the model structure changed since it was seen:
+                # start at the level of its own observation
+                offset = observed[index] - initial_forecast
+                state = kernel.initial_state + offset * self._level_shift
+                if host_id not in self._states:
+                    self.stats["hosts_created"] += 1
+                self._states[host_id] = state
+                seeded[index] = True
+            self._states.move_to_end(host_id)
+            rows.append(state)
+
+        while len(self._states) > self.max_hosts:
+            evicted, _ = self._states.popitem(last=False)
+            self.stats["hosts_evicted"] += 1
+            logger.debug("host_state_evicted", extra={"host_id": evicted})
+
+        if not rows:
+            return np.empty((0, k_states)), seeded
+        return np.vstack(rows), seeded
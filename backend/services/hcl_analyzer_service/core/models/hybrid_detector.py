@@ -26,7 +26,8 @@ from enum import Enum
 import numpy as np
 
 from .sarima_forecaster import SARIMAForecaster, SARIMAConfig
-from .isolation_detector import IsolationAnomalyDetector, IsolationConfig
+from .isolation_detector import AnomalyResult, IsolationAnomalyDetector, IsolationConfig
+from .host_registry import DEFAULT_MAX_HOSTS, SARIMAHostRegistry
 
 logger = logging.getLogger(__name__)
 
@@ -67,6 +68,9 @@ class HybridConfig:  # pylint: disable=too-many-instance-attributes
         default_factory=lambda: ["cpu_usage", "memory_usage", "error_rate", "latency_ms"]
     )
 
+    # Per-host SARIMA states kept for batch detection
+    max_hosts: int = DEFAULT_MAX_HOSTS
+
 
 @dataclass
 class HybridAnomalyResult:  # pylint: disable=too-many-instance-attributes
@@ -132,6 +136,8 @@ class HybridAnomalyDetector:
         if self.config.feature_names:
             self._isolation.config.feature_names = self.config.feature_names
 
+        self._hosts = SARIMAHostRegistry(self._sarima, max_hosts=self.config.max_hosts)
+
         self._fitted = False
         self._detection_history: List[HybridAnomalyResult] = []
 
@@ -206,6 +212,62 @@ class HybridAnomalyDetector:
 
         # Isolation Forest detection
         iso_result = self._isolation.detect(feature_vector)
+
+        return self._combine(result, iso_result, feature_vector)
+
+    def detect_batch(
+        self,
+        host_ids: List[str],
+        time_series_values: List[float],
+        feature_vectors: List[List[float]],
+    ) -> List[HybridAnomalyResult]:
+        """
+        Detect anomalies for many hosts at once.
+
+        SARIMA uses each host's own filter state (see SARIMAHostRegistry);
+        a host's first value seeds that state and gets no SARIMA score. The
+        Isolation Forest scores all feature vectors in one pass.
+
+        Args:
+            host_ids: Unique host ids
+            time_series_values: Current SARIMA value per host
+            feature_vectors: Current feature vector per host
+
+        Returns:
+            One HybridAnomalyResult per host, in input order
+        """
+        if not len(host_ids) == len(time_series_values) == len(feature_vectors):
+            raise ValueError("host_ids, time_series_values and feature_vectors differ in length")
+
+        timestamp = datetime.utcnow()
+        expected, deviations, sarima_flags = self._hosts.score(
+            host_ids,
+            time_series_values,
+            threshold_sigma=self.config.sarima_sigma_threshold,
+        )
+        iso_results = self._isolation.detect_batch(feature_vectors)
+
+        results = []
+        for index, feature_vector in enumerate(feature_vectors):
+            result = HybridAnomalyResult(
+                timestamp=timestamp,
+                sarima_anomaly=bool(sarima_flags[index]),
+                sarima_score=float(deviations[index]),
+                sarima_expected=float(expected[index]),
+            )
+            results.append(self._combine(result, iso_results[index], feature_vector))
+        return results
+
+    def _combine(
+        self,
+        result: HybridAnomalyResult,
+        iso_result: AnomalyResult,
+        feature_vector: List[float],
+    ) -> HybridAnomalyResult:
+        """Merge the Isolation Forest result into a result with SARIMA fields set."""
+        sarima_is_anomaly = result.sarima_anomaly
+        sarima_deviation = result.sarima_score
+
         result.isolation_anomaly = iso_result.is_anomaly
         result.isolation_score = iso_result.anomaly_score
         result.feature_contributions = iso_result.feature_contributions
@@ -346,6 +408,51 @@ class HybridAnomalyDetector:
         self.update(time_series_value, feature_vector)
         return result
 
+    def update_batch(
+        self,
+        host_ids: List[str],
+        time_series_values: List[float],
+        feature_vectors: List[List[float]],
+    ) -> None:
+        """
+        Update per-host SARIMA states and the Isolation Forest with a batch.
+
+        The shared SARIMA model is not re-fitted from host data: its
+        training series and the per-host series are kept apart.
+
+        Args:
+            host_ids: Unique host ids
+            time_series_values: New SARIMA value per host
+            feature_vectors: New feature vector per host
+        """
+        self._hosts.update(host_ids, time_series_values)
+        self._isolation.update_batch(feature_vectors)
+
+    def detect_and_update_batch(
+        self,
+        host_ids: List[str],
+        time_series_values: List[float],
+        feature_vectors: List[List[float]],
+    ) -> List[HybridAnomalyResult]:
+        """
+        Detect anomalies for a batch of hosts and update models in one call.
+
+        Args:
+            host_ids: Unique host ids
+            time_series_values: Current value per host
+            feature_vectors: Current features per host
+
+        Returns:
+            Detection results in input order
+        """
+        results = self.detect_batch(host_ids, time_series_values, feature_vectors)
+        self.update_batch(host_ids, time_series_values, feature_vectors)
+        return results
+
+    def close(self) -> None:
+        """Release background resources (SARIMA refit worker)."""
+        self._sarima.close()
+
     def get_statistics(self) -> Dict[str, Any]:
         """Get detection statistics."""
         if not self._detection_history:
@@ -388,6 +495,7 @@ class HybridAnomalyDetector:
             },
             "sarima_diagnostics": self._sarima.get_diagnostics(),
             "isolation_diagnostics": self._isolation.get_diagnostics(),
+            "host_registry": self._hosts.get_stats(),
             "detection_statistics": self.get_statistics(),
         }
 
@@ -5,6 +5,11 @@ SARIMA Forecaster - Time Series Prediction
 Implements SARIMA (Seasonal ARIMA) for time series forecasting.
 Used to predict expected values and detect deviations.
 
+Online mode: each new observation is filtered into the fitted state-space
+results (Kalman filter extend, no re-optimization). Full re-fits run in a
+background process and are swapped in when done, with the observations that
+arrived meanwhile filtered on top.
+
 Based on:
 - SARIMA-LSTM Hybrid research (2025)
 - Statsmodels SARIMAX implementation
@@ -13,6 +18,10 @@ Based on:
 from __future__ import annotations
 
 import logging
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
 from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -36,6 +45,26 @@ class ForecastResult:  # pylint: disable=too-many-instance-attributes
     residuals_std: Optional[float] = None
 
 
+@dataclass
+class FilterKernel:  # pylint: disable=too-many-instance-attributes
+    """
+    Fixed-gain Kalman filter step for one scalar series.
+
+    Extracted from a fitted model so that many independent series (hosts)
+    sharing its parameters can be forecast and updated with matrix products.
+    The gain is taken from the model's final (converged) state covariance,
+    which does not depend on the observed values.
+    """
+
+    design: np.ndarray  # (k_states,) maps state to the one-step forecast
+    obs_intercept: float
+    transition: np.ndarray  # (k_states, k_states)
+    state_intercept: np.ndarray  # (k_states,)
+    gain: np.ndarray  # (k_states,) Kalman gain for the filtered state
+    initial_state: np.ndarray  # (k_states,) predicted state for a new series
+    residuals_std: float
+
+
 @dataclass
 class SARIMAConfig:  # pylint: disable=too-many-instance-attributes
     """Configuration for SARIMA model."""
@@ -61,6 +90,45 @@ class SARIMAConfig:  # pylint: disable=too-many-instance-attributes
     confidence_level: float = 0.95
     min_observations: int = 50
 
+    # Online update parameters
+    refit_interval: int = 100  # Observations between full re-fits
+    online_updates: bool = True  # Filter new observations into fitted state
+    background_refit: bool = True  # Re-fit in a worker process, not inline
+
+
+def _build_model(data: List[float], config: SARIMAConfig) -> Any:
+    """Create an (unfitted) SARIMAX model for data."""
+    # pylint: disable=import-outside-toplevel
+    from statsmodels.tsa.statespace.sarimax import SARIMAX
+
+    return SARIMAX(
+        data,
+        order=(config.p, config.d, config.q),
+        seasonal_order=(config.P, config.D, config.Q, config.s),
+        enforce_stationarity=config.enforce_stationarity,
+        enforce_invertibility=config.enforce_invertibility,
+    )
+
+
+def _fit_params(data: List[float], config: SARIMAConfig) -> Dict[str, Any]:
+    """
+    Run the full SARIMAX optimization (executed in a worker process).
+
+    Returns only the small results the parent needs to rebuild the
+    state-space results: parameters, information criteria, residual std.
+    """
+    fitted = _build_model(data, config).fit(
+        maxiter=config.max_iter,
+        method=config.method,
+        disp=False,
+    )
+    return {
+        "params": np.asarray(fitted.params),
+        "aic": float(fitted.aic),
+        "bic": float(fitted.bic),
+        "residuals_std": float(np.std(fitted.resid)),
+    }
+
 
 class SARIMAForecaster:  # pylint: disable=too-many-instance-attributes
     """
@@ -89,6 +157,28 @@ class SARIMAForecaster:  # pylint: disable=too-many-instance-attributes
         self._residuals_std: float = 1.0
         self._simple_mean: float = 0.0
         self._simple_trend: float = 0.0
+        self._aic: Optional[float] = None
+        self._bic: Optional[float] = None
+
+        # Online state: guards history and fitted results against the refit swap
+        self._lock = threading.Lock()
+        self._fit_generation = 0
+        self._fitted_length = 0
+        self._fitted_at: Optional[float] = None
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._refit_future: Optional[Future] = None
+        self._refit_idle = threading.Event()
+        self._refit_idle.set()
+        self._refit_metrics: Dict[str, Any] = {
+            "online_updates": 0,
+            "online_update_failures": 0,
+            "refits_started": 0,
+            "refits_completed": 0,
+            "refits_failed": 0,
+            "refits_skipped": 0,
+            "last_refit_duration_seconds": None,
+            "total_refit_duration_seconds": 0.0,
+        }
 
         logger.info(
             "sarima_forecaster_initialized",
@@ -124,24 +214,13 @@ class SARIMAForecaster:  # pylint: disable=too-many-instance-attributes
             return False
 
         self._history = list(data)
+        with self._lock:
+            # Any background refit in flight was started on older data
+            self._fit_generation += 1
 
         try:
-            # pylint: disable=import-outside-toplevel
             # Try to import statsmodels (optional dependency)
-            from statsmodels.tsa.statespace.sarimax import SARIMAX
-
-            self._model = SARIMAX(
-                data,
-                order=(self.config.p, self.config.d, self.config.q),
-                seasonal_order=(
-                    self.config.P,
-                    self.config.D,
-                    self.config.Q,
-                    self.config.s,
-                ),
-                enforce_stationarity=self.config.enforce_stationarity,
-                enforce_invertibility=self.config.enforce_invertibility,
-            )
+            self._model = _build_model(data, self.config)
 
             self._fitted_model = self._model.fit(
                 maxiter=self.config.max_iter,
@@ -152,6 +231,10 @@ class SARIMAForecaster:  # pylint: disable=too-many-instance-attributes
             # Calculate residuals std for anomaly detection
             residuals = self._fitted_model.resid
             self._residuals_std = float(np.std(residuals))
+            self._aic = self._fitted_model.aic
+            self._bic = self._fitted_model.bic
+            self._fitted_length = len(data)
+            self._fitted_at = time.monotonic()
 
             # Also set simple stats as backup
             self._simple_mean = float(np.mean(data))
@@ -231,18 +314,22 @@ class SARIMAForecaster:  # pylint: disable=too-many-instance-attributes
         """
         result = ForecastResult(forecast_horizon=steps)
 
-        if self._fitted_model is not None:
+        fitted_model = self._fitted_model
+        if fitted_model is not None:
             try:
-                forecast = self._fitted_model.get_forecast(steps=steps)
-                mean = forecast.predicted_mean.tolist()
-                conf_int = forecast.conf_int(alpha=1 - self.config.confidence_level)
+                forecast = fitted_model.get_forecast(steps=steps)
+                mean = np.asarray(forecast.predicted_mean).tolist()
+                # ndarray for list input, DataFrame for pandas input
+                conf_int = np.asarray(forecast.conf_int(alpha=1 - self.config.confidence_level))
 
                 result.predicted_values = mean
-                result.confidence_lower = conf_int.iloc[:, 0].tolist()
-                result.confidence_upper = conf_int.iloc[:, 1].tolist()
+                result.confidence_lower = conf_int[:, 0].tolist()
+                result.confidence_upper = conf_int[:, 1].tolist()
                 result.model_fitted = True
-                result.aic = self._fitted_model.aic
-                result.bic = self._fitted_model.bic
+                # Extended results only cover the new observations, so report
+                # the information criteria of the last full fit
+                result.aic = self._aic if self._aic is not None else fitted_model.aic
+                result.bic = self._bic if self._bic is not None else fitted_model.bic
                 result.residuals_std = self._residuals_std
 
                 return result
@@ -330,15 +417,205 @@ class SARIMAForecaster:  # pylint: disable=too-many-instance-attributes
         """
         Update model with new observation (online learning).
 
+        With a fitted SARIMAX model the observation is filtered into the
+        current state (no re-optimization) and every refit_interval
+        observations a full re-fit is started in a background process.
+        Otherwise the model is re-fitted inline, as before.
+
         Args:
             new_value: New observed value
         """
-        self._history.append(new_value)
+        with self._lock:
+            self._history.append(new_value)
+            if self.config.online_updates and self._fitted_model is not None:
+                self._extend_state([new_value])
 
         # Refit periodically or when history grows significantly
-        if len(self._history) % 100 == 0:
-            logger.info("refitting_sarima", extra={"history_length": len(self._history)})
-            self.fit(self._history)
+        if len(self._history) % self.config.refit_interval == 0:
+            if self.config.background_refit and self._fitted_model is not None:
+                self._start_background_refit()
+            else:
+                logger.info("refitting_sarima", extra={"history_length": len(self._history)})
+                self.fit(self._history)
+
+    def _extend_state(self, values: List[float]) -> None:
+        """Filter values into the fitted results (caller holds the lock)."""
+        try:
+            self._fitted_model = self._fitted_model.extend(values)
+            self._refit_metrics["online_updates"] += len(values)
+        except (ValueError, RuntimeError, AttributeError, np.linalg.LinAlgError) as exc:
+            # Keep forecasting from the last good state until the next refit
+            self._refit_metrics["online_update_failures"] += 1
+            logger.error("sarima_online_update_failed", extra={"error": str(exc)})
+
+    def _start_background_refit(self) -> None:
+        """Submit a full re-fit of the current history to the worker process."""
+        if self._refit_future is not None and not self._refit_future.done():
+            self._refit_metrics["refits_skipped"] += 1
+            return
+
+        if self._executor is None:
+            # Spawned, not forked: the service process runs threads
+            self._executor = ProcessPoolExecutor(
+                max_workers=1,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+        with self._lock:
+            data = list(self._history)
+            generation = self._fit_generation
+
+        self._refit_metrics["refits_started"] += 1
+        self._refit_idle.clear()
+        started = time.monotonic()
+        logger.info("refitting_sarima_background", extra={"history_length": len(data)})
+
+        future = self._executor.submit(_fit_params, data, self.config)
+        future.add_done_callback(
+            lambda done: self._install_refit(done, data, generation, started)
+        )
+        self._refit_future = future
+
+    def _install_refit(
+        self,
+        future: Future,
+        data: List[float],
+        generation: int,
+        started: float,
+    ) -> None:
+        """Swap in a finished background fit (runs on the executor's thread)."""
+        try:
+            fit = future.result()
+            # Rebuild the state-space results from the new parameters; a single
+            # filter pass, no optimization
+            fitted_model = _build_model(data, self.config).filter(fit["params"])
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            # Worker errors (optimizer failure, crashed process, shutdown)
+            self._refit_metrics["refits_failed"] += 1
+            logger.error("sarima_background_refit_failed", extra={"error": str(exc)})
+            self._refit_idle.set()
+            return
+
+        with self._lock:
+            if generation != self._fit_generation:
+                # fit() was called meanwhile; its model is newer
+                self._refit_idle.set()
+                return
+
+            catch_up = self._history[len(data):]
+            if catch_up:
+                try:
+                    fitted_model = fitted_model.extend(catch_up)
+                except (ValueError, RuntimeError, AttributeError, np.linalg.LinAlgError) as exc:
+                    self._refit_metrics["refits_failed"] += 1
+                    logger.error("sarima_background_refit_failed", extra={"error": str(exc)})
+                    self._refit_idle.set()
+                    return
+
+            self._fitted_model = fitted_model
+            self._residuals_std = fit["residuals_std"]
+            self._aic = fit["aic"]
+            self._bic = fit["bic"]
+            self._fitted_length = len(data)
+            self._fitted_at = time.monotonic()
+            self._last_fit_time = datetime.utcnow()
+
+        duration = time.monotonic() - started
+        self._refit_metrics["refits_completed"] += 1
+        self._refit_metrics["last_refit_duration_seconds"] = duration
+        self._refit_metrics["total_refit_duration_seconds"] += duration
+        logger.info(
+            "sarima_background_refit_installed",
+            extra={
+                "duration_seconds": duration,
+                "caught_up_observations": len(catch_up),
+                "aic": fit["aic"],
+            },
+        )
+        self._refit_idle.set()
+
+    @property
+    def fit_version(self) -> Tuple[Optional[float], Optional[datetime]]:
+        """Changes whenever new parameters are installed (not on online updates)."""
+        return (self._fitted_at, self._last_fit_time)
+
+    def get_filter_kernel(self) -> FilterKernel:
+        """
+        Get a fixed-gain filter step equivalent to the current model.
+
+        With a fitted SARIMAX model the kernel comes from its state-space
+        matrices and final state; otherwise it reproduces the simple model
+        (forecast = last value + trend).
+
+        Returns:
+            FilterKernel for per-series forecasting and updates
+        """
+        fitted_model = self._fitted_model
+        if fitted_model is not None:
+            try:
+                filtered = fitted_model.filter_results
+                design = np.asarray(filtered.design[0, :, 0], dtype=float)
+                covariance = np.asarray(fitted_model.predicted_state_cov[:, :, -1], dtype=float)
+                variance = float(design @ covariance @ design + filtered.obs_cov[0, 0, 0])
+                if variance > 0:
+                    return FilterKernel(
+                        design=design,
+                        obs_intercept=float(filtered.obs_intercept[0, 0]),
+                        transition=np.asarray(filtered.transition[:, :, 0], dtype=float),
+                        state_intercept=np.asarray(filtered.state_intercept[:, 0], dtype=float),
+                        gain=covariance @ design / variance,
+                        initial_state=np.asarray(fitted_model.predicted_state[:, -1], dtype=float),
+                        residuals_std=self._residuals_std,
+                    )
+            except (AttributeError, IndexError, TypeError, ValueError) as exc:
+                logger.error("sarima_filter_kernel_failed", extra={"error": str(exc)})
+
+        # Simple model: the state is the next expected value
+        initial = self._history[-1] + self._simple_trend if self._history else 0.0
+        return FilterKernel(
+            design=np.ones(1),
+            obs_intercept=0.0,
+            transition=np.ones((1, 1)),
+            state_intercept=np.array([self._simple_trend]),
+            gain=np.ones(1),
+            initial_state=np.array([initial]),
+            residuals_std=self._residuals_std,
+        )
+
+    def wait_for_refit(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until no background refit is in flight.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if idle, False on timeout
+        """
+        return self._refit_idle.wait(timeout)
+
+    def get_refit_metrics(self) -> Dict[str, Any]:
+        """Get online update and background refit metrics, including staleness."""
+        completed = self._refit_metrics["refits_completed"]
+        metrics = dict(self._refit_metrics)
+        metrics["avg_refit_duration_seconds"] = (
+            metrics["total_refit_duration_seconds"] / completed if completed else None
+        )
+        metrics["refit_in_progress"] = not self._refit_idle.is_set()
+        # Staleness: how far the current parameters lag behind the data
+        metrics["observations_since_fit"] = (
+            len(self._history) - self._fitted_length if self._fitted_at is not None else None
+        )
+        metrics["seconds_since_fit"] = (
+            time.monotonic() - self._fitted_at if self._fitted_at is not None else None
+        )
+        return metrics
+
+    def close(self) -> None:
+        """Stop the background refit worker (a pending refit is abandoned)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
 
     def get_diagnostics(self) -> Dict[str, Any]:
         """Get model diagnostics."""
@@ -362,8 +639,10 @@ class SARIMAForecaster:  # pylint: disable=too-many-instance-attributes
         }
 
         if self._fitted_model is not None:
-            diagnostics["aic"] = self._fitted_model.aic
-            diagnostics["bic"] = self._fitted_model.bic
+            diagnostics["aic"] = self._aic if self._aic is not None else self._fitted_model.aic
+            diagnostics["bic"] = self._bic if self._bic is not None else self._fitted_model.bic
+
+        diagnostics["refit"] = self.get_refit_metrics()
 
         return diagnostics
 
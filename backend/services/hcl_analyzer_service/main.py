@@ -15,7 +15,7 @@ from fastapi.responses import PlainTextResponse
 
 from .config import get_settings
 from .api.routes import router as api_router
-from .api.dependencies import initialize_service
+from .api.dependencies import initialize_service, shutdown_service
 
 # Initialize settings
 settings = get_settings()
@@ -36,6 +36,12 @@ async def startup_event() -> None:
     initialize_service()
 
 
+@app.on_event("shutdown")
+async def shutdown_event() -> None:
+    """Release service resources on shutdown."""
+    shutdown_service()
+
+
 @app.get("/health")
 async def health() -> Dict[str, Any]:
     """
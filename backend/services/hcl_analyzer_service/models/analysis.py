@@ -86,3 +86,55 @@ class SystemMetrics(BaseModel):
     avg_latency_ms: float
     error_rate: float
     service_status: Dict[str, str]
+
+
+class BatchAnalysisRequest(BaseModel):
+    """
+    Metrics for many hosts collected in the same interval.
+
+    Attributes:
+        hosts: Metrics snapshot per host id.
+    """
+
+    hosts: Dict[str, SystemMetrics]
+
+
+class BatchAnalysisResult(BaseModel):
+    """
+    Per-host analysis of a batch of metrics.
+
+    Attributes:
+        timestamp: ISO formatted timestamp of the analysis.
+        results: Analysis result per host id.
+        hosts_requiring_intervention: Host ids whose analysis requires intervention.
+    """
+
+    timestamp: str = Field(default_factory=lambda: datetime.now().isoformat())
+    results: Dict[str, AnalysisResult]
+    hosts_requiring_intervention: List[str]
+
+
+class TrainingRequest(BaseModel):
+    """
+    Historical metrics used to train the ML analyzer.
+
+    Attributes:
+        metrics: Metrics snapshots in chronological order.
+    """
+
+    metrics: List[SystemMetrics]
+
+
+class TrainingResult(BaseModel):
+    """
+    Outcome of an ML analyzer training run.
+
+    Attributes:
+        trained: True if the analyzer now uses ML detection.
+        data_points: Number of samples the models were trained on.
+        mode: Analyzer mode after training (ml_hybrid or static_fallback).
+    """
+
+    trained: bool
+    data_points: int
+    mode: str
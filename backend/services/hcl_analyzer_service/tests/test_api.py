@@ -6,6 +6,7 @@ from __future__ import annotations
 
 from datetime import datetime
 from unittest.mock import AsyncMock
+import numpy as np
 import pytest
 from fastapi.testclient import TestClient
 from backend.services.hcl_analyzer_service.main import app
@@ -59,3 +60,87 @@ async def test_analyze_endpoint() -> None:
     assert response.status_code == 200
     data = response.json()
     assert data["overall_health_score"] == 0.9
+
+
+def test_analyze_batch_endpoint() -> None:
+    """Test batch analyze endpoint with the untrained (static) ML analyzer."""
+    from backend.services.hcl_analyzer_service.api.dependencies import get_ml_analyzer  # pylint: disable=import-outside-toplevel
+    from backend.services.hcl_analyzer_service.config import AnalyzerSettings  # pylint: disable=import-outside-toplevel
+    from backend.services.hcl_analyzer_service.core.ml_analyzer import MLSystemAnalyzer  # pylint: disable=import-outside-toplevel
+
+    analyzer = MLSystemAnalyzer(AnalyzerSettings())
+    app.dependency_overrides[get_ml_analyzer] = lambda: analyzer
+
+    def payload(cpu: float) -> dict:
+        return {
+            "timestamp": datetime.now().isoformat(),
+            "cpu_usage": cpu,
+            "memory_usage": 60.0,
+            "disk_io_rate": 1000.0,
+            "network_io_rate": 2000.0,
+            "avg_latency_ms": 100.0,
+            "error_rate": 0.01,
+            "service_status": {"db": "up"}
+        }
+
+    try:
+        response = client.post(
+            "/v1/analyze/batch",
+            json={"hosts": {"web-1": payload(40.0), "web-2": payload(99.0)}},
+        )
+    finally:
+        app.dependency_overrides.pop(get_ml_analyzer)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert set(data["results"]) == {"web-1", "web-2"}
+    assert data["results"]["web-1"]["anomalies"] == []
+    assert data["results"]["web-2"]["anomalies"][0]["metric_name"] == "cpu_usage"
+
+
+def test_train_enables_ml_batch_analysis() -> None:
+    """Test that /train switches batch analysis to the ML detector."""
+    from backend.services.hcl_analyzer_service.api.dependencies import get_ml_analyzer  # pylint: disable=import-outside-toplevel
+    from backend.services.hcl_analyzer_service.config import AnalyzerSettings  # pylint: disable=import-outside-toplevel
+    from backend.services.hcl_analyzer_service.core.ml_analyzer import MLSystemAnalyzer  # pylint: disable=import-outside-toplevel
+
+    analyzer = MLSystemAnalyzer(AnalyzerSettings())
+    app.dependency_overrides[get_ml_analyzer] = lambda: analyzer
+    rng = np.random.default_rng(42)
+
+    def payload(cpu: float, memory: float = 50.0, latency: float = 100.0) -> dict:
+        return {
+            "timestamp": datetime.now().isoformat(),
+            "cpu_usage": cpu,
+            "memory_usage": memory,
+            "disk_io_rate": 1000.0,
+            "network_io_rate": 5000.0,
+            "avg_latency_ms": latency,
+            "error_rate": 0.01,
+            "service_status": {"db": "up"}
+        }
+
+    history = [
+        payload(50 + rng.normal() * 10, 50 + rng.normal() * 10, 100 + rng.normal() * 20)
+        for _ in range(100)
+    ]
+
+    try:
+        trained = client.post("/v1/train", json={"metrics": history})
+        # A host's first sample only seeds its SARIMA state
+        client.post("/v1/analyze/batch", json={"hosts": {"web-1": payload(50.0), "db-1": payload(50.0)}})
+        response = client.post(
+            "/v1/analyze/batch",
+            json={"hosts": {"web-1": payload(52.0), "db-1": payload(200.0, 200.0, 2000.0)}},
+        )
+    finally:
+        app.dependency_overrides.pop(get_ml_analyzer)
+        analyzer.close()
+
+    assert trained.status_code == 200
+    assert trained.json() == {"trained": True, "data_points": 100, "mode": "ml_hybrid"}
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert results["web-1"]["overall_health_score"] > results["db-1"]["overall_health_score"]
+    assert analyzer.get_statistics()["detector_stats"]["total_detections"] == 4
@@ -4,6 +4,9 @@ Tests for Hybrid Anomaly Detector (SARIMA + Isolation Forest).
 
 from __future__ import annotations
 
+import time
+from unittest.mock import patch
+
 import pytest
 import numpy as np
 from datetime import datetime
@@ -20,6 +23,7 @@ from core.models.hybrid_detector import (
     HybridAnomalyResult,
     AnomalySource,
 )
+from core.models.host_registry import SARIMAHostRegistry
 
 
 class TestSARIMAForecaster:
@@ -140,6 +144,112 @@ class TestSARIMAForecaster:
         assert health["healthy"] is True
 
 
+class TestSARIMAOnlineUpdates:
+    """Tests for Kalman-filter updates and background refits (needs statsmodels)."""
+
+    @staticmethod
+    def _series(n: int, seed: int = 0) -> list:
+        rng = np.random.default_rng(seed)
+        t = np.arange(n)
+        return list(50 + 10 * np.sin(2 * np.pi * t / 12) + rng.normal(0, 1, n))
+
+    @pytest.fixture
+    def forecaster(self):
+        pytest.importorskip("statsmodels")
+        config = SARIMAConfig(s=12, refit_interval=1000)
+        forecaster = SARIMAForecaster(config)
+        yield forecaster
+        forecaster.close()
+
+    def test_update_filters_without_refit(self, forecaster):
+        """Test that update extends the state, matching a full filter pass."""
+        data = self._series(200)
+        assert forecaster.fit(data[:150])
+        params = forecaster._fitted_model.params
+
+        for value in data[150:]:
+            forecaster.update(value)
+
+        reference = forecaster._fitted_model.model.clone(data).filter(params)
+        assert forecaster.predict(steps=1).predicted_values[0] == pytest.approx(
+            reference.get_forecast(steps=1).predicted_mean[0]
+        )
+        metrics = forecaster.get_refit_metrics()
+        assert metrics["online_updates"] == 50
+        assert metrics["refits_started"] == 0
+        assert metrics["observations_since_fit"] == 50
+
+    def test_background_refit_hot_swaps(self, forecaster):
+        """Test that a background refit is installed with later observations caught up."""
+        forecaster.config.refit_interval = 160
+        data = self._series(200, seed=1)
+        assert forecaster.fit(data[:150])
+        old_params = forecaster._fitted_model.params
+
+        for value in data[150:170]:
+            forecaster.update(value)
+        assert forecaster.wait_for_refit(timeout=60)
+
+        metrics = forecaster.get_refit_metrics()
+        assert metrics["refits_started"] == 1
+        assert metrics["refits_completed"] == 1
+        assert metrics["last_refit_duration_seconds"] > 0
+        assert metrics["observations_since_fit"] == 10
+        assert not metrics["refit_in_progress"]
+
+        new_params = forecaster._fitted_model.params
+        assert not np.allclose(new_params, old_params)
+        reference = forecaster._fitted_model.model.clone(data[:170]).filter(new_params)
+        assert forecaster.predict(steps=1).predicted_values[0] == pytest.approx(
+            reference.get_forecast(steps=1).predicted_mean[0]
+        )
+
+    def test_explicit_fit_supersedes_background_refit(self, forecaster):
+        """Test that a refit started before fit() is discarded."""
+        forecaster.config.refit_interval = 160
+        data = self._series(200, seed=2)
+        assert forecaster.fit(data[:150])
+
+        for value in data[150:160]:
+            forecaster.update(value)
+        assert forecaster.fit(data)
+        fitted = forecaster._fitted_model
+        assert forecaster.wait_for_refit(timeout=60)
+
+        assert forecaster._fitted_model is fitted
+        assert forecaster.get_refit_metrics()["refits_completed"] == 0
+
+    def test_inline_refit_when_background_disabled(self, forecaster):
+        """Test that background_refit=False keeps the synchronous refit."""
+        forecaster.config.refit_interval = 160
+        forecaster.config.background_refit = False
+        data = self._series(160, seed=3)
+        assert forecaster.fit(data[:150])
+
+        for value in data[150:]:
+            forecaster.update(value)
+
+        assert forecaster.get_refit_metrics()["refits_started"] == 0
+        assert forecaster.get_refit_metrics()["observations_since_fit"] == 0
+
+    def test_update_latency_benchmark(self, forecaster):
+        """Benchmark: online update vs the inline refit it replaces."""
+        data = self._series(400, seed=4)
+        assert forecaster.fit(data[:300])
+
+        start = time.perf_counter()
+        for value in data[300:]:
+            forecaster.update(value)
+        online = (time.perf_counter() - start) / 100
+
+        start = time.perf_counter()
+        forecaster.fit(data)
+        refit = time.perf_counter() - start
+
+        print(f"\nonline update: {online * 1000:.1f}ms/obs, inline refit: {refit * 1000:.0f}ms")
+        assert online * 10 < refit
+
+
 class TestIsolationAnomalyDetector:
     """Tests for Isolation Forest Detector."""
 
@@ -444,6 +554,174 @@ class TestHybridAnomalyDetector:
         assert len(result.explanation) > 10
 
 
+class TestBatchDetection:
+    """Tests for batched multi-host detection."""
+
+    @staticmethod
+    def _training(seed: int = 42):
+        rng = np.random.default_rng(seed)
+        series = list(50 + rng.normal(0, 5, 100))
+        vectors = [[v, 50 + rng.normal(0, 5), 0.01, 100 + rng.normal(0, 10)] for v in series]
+        return series, vectors
+
+    def test_isolation_batch_matches_single(self):
+        """Test that stacked scoring equals per-sample detect()."""
+        pytest.importorskip("sklearn")
+        detector = IsolationAnomalyDetector(IsolationConfig(feature_names=["a", "b", "c"]))
+        rng = np.random.default_rng(0)
+        detector.fit(list(rng.normal(50, 5, (200, 3))))
+        samples = [[50, 50, 50], [95, 20, 50], [51, 49, 200]]
+
+        batch = detector.detect_batch(samples)
+        single = [detector.detect(sample) for sample in samples]
+
+        for got, want in zip(batch, single):
+            assert got.is_anomaly == want.is_anomaly
+            assert got.raw_score == pytest.approx(want.raw_score)
+            assert got.feature_contributions == pytest.approx(want.feature_contributions)
+
+    def test_isolation_batch_simple_fallback(self):
+        """Test that batch detection falls back to z-scores without a forest."""
+        detector = IsolationAnomalyDetector()
+        detector._fit_simple_model([[50, 50], [52, 48], [48, 52]] * 5)
+
+        results = detector.detect_batch([[50, 50], [90, 50]])
+
+        assert not results[0].is_anomaly
+        assert results[1].is_anomaly
+        assert detector.detect_batch([]) == []
+
+    def test_isolation_update_batch_refits_once(self):
+        """Test that a batch crossing the refit boundary refits once."""
+        detector = IsolationAnomalyDetector()
+        detector._training_data = [[50, 50, 50]] * 490
+
+        with patch.object(detector, "fit") as fit:
+            detector.update_batch([[51, 51, 51]] * 20)
+
+        fit.assert_called_once()
+        assert len(detector._training_data) == 510
+
+    def test_registry_tracks_each_host(self):
+        """Test that each host is forecast from its own observations."""
+        forecaster = SARIMAForecaster()
+        forecaster._fit_simple_model([50.0] * 60)
+        registry = SARIMAHostRegistry(forecaster)
+
+        for _ in range(3):
+            registry.update(["low", "high"], [20.0, 80.0])
+        expected, deviation, anomalous = registry.score(["low", "high", "new"], [21.0, 80.0, 50.0], 2.5)
+
+        assert expected.tolist() == pytest.approx([20.0, 80.0, 50.0])
+        assert not anomalous.any()
+        assert registry.get_stats()["hosts"] == 3
+
+    def test_registry_matches_statsmodels_filter(self):
+        """Test that the vectorized filter step tracks statsmodels' own extend()."""
+        pytest.importorskip("statsmodels")
+        rng = np.random.default_rng(0)
+        t = np.arange(360)
+        series = list(50 + 10 * np.sin(2 * np.pi * t / 12) + rng.normal(0, 1, 360))
+        config = SARIMAConfig(s=12, refit_interval=10_000)
+        shared = SARIMAForecaster(config)
+        reference = SARIMAForecaster(config)
+        shared.fit(series[:300])
+        reference.fit(series[:300])
+        registry = SARIMAHostRegistry(shared)
+
+        # A first observation on the shared forecast seeds the shared state
+        first = reference.predict(steps=1).predicted_values[0]
+        registry.update(["host"], [first])
+        reference.update(first)
+
+        for value in series[300:]:
+            expected, _, _ = registry.score(["host"], [value], 2.5)
+            assert expected[0] == pytest.approx(reference.predict(steps=1).predicted_values[0], abs=0.05)
+            registry.update(["host"], [value])
+            reference.update(value)
+
+    def test_registry_seeds_new_host_from_first_observation(self):
+        """Test that a new host starts at its own level and its first sample is not scored."""
+        forecaster = SARIMAForecaster()
+        forecaster._fit_simple_model([50.0] * 60)
+        registry = SARIMAHostRegistry(forecaster)
+
+        expected, deviation, anomalous = registry.score(["busy"], [95.0], 2.5)
+        assert expected.tolist() == pytest.approx([95.0])
+        assert deviation.tolist() == [0.0]
+        assert not anomalous.any()
+
+        registry.update(["busy"], [95.0])
+        expected, _, anomalous = registry.score(["busy"], [95.0], 2.5)
+        assert expected.tolist() == pytest.approx([95.0])
+        assert not anomalous.any()
+
+    def test_registry_seeded_sarima_host_tracks_its_level(self):
+        """Test that a host offset from the training series is not flagged after seeding."""
+        pytest.importorskip("statsmodels")
+        rng = np.random.default_rng(0)
+        t = np.arange(360)
+        series = 50 + 10 * np.sin(2 * np.pi * t / 12) + rng.normal(0, 1, 360)
+        forecaster = SARIMAForecaster(SARIMAConfig(s=12, refit_interval=10_000))
+        forecaster.fit(list(series[:300]))
+        registry = SARIMAHostRegistry(forecaster)
+
+        for value in series[300:] + 30.0:
+            _, _, anomalous = registry.score(["shifted"], [value], 2.5)
+            assert not anomalous.any()
+            registry.update(["shifted"], [value])
+
+    def test_registry_evicts_least_recently_seen(self):
+        """Test that the registry is bounded."""
+        forecaster = SARIMAForecaster()
+        forecaster._fit_simple_model([50.0] * 60)
+        registry = SARIMAHostRegistry(forecaster, max_hosts=2)
+
+        registry.update(["a", "b"], [1.0, 2.0])
+        registry.update(["a"], [1.0])
+        registry.update(["c"], [3.0])
+
+        assert "a" in registry and "c" in registry and "b" not in registry
+        assert registry.get_stats()["hosts_evicted"] == 1
+
+    def test_registry_rejects_duplicate_hosts(self):
+        """Test that a host may appear only once per batch."""
+        registry = SARIMAHostRegistry(SARIMAForecaster())
+
+        with pytest.raises(ValueError):
+            registry.update(["a", "a"], [1.0, 2.0])
+
+    def test_detect_and_update_batch(self):
+        """Test per-host hybrid results in input order."""
+        detector = HybridAnomalyDetector()
+        series, vectors = self._training()
+        detector.fit(series, vectors)
+
+        hosts = ["web-1", "web-2", "db-1"]
+        warmup = detector.detect_and_update_batch(
+            hosts, [50.0, 50.0, 50.0], [[50.0, 50.0, 0.01, 100.0]] * 3
+        )
+        assert not any(r.sarima_anomaly for r in warmup)  # First samples seed, unscored
+
+        values = [51.0, 49.0, 99.0]
+        features = [[51.0, 50.0, 0.01, 100.0], [49.0, 51.0, 0.01, 95.0], [99.0, 95.0, 0.5, 900.0]]
+        results = detector.detect_and_update_batch(hosts, values, features)
+
+        assert len(results) == 3
+        assert all(r.sarima_expected is not None for r in results)
+        assert results[2].weighted_score > results[0].weighted_score
+        assert results[2].sarima_anomaly
+        assert detector.get_diagnostics()["host_registry"]["hosts"] == 3
+        assert len(detector._isolation._training_data) == 106
+
+    def test_detect_batch_length_mismatch(self):
+        """Test that misaligned inputs are rejected."""
+        detector = HybridAnomalyDetector()
+
+        with pytest.raises(ValueError):
+            detector.detect_batch(["a", "b"], [1.0], [[1.0]])
+
+
 class TestAnomalySource:
     """Tests for AnomalySource enum."""
 
@@ -4,6 +4,8 @@ Tests for ML-enhanced System Analyzer.
 
 from __future__ import annotations
 
+import time
+
 import pytest
 import numpy as np
 from datetime import datetime
@@ -288,3 +290,95 @@ class TestMLAnalyzerStaticFallback:
         error_anomalies = [a for a in result.anomalies if a.metric_name == "error_rate"]
         assert len(error_anomalies) > 0
         assert error_anomalies[0].severity == 1.0
+
+
+class TestBatchAnalysis:
+    """Tests for multi-host batch analysis."""
+
+    @pytest.mark.asyncio
+    async def test_batch_without_training(self):
+        """Test static fallback per host before training."""
+        analyzer = MLSystemAnalyzer(AnalyzerSettings())
+
+        results = await analyzer.analyze_batch({
+            "web-1": generate_test_metrics(cpu=50.0),
+            "web-2": generate_test_metrics(cpu=95.0),
+        })
+
+        assert list(results) == ["web-1", "web-2"]
+        assert not results["web-1"].anomalies
+        assert any(a.metric_name == "cpu_usage" for a in results["web-2"].anomalies)
+
+    @pytest.mark.asyncio
+    async def test_batch_with_training(self):
+        """Test per-host ML results after training."""
+        analyzer = MLSystemAnalyzer(AnalyzerSettings())
+        analyzer.train(generate_historical_metrics(100))
+        # A host's first sample only seeds its SARIMA state
+        await analyzer.analyze_batch({
+            "web-1": generate_test_metrics(cpu=50.0, memory=50.0),
+            "db-1": generate_test_metrics(cpu=50.0, memory=50.0),
+        })
+
+        results = await analyzer.analyze_batch({
+            "web-1": generate_test_metrics(cpu=52.0, memory=50.0),
+            "db-1": generate_test_metrics(cpu=200.0, memory=200.0, latency=2000.0),
+        })
+
+        assert results["web-1"].overall_health_score > results["db-1"].overall_health_score
+        assert results["db-1"].anomalies
+        assert analyzer.get_statistics()["detector_stats"]["total_detections"] == 4
+
+    @pytest.mark.asyncio
+    async def test_batch_trends_are_per_host(self):
+        """Test that trends use each host's own recent samples."""
+        analyzer = MLSystemAnalyzer(AnalyzerSettings())
+
+        for step in range(10):
+            results = await analyzer.analyze_batch({
+                "rising": generate_test_metrics(cpu=20.0 + step * 5),
+                "flat": generate_test_metrics(cpu=40.0),
+            })
+        results = await analyzer.analyze_batch({
+            "rising": generate_test_metrics(cpu=75.0),
+            "flat": generate_test_metrics(cpu=40.0),
+        })
+
+        assert results["rising"].trends["cpu_trend"] == "increasing"
+        assert results["flat"].trends["cpu_trend"] == "stable"
+
+    @pytest.mark.asyncio
+    async def test_batch_throughput_benchmark(self):
+        """Benchmark: batched scoring vs one analyze_metrics call per host."""
+        analyzer = MLSystemAnalyzer(AnalyzerSettings())
+        analyzer.train(generate_historical_metrics(100))
+        rng = np.random.default_rng(7)
+
+        def hosts(count: int) -> dict:
+            return {
+                f"host-{i}": generate_test_metrics(
+                    cpu=float(50 + rng.normal(0, 10)),
+                    memory=float(50 + rng.normal(0, 10)),
+                    latency=float(100 + rng.normal(0, 20)),
+                )
+                for i in range(count)
+            }
+
+        # Per-host calls are slow; time a sample and report the rate
+        single = list(hosts(10).values())
+        start = time.perf_counter()
+        for metrics in single:
+            await analyzer.analyze_metrics(metrics)
+        single_rate = len(single) / (time.perf_counter() - start)
+        print(f"\n   per-host: {single_rate:8.0f} hosts/s")
+
+        for count in (10, 100, 1000):
+            batch = hosts(count)
+            start = time.perf_counter()
+            results = await analyzer.analyze_batch(batch)
+            batch_rate = count / (time.perf_counter() - start)
+            print(f"{count:5d} hosts: {batch_rate:8.0f} hosts/s (batched)")
+
+            assert len(results) == count
+            if count >= 100:
+                assert batch_rate > single_rate * 5
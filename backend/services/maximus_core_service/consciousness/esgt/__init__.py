@@ -87,6 +87,10 @@ from consciousness.esgt.kuramoto import (
     PhaseCoherence,
     SynchronizationDynamics,
 )
+from consciousness.esgt.kuramoto_executor import KuramotoExecutor
+from consciousness.esgt.kuramoto_history import PhaseHistoryBuffer
+from consciousness.esgt.kuramoto_models import IgnitionCandidate
+from consciousness.esgt.kuramoto_vectorized import VectorizedKuramotoNetwork
 
 __all__ = [
     "ESGTCoordinator",
@@ -99,6 +103,10 @@ __all__ = [
     "KuramotoOscillator",
     "PhaseCoherence",
     "SynchronizationDynamics",
+    "VectorizedKuramotoNetwork",
+    "PhaseHistoryBuffer",
+    "IgnitionCandidate",
+    "KuramotoExecutor",
     "ESGTArousalBridge",
     "ArousalModulationConfig",
 ]
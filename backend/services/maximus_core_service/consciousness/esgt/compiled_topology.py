@@ -0,0 +1,182 @@
+"""
+Compiled ESGT Topology - CSR coupling cached across ignitions.
+
+Each ignition used to rebuild a neighbor dict from TIG connections three
+times (synchronize, sustain, dissolve) and then resolve (node, neighbor)
+tuple keys into weight dicts on every Kuramoto step. A CompiledTopology
+captures the recruited subgraph once as a node index map, CSR adjacency and
+weight array aligned with the Kuramoto oscillator order.
+
+Invalidation follows the TIG fabric counters:
+- topology_version: structural changes (connections, isolation, repair)
+- weights_version: connection weight changes (enter/exit ESGT mode)
+
+A weights-only change refreshes the CSR data array in place from the
+retained TIGConnection references; no graph walk is repeated.
+
+Coupling is uniform (every edge 1.0, as with a plain neighbor dict) unless
+compiled with weighted=True. Weighted coupling follows TIGConnection.weight,
+so edges couple 1.5x harder while the fabric is in ESGT mode.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+import numpy as np
+from scipy import sparse
+
+if TYPE_CHECKING:
+    from consciousness.tig.fabric import TIGConnection, TIGFabric
+
+
+@dataclass
+class CompiledTopology:
+    """Recruited subgraph compiled for vectorized Kuramoto integration."""
+
+    node_ids: tuple[str, ...]  # Oscillator order the matrix is indexed by
+    node_index: dict[str, int]
+    coupling: sparse.csr_matrix  # Adjacency (indptr/indices) + weights (data)
+    topology: dict[str, list[str]]  # Neighbor dict, for dict-based consumers
+    connections: list["TIGConnection"] = field(default_factory=list)  # Aligned with coupling.data
+    topology_version: int = 0
+    weights_version: int = 0
+    weighted: bool = False  # Data follows connection weights (else all 1.0)
+
+    @property
+    def weights(self) -> np.ndarray:
+        """Coupling weight array (view of the CSR data)."""
+        return self.coupling.data
+
+    @property
+    def edge_count(self) -> int:
+        return int(self.coupling.nnz)
+
+    def refresh_weights(self, weights_version: int) -> None:
+        """Re-read connection weights into the CSR data array in place."""
+        if self.weighted and self.connections:
+            self.coupling.data[:] = np.fromiter(
+                (conn.weight for conn in self.connections),
+                dtype=np.float64,
+                count=len(self.connections),
+            )
+        self.weights_version = weights_version
+
+
+def compile_fabric_topology(
+    fabric: "TIGFabric",
+    participating: set[str] | frozenset[str],
+    node_ids: tuple[str, ...],
+    weighted: bool = False,
+) -> CompiledTopology:
+    """
+    Compile the active connections among participating nodes.
+
+    Rows/columns follow node_ids (the oscillator order). Nodes outside the
+    participating set keep empty rows so they free-run, as before. With
+    weighted=True edge data is the connection weight, otherwise 1.0.
+    """
+    node_index = {node_id: i for i, node_id in enumerate(node_ids)}
+    topology: dict[str, list[str]] = {}
+    indptr = [0]
+    indices: list[int] = []
+    connections: list[TIGConnection] = []
+
+    for node_id in node_ids:
+        node = fabric.nodes.get(node_id) if node_id in participating else None
+        if node is not None:
+            # CSR requires sorted, unique column indices per row
+            row = sorted(
+                (node_index[conn.remote_node_id], conn)
+                for conn in node.connections.values()
+                if conn.active
+                and conn.remote_node_id in participating
+                and conn.remote_node_id in node_index
+            )
+            topology[node_id] = [node_ids[j] for j, _ in row]
+            for j, conn in row:
+                indices.append(j)
+                connections.append(conn)
+        elif node_id in participating:
+            topology[node_id] = []
+        indptr.append(len(indices))
+
+    n = len(node_ids)
+    if weighted:
+        data = np.fromiter((conn.weight for conn in connections), dtype=np.float64, count=len(connections))
+    else:
+        data = np.ones(len(connections), dtype=np.float64)
+    coupling = sparse.csr_matrix(
+        (data, np.asarray(indices, dtype=np.int32), np.asarray(indptr, dtype=np.int32)),
+        shape=(n, n),
+    )
+
+    return CompiledTopology(
+        node_ids=node_ids,
+        node_index=node_index,
+        coupling=coupling,
+        topology=topology,
+        connections=connections,
+        topology_version=getattr(fabric, "topology_version", 0),
+        weights_version=getattr(fabric, "weights_version", 0),
+        weighted=weighted,
+    )
+
+
+class TopologyCache:
+    """
+    LRU of CompiledTopology keyed by the participating-node set.
+
+    Entries are reused while the fabric topology_version and the oscillator
+    ordering are unchanged; a bumped weights_version only refreshes weights
+    (a no-op for uniform coupling).
+    """
+
+    def __init__(self, max_entries: int = 8, weighted: bool = False):
+        self.max_entries = max_entries
+        self.weighted = weighted
+        self._entries: OrderedDict[frozenset[str], CompiledTopology] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.weight_refreshes = 0
+
+    def get(
+        self,
+        fabric: "TIGFabric",
+        participating: set[str] | frozenset[str],
+        node_ids: tuple[str, ...],
+    ) -> CompiledTopology:
+        """Return a compiled topology for participating, compiling on miss."""
+        key = frozenset(participating)
+        topology_version = getattr(fabric, "topology_version", 0)
+        weights_version = getattr(fabric, "weights_version", 0)
+
+        compiled = self._entries.get(key)
+        if (
+            compiled is not None
+            and compiled.node_ids is node_ids
+            and compiled.topology_version == topology_version
+        ):
+            self._entries.move_to_end(key)
+            if compiled.weights_version != weights_version:
+                compiled.refresh_weights(weights_version)
+                self.weight_refreshes += 1
+            self.hits += 1
+            return compiled
+
+        self.misses += 1
+        compiled = compile_fabric_topology(fabric, key, node_ids, self.weighted)
+        self._entries[key] = compiled
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return compiled
+
+    def clear(self) -> None:
+        """Drop all compiled topologies."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
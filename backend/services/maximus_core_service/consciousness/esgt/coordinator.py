@@ -14,10 +14,10 @@ import time
 from collections import deque
 from typing import Any, TYPE_CHECKING
 
-from consciousness.esgt.kuramoto import (
-    KuramotoNetwork,
-    OscillatorConfig,
-)
+from consciousness.esgt.kuramoto import OscillatorConfig
+from consciousness.esgt.kuramoto_executor import KuramotoExecutor
+from consciousness.esgt.kuramoto_models import IgnitionCandidate, SynchronizationDynamics
+from consciousness.esgt.kuramoto_vectorized import VectorizedKuramotoNetwork
 from consciousness.tig.fabric import TIGFabric, CircuitBreaker
 from consciousness.tig.sync import PTPCluster
 
@@ -25,6 +25,7 @@ from .attention_helpers import (
     compute_salience_from_attention as _compute_salience,
     build_content_from_attention as _build_content,
 )
+from .compiled_topology import TopologyCache
 
 # Re-exports for backward compatibility (tests import from coordinator)
 from .enums import ESGTPhase, SalienceLevel
@@ -74,6 +75,8 @@ class ESGTCoordinator(
         kuramoto_config: OscillatorConfig | None = None,
         coordinator_id: str = "esgt-coordinator",
         prefrontal_cortex: Any | None = None,
+        kuramoto_executor: KuramotoExecutor | None = None,
+        weighted_coupling: bool = False,
     ):
         self.coordinator_id = coordinator_id
         self.tig = tig_fabric
@@ -81,8 +84,12 @@ class ESGTCoordinator(
         self.triggers = triggers or TriggerConditions()
         self.kuramoto_config = kuramoto_config or OscillatorConfig()
 
-        # Kuramoto network for phase synchronization
-        self.kuramoto = KuramotoNetwork(self.kuramoto_config)
+        # Kuramoto network for phase synchronization (array-backed RK4).
+        # With an executor, integration runs off the event loop.
+        self.kuramoto = VectorizedKuramotoNetwork(self.kuramoto_config, kuramoto_executor)
+        # Uniform coupling by default; weighted follows TIG connection
+        # weights (1.5x during ESGT mode)
+        self._topology_cache = TopologyCache(weighted=weighted_coupling)
 
         # ESGT state
         self.active_event: ESGTEvent | None = None
@@ -238,8 +245,8 @@ class ESGTCoordinator(
             event.transition_phase(ESGTPhase.SYNCHRONIZE)
             sync_start = time.time()
 
-            # Build topology for recruited nodes
-            topology = self._build_topology(participating)
+            # Compiled (cached) topology for recruited nodes
+            topology = self._compile_topology(participating)
 
             # Run Kuramoto synchronization
             dynamics = await self.kuramoto.synchronize(
@@ -306,7 +313,9 @@ class ESGTCoordinator(
             # PHASE 4: SUSTAIN
             event.transition_phase(ESGTPhase.SUSTAIN)
 
-            # Sustain synchronization for target duration
+            # Sustain synchronization for target duration (picks up ESGT-mode
+            # weights when weighted_coupling is on)
+            topology = self._compile_topology(participating)
             await self._sustain_coherence(event, target_duration_ms, topology)
 
             # PHASE 5: DISSOLVE
@@ -344,6 +353,33 @@ class ESGTCoordinator(
             logger.info("❌ ESGT %s failed: {e}", event.event_id)
             return event
 
+    async def evaluate_ignition_candidates(
+        self,
+        contents: list[dict[str, Any]],
+        target_coherence: float = 0.70,
+        duration_ms: float = 300.0,
+    ) -> list[SynchronizationDynamics]:
+        """
+        Simulate synchronization for competing contents in one batched run.
+
+        Nothing is ignited: the frequency limiter, event counters and live
+        Kuramoto state are untouched, so callers can rank candidates (e.g. by
+        time_to_sync or max_coherence) and pass the winner to initiate_esgt().
+        """
+        candidates = []
+        for content in contents:
+            participating = await self._recruit_nodes(content)
+            candidates.append(
+                IgnitionCandidate(
+                    topology=self._compile_topology(participating),
+                    target_coherence=target_coherence,
+                )
+            )
+
+        return await self.kuramoto.synchronize_batch(
+            candidates, duration_ms=duration_ms, dt=0.005
+        )
+
     def compute_salience_from_attention(
         self,
         attention_state: "AttentionState",
@@ -68,4 +68,5 @@ class HealthMetricsMixin:
             "circuit_breaker_state": self.ignition_breaker.state,
             "total_events": self.total_events,
             "successful_events": self.successful_events,
+            "kuramoto_loop_blocking": self.kuramoto.loop_metrics.to_dict(),
         }
@@ -14,6 +14,7 @@ from __future__ import annotations
 
 import asyncio
 import time
+from collections import deque
 
 import numpy as np
 
@@ -41,8 +42,10 @@ class KuramotoOscillator:
         self.frequency: float = self.config.natural_frequency
         self.state: OscillatorState = OscillatorState.IDLE
 
-        self.phase_history: list[float] = [self.phase]
-        self.frequency_history: list[float] = [self.frequency]
+        # Bounded deques: O(1) append with automatic trimming
+        window = self.config.history_window
+        self.phase_history: deque[float] = deque([self.phase], maxlen=window)
+        self.frequency_history: deque[float] = deque([self.frequency], maxlen=window)
 
     def _compute_phase_velocity(
         self,
@@ -107,10 +110,6 @@ class KuramotoOscillator:
         )
         self.frequency_history.append(current_velocity / (2 * np.pi))
 
-        if len(self.phase_history) > 1000:
-            self.phase_history.pop(0)
-            self.frequency_history.pop(0)
-
         return self.phase
 
     def get_phase(self) -> float:
@@ -125,7 +124,7 @@ class KuramotoOscillator:
         """Reset to random phase."""
         self.phase = np.random.uniform(0, 2 * np.pi)
         self.state = OscillatorState.IDLE
-        self.phase_history = [self.phase]
+        self.phase_history = deque([self.phase], maxlen=self.config.history_window)
 
     def __repr__(self) -> str:
         return f"KuramotoOscillator(node={self.node_id}, phase={self.phase:.3f}, freq={self.frequency:.1f}Hz)"
@@ -259,8 +258,17 @@ class KuramotoNetwork:
         if not self.oscillators:
             return
 
-        phases = [osc.get_phase() for osc in self.oscillators.values()]
-        complex_sum = np.sum([np.exp(1j * phase) for phase in phases])
+        phases = np.array([osc.get_phase() for osc in self.oscillators.values()])
+        self._update_coherence_from_phases(phases, timestamp)
+
+    def _update_coherence_from_phases(
+        self, phases: np.ndarray, timestamp: float | None = None
+    ) -> None:
+        """Compute coherence from a phase array and record it."""
+        if timestamp is None:
+            timestamp = time.time()
+
+        complex_sum = np.sum(np.exp(1j * phases))
         r = np.abs(complex_sum) / len(phases)
 
         mean_phase = np.angle(complex_sum)
@@ -0,0 +1,208 @@
+"""
+Kuramoto Executor - Off-event-loop phase integration for ESGT.
+
+KuramotoNetwork.synchronize is CPU-bound and runs on the asyncio loop,
+yielding only every 10 steps, so API handlers and SSE streams stall while an
+ignition synchronizes. KuramotoExecutor moves whole integration runs onto a
+worker pool:
+
+- "thread": ThreadPoolExecutor. NumPy/SciPy kernels release the GIL for
+  most of each step, so the loop stays responsive at no IPC cost.
+- "process": ProcessPoolExecutor. The phase/frequency trajectory is written
+  by the worker straight into a SharedMemory block, so only scalars and the
+  CSR arrays are pickled.
+
+LoopBlockingMetrics records how long each run held the event loop, so the
+inline and offloaded paths can be compared directly.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Any
+
+import numpy as np
+from scipy import sparse
+
+EXECUTION_MODES = ("thread", "process")
+
+
+@dataclass
+class LoopBlockingMetrics:
+    """Time the asyncio loop spent inside Kuramoto integration."""
+
+    runs: int = 0
+    steps: int = 0
+    total_blocking_ms: float = 0.0
+    max_blocking_ms: float = 0.0  # Longest single stretch without yielding
+    total_wall_ms: float = 0.0
+
+    def record(self, steps: int, blocking_ms: list[float], wall_ms: float) -> None:
+        """Record one run given its non-yielding stretches (ms)."""
+        self.runs += 1
+        self.steps += steps
+        self.total_blocking_ms += sum(blocking_ms)
+        if blocking_ms:
+            self.max_blocking_ms = max(self.max_blocking_ms, max(blocking_ms))
+        self.total_wall_ms += wall_ms
+
+    @property
+    def avg_blocking_ms(self) -> float:
+        return self.total_blocking_ms / self.runs if self.runs else 0.0
+
+    def to_dict(self) -> dict[str, float]:
+        return {
+            "runs": self.runs,
+            "steps": self.steps,
+            "avg_blocking_ms": self.avg_blocking_ms,
+            "max_blocking_ms": self.max_blocking_ms,
+            "total_blocking_ms": self.total_blocking_ms,
+            "total_wall_ms": self.total_wall_ms,
+        }
+
+
+def integrate_trajectory(
+    phases: np.ndarray,
+    omega: np.ndarray,
+    coupling_strength: np.ndarray,
+    noise_std: np.ndarray,
+    coupling: sparse.csr_matrix,
+    dt: float,
+    method: str,
+    out_phases: np.ndarray,
+    out_frequencies: np.ndarray,
+    rng: np.random.Generator | None = None,
+) -> None:
+    """
+    Run len(out_phases) steps, writing each step's phases and frequencies.
+
+    Matches VectorizedKuramotoNetwork.update_network step for step. Uses the
+    global NumPy RNG for noise unless rng is given.
+    """
+    # Imported here so worker processes only pay for what they use
+    from consciousness.esgt.kuramoto_vectorized import integrate_step
+
+    normal = rng.normal if rng is not None else np.random.normal
+    for step in range(len(out_phases)):
+        phases, velocities = integrate_step(
+            phases, omega, coupling_strength, coupling, dt, method
+        )
+        phases = (phases + normal(0, noise_std) * dt) % (2 * np.pi)
+        out_phases[step] = phases
+        out_frequencies[step] = velocities / (2 * np.pi)
+
+
+def _integrate_shared(
+    shm_name: str,
+    steps: int,
+    phases: np.ndarray,
+    omega: np.ndarray,
+    coupling_strength: np.ndarray,
+    noise_std: np.ndarray,
+    csr_parts: tuple[np.ndarray, np.ndarray, np.ndarray],
+    dt: float,
+    method: str,
+) -> None:
+    """Process-pool entry point: integrate into a SharedMemory trajectory."""
+    n = len(phases)
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        out = np.ndarray((2, steps, n), dtype=np.float64, buffer=shm.buf)
+        coupling = sparse.csr_matrix(csr_parts, shape=(n, n))
+        integrate_trajectory(
+            phases,
+            omega,
+            coupling_strength,
+            noise_std,
+            coupling,
+            dt,
+            method,
+            out[0],
+            out[1],
+            rng=np.random.default_rng(),  # Forked workers would share global RNG state
+        )
+        del out  # Release the buffer export before close()
+    finally:
+        shm.close()
+
+
+class KuramotoExecutor:
+    """Worker pool that runs Kuramoto integration off the event loop."""
+
+    def __init__(self, mode: str = "thread", max_workers: int = 1) -> None:
+        if mode not in EXECUTION_MODES:
+            raise ValueError(f"mode must be one of {EXECUTION_MODES}, got {mode!r}")
+
+        self.mode = mode
+        self.max_workers = max_workers
+        self._pool: Executor = (
+            ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="kuramoto")
+            if mode == "thread"
+            else ProcessPoolExecutor(max_workers=max_workers)
+        )
+
+    async def integrate(
+        self,
+        phases: np.ndarray,
+        omega: np.ndarray,
+        coupling_strength: np.ndarray,
+        noise_std: np.ndarray,
+        coupling: sparse.csr_matrix,
+        steps: int,
+        dt: float,
+        method: str = "rk4",
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Integrate `steps` steps in the pool.
+
+        Returns (phases, frequencies), each shaped (steps × nodes).
+        """
+        loop = asyncio.get_running_loop()
+        n = len(phases)
+
+        if self.mode == "thread":
+            out = np.empty((2, steps, n), dtype=np.float64)
+            await loop.run_in_executor(
+                self._pool,
+                integrate_trajectory,
+                phases,
+                omega,
+                coupling_strength,
+                noise_std,
+                coupling,
+                dt,
+                method,
+                out[0],
+                out[1],
+            )
+            return out[0], out[1]
+
+        shm = shared_memory.SharedMemory(create=True, size=max(2 * steps * n * 8, 1))
+        try:
+            args: tuple[Any, ...] = (
+                shm.name,
+                steps,
+                phases,
+                omega,
+                coupling_strength,
+                noise_std,
+                (coupling.data, coupling.indices, coupling.indptr),
+                dt,
+                method,
+            )
+            await loop.run_in_executor(self._pool, _integrate_shared, *args)
+            out = np.ndarray((2, steps, n), dtype=np.float64, buffer=shm.buf).copy()
+        finally:
+            shm.close()
+            shm.unlink()
+        return out[0], out[1]
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker pool."""
+        self._pool.shutdown(wait=wait)
+
+    def __repr__(self) -> str:
+        return f"KuramotoExecutor(mode={self.mode}, workers={self.max_workers})"
@@ -0,0 +1,85 @@
+"""
+Kuramoto History Buffer - Fixed-size phase/frequency history for a network.
+
+Per-oscillator history lists grow with every step and trimming them with
+pop(0) is O(n). PhaseHistoryBuffer preallocates one (2·window × nodes) array
+per signal and writes each step twice, at head and head + window, so that the
+most recent k samples are always one contiguous slice:
+
+    buf[head + window - k + 1 : head + window + 1]
+
+Writes are O(nodes) per step regardless of how long the network has run, and
+reads are zero-copy views. Rows are time (oldest first), columns follow the
+network's oscillator order.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+class PhaseHistoryBuffer:
+    """Ring buffer of phase and frequency samples for a fixed node set."""
+
+    def __init__(self, node_ids: tuple[str, ...], window: int = 1000) -> None:
+        if window < 1:
+            raise ValueError(f"window must be >= 1, got {window}")
+
+        self.node_ids = node_ids
+        self.window = window
+        self._phases = np.zeros((2 * window, len(node_ids)), dtype=np.float64)
+        self._frequencies = np.zeros((2 * window, len(node_ids)), dtype=np.float64)
+        self._head = -1  # Index of the latest sample in [0, window)
+        self._count = 0
+        self.total_steps = 0
+
+    def record(self, phases: np.ndarray, frequencies: np.ndarray) -> None:
+        """Append one sample for every node."""
+        head = (self._head + 1) % self.window
+        self._phases[head] = phases
+        self._phases[head + self.window] = phases
+        self._frequencies[head] = frequencies
+        self._frequencies[head + self.window] = frequencies
+        self._head = head
+        self._count = min(self._count + 1, self.window)
+        self.total_steps += 1
+
+    def _slice(self, last: int | None) -> slice:
+        k = self._count if last is None else max(0, min(last, self._count))
+        end = self._head + self.window + 1
+        return slice(end - k, end)
+
+    def phases(self, last: int | None = None) -> np.ndarray:
+        """View of the last `last` phase samples (all retained if None)."""
+        return self._phases[self._slice(last)]
+
+    def frequencies(self, last: int | None = None) -> np.ndarray:
+        """View of the last `last` frequency samples (all retained if None)."""
+        return self._frequencies[self._slice(last)]
+
+    def node_phases(self, node_id: str, last: int | None = None) -> np.ndarray:
+        """Phase history of one node (strided view)."""
+        return self.phases(last)[:, self.node_ids.index(node_id)]
+
+    def node_frequencies(self, node_id: str, last: int | None = None) -> np.ndarray:
+        """Frequency history of one node (strided view)."""
+        return self.frequencies(last)[:, self.node_ids.index(node_id)]
+
+    def clear(self) -> None:
+        """Forget all samples, keeping the allocation."""
+        self._head = -1
+        self._count = 0
+        self.total_steps = 0
+
+    @property
+    def nbytes(self) -> int:
+        return self._phases.nbytes + self._frequencies.nbytes
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __repr__(self) -> str:
+        return (
+            f"PhaseHistoryBuffer(nodes={len(self.node_ids)}, "
+            f"samples={self._count}/{self.window})"
+        )
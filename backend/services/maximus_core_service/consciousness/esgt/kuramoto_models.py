@@ -5,9 +5,13 @@ from __future__ import annotations
 import time
 from dataclasses import dataclass, field
 from enum import Enum
+from typing import TYPE_CHECKING
 
 import numpy as np
 
+if TYPE_CHECKING:
+    from consciousness.esgt.compiled_topology import CompiledTopology
+
 
 class OscillatorState(Enum):
     """State of an oscillator during synchronization."""
@@ -26,6 +30,7 @@ class OscillatorConfig:
     coupling_strength: float = 20.0  # K parameter
     phase_noise: float = 0.001  # Additive phase noise
     integration_method: str = "rk4"  # "euler" or "rk4"
+    history_window: int = 1000  # Phase/frequency samples retained per oscillator
 
 
 @dataclass
@@ -96,3 +101,18 @@ class SynchronizationDynamics:
         decay_rate = -slope
 
         return float(decay_rate)
+
+
+@dataclass
+class IgnitionCandidate:
+    """
+    One competing ignition for batched synchronization.
+
+    Candidates share the network's oscillators but may recruit different
+    subsets (topology) and override the coupling strength K.
+    """
+
+    topology: "dict[str, list[str]] | CompiledTopology"
+    coupling_strength: float | None = None  # None: per-oscillator config
+    target_coherence: float = 0.70
+    label: str = ""
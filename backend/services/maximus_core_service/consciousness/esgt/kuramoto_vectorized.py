@@ -0,0 +1,435 @@
+"""
+Vectorized Kuramoto Engine - Array-backed phase integration for ESGT.
+
+KuramotoNetwork.update_network rebuilds per-node neighbor dicts on every RK4
+stage. This engine keeps phases, natural frequencies and coupling strengths in
+NumPy arrays and compiles the topology once into a sparse CSR coupling matrix W.
+The coupling term then reduces to two sparse mat-vecs per stage:
+
+    Σⱼ wᵢⱼ sin(θⱼ - θᵢ) = cos θᵢ · (W sin θ)ᵢ - sin θᵢ · (W cos θ)ᵢ
+
+Dynamics are identical to KuramotoNetwork:
+    dθᵢ/dt = 2π fᵢ + (Kᵢ/N) Σⱼ wᵢⱼ sin(θⱼ - θᵢ)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+import numpy as np
+from scipy import sparse
+
+from consciousness.esgt.compiled_topology import CompiledTopology
+from consciousness.esgt.kuramoto import KuramotoNetwork, KuramotoOscillator
+from consciousness.esgt.kuramoto_executor import KuramotoExecutor, LoopBlockingMetrics
+from consciousness.esgt.kuramoto_history import PhaseHistoryBuffer
+from consciousness.esgt.kuramoto_models import (
+    IgnitionCandidate,
+    OscillatorConfig,
+    SynchronizationDynamics,
+)
+
+
+def build_coupling_matrix(
+    node_ids: list[str],
+    topology: dict[str, list[str]],
+    coupling_weights: dict[tuple[str, str], float] | None = None,
+) -> sparse.csr_matrix:
+    """
+    Compile a topology into a CSR coupling matrix.
+
+    Row i holds the weights of node_ids[i]'s neighbors. Neighbors outside
+    node_ids are dropped and missing weights default to 1.0, matching
+    KuramotoNetwork._compute_network_derivatives.
+    """
+    index = {node_id: i for i, node_id in enumerate(node_ids)}
+    rows: list[int] = []
+    cols: list[int] = []
+    data: list[float] = []
+
+    for i, node_id in enumerate(node_ids):
+        seen: set[int] = set()
+        for neighbor in topology.get(node_id, []):
+            j = index.get(neighbor)
+            if j is None or j in seen:
+                continue
+            seen.add(j)
+            rows.append(i)
+            cols.append(j)
+            data.append(coupling_weights.get((node_id, neighbor), 1.0) if coupling_weights else 1.0)
+
+    n = len(node_ids)
+    return sparse.csr_matrix(
+        (np.asarray(data, dtype=np.float64), (rows, cols)), shape=(n, n)
+    )
+
+
+def compute_phase_velocities(
+    phases: np.ndarray,
+    omega: np.ndarray,
+    coupling_strength: np.ndarray,
+    coupling: sparse.csr_matrix,
+    n: int,
+) -> np.ndarray:
+    """Compute dθ/dt for every oscillator at once."""
+    sin_p = np.sin(phases)
+    cos_p = np.cos(phases)
+    coupling_sum = cos_p * (coupling @ sin_p) - sin_p * (coupling @ cos_p)
+    return omega + coupling_strength * (coupling_sum / n)
+
+
+def integrate_step(
+    phases: np.ndarray,
+    omega: np.ndarray,
+    coupling_strength: np.ndarray,
+    coupling: sparse.csr_matrix,
+    dt: float,
+    method: str = "rk4",
+    n: int | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Advance phases by one step without noise or wrapping.
+
+    Returns (new_phases, velocities) where velocities are evaluated at the
+    start of the step (the value recorded in frequency history). n is the
+    coupling normalizer and defaults to len(phases); stacked batches pass the
+    per-network oscillator count.
+    """
+    n = max(len(phases) if n is None else n, 1)
+    v1 = compute_phase_velocities(phases, omega, coupling_strength, coupling, n)
+
+    if method != "rk4":
+        return phases + v1 * dt, v1
+
+    k1 = dt * v1
+    k2 = dt * compute_phase_velocities(phases + 0.5 * k1, omega, coupling_strength, coupling, n)
+    k3 = dt * compute_phase_velocities(phases + 0.5 * k2, omega, coupling_strength, coupling, n)
+    k4 = dt * compute_phase_velocities(phases + k3, omega, coupling_strength, coupling, n)
+    return phases + (k1 + 2 * k2 + 2 * k3 + k4) / 6.0, v1
+
+
+class VectorizedKuramotoNetwork(KuramotoNetwork):
+    """
+    Drop-in KuramotoNetwork backed by NumPy arrays and a CSR coupling matrix.
+
+    The coupling matrix is compiled on the first update for a topology and
+    reused while the same topology object (and oscillator set) is passed in,
+    so a synchronize() run builds it exactly once. Topologies are treated as
+    immutable once handed to the network. A CompiledTopology built against
+    node_ids can be passed anywhere a topology dict is accepted.
+
+    With an executor, synchronize() and run_steps() integrate in a worker pool
+    and only apply the resulting trajectory on the event loop; loop_metrics
+    records how long the loop was held either way.
+
+    synchronize_batch() evaluates several IgnitionCandidates in one stacked
+    integration without disturbing the live oscillator state.
+
+    Phase/frequency history is kept network-wide in a PhaseHistoryBuffer
+    (default_config.history_window samples) rather than on each oscillator.
+    """
+
+    def __init__(
+        self,
+        config: OscillatorConfig | None = None,
+        executor: KuramotoExecutor | None = None,
+    ) -> None:
+        super().__init__(config)
+        self.executor = executor
+        self.loop_metrics = LoopBlockingMetrics()
+        self._node_ids: tuple[str, ...] | None = None
+        self._coupling: sparse.csr_matrix | None = None
+        self._compiled_for: tuple[Any, Any] | None = None
+        self._history: PhaseHistoryBuffer | None = None
+
+    def add_oscillator(self, node_id: str, config: OscillatorConfig | None = None) -> None:
+        """Add oscillator for a TIG node."""
+        super().add_oscillator(node_id, config)
+        self._invalidate_coupling()
+
+    def remove_oscillator(self, node_id: str) -> None:
+        """Remove oscillator."""
+        super().remove_oscillator(node_id)
+        self._invalidate_coupling()
+
+    def reset_all(self) -> None:
+        """Reset all oscillators to random phases."""
+        super().reset_all()
+        if self._history is not None:
+            self._history.clear()
+
+    def _invalidate_coupling(self) -> None:
+        self._node_ids = None
+        self._coupling = None
+        self._compiled_for = None
+
+    @property
+    def node_ids(self) -> tuple[str, ...]:
+        """Oscillator order used for array and matrix indexing.
+
+        The same tuple object is returned until oscillators are added or
+        removed, so callers can cache against it by identity.
+        """
+        if self._node_ids is None:
+            self._node_ids = tuple(self.oscillators)
+        return self._node_ids
+
+    @property
+    def history(self) -> PhaseHistoryBuffer:
+        """Phase/frequency history, reallocated when the oscillator set changes."""
+        node_ids = self.node_ids
+        if self._history is None or self._history.node_ids is not node_ids:
+            self._history = PhaseHistoryBuffer(node_ids, self.default_config.history_window)
+        return self._history
+
+    def _check_compiled(self, topology: CompiledTopology) -> sparse.csr_matrix:
+        if topology.node_ids is not self.node_ids:
+            raise ValueError("CompiledTopology was built for a different oscillator set")
+        return topology.coupling
+
+    def _get_coupling(
+        self,
+        topology: dict[str, list[str]] | CompiledTopology,
+        coupling_weights: dict[tuple[str, str], float] | None,
+    ) -> sparse.csr_matrix:
+        """Return the compiled coupling matrix, rebuilding it on topology change."""
+        if isinstance(topology, CompiledTopology):
+            return self._check_compiled(topology)
+
+        compiled_for = self._compiled_for
+        if (
+            self._coupling is None
+            or compiled_for is None
+            or compiled_for[0] is not topology
+            or compiled_for[1] is not coupling_weights
+        ):
+            self._coupling = build_coupling_matrix(list(self.node_ids), topology, coupling_weights)
+            self._compiled_for = (topology, coupling_weights)
+        return self._coupling
+
+    @staticmethod
+    def _state_arrays(
+        oscillators: list[KuramotoOscillator],
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Gather (phases, omega, coupling_strength, noise_std) in node order."""
+        n = len(oscillators)
+        phases = np.fromiter((osc.phase for osc in oscillators), dtype=np.float64, count=n)
+        omega = np.fromiter(
+            (2 * np.pi * osc.frequency for osc in oscillators), dtype=np.float64, count=n
+        )
+        # Read per run: dissolution scales coupling_strength in place
+        strength = np.fromiter(
+            (osc.config.coupling_strength for osc in oscillators), dtype=np.float64, count=n
+        )
+        noise_std = np.fromiter(
+            (osc.config.phase_noise for osc in oscillators), dtype=np.float64, count=n
+        )
+        return phases, omega, strength, noise_std
+
+    def update_network(
+        self,
+        topology: dict[str, list[str]] | CompiledTopology,  # type: ignore[override]
+        coupling_weights: dict[tuple[str, str], float] | None = None,
+        dt: float = 0.005,
+    ) -> None:
+        """Update all oscillators in one vectorized step."""
+        if not self.oscillators:
+            return
+
+        coupling = self._get_coupling(topology, coupling_weights)
+        oscillators = [self.oscillators[node_id] for node_id in self.node_ids]
+        phases, omega, strength, noise_std = self._state_arrays(oscillators)
+
+        method = oscillators[0].config.integration_method
+        new_phases, velocities = integrate_step(phases, omega, strength, coupling, dt, method)
+        new_phases = (new_phases + np.random.normal(0, noise_std) * dt) % (2 * np.pi)
+        self.history.record(new_phases, velocities / (2 * np.pi))
+
+        for osc, phase in zip(oscillators, new_phases.tolist()):
+            osc.phase = phase
+
+        self._update_coherence_from_phases(new_phases)
+
+    async def run_steps(
+        self,
+        topology: dict[str, list[str]] | CompiledTopology,
+        steps: int,
+        dt: float = 0.005,
+        coupling_weights: dict[tuple[str, str], float] | None = None,
+    ) -> list[float]:
+        """
+        Advance the network `steps` steps and return r(t) after each.
+
+        Inline (no executor) this is update_network in a loop, yielding every
+        10 steps. With an executor the integration runs in the pool and the
+        trajectory is written back to oscillators, history and coherence.
+        """
+        if self.executor is None or not self.oscillators or steps <= 0:
+            return await self._run_steps_inline(topology, steps, dt, coupling_weights)
+
+        wall_start = time.perf_counter()
+        coupling = self._get_coupling(topology, coupling_weights)
+        oscillators = [self.oscillators[node_id] for node_id in self.node_ids]
+        phases, omega, strength, noise_std = self._state_arrays(oscillators)
+        method = oscillators[0].config.integration_method
+        prepare_ms = (time.perf_counter() - wall_start) * 1000
+
+        trajectory, frequencies = await self.executor.integrate(
+            phases, omega, strength, noise_std, coupling, steps, dt, method
+        )
+
+        apply_start = time.perf_counter()
+        history = self.history
+        coherences = []
+        for step_phases, step_frequencies in zip(trajectory, frequencies):
+            history.record(step_phases, step_frequencies)
+            self._update_coherence_from_phases(step_phases)
+            coherences.append(self.get_order_parameter())
+        for osc, phase in zip(oscillators, trajectory[-1].tolist()):
+            osc.phase = phase
+        apply_ms = (time.perf_counter() - apply_start) * 1000
+
+        self.loop_metrics.record(
+            steps, [prepare_ms, apply_ms], (time.perf_counter() - wall_start) * 1000
+        )
+        return coherences
+
+    async def _run_steps_inline(
+        self,
+        topology: dict[str, list[str]] | CompiledTopology,
+        steps: int,
+        dt: float,
+        coupling_weights: dict[tuple[str, str], float] | None,
+    ) -> list[float]:
+        wall_start = segment_start = time.perf_counter()
+        blocking_ms: list[float] = []
+        coherences = []
+
+        for step in range(steps):
+            self.update_network(topology, coupling_weights, dt)
+            coherences.append(self.get_order_parameter())
+
+            if step % 10 == 0:
+                blocking_ms.append((time.perf_counter() - segment_start) * 1000)
+                await asyncio.sleep(0)
+                segment_start = time.perf_counter()
+
+        blocking_ms.append((time.perf_counter() - segment_start) * 1000)
+        self.loop_metrics.record(steps, blocking_ms, (time.perf_counter() - wall_start) * 1000)
+        return coherences
+
+    async def synchronize(
+        self,
+        topology: dict[str, list[str]] | CompiledTopology,  # type: ignore[override]
+        duration_ms: float = 200.0,
+        target_coherence: float = 0.70,
+        dt: float = 0.005,
+    ) -> SynchronizationDynamics:
+        """
+        Run synchronization protocol for specified duration.
+
+        time_to_sync is simulated time, (step + 1) * dt at the first step at
+        or above target, so it is the same for inline and offloaded runs.
+        """
+        steps = int(duration_ms / 1000.0 / dt)
+
+        coherences = await self.run_steps(topology, steps, dt)
+
+        for step, r in enumerate(coherences):
+            if self._coherence_cache is not None and r >= target_coherence:
+                if self.dynamics.time_to_sync is None:
+                    self.dynamics.time_to_sync = (step + 1) * dt
+                self.dynamics.sustained_duration += dt
+
+        return self.dynamics
+
+    async def synchronize_batch(
+        self,
+        candidates: list[IgnitionCandidate],
+        duration_ms: float = 300.0,
+        dt: float = 0.005,
+    ) -> list[SynchronizationDynamics]:
+        """
+        Integrate several ignition candidates side by side.
+
+        Each candidate starts from the current oscillator phases and evolves
+        independently; the B candidates are stacked into one (B·N) phase vector
+        over a block-diagonal coupling matrix so every step is a single
+        vectorized RK4 update. Oscillator state and history are left untouched.
+        As in synchronize(), time_to_sync is simulated time, not wall clock.
+
+        Returns one SynchronizationDynamics per candidate, in order.
+        """
+        results = [SynchronizationDynamics() for _ in candidates]
+        if not candidates or not self.oscillators:
+            return results
+
+        oscillators = [self.oscillators[node_id] for node_id in self.node_ids]
+        n = len(oscillators)
+        b = len(candidates)
+
+        blocks = [
+            self._check_compiled(c.topology)
+            if isinstance(c.topology, CompiledTopology)
+            else build_coupling_matrix(list(self.node_ids), c.topology)
+            for c in candidates
+        ]
+        coupling = sparse.block_diag(blocks, format="csr")
+
+        base_phases, base_omega, base_strength, base_noise = self._state_arrays(oscillators)
+
+        phases = np.tile(base_phases, b)
+        omega = np.tile(base_omega, b)
+        noise_std = np.tile(base_noise, b)
+        strength = np.concatenate(
+            [
+                np.full(n, c.coupling_strength) if c.coupling_strength is not None else base_strength
+                for c in candidates
+            ]
+        )
+        targets = np.array([c.target_coherence for c in candidates])
+        method = oscillators[0].config.integration_method
+
+        steps = int(duration_ms / 1000.0 / dt)
+
+        for step in range(steps):
+            phases, _ = integrate_step(phases, omega, strength, coupling, dt, method, n=n)
+            phases = (phases + np.random.normal(0, noise_std) * dt) % (2 * np.pi)
+
+            r = np.abs(np.exp(1j * phases).reshape(b, n).mean(axis=1))
+            timestamp = time.time()
+            for i, dynamics in enumerate(results):
+                dynamics.add_coherence_sample(float(r[i]), timestamp)
+                if r[i] >= targets[i]:
+                    if dynamics.time_to_sync is None:
+                        dynamics.time_to_sync = (step + 1) * dt
+                    dynamics.sustained_duration += dt
+
+            if step % 10 == 0:
+                await asyncio.sleep(0)
+
+        return results
+
+    def get_phase_distribution(self, window: int | None = None) -> np.ndarray:
+        """
+        Get current phase distribution for visualization.
+
+        With window=k, returns a zero-copy (k × nodes) view of the last k
+        recorded steps instead, columns in node_ids order.
+        """
+        if window is not None:
+            return self.history.phases(window)
+        return np.fromiter(
+            (osc.phase for osc in self.oscillators.values()),
+            dtype=np.float64,
+            count=len(self.oscillators),
+        )
+
+    def __repr__(self) -> str:
+        coherence = self.get_order_parameter()
+        return (
+            f"VectorizedKuramotoNetwork(oscillators={len(self.oscillators)}, "
+            f"coherence={coherence:.3f})"
+        )
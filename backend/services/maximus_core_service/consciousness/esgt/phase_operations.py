@@ -7,6 +7,7 @@ import time
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from .compiled_topology import CompiledTopology
     from .models import ESGTEvent
     from .coordinator import ESGTCoordinator
 
@@ -18,7 +19,7 @@ class PhaseOperationsMixin:
         self: "ESGTCoordinator",
         event: "ESGTEvent",
         duration_ms: float,
-        topology: dict[str, list[str]],
+        topology: "dict[str, list[str]] | CompiledTopology",
     ) -> None:
         """
         Sustain synchronization for target duration.
@@ -28,6 +29,14 @@ class PhaseOperationsMixin:
         start_time = time.time()
         duration_s = duration_ms / 1000.0
 
+        if self.kuramoto.executor is not None:
+            # Integrate the whole window off-loop instead of pacing per step
+            coherences = await self.kuramoto.run_steps(
+                topology, int(duration_s / 0.005), dt=0.005
+            )
+            event.coherence_history.extend(coherences)
+            return
+
         while (time.time() - start_time) < duration_s:
             # Update network
             self.kuramoto.update_network(topology, dt=0.005)
@@ -47,7 +56,12 @@ class PhaseOperationsMixin:
             osc.config.coupling_strength *= 0.5
 
         # Continue for 50ms with reduced coupling
-        topology = self._build_topology(event.participating_nodes)
+        topology = self._compile_topology(event.participating_nodes)
+
+        if self.kuramoto.executor is not None:
+            await self.kuramoto.run_steps(topology, 10, dt=0.005)
+            self.kuramoto.reset_all()
+            return
 
         for _ in range(10):  # 10 x 5ms = 50ms
             self.kuramoto.update_network(topology, dt=0.005)
@@ -6,6 +6,7 @@ import time
 from typing import Any, TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from .compiled_topology import CompiledTopology
     from .models import SalienceScore
     from .coordinator import ESGTCoordinator
 
@@ -111,3 +112,14 @@ class TriggerValidationMixin:
                 topology[node_id] = neighbors
 
         return topology
+
+    def _compile_topology(
+        self: "ESGTCoordinator", node_ids: set[str]
+    ) -> "CompiledTopology":
+        """
+        Get the cached CSR topology for the recruited node set.
+
+        Repeated ignitions over the same recruited set reuse the compiled
+        matrix until the TIG fabric reports a structural or weight change.
+        """
+        return self._topology_cache.get(self.tig, node_ids, self.kuramoto.node_ids)
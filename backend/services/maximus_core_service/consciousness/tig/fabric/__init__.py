@@ -25,6 +25,7 @@ Main Classes:
     - TIGFabric: The main fabric implementation
     - TopologyConfig: Configuration for topology generation
     - FabricMetrics: Consciousness-relevant validation metrics
+    - FabricSnapshot: On-disk topology cache (TopologyConfig.snapshot_path)
 
 Data Models:
     - TIGNode: Individual processing unit
@@ -93,6 +94,12 @@ from .health import HealthManager
 # Topology generation (primarily for internal use, but exposed for testing)
 from .topology import TopologyGenerator
 
+# Incremental metrics (primarily for internal use, but exposed for testing)
+from .incremental_metrics import IncrementalTopologyMetrics
+
+# On-disk topology snapshots
+from .snapshot import FabricSnapshot, load_snapshot, save_snapshot
+
 __all__ = [
     # Main API
     "TIGFabric",
@@ -108,4 +115,9 @@ __all__ = [
     # Internal (exposed for testing)
     "HealthManager",
     "TopologyGenerator",
+    "IncrementalTopologyMetrics",
+    # Snapshots
+    "FabricSnapshot",
+    "load_snapshot",
+    "save_snapshot",
 ]
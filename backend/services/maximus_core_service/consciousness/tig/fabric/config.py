@@ -20,6 +20,14 @@ class TopologyConfig:
     - density: Connection density (higher = more integration)
     - gamma: Scale-free exponent (2.5 = optimal hub/spoke balance)
     - clustering_target: Target clustering coefficient (0.75 = high differentiation)
+    - analytics_backend: "networkx" (default) or "sparse" (scipy CSR/csgraph,
+      exact Fiedler value; intended for 1k+ node fabrics)
+    - generator_mode: "networkx" (default) or "vectorized" (batched NumPy
+      sampling on edge arrays; intended for 1k+ node fabrics)
+    - seed: RNG seed for topology generation (same seed, same topology)
+    - snapshot_path: Directory for the on-disk topology snapshot. When set, a
+      snapshot built with an identical config is restored at initialize()
+      instead of regenerating; otherwise one is written after generation
 
     Parameter Tuning History:
     - 2025-10-06: min_degree 3→5, rewiring_probability 0.1→0.35, target_density 0.15→0.20
@@ -40,6 +48,10 @@ class TopologyConfig:
     clustering_target: float = 0.75
     enable_small_world_rewiring: bool = True
     rewiring_probability: float = 0.58  # CONSERVATIVE: Realistic density with IIT targets
+    analytics_backend: str = "networkx"
+    generator_mode: str = "networkx"
+    seed: int = 42
+    snapshot_path: str | None = None
 
     def __init__(
         self,
@@ -52,8 +64,12 @@ class TopologyConfig:
         clustering_target: float = 0.75,
         enable_small_world_rewiring: bool = True,
         rewiring_probability: float = 0.58,
-        rewire_probability: float | None = None,
-    ):  # Alias for rewiring_probability
+        rewire_probability: float | None = None,  # Alias for rewiring_probability
+        analytics_backend: str = "networkx",
+        generator_mode: str = "networkx",
+        seed: int = 42,
+        snapshot_path: str | None = None,
+    ):
         # Support both node_count and num_nodes (alias)
         if num_nodes is not None:
             node_count = num_nodes
@@ -73,3 +89,17 @@ class TopologyConfig:
         self.clustering_target = clustering_target
         self.enable_small_world_rewiring = enable_small_world_rewiring
         self.rewiring_probability = rewiring_probability
+
+        if analytics_backend not in ("networkx", "sparse"):
+            raise ValueError(
+                f"analytics_backend must be 'networkx' or 'sparse', got {analytics_backend!r}"
+            )
+        self.analytics_backend = analytics_backend
+
+        if generator_mode not in ("networkx", "vectorized"):
+            raise ValueError(
+                f"generator_mode must be 'networkx' or 'vectorized', got {generator_mode!r}"
+            )
+        self.generator_mode = generator_mode
+        self.seed = seed
+        self.snapshot_path = snapshot_path
@@ -8,6 +8,7 @@ The Global Interconnect Fabric - consciousness substrate.
 from __future__ import annotations
 
 import asyncio
+import logging
 from typing import Any
 
 import networkx as nx
@@ -15,12 +16,16 @@ import numpy as np
 
 from .config import TopologyConfig
 from .health import HealthManager
+from .incremental_metrics import IncrementalTopologyMetrics
 from .metrics import FabricMetrics
 from .metrics_computation import MetricsComputationMixin
 from .models import NodeState, TIGConnection
 from .node import TIGNode
+from .snapshot import FabricSnapshot, config_hash, load_snapshot, save_snapshot
 from .topology import TopologyGenerator
 
+logger = logging.getLogger(__name__)
+
 
 class TIGFabric(MetricsComputationMixin):
     """
@@ -65,6 +70,15 @@ class TIGFabric(MetricsComputationMixin):
         self._initialized = False
         self._initializing = False  # Track background init
 
+        # Change counters for consumers that cache compiled views of the fabric
+        # (e.g. ESGT coupling matrices). Bump on structure or weight changes.
+        self.topology_version = 0
+        self.weights_version = 0
+
+        # Incremental metrics state, seeded lazily on the first structural
+        # change after _compute_metrics (see MetricsComputationMixin)
+        self._metrics_engine: IncrementalTopologyMetrics | None = None
+
         # Health manager (FASE VII)
         self.health_manager = HealthManager(self)
 
@@ -91,18 +105,21 @@ class TIGFabric(MetricsComputationMixin):
             f"   Target: Scale-free (γ={self.config.gamma}) + Small-world (C≥{self.config.clustering_target})"
         )
 
-        # Step 1-2: Generate topology
-        generator = TopologyGenerator(self.config)
-        self.graph = generator.generate()
+        # Steps 1-5 are skipped when a snapshot for this config exists
+        if not self._restore_snapshot():
+            # Step 1-2: Generate topology
+            generator = TopologyGenerator(self.config)
+            self.graph = generator.generate()
 
-        # Step 3: Create TIGNode instances
-        self._instantiate_nodes()
+            # Step 3: Create TIGNode instances
+            self._instantiate_nodes()
 
-        # Step 4: Establish connections based on generated topology
-        self._establish_connections()
+            # Step 4: Establish connections based on generated topology
+            self._establish_connections()
 
-        # Step 5: Validate IIT compliance
-        self._compute_metrics()
+            # Step 5: Validate IIT compliance
+            self._compute_metrics()
+            self._write_snapshot()
 
         is_valid, violations = self.metrics.validate_iit_compliance()
 
@@ -175,19 +192,26 @@ class TIGFabric(MetricsComputationMixin):
             # Run CPU-bound topology generation in thread pool to avoid blocking event loop
             loop = asyncio.get_running_loop()
 
-            # Step 1-2: Generate topology (CPU-bound)
-            generator = TopologyGenerator(self.config)
-            await loop.run_in_executor(self._executor, generator.generate)
-            self.graph = generator.graph
+            # Steps 1-5 are skipped when a snapshot for this config exists.
+            # The snapshot is read off the loop but applied on it.
+            restored = await loop.run_in_executor(self._executor, self._read_snapshot)
+            if restored is not None:
+                self._apply_snapshot(*restored)
+            else:
+                # Step 1-2: Generate topology (CPU-bound)
+                generator = TopologyGenerator(self.config)
+                await loop.run_in_executor(self._executor, generator.generate)
+                self.graph = generator.graph
 
-            # Step 3: Create TIGNode instances (fast, can run async)
-            self._instantiate_nodes()
+                # Step 3: Create TIGNode instances (fast, can run async)
+                self._instantiate_nodes()
 
-            # Step 4: Establish connections (fast, can run async)
-            self._establish_connections()
+                # Step 4: Establish connections (fast, can run async)
+                self._establish_connections()
 
-            # Step 5: Compute metrics (CPU-bound)
-            await loop.run_in_executor(self._executor, self._compute_metrics)
+                # Step 5: Compute metrics (CPU-bound)
+                await loop.run_in_executor(self._executor, self._compute_metrics)
+                await loop.run_in_executor(self._executor, self._write_snapshot)
 
             is_valid, violations = self.metrics.validate_iit_compliance()
 
@@ -264,12 +288,28 @@ class TIGFabric(MetricsComputationMixin):
 
     def _instantiate_nodes(self) -> None:
         """Create TIGNode instances for each node in the graph."""
-        for node_id in self.graph.nodes():
+        self.nodes.update(self._new_nodes(self.graph))
+
+    @staticmethod
+    def _new_nodes(graph: nx.Graph) -> dict[str, TIGNode]:
+        """TIGNode instances for each node in graph, keyed by node id."""
+        nodes = {}
+        for node_id in graph.nodes():
             node = TIGNode(id=f"tig-node-{node_id:03d}", node_state=NodeState.INITIALIZING)
-            self.nodes[node.id] = node
+            nodes[node.id] = node
+        return nodes
+
+    def mark_topology_changed(self) -> None:
+        """Signal a structural change (connections, node isolation/reintegration)."""
+        self.topology_version += 1
+
+    def mark_weights_changed(self) -> None:
+        """Signal that connection weights changed without structural change."""
+        self.weights_version += 1
 
     def _establish_connections(self) -> None:
         """Establish bidirectional connections based on graph topology."""
+        self.mark_topology_changed()
         for edge in self.graph.edges():
             node_a_id = f"tig-node-{edge[0]:03d}"
             node_b_id = f"tig-node-{edge[1]:03d}"
@@ -293,6 +333,91 @@ class TIGFabric(MetricsComputationMixin):
                 bandwidth_bps=bandwidth,
             )
 
+    def create_snapshot(self) -> FabricSnapshot:
+        """Capture topology, link characteristics and metrics for save_snapshot()."""
+        edges = np.array(list(self.graph.edges()), dtype=np.int64).reshape(-1, 2)
+        links = [
+            self.nodes[f"tig-node-{a:03d}"].connections[f"tig-node-{b:03d}"] for a, b in edges.tolist()
+        ]
+        return FabricSnapshot(
+            config_hash=config_hash(self.config),
+            nodes=np.array(list(self.graph.nodes()), dtype=np.int64),
+            edges=edges,
+            latency_us=np.array([c.latency_us for c in links], dtype=np.float64),
+            bandwidth_bps=np.array([c.bandwidth_bps for c in links], dtype=np.int64),
+            weight=np.array([c.weight for c in links], dtype=np.float64),
+            metrics=self.metrics,
+        )
+
+    def _restore_snapshot(self) -> bool:
+        """Rebuild graph, nodes, connections and metrics from config.snapshot_path."""
+        restored = self._read_snapshot()
+        if restored is None:
+            return False
+        self._apply_snapshot(*restored)
+        return True
+
+    def _read_snapshot(self) -> tuple[nx.Graph, dict[str, TIGNode], FabricMetrics] | None:
+        """
+        Build graph, connected nodes and metrics from config.snapshot_path.
+
+        Touches no fabric state, so it can run in the init executor; the
+        result is installed with _apply_snapshot() on the event loop.
+        """
+        if self.config.snapshot_path is None:
+            return None
+        snapshot = load_snapshot(self.config.snapshot_path, self.config)
+        if snapshot is None:
+            return None
+
+        edges = snapshot.edges.tolist()
+        graph = nx.Graph()
+        graph.add_nodes_from(snapshot.nodes.tolist())
+        graph.add_edges_from(edges)
+        nodes = self._new_nodes(graph)
+
+        for (a, b), latency, bandwidth, weight in zip(
+            edges,
+            snapshot.latency_us.tolist(),
+            snapshot.bandwidth_bps.tolist(),
+            snapshot.weight.tolist(),
+        ):
+            node_a_id = f"tig-node-{a:03d}"
+            node_b_id = f"tig-node-{b:03d}"
+            nodes[node_a_id].connections[node_b_id] = TIGConnection(
+                remote_node_id=node_b_id, latency_us=latency, bandwidth_bps=bandwidth, weight=weight
+            )
+            nodes[node_b_id].connections[node_a_id] = TIGConnection(
+                remote_node_id=node_a_id, latency_us=latency, bandwidth_bps=bandwidth, weight=weight
+            )
+        return graph, nodes, snapshot.metrics
+
+    def _apply_snapshot(
+        self, graph: nx.Graph, nodes: dict[str, TIGNode], metrics: FabricMetrics
+    ) -> None:
+        """Install a topology built by _read_snapshot()."""
+        self.graph = graph
+        self.nodes.update(nodes)
+        self.mark_topology_changed()
+        self.metrics = metrics
+        self._metrics_engine = None
+        logger.info(
+            "TIG Fabric restored from snapshot %s (%d nodes, %d edges)",
+            self.config.snapshot_path,
+            graph.number_of_nodes(),
+            graph.number_of_edges(),
+        )
+
+    def _write_snapshot(self) -> None:
+        """Persist the freshly generated fabric to config.snapshot_path, if set."""
+        if self.config.snapshot_path is None:
+            return
+        try:
+            save_snapshot(self.create_snapshot(), self.config.snapshot_path)
+        except OSError as e:
+            # A missing cache only costs the next startup a regeneration
+            logger.warning("Could not write TIG snapshot to %s: %s", self.config.snapshot_path, e)
+
     async def broadcast_global(self, message: dict[str, Any], priority: int = 0) -> int:
         """
         Broadcast message to all nodes (implements GWD global workspace).
@@ -417,6 +542,8 @@ class TIGFabric(MetricsComputationMixin):
             for conn in node.connections.values():
                 conn.weight = min(conn.weight * 1.5, 2.0)
 
+        self.mark_weights_changed()
+
     async def exit_esgt_mode(self) -> None:
         """Return fabric to normal operation after ESGT dissolution."""
         for node in self.nodes.values():
@@ -426,6 +553,8 @@ class TIGFabric(MetricsComputationMixin):
             for conn in node.connections.values():
                 conn.weight = max(conn.weight / 1.5, 1.0)
 
+        self.mark_weights_changed()
+
     def __repr__(self) -> str:
         return (
             f"TIGFabric(nodes={self.metrics.node_count}, "
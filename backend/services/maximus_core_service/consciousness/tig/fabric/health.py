@@ -9,6 +9,7 @@ FASE VII (Safety Hardening) components.
 from __future__ import annotations
 
 import asyncio
+import logging
 import time
 from typing import TYPE_CHECKING, Any
 
@@ -20,6 +21,8 @@ from .models import CircuitBreaker, NodeHealth, NodeState, TIGConnection
 if TYPE_CHECKING:
     from .core import TIGFabric
 
+logger = logging.getLogger(__name__)
+
 
 class HealthManager:
     """
@@ -113,6 +116,8 @@ class HealthManager:
         node = self.fabric.nodes.get(node_id)
         if node:
             node.node_state = NodeState.OFFLINE
+        self.fabric.mark_topology_changed()
+        self.fabric._on_node_isolated(node_id)
 
         # Trigger topology repair
         await self._repair_topology_around_dead_node(node_id)
@@ -131,6 +136,8 @@ class HealthManager:
         node = self.fabric.nodes.get(node_id)
         if node:
             node.node_state = NodeState.ACTIVE
+        self.fabric.mark_topology_changed()
+        self.fabric._on_node_reintegrated(node_id)
 
         # Reset health tracking
         self.node_health[node_id].last_seen = time.time()
@@ -153,7 +160,7 @@ class HealthManager:
             return  # No bypass needed
 
         # Create bypass connections (connect neighbors to each other)
-        bypasses_created = 0
+        bypasses: list[tuple[str, str]] = []
         for i, n1_id in enumerate(neighbors):
             for n2_id in neighbors[i + 1 :]:
                 n1 = self.fabric.nodes.get(n1_id)
@@ -172,10 +179,12 @@ class HealthManager:
                         remote_node_id=n1_id, latency_us=latency, bandwidth_bps=bandwidth
                     )
 
-                    bypasses_created += 1
+                    bypasses.append((n1_id, n2_id))
 
-        if bypasses_created > 0:
-            logger.info("  ✓ Created %s bypass connections", bypasses_created)
+        if bypasses:
+            self.fabric.mark_topology_changed()
+            self.fabric._on_edges_added(bypasses)
+            logger.info("  ✓ Created %s bypass connections", len(bypasses))
 
     async def send_to_node(self, node_id: str, data: Any, timeout: float = 1.0) -> bool:
         """
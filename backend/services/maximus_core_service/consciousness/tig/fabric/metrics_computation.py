@@ -10,10 +10,19 @@ from typing import TYPE_CHECKING
 
 import networkx as nx
 import numpy as np
+from scipy import sparse
+
+from .incremental_metrics import IncrementalTopologyMetrics, count_short_paths
+from .models import NodeState
+from .sparse_analytics import compute_sparse_metrics, fiedler_value
 
 if TYPE_CHECKING:
     from .core import TIGFabric
 
+# The incremental engine keeps a dense n×n float32 distance matrix (64 MB at
+# this size); larger fabrics recompute with the block-BFS sparse backend instead
+INCREMENTAL_METRICS_MAX_NODES = 4096
+
 
 class MetricsComputationMixin:
     """Mixin providing metrics computation methods for TIGFabric.
@@ -22,10 +31,19 @@ class MetricsComputationMixin:
         _compute_metrics: Compute all consciousness-relevant metrics.
         _compute_eci: Compute Effective Connectivity Index.
         _detect_bottlenecks: Detect feed-forward bottlenecks.
+        _on_edges_added / _on_node_isolated / _on_node_reintegrated:
+            Incremental updates after a single structural change.
     """
 
     def _compute_metrics(self: TIGFabric) -> None:
         """Compute all consciousness-relevant metrics."""
+        # Full recomputation supersedes any incremental state
+        self._metrics_engine = None
+
+        if getattr(self.config, "analytics_backend", "networkx") == "sparse":
+            self._compute_metrics_sparse()
+            return
+
         # Basic graph metrics
         self.metrics.node_count = self.graph.number_of_nodes()
         self.metrics.edge_count = self.graph.number_of_edges()
@@ -61,7 +79,31 @@ class MetricsComputationMixin:
         # Feed-forward bottleneck detection
         self._detect_bottlenecks()
 
-        # Performance metrics
+        self._compute_link_metrics()
+
+    def _compute_metrics_sparse(self: TIGFabric, graph: nx.Graph | None = None) -> None:
+        """Compute all metrics with the scipy CSR backend (exact Fiedler value).
+
+        Args:
+            graph: Graph to analyse (defaults to the full fabric graph).
+        """
+        if graph is None:
+            graph = self.graph
+        sparse_metrics = compute_sparse_metrics(graph)
+
+        self.metrics.node_count = sparse_metrics.node_count
+        self.metrics.edge_count = sparse_metrics.edge_count
+        self.metrics.density = sparse_metrics.density
+        self.metrics.avg_clustering_coefficient = sparse_metrics.avg_clustering
+        self.metrics.avg_path_length = sparse_metrics.avg_path_length
+        self.metrics.algebraic_connectivity = sparse_metrics.algebraic_connectivity
+        self.metrics.effective_connectivity_index = min(sparse_metrics.global_efficiency, 1.0)
+
+        self._detect_bottlenecks(graph)
+        self._compute_link_metrics()
+
+    def _compute_link_metrics(self: TIGFabric) -> None:
+        """Compute latency/bandwidth aggregates over all connections."""
         latencies = [
             conn.latency_us for node in self.nodes.values() for conn in node.connections.values()
         ]
@@ -110,13 +152,18 @@ class MetricsComputationMixin:
         # Global efficiency is already in [0, 1] range
         return min(efficiency, 1.0)
 
-    def _detect_bottlenecks(self: TIGFabric) -> None:
+    def _detect_bottlenecks(self: TIGFabric, graph: nx.Graph | None = None) -> None:
         """Detect feed-forward bottlenecks that would prevent consciousness.
 
         A bottleneck exists when removing a node partitions the graph,
         indicating feed-forward information flow (IIT violation).
+
+        Args:
+            graph: Graph to analyse (defaults to the full fabric graph).
         """
-        articulation_points = list(nx.articulation_points(self.graph))
+        if graph is None:
+            graph = self.graph
+        articulation_points = list(nx.articulation_points(graph))
 
         if articulation_points:
             self.metrics.has_feed_forward_bottlenecks = True
@@ -125,25 +172,105 @@ class MetricsComputationMixin:
             self.metrics.has_feed_forward_bottlenecks = False
             self.metrics.bottleneck_locations = []
 
-        # Compute minimum path redundancy
+        # Compute minimum path redundancy (simple paths of <= 4 hops)
         if self.metrics.node_count > 1:
             redundancies = []
-            node_list = list(self.nodes.keys())
+            nodelist = list(graph.nodes())
+            index = {label: i for i, label in enumerate(nodelist)}
+            adjacency = sparse.csr_matrix(
+                nx.to_scipy_sparse_array(graph, nodelist=nodelist, weight=None, dtype=np.float64)
+            )
+            node_list = [
+                node_id for node_id in self.nodes if int(node_id.split("-")[-1]) in index
+            ]
 
             # Sample first 10 for efficiency
             for i, node_a_id in enumerate(node_list[:10]):
                 for node_b_id in node_list[i + 1 : i + 11]:
-                    try:
-                        paths = list(
-                            nx.all_simple_paths(
-                                self.graph,
-                                source=int(node_a_id.split("-")[-1]),
-                                target=int(node_b_id.split("-")[-1]),
-                                cutoff=4,
-                            )
+                    redundancies.append(
+                        count_short_paths(
+                            adjacency,
+                            index[int(node_a_id.split("-")[-1])],
+                            index[int(node_b_id.split("-")[-1])],
                         )
-                        redundancies.append(len(paths))
-                    except nx.NetworkXNoPath:  # pragma: no cover
-                        redundancies.append(0)
+                    )
 
             self.metrics.min_path_redundancy = min(redundancies) if redundancies else 0
+
+    # ------------------------------------------------------------------
+    # Incremental updates (health isolation/reintegration, topology repair)
+    # ------------------------------------------------------------------
+
+    def _get_metrics_engine(self: TIGFabric) -> IncrementalTopologyMetrics | None:
+        """Return the incremental engine, seeding it from the graph on first use.
+
+        None above INCREMENTAL_METRICS_MAX_NODES, where structural changes fall
+        back to _compute_active_metrics.
+        """
+        if self._metrics_engine is None:
+            if self.graph.number_of_nodes() > INCREMENTAL_METRICS_MAX_NODES:
+                return None
+            self._metrics_engine = IncrementalTopologyMetrics(self.graph)
+        return self._metrics_engine
+
+    def _on_edges_added(self: TIGFabric, edges: list[tuple[str, str]]) -> None:
+        """Record new connections (e.g. repair bypasses) and update metrics once."""
+        engine = self._get_metrics_engine()
+        changed = False
+        for node_a_id, node_b_id in edges:
+            a, b = int(node_a_id.split("-")[-1]), int(node_b_id.split("-")[-1])
+            if engine is None:
+                changed = changed or not self.graph.has_edge(a, b)
+            else:
+                changed = engine.add_edge(a, b) or changed
+            self.graph.add_edge(a, b)
+        if changed:
+            self._apply_incremental_metrics()
+
+    def _on_node_isolated(self: TIGFabric, node_id: str) -> None:
+        """Drop a node from the active topology and update metrics."""
+        engine = self._get_metrics_engine()
+        if engine is None or engine.remove_node(int(node_id.split("-")[-1])):
+            self._apply_incremental_metrics()
+
+    def _on_node_reintegrated(self: TIGFabric, node_id: str) -> None:
+        """Return a node and its connections to the active topology."""
+        engine = self._get_metrics_engine()
+        node = self.nodes.get(node_id)
+        neighbors = (
+            [int(remote_id.split("-")[-1]) for remote_id in node.connections] if node else []
+        )
+        if engine is None or engine.add_node(int(node_id.split("-")[-1]), neighbors):
+            self._apply_incremental_metrics()
+
+    def _compute_active_metrics(self: TIGFabric) -> None:
+        """Recompute metrics over non-offline nodes with the sparse backend."""
+        active = [
+            label
+            for label in self.graph.nodes()
+            if (node := self.nodes.get(f"tig-node-{label:03d}")) is None
+            or node.node_state != NodeState.OFFLINE
+        ]
+        self._compute_metrics_sparse(self.graph.subgraph(active))
+
+    def _apply_incremental_metrics(self: TIGFabric) -> None:
+        """Refresh FabricMetrics from the incremental engine's state."""
+        engine = self._get_metrics_engine()
+        if engine is None:
+            self._compute_active_metrics()
+            return
+        n = engine.node_count
+
+        self.metrics.node_count = n
+        self.metrics.edge_count = engine.edge_count
+        self.metrics.density = engine.density()
+        self.metrics.avg_clustering_coefficient = engine.avg_clustering()
+        self.metrics.avg_path_length = engine.avg_path_length()
+        if getattr(self.config, "analytics_backend", "networkx") == "sparse":
+            adjacency = engine._adjacency()[engine.active][:, engine.active]
+            self.metrics.algebraic_connectivity = fiedler_value(adjacency)
+        else:
+            self.metrics.algebraic_connectivity = engine.min_degree() / n if n else 0.0
+        self.metrics.effective_connectivity_index = min(engine.global_efficiency(), 1.0)
+        self._detect_bottlenecks(engine.graph.subgraph(engine.active_labels()))
+        self._compute_link_metrics()
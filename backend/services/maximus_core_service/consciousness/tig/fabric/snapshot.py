@@ -0,0 +1,151 @@
+"""
+TIG Fabric Snapshot - On-disk topology cache
+=============================================
+
+Lets a fabric start from a previously generated topology instead of
+regenerating it, re-randomizing connections and recomputing metrics.
+
+A snapshot is a directory of flat arrays plus a JSON manifest:
+
+    nodes.npy          (N,)   int64    graph node labels
+    edges.npy          (E, 2) int64    graph edges (labels)
+    latency_us.npy     (E,)   float64  per-edge link latency
+    bandwidth_bps.npy  (E,)   int64    per-edge link bandwidth
+    weight.npy         (E,)   float64  per-edge routing weight
+    meta.json                          format version, config hash, FabricMetrics
+
+Arrays are read whole with np.load: a restore converts every element into
+graph edges and connections, so one sequential read beats page-faulting a
+memory map. meta.json is written last and removed first, so a
+partially written snapshot is never considered valid. Any TopologyConfig
+change alters config_hash() and forces regeneration.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from .config import TopologyConfig
+from .metrics import FabricMetrics
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT_VERSION = 1
+META_FILE = "meta.json"
+ARRAY_NAMES = ("nodes", "edges", "latency_us", "bandwidth_bps", "weight")
+
+# Settings that do not affect the generated topology
+_UNHASHED_CONFIG_FIELDS = frozenset({"snapshot_path"})
+
+
+def config_hash(config: TopologyConfig) -> str:
+    """Stable hash of every topology-relevant TopologyConfig setting."""
+    settings = {k: v for k, v in vars(config).items() if k not in _UNHASHED_CONFIG_FIELDS}
+    encoded = json.dumps(settings, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+@dataclass
+class FabricSnapshot:
+    """Topology, link characteristics and metrics of an initialized fabric."""
+
+    config_hash: str
+    nodes: np.ndarray
+    edges: np.ndarray
+    latency_us: np.ndarray
+    bandwidth_bps: np.ndarray
+    weight: np.ndarray
+    metrics: FabricMetrics
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.edges)
+
+
+def save_snapshot(snapshot: FabricSnapshot, path: str | os.PathLike[str]) -> Path:
+    """Write a snapshot directory, replacing any previous snapshot at path."""
+    directory = Path(path)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    meta_path = directory / META_FILE
+    meta_path.unlink(missing_ok=True)  # Invalidate before touching arrays
+
+    for name in ARRAY_NAMES:
+        tmp = directory / f"{name}.tmp.npy"
+        np.save(tmp, np.ascontiguousarray(getattr(snapshot, name)))
+        os.replace(tmp, directory / f"{name}.npy")
+
+    meta = {
+        "format_version": SNAPSHOT_FORMAT_VERSION,
+        "config_hash": snapshot.config_hash,
+        "node_count": len(snapshot.nodes),
+        "edge_count": snapshot.edge_count,
+        "metrics": _metrics_to_dict(snapshot.metrics),
+    }
+    tmp = directory / f"{META_FILE}.tmp"
+    tmp.write_text(json.dumps(meta, indent=2))
+    os.replace(tmp, meta_path)
+    return directory
+
+
+def load_snapshot(
+    path: str | os.PathLike[str], config: TopologyConfig
+) -> FabricSnapshot | None:
+    """
+    Load a snapshot if it exists and matches config.
+
+    Returns None (and logs why) when the snapshot is missing, incomplete,
+    from another format version, or was built for a different config.
+    """
+    directory = Path(path)
+    meta_path = directory / META_FILE
+    if not meta_path.exists():
+        return None
+
+    try:
+        meta = json.loads(meta_path.read_text())
+        if meta.get("format_version") != SNAPSHOT_FORMAT_VERSION:
+            logger.info("TIG snapshot %s: format version mismatch, regenerating", directory)
+            return None
+
+        expected = config_hash(config)
+        if meta.get("config_hash") != expected:
+            logger.info("TIG snapshot %s: TopologyConfig changed, regenerating", directory)
+            return None
+
+        arrays = {
+            name: np.load(directory / f"{name}.npy") for name in ARRAY_NAMES
+        }
+
+        edge_count = meta["edge_count"]
+        if len(arrays["nodes"]) != meta["node_count"] or any(
+            len(arrays[name]) != edge_count for name in ARRAY_NAMES[1:]
+        ):
+            logger.warning("TIG snapshot %s: array sizes do not match manifest, regenerating", directory)
+            return None
+
+        # Raises TypeError if FabricMetrics fields changed since the snapshot was written
+        metrics = FabricMetrics(**meta["metrics"])
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning("TIG snapshot %s unreadable (%r), regenerating", directory, e)
+        return None
+
+    return FabricSnapshot(config_hash=expected, metrics=metrics, **arrays)
+
+
+def _metrics_to_dict(metrics: FabricMetrics) -> dict[str, Any]:
+    """FabricMetrics as JSON-safe builtins (fields may hold NumPy scalars)."""
+    data = dataclasses.asdict(metrics)
+    for key, value in data.items():
+        if isinstance(value, np.generic):
+            data[key] = value.item()
+    return data
@@ -9,16 +9,27 @@ from __future__ import annotations
 
 import networkx as nx
 import numpy as np
+from scipy import sparse
 
 from .config import TopologyConfig
 
 
+CLOSURE_BLOCKS = 4  # Sparse snapshots per vectorized triadic closure pass
+
+
 class TopologyGenerator:
     """
     Generates IIT-compliant network topologies.
 
     Implements Barabási-Albert scale-free model with triadic closure
     enhancements to achieve required clustering coefficients.
+
+    With config.generator_mode == "vectorized" the same two steps run on
+    NumPy edge arrays: preferential attachment draws from a degree-weighted
+    endpoint pool, and each triadic closure pass samples neighbor pairs for a
+    block of nodes at a time against a CSR snapshot of the graph (instead of
+    one np.random.choice / has_edge call per pair). Output is deterministic
+    for a given config.seed but is not the same graph as the networkx mode.
     """
 
     def __init__(self, config: TopologyConfig):
@@ -32,6 +43,13 @@ class TopologyGenerator:
         Returns:
             NetworkX graph with IIT-compliant structure
         """
+        if self.config.generator_mode == "vectorized":
+            edges = self.generate_edges()
+            self.graph = nx.Graph()
+            self.graph.add_nodes_from(range(self.config.node_count))
+            self.graph.add_edges_from(edges.tolist())
+            return self.graph
+
         # Step 1: Generate scale-free base
         self._generate_scale_free_base()
 
@@ -45,7 +63,9 @@ class TopologyGenerator:
         """Generate scale-free network using Barabási-Albert preferential attachment."""
         # Start with a small complete graph
         m = self.config.min_degree
-        self.graph = nx.barabasi_albert_graph(self.config.node_count, m, seed=42)
+        self.graph = nx.barabasi_albert_graph(
+            self.config.node_count, m, seed=self.config.seed
+        )
 
     def _apply_small_world_rewiring(self) -> None:
         """
@@ -65,7 +85,7 @@ class TopologyGenerator:
         Enhancement: Increased sampling rate and added second pass for stubborn cases.
         """
         # Set seed for reproducibility
-        np.random.seed(42)
+        np.random.seed(self.config.seed)
 
         if self.graph is None:
             return
@@ -133,3 +153,159 @@ class TopologyGenerator:
                     # Conservative probability for hub connections
                     if np.random.random() < 0.60:
                         self.graph.add_edge(n1, n2)
+
+    # ------------------------------------------------------------------
+    # Vectorized mode
+    # ------------------------------------------------------------------
+
+    def generate_edges(self) -> np.ndarray:
+        """
+        Generate the topology as an (E, 2) int array of edges (u < v).
+
+        Vectorized counterpart of generate(): BA base plus the same two
+        triadic closure passes, sampled in batches from a seeded Generator.
+        """
+        rng = np.random.default_rng(self.config.seed)
+        n = self.config.node_count
+        edges = _barabasi_albert_edges(n, self.config.min_degree, rng)
+
+        if not self.config.enable_small_world_rewiring:
+            return edges
+
+        # PASS 1: every node, 3.5x degree samples (max 35)
+        every_node = np.ones(n, dtype=bool)
+        edges = _closure_pass(edges, n, every_node, 3.5, 35, self.config.rewiring_probability, rng)
+
+        # PASS 2: hubs above the 75th degree percentile, 1.5x degree (max 15)
+        if n < 12:
+            return edges
+        degrees = np.bincount(edges.ravel(), minlength=n)
+        if len(np.unique(degrees)) <= 2:
+            return edges
+        threshold = np.sort(degrees)[min(int(n * 0.75), n - 1)]
+        return _closure_pass(edges, n, degrees > threshold, 1.5, 15, 0.60, rng)
+
+
+def _barabasi_albert_edges(n: int, m: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    Barabási-Albert preferential attachment as an edge array.
+
+    Seeds with a star on m + 1 nodes (as networkx), then each new node links
+    to m distinct targets drawn from the endpoint pool edges.ravel(), where
+    every node appears once per incident edge (probability proportional to
+    degree).
+
+    The pool only grows, so the size a node draws from is known up front:
+    all draws are made at once as pool positions. A position holding a
+    source is final; one holding an earlier draw's target is followed back
+    (pointer jumping) until it reaches a source or the star. Slots that
+    duplicate an earlier target of the same node are redrawn until every
+    node has m distinct targets.
+    """
+    if m < 1 or m >= n:
+        raise ValueError(f"Barabási-Albert requires 1 <= m < n, got m={m}, n={n}")
+
+    total = m + (n - m - 1) * m
+    edges = np.empty((total, 2), dtype=np.int64)
+    edges[:m, 0] = 0
+    edges[:m, 1] = np.arange(1, m + 1)
+    if total == m:
+        return edges
+
+    # Rows after the star, m per source node
+    sources = np.repeat(np.arange(m + 1, n, dtype=np.int64), m)
+    edges[m:, 1] = sources
+    # Each row draws from the 2 * (rows before its node) endpoints so far
+    pool_size = 2 * (m + (sources - m - 1) * m)
+    draws = rng.integers(0, pool_size)
+
+    redraw = np.ones(len(draws), dtype=bool)
+    while True:
+        ptr = draws.copy()
+        # Even positions past the star are targets drawn by earlier rows
+        pending = (ptr % 2 == 0) & (ptr // 2 >= m)
+        while pending.any():
+            ptr[pending] = draws[ptr[pending] // 2 - m]
+            pending[pending] = (ptr[pending] % 2 == 0) & (ptr[pending] // 2 >= m)
+        edges[m:, 0] = edges.ravel()[ptr]
+
+        targets = edges[m:, 0].reshape(-1, m)
+        duplicate = np.zeros(targets.shape, dtype=bool)
+        for j in range(1, m):
+            duplicate[:, j] = (targets[:, :j] == targets[:, j : j + 1]).any(axis=1)
+        redraw = duplicate.ravel()
+        if not redraw.any():
+            return edges
+        draws[redraw] = rng.integers(0, pool_size[redraw])
+
+
+def _closure_pass(
+    edges: np.ndarray,
+    n: int,
+    centers: np.ndarray,
+    rate: float,
+    max_samples: int,
+    probability: float,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """
+    Triadic closure over the selected centers in CLOSURE_BLOCKS node blocks.
+
+    The sequential loop lets edges closed around early nodes raise the degree
+    (and sample count) of later ones. Sampling block by block against the
+    updated graph keeps most of that effect at a few sparse rebuilds per pass.
+    """
+    bounds = np.linspace(0, n, min(CLOSURE_BLOCKS, n) + 1).astype(np.int64)
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        degrees = np.bincount(edges.ravel(), minlength=n)
+        samples = np.zeros(n, dtype=np.int64)
+        block = slice(start, stop)
+        samples[block] = np.minimum((degrees[block] * rate).astype(np.int64), max_samples)
+        samples[(degrees < 2) | ~centers] = 0
+        edges = _close_triangles(edges, n, samples, probability, rng)
+    return edges
+
+
+def _close_triangles(
+    edges: np.ndarray,
+    n: int,
+    samples: np.ndarray,
+    probability: float,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """
+    One batched triadic closure pass.
+
+    For node v, draws samples[v] random pairs of distinct neighbors (from the
+    graph as it stands at the start of the pass) and connects each missing
+    pair with the given probability. Returns the updated edge array.
+    """
+    adjacency = sparse.coo_matrix(
+        (np.ones(2 * len(edges), dtype=np.int8), (edges.ravel(), edges[:, ::-1].ravel())),
+        shape=(n, n),
+    ).tocsr()
+    indptr, indices = adjacency.indptr, adjacency.indices
+    degrees = np.diff(indptr)
+
+    centers = np.repeat(np.arange(n), samples)
+    if len(centers) == 0:
+        return edges
+    deg = degrees[centers]
+
+    # Two distinct neighbor slots per sample
+    first = (rng.random(len(centers)) * deg).astype(np.int64)
+    second = (rng.random(len(centers)) * (deg - 1)).astype(np.int64)
+    second += second >= first
+    a = indices[indptr[centers] + first]
+    b = indices[indptr[centers] + second]
+
+    accepted = rng.random(len(centers)) < probability
+    low = np.minimum(a, b)[accepted]
+    high = np.maximum(a, b)[accepted]
+
+    existing = edges.min(axis=1) * n + edges.max(axis=1)
+    candidates = np.unique(low * n + high)
+    new = candidates[~np.isin(candidates, existing)]
+    if len(new) == 0:
+        return edges
+    return np.concatenate([edges, np.column_stack([new // n, new % n])])
@@ -0,0 +1,57 @@
+"""TIG Topology Generation Benchmark
+
+Compares fabric topology generation time between the per-pair NetworkX
+generator and the vectorized NumPy generator (TopologyConfig
+generator_mode="vectorized") as the fabric grows.
+
+Target: vectorized generation of a 4096-node fabric in under 2s.
+"""
+
+from __future__ import annotations
+
+import time
+
+import networkx as nx
+import pytest
+
+from consciousness.tig.fabric import TopologyConfig, TopologyGenerator
+
+NODE_COUNTS = [32, 256, 1024, 4096]
+
+
+def _time_generation(node_count: int, mode: str) -> tuple[float, nx.Graph]:
+    config = TopologyConfig(node_count=node_count, generator_mode=mode)
+    start = time.perf_counter()
+    graph = TopologyGenerator(config).generate()
+    return (time.perf_counter() - start) * 1000, graph
+
+
+@pytest.mark.benchmark
+def test_topology_generation_scaling():
+    """Generation time per mode and fabric size."""
+    print("\n" + "=" * 72)
+    print("TIG TOPOLOGY GENERATION")
+    print("=" * 72)
+    print(f"{'nodes':>6} {'mode':>11} {'time (ms)':>11} {'edges':>8} {'density':>8} {'min deg':>8}")
+
+    results: dict[tuple[int, str], float] = {}
+    for node_count in NODE_COUNTS:
+        for mode in ("networkx", "vectorized"):
+            elapsed_ms, graph = _time_generation(node_count, mode)
+            results[(node_count, mode)] = elapsed_ms
+            min_degree = min(d for _, d in graph.degree())
+            print(
+                f"{node_count:>6} {mode:>11} {elapsed_ms:>11.1f} {graph.number_of_edges():>8} "
+                f"{nx.density(graph):>8.3f} {min_degree:>8}"
+            )
+
+            assert nx.is_connected(graph)
+            assert min_degree >= 5
+
+        speedup = results[(node_count, "networkx")] / results[(node_count, "vectorized")]
+        print(f"{'':>6} {'speedup':>11} {speedup:>10.1f}x")
+
+    print("=" * 72)
+
+    assert results[(4096, "vectorized")] < 2000
+    assert results[(4096, "vectorized")] < results[(4096, "networkx")]
@@ -0,0 +1,209 @@
+"""
+Compiled ESGT Topology Tests
+=============================
+
+Validates CSR topology compilation from the TIG fabric, cache reuse across
+ignitions, and invalidation on fabric structure/weight changes.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from consciousness.esgt.compiled_topology import TopologyCache, compile_fabric_topology
+from consciousness.esgt.coordinator import ESGTCoordinator
+from consciousness.esgt.kuramoto import OscillatorConfig
+from consciousness.esgt.kuramoto_vectorized import VectorizedKuramotoNetwork
+from consciousness.tig.fabric import TIGConnection, TIGFabric, TopologyConfig, TopologyGenerator
+
+
+@pytest.fixture
+def fabric():
+    """Fabric with generated topology and connections (no monitoring loop)."""
+    fabric = TIGFabric(TopologyConfig(node_count=12, min_degree=3))
+    fabric.graph = TopologyGenerator(fabric.config).generate()
+    fabric._instantiate_nodes()
+    fabric._establish_connections()
+    yield fabric
+    fabric._executor.shutdown(wait=False)
+
+
+def _coordinator(fabric, **kwargs):
+    coordinator = ESGTCoordinator(tig_fabric=fabric, **kwargs)
+    for node_id in fabric.nodes:
+        coordinator.kuramoto.add_oscillator(node_id, coordinator.kuramoto_config)
+    return coordinator
+
+
+@pytest.fixture
+def coordinator(fabric):
+    return _coordinator(fabric)
+
+
+@pytest.fixture
+def weighted_coordinator(fabric):
+    return _coordinator(fabric, weighted_coupling=True)
+
+
+class TestCompileFabricTopology:
+    def test_matches_dict_topology(self, coordinator, fabric):
+        participating = set(list(fabric.nodes)[:8])
+
+        compiled = coordinator._compile_topology(participating)
+        expected = coordinator._build_topology(participating)
+
+        assert {k: sorted(v) for k, v in compiled.topology.items()} == {
+            k: sorted(v) for k, v in expected.items()
+        }
+        assert compiled.edge_count == sum(len(v) for v in expected.values())
+        # Non-participating oscillators keep empty rows (free-running)
+        outside = [compiled.node_index[n] for n in fabric.nodes if n not in participating]
+        assert compiled.coupling[outside].nnz == 0
+
+    def test_inactive_connections_excluded(self, fabric):
+        node_ids = tuple(fabric.nodes)
+        first = fabric.nodes[node_ids[0]]
+        for conn in first.connections.values():
+            conn.active = False
+
+        compiled = compile_fabric_topology(fabric, set(node_ids), node_ids)
+
+        assert compiled.topology[node_ids[0]] == []
+
+
+class TestTopologyCache:
+    def test_reuses_compiled_topology_for_same_set(self, coordinator, fabric):
+        participating = set(fabric.nodes)
+
+        first = coordinator._compile_topology(participating)
+        second = coordinator._compile_topology(set(participating))
+
+        assert first is second
+        assert coordinator._topology_cache.hits == 1
+        assert coordinator._topology_cache.misses == 1
+
+    def test_structural_change_invalidates(self, coordinator, fabric):
+        participating = set(fabric.nodes)
+        first = coordinator._compile_topology(participating)
+
+        a, b = sorted(fabric.nodes)[0], sorted(fabric.nodes)[-1]
+        fabric.nodes[a].connections.pop(b, None)
+        fabric.nodes[b].connections.pop(a, None)
+        fabric.nodes[a].connections[b] = TIGConnection(remote_node_id=b)
+        fabric.mark_topology_changed()
+
+        second = coordinator._compile_topology(participating)
+
+        assert second is not first
+        assert b in second.topology[a]
+
+    @pytest.mark.asyncio
+    async def test_weight_change_refreshes_in_place(self, weighted_coordinator, fabric):
+        coordinator = weighted_coordinator
+        participating = set(fabric.nodes)
+        compiled = coordinator._compile_topology(participating)
+        assert np.allclose(compiled.weights, 1.0)
+
+        await fabric.enter_esgt_mode()
+        refreshed = coordinator._compile_topology(participating)
+
+        assert refreshed is compiled
+        assert np.allclose(refreshed.weights, 1.5)
+        assert coordinator._topology_cache.weight_refreshes == 1
+
+        await fabric.exit_esgt_mode()
+        assert np.allclose(coordinator._compile_topology(participating).weights, 1.0)
+
+    @pytest.mark.asyncio
+    async def test_uniform_coupling_by_default(self, coordinator, fabric):
+        """ESGT-mode weights do not change coupling unless weighted_coupling is set."""
+        participating = set(fabric.nodes)
+        compiled = coordinator._compile_topology(participating)
+
+        await fabric.enter_esgt_mode()
+        sustained = coordinator._compile_topology(participating)
+
+        assert sustained is compiled
+        assert np.allclose(sustained.weights, 1.0)
+        await fabric.exit_esgt_mode()
+
+    def test_oscillator_change_invalidates(self, coordinator, fabric):
+        participating = set(fabric.nodes)
+        first = coordinator._compile_topology(participating)
+
+        coordinator.kuramoto.add_oscillator("late-node")
+
+        second = coordinator._compile_topology(participating)
+        assert second is not first
+        assert second.node_ids == coordinator.kuramoto.node_ids
+
+    def test_lru_bound(self, fabric):
+        cache = TopologyCache(max_entries=2)
+        node_ids = tuple(fabric.nodes)
+        for i in range(4):
+            cache.get(fabric, set(node_ids[i:]), node_ids)
+        assert len(cache) == 2
+
+
+class TestCompiledTopologyIntegration:
+    def test_update_network_matches_dict_topology(self, fabric):
+        config = OscillatorConfig(phase_noise=0.0)
+        compiled_net = VectorizedKuramotoNetwork(config)
+        dict_net = VectorizedKuramotoNetwork(config)
+        for i, node_id in enumerate(fabric.nodes):
+            for network in (compiled_net, dict_net):
+                network.add_oscillator(node_id)
+                network.oscillators[node_id].phase = 0.4 * i
+
+        participating = set(fabric.nodes)
+        compiled = compile_fabric_topology(fabric, participating, compiled_net.node_ids)
+
+        for _ in range(10):
+            compiled_net.update_network(compiled)
+            dict_net.update_network(compiled.topology)
+
+        assert np.allclose(
+            compiled_net.get_phase_distribution(), dict_net.get_phase_distribution()
+        )
+
+    @pytest.mark.asyncio
+    async def test_weighted_vs_uniform_dynamics_in_esgt_mode(self, fabric):
+        """Uniform compiled coupling matches the dict path; weighted couples 1.5x."""
+        config = OscillatorConfig(phase_noise=0.0)
+        networks = {name: VectorizedKuramotoNetwork(config) for name in ("dict", "uniform", "weighted", "scaled")}
+        for i, node_id in enumerate(fabric.nodes):
+            for name, network in networks.items():
+                scale = 1.5 if name == "scaled" else 1.0
+                network.add_oscillator(
+                    node_id,
+                    OscillatorConfig(phase_noise=0.0, coupling_strength=config.coupling_strength * scale),
+                )
+                network.oscillators[node_id].phase = 0.4 * i
+                network.oscillators[node_id].frequency = 40.0
+
+        participating = set(fabric.nodes)
+        await fabric.enter_esgt_mode()
+        uniform = compile_fabric_topology(fabric, participating, networks["uniform"].node_ids)
+        weighted = compile_fabric_topology(fabric, participating, networks["weighted"].node_ids, weighted=True)
+
+        for _ in range(10):
+            networks["dict"].update_network(uniform.topology)
+            networks["uniform"].update_network(uniform)
+            networks["weighted"].update_network(weighted)
+            networks["scaled"].update_network(uniform.topology)
+        await fabric.exit_esgt_mode()
+
+        phases = {name: np.asarray(network.get_phase_distribution()) for name, network in networks.items()}
+        assert np.allclose(phases["uniform"], phases["dict"])
+        assert np.allclose(phases["weighted"], phases["scaled"])
+        assert not np.allclose(phases["weighted"], phases["uniform"])
+
+    def test_rejects_topology_for_other_oscillator_set(self, fabric):
+        network = VectorizedKuramotoNetwork()
+        for node_id in fabric.nodes:
+            network.add_oscillator(node_id)
+        compiled = compile_fabric_topology(fabric, set(fabric.nodes), tuple(fabric.nodes))
+
+        with pytest.raises(ValueError):
+            network.update_network(compiled)
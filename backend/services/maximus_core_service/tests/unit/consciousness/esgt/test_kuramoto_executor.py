@@ -0,0 +1,129 @@
+"""
+Kuramoto Executor Tests
+========================
+
+Validates off-event-loop integration (thread and shared-memory process
+pools), parity with inline integration, and loop-blocking metrics.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from consciousness.esgt.kuramoto import OscillatorConfig
+from consciousness.esgt.kuramoto_executor import KuramotoExecutor, LoopBlockingMetrics
+from consciousness.esgt.kuramoto_vectorized import VectorizedKuramotoNetwork
+
+
+def _ring_topology(n: int) -> dict[str, list[str]]:
+    return {
+        f"node-{i:03d}": [f"node-{(i - 1) % n:03d}", f"node-{(i + 1) % n:03d}"]
+        for i in range(n)
+    }
+
+
+def _network(executor: KuramotoExecutor | None = None, n: int = 8) -> VectorizedKuramotoNetwork:
+    network = VectorizedKuramotoNetwork(OscillatorConfig(phase_noise=0.0), executor)
+    for i in range(n):
+        node_id = f"node-{i:03d}"
+        network.add_oscillator(node_id)
+        network.oscillators[node_id].phase = 0.3 * i
+    return network
+
+
+@pytest.fixture(params=["thread", "process"])
+def executor(request):
+    executor = KuramotoExecutor(mode=request.param)
+    yield executor
+    executor.shutdown()
+
+
+class TestKuramotoExecutor:
+    @pytest.mark.asyncio
+    async def test_offloaded_matches_inline(self, executor):
+        inline = _network()
+        offloaded = _network(executor)
+        topology = _ring_topology(8)
+
+        expected = await inline.run_steps(topology, 25)
+        actual = await offloaded.run_steps(topology, 25)
+
+        assert np.allclose(actual, expected)
+        assert np.allclose(offloaded.get_phase_distribution(), inline.get_phase_distribution())
+        assert np.allclose(offloaded.history.phases(), inline.history.phases())
+        assert len(offloaded.dynamics.coherence_history) == 25
+
+    @pytest.mark.asyncio
+    async def test_time_to_sync_is_simulated_time(self, executor):
+        inline = _network()
+        offloaded = _network(executor)
+        topology = {a: [b for b in inline.node_ids if b != a] for a in inline.node_ids}
+
+        expected = await inline.synchronize(topology, duration_ms=300.0, target_coherence=0.70, dt=0.005)
+        actual = await offloaded.synchronize(topology, duration_ms=300.0, target_coherence=0.70, dt=0.005)
+
+        first = next(i for i, r in enumerate(expected.coherence_history) if r >= 0.70)
+        assert expected.time_to_sync == pytest.approx((first + 1) * 0.005)
+        assert actual.time_to_sync == pytest.approx(expected.time_to_sync)
+
+    @pytest.mark.asyncio
+    async def test_synchronize_offloaded(self, executor):
+        network = _network(executor)
+        topology = {a: [b for b in network.node_ids if b != a] for a in network.node_ids}
+
+        dynamics = await network.synchronize(topology, duration_ms=300.0, target_coherence=0.70)
+
+        assert len(dynamics.coherence_history) == 60
+        assert dynamics.time_to_sync is not None
+        assert network.get_coherence().is_conscious_level()
+
+    def test_invalid_mode(self):
+        with pytest.raises(ValueError):
+            KuramotoExecutor(mode="gpu")
+
+
+class TestLoopBlockingMetrics:
+    @pytest.mark.asyncio
+    async def test_inline_records_segments(self):
+        network = _network()
+
+        await network.run_steps(_ring_topology(8), 30)
+
+        metrics = network.loop_metrics
+        assert metrics.runs == 1
+        assert metrics.steps == 30
+        assert 0 < metrics.max_blocking_ms <= metrics.total_blocking_ms
+
+    @pytest.mark.asyncio
+    async def test_offloaded_loop_stays_responsive(self):
+        executor = KuramotoExecutor(mode="thread")
+        network = _network(executor)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(ticker())
+        try:
+            await network.run_steps(_ring_topology(8), 200)
+        finally:
+            task.cancel()
+            executor.shutdown()
+
+        assert ticks > 1
+        assert network.loop_metrics.to_dict()["runs"] == 1
+
+    def test_record_and_average(self):
+        metrics = LoopBlockingMetrics()
+        metrics.record(10, [1.0, 3.0], wall_ms=5.0)
+        metrics.record(10, [2.0], wall_ms=2.0)
+
+        assert metrics.max_blocking_ms == 3.0
+        assert metrics.avg_blocking_ms == 3.0
+        assert metrics.total_wall_ms == 7.0
@@ -0,0 +1,112 @@
+"""
+Kuramoto History Buffer Tests
+==============================
+
+Validates O(1) ring-buffer writes, zero-copy windowed views and bounded
+retention for Kuramoto phase/frequency history.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from consciousness.esgt.kuramoto import KuramotoOscillator, OscillatorConfig
+from consciousness.esgt.kuramoto_history import PhaseHistoryBuffer
+from consciousness.esgt.kuramoto_vectorized import VectorizedKuramotoNetwork
+
+
+class TestPhaseHistoryBuffer:
+    def test_window_is_chronological_after_wrap(self):
+        buffer = PhaseHistoryBuffer(("a", "b"), window=4)
+        for step in range(10):
+            buffer.record(np.array([step, -step], dtype=float), np.zeros(2))
+
+        assert len(buffer) == 4
+        assert buffer.total_steps == 10
+        assert buffer.phases()[:, 0].tolist() == [6.0, 7.0, 8.0, 9.0]
+        assert buffer.phases(2)[:, 1].tolist() == [-8.0, -9.0]
+        assert buffer.node_phases("b", 1).tolist() == [-9.0]
+
+    def test_views_are_zero_copy(self):
+        buffer = PhaseHistoryBuffer(("a",), window=3)
+        for step in range(5):
+            buffer.record(np.array([float(step)]), np.array([float(step)]))
+
+        assert np.shares_memory(buffer.phases(), buffer._phases)
+        assert np.shares_memory(buffer.frequencies(2), buffer._frequencies)
+
+    def test_partial_fill_and_clear(self):
+        buffer = PhaseHistoryBuffer(("a",), window=8)
+        assert buffer.phases().shape == (0, 1)
+
+        buffer.record(np.array([1.0]), np.array([40.0]))
+        assert buffer.phases(5).tolist() == [[1.0]]
+        assert buffer.frequencies().tolist() == [[40.0]]
+
+        buffer.clear()
+        assert len(buffer) == 0
+
+    def test_invalid_window(self):
+        with pytest.raises(ValueError):
+            PhaseHistoryBuffer(("a",), window=0)
+
+
+class TestOscillatorHistory:
+    def test_history_bounded_by_config_window(self):
+        osc = KuramotoOscillator("node-001", OscillatorConfig(history_window=5))
+        for _ in range(20):
+            osc.update({}, {}, dt=0.005)
+
+        assert len(osc.phase_history) == 5
+        assert len(osc.frequency_history) == 5
+        assert osc.phase_history[-1] == osc.phase
+
+
+class TestNetworkHistory:
+    def _network(self, n: int = 4, window: int = 16) -> VectorizedKuramotoNetwork:
+        network = VectorizedKuramotoNetwork(OscillatorConfig(history_window=window))
+        for i in range(n):
+            network.add_oscillator(f"node-{i:03d}")
+        return network
+
+    def test_memory_stays_flat(self):
+        network = self._network(window=16)
+        topology = {f"node-{i:03d}": [f"node-{(i + 1) % 4:03d}"] for i in range(4)}
+
+        network.update_network(topology)
+        nbytes = network.history.nbytes
+        for _ in range(200):
+            network.update_network(topology)
+
+        assert len(network.history) == 16
+        assert network.history.total_steps == 201
+        assert network.history.nbytes == nbytes
+
+    def test_windowed_phase_distribution(self):
+        network = self._network()
+        for _ in range(5):
+            network.update_network({})
+
+        window = network.get_phase_distribution(window=3)
+
+        assert window.shape == (3, 4)
+        assert np.allclose(window[-1], network.get_phase_distribution())
+
+    def test_history_reallocated_on_oscillator_change(self):
+        network = self._network()
+        network.update_network({})
+        first = network.history
+
+        network.add_oscillator("node-extra")
+
+        assert network.history is not first
+        assert network.history.phases().shape == (0, 5)
+
+    def test_reset_all_clears_history(self):
+        network = self._network()
+        network.update_network({})
+
+        network.reset_all()
+
+        assert len(network.history) == 0
@@ -0,0 +1,190 @@
+"""
+TIG Fabric Snapshot Tests
+==========================
+
+Validates the on-disk topology snapshot: round trip of topology, link
+characteristics and metrics, config-hash invalidation and restore through
+TIGFabric.initialize() and initialize_async().
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+
+import numpy as np
+import pytest
+
+from consciousness.tig.fabric import (
+    TIGFabric,
+    TopologyConfig,
+    load_snapshot,
+    save_snapshot,
+)
+from consciousness.tig.fabric.snapshot import META_FILE, config_hash
+
+
+async def _initialized_fabric(config: TopologyConfig) -> TIGFabric:
+    fabric = TIGFabric(config)
+    await fabric.initialize()
+    return fabric
+
+
+def _links(fabric: TIGFabric) -> dict[tuple[str, str], tuple[float, int, float]]:
+    return {
+        (node.id, remote): (conn.latency_us, conn.bandwidth_bps, conn.weight)
+        for node in fabric.nodes.values()
+        for remote, conn in node.connections.items()
+    }
+
+
+class TestConfigHash:
+    def test_ignores_snapshot_path(self):
+        assert config_hash(TopologyConfig(node_count=16)) == config_hash(
+            TopologyConfig(node_count=16, snapshot_path="/tmp/elsewhere")
+        )
+
+    def test_changes_with_topology_settings(self):
+        base = config_hash(TopologyConfig(node_count=16))
+        assert config_hash(TopologyConfig(node_count=17)) != base
+        assert config_hash(TopologyConfig(node_count=16, seed=1)) != base
+
+
+class TestSnapshotFiles:
+    @pytest.mark.asyncio
+    async def test_round_trip_arrays(self, tmp_path):
+        config = TopologyConfig(node_count=16)
+        fabric = await _initialized_fabric(config)
+        try:
+            snapshot = fabric.create_snapshot()
+            save_snapshot(snapshot, tmp_path)
+
+            loaded = load_snapshot(tmp_path, config)
+        finally:
+            await fabric.stop()
+
+        assert loaded is not None
+        assert not isinstance(loaded.edges, np.memmap)
+        np.testing.assert_array_equal(loaded.edges, snapshot.edges)
+        np.testing.assert_array_equal(loaded.latency_us, snapshot.latency_us)
+        np.testing.assert_array_equal(loaded.bandwidth_bps, snapshot.bandwidth_bps)
+        assert loaded.metrics.avg_clustering_coefficient == pytest.approx(
+            snapshot.metrics.avg_clustering_coefficient
+        )
+        assert loaded.metrics.bottleneck_locations == snapshot.metrics.bottleneck_locations
+
+    @pytest.mark.asyncio
+    async def test_config_change_invalidates(self, tmp_path):
+        fabric = await _initialized_fabric(TopologyConfig(node_count=16))
+        try:
+            save_snapshot(fabric.create_snapshot(), tmp_path)
+        finally:
+            await fabric.stop()
+
+        assert load_snapshot(tmp_path, TopologyConfig(node_count=16, seed=7)) is None
+        assert load_snapshot(tmp_path, TopologyConfig(node_count=16)) is not None
+
+    def test_missing_or_incomplete_snapshot(self, tmp_path):
+        config = TopologyConfig(node_count=16)
+        assert load_snapshot(tmp_path / "absent", config) is None
+
+        meta = {
+            "format_version": 1,
+            "config_hash": config_hash(config),
+            "node_count": 16,
+            "edge_count": 0,
+            "metrics": {},
+        }
+        (tmp_path / META_FILE).write_text(json.dumps(meta))
+        assert load_snapshot(tmp_path, config) is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("field", ["node_count", "metrics"])
+    async def test_malformed_manifest_regenerates(self, tmp_path, field):
+        config = TopologyConfig(node_count=16)
+        fabric = await _initialized_fabric(config)
+        try:
+            save_snapshot(fabric.create_snapshot(), tmp_path)
+        finally:
+            await fabric.stop()
+
+        meta_path = tmp_path / META_FILE
+        meta = json.loads(meta_path.read_text())
+        if field == "metrics":
+            meta["metrics"]["renamed_field"] = meta["metrics"].pop("avg_clustering_coefficient")
+        else:
+            del meta[field]
+        meta_path.write_text(json.dumps(meta))
+
+        assert load_snapshot(tmp_path, config) is None
+
+
+class TestFabricRestore:
+    @pytest.mark.asyncio
+    async def test_initialize_writes_then_restores(self, tmp_path, monkeypatch):
+        config = TopologyConfig(node_count=16, snapshot_path=str(tmp_path))
+        first = await _initialized_fabric(config)
+        try:
+            expected_links = _links(first)
+            expected_metrics = first.metrics
+        finally:
+            await first.stop()
+        assert (tmp_path / META_FILE).exists()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("topology should not be regenerated")
+
+        monkeypatch.setattr("consciousness.tig.fabric.core.TopologyGenerator.generate", fail)
+        monkeypatch.setattr(TIGFabric, "_compute_metrics", fail)
+
+        second = await _initialized_fabric(TopologyConfig(node_count=16, snapshot_path=str(tmp_path)))
+        try:
+            assert second.is_ready()
+            assert _links(second) == expected_links
+            assert second.metrics.effective_connectivity_index == pytest.approx(
+                expected_metrics.effective_connectivity_index
+            )
+            assert second.graph.number_of_edges() == len(expected_links) // 2
+        finally:
+            await second.stop()
+
+    @pytest.mark.asyncio
+    async def test_background_restore_applies_on_loop(self, tmp_path, monkeypatch):
+        config = TopologyConfig(node_count=16, snapshot_path=str(tmp_path))
+        first = await _initialized_fabric(config)
+        try:
+            expected_links = _links(first)
+        finally:
+            await first.stop()
+
+        second = TIGFabric(TopologyConfig(node_count=16, snapshot_path=str(tmp_path)))
+        loop_thread = threading.get_ident()
+        apply_threads = []
+        apply_snapshot = TIGFabric._apply_snapshot
+
+        def record_thread(self, *args):
+            apply_threads.append(threading.get_ident())
+            apply_snapshot(self, *args)
+
+        monkeypatch.setattr(TIGFabric, "_apply_snapshot", record_thread)
+        await second.initialize_async()
+        await second._init_task
+        try:
+            assert apply_threads == [loop_thread]
+            assert _links(second) == expected_links
+        finally:
+            await second.stop()
+
+    @pytest.mark.asyncio
+    async def test_changed_config_regenerates(self, tmp_path):
+        first = await _initialized_fabric(TopologyConfig(node_count=16, snapshot_path=str(tmp_path)))
+        await first.stop()
+
+        second = await _initialized_fabric(TopologyConfig(node_count=20, snapshot_path=str(tmp_path)))
+        try:
+            assert len(second.nodes) == 20
+        finally:
+            await second.stop()
+
+        # The regenerated fabric replaced the stale snapshot
+        assert load_snapshot(tmp_path, TopologyConfig(node_count=20)) is not None
@@ -0,0 +1,207 @@
+"""
+TIG Incremental Metrics Tests
+==============================
+
+Validates that IncrementalTopologyMetrics tracks the NetworkX reference
+metrics through edge/node insertions and deletions, and that fabric health
+isolation, repair and reintegration update FabricMetrics without a full
+recomputation.
+"""
+
+from __future__ import annotations
+
+import random
+import warnings
+
+import networkx as nx
+import numpy as np
+import pytest
+from scipy.sparse import csgraph
+
+from consciousness.tig.fabric import (
+    IncrementalTopologyMetrics,
+    TIGFabric,
+    TopologyConfig,
+    TopologyGenerator,
+)
+from consciousness.tig.fabric import incremental_metrics, metrics_computation
+from consciousness.tig.fabric.incremental_metrics import count_short_paths
+
+
+def _assert_matches(engine: IncrementalTopologyMetrics) -> None:
+    reference = engine.graph.subgraph(engine.active_labels())
+    assert engine.node_count == reference.number_of_nodes()
+    assert engine.edge_count == reference.number_of_edges()
+    assert engine.density() == pytest.approx(nx.density(reference))
+    assert engine.avg_clustering() == pytest.approx(nx.average_clustering(reference))
+    assert engine.global_efficiency() == pytest.approx(nx.global_efficiency(reference))
+
+    largest = reference.subgraph(max(nx.connected_components(reference), key=len))
+    assert engine.avg_path_length() == pytest.approx(nx.average_shortest_path_length(largest))
+    assert set(engine.articulation_points()) == set(nx.articulation_points(reference))
+
+
+@pytest.fixture
+def graph():
+    return nx.connected_watts_strogatz_graph(40, 4, 0.2, seed=11)
+
+
+class TestIncrementalTopologyMetrics:
+    def test_initial_state_matches_networkx(self, graph):
+        _assert_matches(IncrementalTopologyMetrics(graph))
+
+    def test_random_edge_churn(self, graph):
+        engine = IncrementalTopologyMetrics(graph)
+        rng = random.Random(5)
+
+        for _ in range(30):
+            a, b = rng.sample(range(40), 2)
+            if engine.graph.has_edge(a, b):
+                engine.remove_edge(a, b)
+            else:
+                engine.add_edge(a, b)
+            _assert_matches(engine)
+
+    def test_node_removal_and_return(self, graph):
+        engine = IncrementalTopologyMetrics(graph)
+        neighbors = list(graph.neighbors(7))
+
+        assert engine.remove_node(7)
+        _assert_matches(engine)
+        assert 7 not in engine.active_labels()
+
+        assert engine.add_node(7, neighbors)
+        _assert_matches(engine)
+        assert engine.global_efficiency() == pytest.approx(nx.global_efficiency(graph))
+
+    def test_deletion_only_recomputes_affected_rows(self):
+        # In a complete graph only the endpoints route through edge (0, 1)
+        engine = IncrementalTopologyMetrics(nx.complete_graph(20))
+
+        engine.remove_edge(0, 1)
+
+        assert engine.bfs_sources == 2
+        _assert_matches(engine)
+
+    def test_ignores_unknown_and_duplicate_edges(self, graph):
+        engine = IncrementalTopologyMetrics(graph)
+        a, b = next(iter(graph.edges()))
+
+        assert not engine.add_edge(a, b)
+        assert not engine.add_edge(a, 999)
+        assert not engine.remove_edge(0, 999)
+        assert not engine.remove_node(999)
+
+    def test_disconnected_graph_raises_no_warnings(self):
+        # Two components: rows from the far component are inf at both ends
+        graph = nx.disjoint_union(nx.cycle_graph(6), nx.cycle_graph(6))
+        engine = IncrementalTopologyMetrics(graph)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", RuntimeWarning)
+            engine.remove_edge(0, 1)
+            engine.add_edge(0, 6)
+            engine.remove_node(3)
+
+        assert engine.bfs_sources > 0
+
+    def test_add_new_node(self, graph):
+        engine = IncrementalTopologyMetrics(graph)
+
+        assert engine.add_node(40, [0, 1, 2])
+
+        assert engine.node_count == 41
+        _assert_matches(engine)
+
+    def test_distances_filled_in_row_blocks(self, graph, monkeypatch):
+        monkeypatch.setattr(incremental_metrics, "BFS_ROW_BLOCK", 7)
+        engine = IncrementalTopologyMetrics(graph)
+
+        expected = csgraph.shortest_path(
+            nx.to_scipy_sparse_array(graph, nodelist=engine.labels, weight=None),
+            unweighted=True,
+            directed=False,
+        )
+        assert engine.distances.dtype == np.float32
+        np.testing.assert_array_equal(engine.distances, expected)
+
+        engine.remove_node(7)
+        assert engine.bfs_sources > 7
+        _assert_matches(engine)
+
+
+class TestCountShortPaths:
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_matches_all_simple_paths(self, seed):
+        graph = nx.gnp_random_graph(14, 0.35, seed=seed)
+        adjacency = nx.to_scipy_sparse_array(graph, weight=None, dtype=float).tocsr()
+
+        for i, j in [(0, 1), (2, 9), (5, 13), (7, 8)]:
+            expected = len(list(nx.all_simple_paths(graph, i, j, cutoff=4)))
+            assert count_short_paths(adjacency, i, j) == expected
+
+
+class TestFabricIncrementalMetrics:
+    @pytest.fixture
+    def fabric(self):
+        fabric = TIGFabric(TopologyConfig(node_count=24, min_degree=3))
+        fabric.graph = TopologyGenerator(fabric.config).generate()
+        fabric._instantiate_nodes()
+        fabric._establish_connections()
+        fabric._compute_metrics()
+        fabric.health_manager.initialize()
+        yield fabric
+        fabric._executor.shutdown(wait=False)
+
+    @pytest.mark.asyncio
+    async def test_isolation_and_repair_update_metrics(self, fabric):
+        await fabric.health_manager._isolate_dead_node("tig-node-005")
+
+        engine = fabric._metrics_engine
+        assert engine is not None
+        assert fabric.metrics.node_count == 23
+        _assert_matches(engine)
+
+        # Bypass edges between the dead node's neighbors are in the graph
+        neighbors = [int(n.split("-")[-1]) for n in fabric.nodes["tig-node-005"].connections]
+        for i, a in enumerate(neighbors):
+            for b in neighbors[i + 1 :]:
+                assert engine.graph.has_edge(a, b)
+
+        active = fabric.graph.subgraph(engine.active_labels())
+        assert fabric.metrics.effective_connectivity_index == pytest.approx(
+            nx.global_efficiency(active)
+        )
+
+    @pytest.mark.asyncio
+    async def test_reintegration_restores_node(self, fabric):
+        await fabric.health_manager._isolate_dead_node("tig-node-005")
+        await fabric.health_manager._reintegrate_node("tig-node-005")
+
+        assert fabric.metrics.node_count == 24
+        _assert_matches(fabric._metrics_engine)
+
+    @pytest.mark.asyncio
+    async def test_large_fabric_falls_back_to_sparse_recompute(self, fabric, monkeypatch):
+        monkeypatch.setattr(metrics_computation, "INCREMENTAL_METRICS_MAX_NODES", 16)
+
+        await fabric.health_manager._isolate_dead_node("tig-node-005")
+
+        assert fabric._metrics_engine is None
+        assert fabric.metrics.node_count == 23
+        active = fabric.graph.subgraph(n for n in fabric.graph if n != 5)
+        assert fabric.metrics.edge_count == active.number_of_edges()
+        assert fabric.metrics.effective_connectivity_index == pytest.approx(
+            nx.global_efficiency(active)
+        )
+
+        await fabric.health_manager._reintegrate_node("tig-node-005")
+        assert fabric.metrics.node_count == 24
+
+    def test_full_recompute_resets_engine(self, fabric):
+        fabric._on_node_isolated("tig-node-003")
+        assert fabric._metrics_engine is not None
+
+        fabric._compute_metrics()
+
+        assert fabric._metrics_engine is None
@@ -0,0 +1,132 @@
+"""
+TIG Sparse Analytics Backend Tests
+===================================
+
+Validates the scipy CSR analytics backend against NetworkX reference values,
+including the exact Fiedler eigenvalue, and its wiring into TIGFabric.
+"""
+
+from __future__ import annotations
+
+import time
+
+import networkx as nx
+import numpy as np
+import pytest
+from scipy.sparse import csgraph
+
+from consciousness.tig.fabric import TIGFabric, TopologyConfig
+from consciousness.tig.fabric.sparse_analytics import (
+    compute_sparse_metrics,
+    fiedler_value,
+    graph_to_csr,
+)
+
+
+def _exact_fiedler(graph: nx.Graph) -> float:
+    # nx.algebraic_connectivity(method="lanczos") occasionally returns λ₃
+    laplacian = nx.laplacian_matrix(graph).toarray().astype(np.float64)
+    return float(np.sort(np.linalg.eigvalsh(laplacian))[1])
+
+
+class TestSparseMetrics:
+    @pytest.mark.parametrize("n", [12, 120])
+    def test_matches_networkx(self, n):
+        graph = nx.connected_watts_strogatz_graph(n, 6, 0.3, seed=4)
+
+        metrics = compute_sparse_metrics(graph, block_size=32)
+
+        assert metrics.node_count == n
+        assert metrics.edge_count == graph.number_of_edges()
+        assert metrics.density == pytest.approx(nx.density(graph))
+        assert metrics.avg_clustering == pytest.approx(nx.average_clustering(graph))
+        assert metrics.global_efficiency == pytest.approx(nx.global_efficiency(graph))
+        assert metrics.avg_path_length == pytest.approx(nx.average_shortest_path_length(graph))
+        assert metrics.algebraic_connectivity == pytest.approx(
+            _exact_fiedler(graph), rel=1e-5
+        )
+
+    def test_disconnected_graph_uses_largest_component(self):
+        graph = nx.disjoint_union(nx.complete_graph(6), nx.path_graph(3))
+
+        metrics = compute_sparse_metrics(graph)
+
+        assert metrics.avg_path_length == pytest.approx(1.0)
+        assert metrics.global_efficiency == pytest.approx(nx.global_efficiency(graph))
+        assert metrics.algebraic_connectivity == pytest.approx(0.0, abs=1e-8)
+
+    def test_fiedler_value_known_graphs(self):
+        # λ₂(K_n) = n, λ₂(P_n) = 2 - 2cos(π/n)
+        assert fiedler_value(graph_to_csr(nx.complete_graph(10))) == pytest.approx(10.0)
+        path = nx.path_graph(200)
+        assert fiedler_value(graph_to_csr(path)) == pytest.approx(
+            2 - 2 * np.cos(np.pi / 200), rel=1e-5
+        )
+
+    def test_large_fabric_graph(self):
+        graph = nx.connected_watts_strogatz_graph(2000, 8, 0.1, seed=1)
+
+        metrics = compute_sparse_metrics(graph)
+
+        assert metrics.node_count == 2000
+        assert 0.0 < metrics.algebraic_connectivity < 8.0
+        assert 0.0 < metrics.global_efficiency < 1.0
+
+    def test_fiedler_value_matches_dense_above_threshold(self):
+        graph = nx.connected_watts_strogatz_graph(1000, 10, 0.1, seed=3)
+        adjacency = graph_to_csr(graph)
+
+        exact = np.sort(np.linalg.eigvalsh(csgraph.laplacian(adjacency).toarray()))[1]
+
+        assert fiedler_value(adjacency) == pytest.approx(exact, rel=1e-5)
+
+    def test_fiedler_value_ill_conditioned_chain(self):
+        path = nx.path_graph(1000)
+
+        # λ₂(P_n) = 2 - 2cos(π/n); LOBPCG stalls here and falls back
+        assert fiedler_value(graph_to_csr(path)) == pytest.approx(2 - 2 * np.cos(np.pi / 1000), rel=1e-5)
+
+    def test_fiedler_value_fast_at_5k_nodes(self):
+        graph = nx.connected_watts_strogatz_graph(5000, 10, 0.1, seed=1)
+        adjacency = graph_to_csr(graph)
+
+        start = time.perf_counter()
+        value = fiedler_value(adjacency)
+        elapsed = time.perf_counter() - start
+
+        assert 0.0 < value < 10.0
+        assert elapsed < 1.0
+
+    def test_tiny_graphs(self):
+        assert compute_sparse_metrics(nx.empty_graph(1)).global_efficiency == 0.0
+        assert fiedler_value(graph_to_csr(nx.empty_graph(1))) == 0.0
+
+
+class TestFabricSparseBackend:
+    def test_config_rejects_unknown_backend(self):
+        with pytest.raises(ValueError):
+            TopologyConfig(analytics_backend="igraph")
+
+    def test_fabric_uses_sparse_backend(self):
+        fabric = TIGFabric(TopologyConfig(node_count=40, analytics_backend="sparse"))
+        fabric.graph = nx.connected_watts_strogatz_graph(40, 6, 0.2, seed=2)
+        fabric._instantiate_nodes()
+        fabric._establish_connections()
+
+        try:
+            fabric._compute_metrics()
+            assert fabric.metrics.algebraic_connectivity == pytest.approx(
+                _exact_fiedler(fabric.graph), rel=1e-5
+            )
+            assert fabric.metrics.effective_connectivity_index == pytest.approx(
+                nx.global_efficiency(fabric.graph)
+            )
+
+            # Incremental updates keep the exact Fiedler value
+            fabric._on_node_isolated("tig-node-007")
+            active = fabric.graph.subgraph(n for n in fabric.graph if n != 7)
+            assert fabric.metrics.algebraic_connectivity == pytest.approx(
+                _exact_fiedler(active), rel=1e-5
+            )
+        finally:
+            fabric._executor.shutdown(wait=False)
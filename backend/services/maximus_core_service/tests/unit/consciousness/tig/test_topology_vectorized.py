@@ -0,0 +1,90 @@
+"""
+TIG Vectorized Topology Generator Tests
+========================================
+
+Validates TopologyConfig generator_mode="vectorized": seeded determinism,
+structural guarantees of the BA base and triadic closure, and config checks.
+"""
+
+from __future__ import annotations
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from consciousness.tig.fabric import TopologyConfig, TopologyGenerator
+from consciousness.tig.fabric.topology import _barabasi_albert_edges
+
+
+def _generate(node_count: int, seed: int = 42, **kwargs) -> nx.Graph:
+    config = TopologyConfig(node_count=node_count, generator_mode="vectorized", seed=seed, **kwargs)
+    return TopologyGenerator(config).generate()
+
+
+class TestBarabasiAlbertEdges:
+    def test_edge_count_and_min_degree(self):
+        edges = _barabasi_albert_edges(200, 5, np.random.default_rng(0))
+        graph = nx.Graph(edges.tolist())
+
+        assert graph.number_of_edges() == len(edges) == 5 * (200 - 5)
+        assert min(d for _, d in graph.degree()) >= 5
+        assert nx.is_connected(graph)
+
+    def test_targets_are_distinct_earlier_nodes(self):
+        edges = _barabasi_albert_edges(300, 5, np.random.default_rng(1))
+        targets, sources = edges[5:, 0], edges[5:, 1]
+
+        assert (targets < sources).all()
+        assert all(len(set(row)) == 5 for row in targets.reshape(-1, 5).tolist())
+
+    def test_small_fabric(self):
+        edges = _barabasi_albert_edges(7, 5, np.random.default_rng(0))
+        assert nx.Graph(edges.tolist()).number_of_edges() == 10
+
+    def test_rejects_invalid_m(self):
+        with pytest.raises(ValueError):
+            _barabasi_albert_edges(5, 5, np.random.default_rng(0))
+
+
+class TestVectorizedGenerator:
+    def test_deterministic_for_seed(self):
+        first = _generate(128, seed=7)
+        second = _generate(128, seed=7)
+
+        assert sorted(first.edges()) == sorted(second.edges())
+
+    def test_seed_changes_graph(self):
+        assert sorted(_generate(128, seed=1).edges()) != sorted(_generate(128, seed=2).edges())
+
+    @pytest.mark.parametrize("n", [16, 256])
+    def test_structure(self, n):
+        graph = _generate(n)
+
+        assert sorted(graph.nodes()) == list(range(n))
+        assert nx.is_connected(graph)
+        assert nx.number_of_selfloops(graph) == 0
+        assert min(d for _, d in graph.degree()) >= 5
+
+    def test_triadic_closure_raises_clustering(self):
+        base = _generate(256, enable_small_world_rewiring=False)
+        closed = _generate(256)
+
+        assert base.number_of_edges() == 5 * (256 - 5)
+        assert nx.average_clustering(closed) > nx.average_clustering(base) + 0.2
+
+    def test_generate_edges_matches_graph(self):
+        config = TopologyConfig(node_count=64, generator_mode="vectorized")
+        edges = TopologyGenerator(config).generate_edges()
+        graph = TopologyGenerator(config).generate()
+
+        assert (edges[:, 0] < edges[:, 1]).all()
+        assert sorted(map(tuple, edges.tolist())) == sorted(graph.edges())
+
+
+class TestGeneratorModeConfig:
+    def test_default_is_networkx(self):
+        assert TopologyConfig().generator_mode == "networkx"
+
+    def test_invalid_mode(self):
+        with pytest.raises(ValueError, match="generator_mode"):
+            TopologyConfig(generator_mode="igraph")
@@ -93,8 +93,9 @@ async def startup_event() -> None:
 
     logger.info("Initializing Meta-Orchestrator...")
 
-    # Create registry
+    # Create registry (health is probed in the background, not per selection)
     registry = AgentRegistry()
+    registry.start_health_prober()
 
     # Create decomposer (without LLM for now)
     decomposer = TaskDecomposer()
@@ -108,6 +109,13 @@ async def startup_event() -> None:
     logger.info("Meta-Orchestrator ready")
 
 
+@app.on_event("shutdown")
+async def shutdown_event() -> None:
+    """Stop background work on shutdown"""
+    if registry:
+        await registry.stop_health_prober()
+
+
 @app.get("/health")
 async def health_check() -> Dict[str, str]:
     """Service health check"""
@@ -5,6 +5,11 @@ Meta-Orchestrator: Agent Registry
 Plugin registry system for managing specialist agents.
 Implements dynamic agent discovery, routing, and load balancing.
 
+Agent selection reads copy-on-write indexes (task type / tag -> agent names)
+without taking the registry lock, and consults cached health results that a
+background prober keeps fresh. Only health entries older than the staleness
+bound are checked inline, once per agent however many selections need them.
+
 Pattern: Registry Pattern + Factory Pattern
 Inspiration: Google's agent management, Kubernetes controller pattern
 """
@@ -12,7 +17,9 @@ Inspiration: Google's agent management, Kubernetes controller pattern
 from __future__ import annotations
 
 import asyncio
-from typing import Dict, List, Optional, Set, Any, cast
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Any, Tuple, cast
 from datetime import datetime
 import logging
 
@@ -26,6 +33,21 @@ from plugins.base import (
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class HealthEntry:
+    """
+    Cached result of an agent health check.
+
+    Attributes:
+        healthy: Whether the agent reported itself healthy
+        checked_at: time.monotonic() of the check
+        detail: Raw health payload (or error description)
+    """
+    healthy: bool
+    checked_at: float
+    detail: Dict[str, Any]
+
+
 class AgentRegistry:
     """
     Central registry for all agent plugins in Maximus 2.0.
@@ -40,11 +62,38 @@ class AgentRegistry:
     Thread-safe for concurrent agent operations.
     """
 
-    def __init__(self) -> None:
-        """Initialize empty registry."""
+    def __init__(
+        self,
+        health_max_age_seconds: float = 10.0,
+        health_probe_interval_seconds: float = 5.0,
+        health_check_timeout_seconds: float = 2.0
+    ) -> None:
+        """
+        Initialize empty registry.
+
+        Args:
+            health_max_age_seconds: Oldest cached health result select_agent trusts
+            health_probe_interval_seconds: Period of the background health prober
+            health_check_timeout_seconds: Health checks slower than this count as unhealthy
+        """
         self._agents: Dict[str, AgentPluginMetadata] = {}
         self._lock = asyncio.Lock()
         self._initialized = False
+
+        self.health_max_age_seconds = health_max_age_seconds
+        self.health_probe_interval_seconds = health_probe_interval_seconds
+        self.health_check_timeout_seconds = health_check_timeout_seconds
+
+        # Copy-on-write indexes, replaced (never mutated) under the lock
+        self._capability_index: Dict[str, Tuple[str, ...]] = {}
+        self._tag_index: Dict[str, Tuple[str, ...]] = {}
+        self._wildcard_agents: Tuple[str, ...] = ()  # Agents declaring no capabilities
+
+        self._health: Dict[str, HealthEntry] = {}
+        self._health_inflight: Dict[str, asyncio.Future] = {}
+        self._prober_task: Optional[asyncio.Task] = None
+        self._health_cache_hits = 0
+        self._health_cache_misses = 0
         logger.info("AgentRegistry initialized")
 
     async def register(
@@ -84,6 +133,7 @@ class AgentRegistry:
             metadata.registration_timestamp = datetime.now().timestamp()
 
             self._agents[agent_name] = metadata
+            self._rebuild_indexes()
 
             logger.info(
                 "Registered agent: %s (version=%s, enabled=%s, capabilities=%s)",
@@ -113,6 +163,8 @@ class AgentRegistry:
                 logger.error("Error during shutdown of %s: %s", agent_name, e)
 
             del self._agents[agent_name]
+            self._rebuild_indexes()
+            self._health.pop(agent_name, None)
             logger.info("Unregistered agent: %s", agent_name)
 
     async def select_agent(self, task: Task) -> Optional[AgentPlugin]:
@@ -120,76 +172,191 @@ class AgentRegistry:
         Select the best agent to handle a given task.
 
         Algorithm:
-        1. Filter agents that can handle this task type
+        1. Look up agents indexed under the task type (plus agents that
+           declare no capabilities)
         2. Filter enabled agents
-        3. Check health status
+        3. Check can_handle and (cached) health status
         4. Pick agent with highest (priority / current_load)
 
+        Runs without the registry lock; can_handle and health lookups for
+        the candidates run concurrently.
+
         Args:
             task: Task to route
 
         Returns:
             Best agent to handle task, or None if no suitable agent found
         """
-        async with self._lock:
-            candidate_agents: List[tuple[float, AgentPluginMetadata]] = []
+        agents = self._agents
+        candidates = [
+            agents[name]
+            for name in self._capability_index.get(task.type, ()) + self._wildcard_agents
+            if name in agents and agents[name].enabled
+        ]
+
+        verdicts = await asyncio.gather(
+            *(self._is_eligible(metadata, task) for metadata in candidates)
+        )
+
+        candidate_agents: List[tuple[float, AgentPluginMetadata]] = []
+        for metadata, eligible in zip(candidates, verdicts):
+            if not eligible:
+                continue
+
+            # Calculate score (priority / average_exec_time)
+            # Higher priority and faster execution = higher score
+            avg_time = metadata.average_execution_time_ms or 1.0
+            score = metadata.priority / avg_time
+
+            candidate_agents.append((score, metadata))
+
+        if not candidate_agents:
+            logger.warning(
+                "No suitable agent found for task: %s (type=%s)",
+                task.task_id, task.type
+            )
+            return None
 
-            for metadata in self._agents.values():
-                # Skip disabled agents
-                if not metadata.enabled:
-                    continue
+        # Highest score wins; ties go to the earliest registered
+        best_score, best_metadata = max(candidate_agents, key=lambda x: x[0])
+        logger.info(
+            "Selected agent %s for task %s (score=%.2f)",
+            best_metadata.agent.name, task.task_id, best_score
+        )
 
-                agent = metadata.agent
-
-                # Check if agent can handle this task
-                try:
-                    if not await agent.can_handle(task):
-                        continue
-                except Exception as e:  # pylint: disable=broad-exception-caught
-                    logger.warning(
-                        "Agent %s failed can_handle check: %s",
-                        agent.name, e
-                    )
-                    continue
+        return best_metadata.agent
 
-                # Check health
-                try:
-                    health = await agent.health_check()
-                    if not health.get("healthy", False):
-                        logger.warning(
-                            "Agent %s is unhealthy, skipping",
-                            agent.name
-                        )
-                        continue
-                except Exception as e:  # pylint: disable=broad-exception-caught
-                    logger.error("Health check failed for %s: %s", agent.name, e)
-                    continue
+    async def _is_eligible(self, metadata: AgentPluginMetadata, task: Task) -> bool:
+        """Whether the agent accepts the task and is (cached) healthy."""
+        agent = metadata.agent
 
-                # Calculate score (priority / average_exec_time)
-                # Higher priority and faster execution = higher score
-                avg_time = metadata.average_execution_time_ms or 1.0
-                score = metadata.priority / avg_time
+        # Check if agent can handle this task
+        try:
+            if not await agent.can_handle(task):
+                return False
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.warning(
+                "Agent %s failed can_handle check: %s",
+                agent.name, e
+            )
+            return False
+
+        # Check health
+        entry = await self.get_health(agent.name)
+        if not entry.healthy:
+            logger.warning(
+                "Agent %s is unhealthy, skipping",
+                agent.name
+            )
+            return False
+        return True
 
-                candidate_agents.append((score, metadata))
+    async def get_health(self, agent_name: str, max_age: Optional[float] = None) -> HealthEntry:
+        """
+        Cached health of an agent, re-checked when older than max_age.
 
-            if not candidate_agents:
-                logger.warning(
-                    "No suitable agent found for task: %s (type=%s)",
-                    task.task_id, task.type
-                )
-                return None
+        Concurrent callers needing a fresh check for the same agent share
+        one health_check call.
 
-            # Sort by score (descending)
-            candidate_agents.sort(key=lambda x: x[0], reverse=True)
+        Args:
+            agent_name: Name of agent
+            max_age: Staleness bound in seconds (default: health_max_age_seconds)
 
-            # Return best agent
-            best_metadata = candidate_agents[0][1]
+        Returns:
+            Health entry (unhealthy if the agent is unknown)
+        """
+        max_age = self.health_max_age_seconds if max_age is None else max_age
+        entry = self._health.get(agent_name)
+        if entry is not None and time.monotonic() - entry.checked_at <= max_age:
+            self._health_cache_hits += 1
+            return entry
+
+        self._health_cache_misses += 1
+        inflight = self._health_inflight.get(agent_name)
+        if inflight is None:
+            metadata = self._agents.get(agent_name)
+            if metadata is None:
+                return HealthEntry(False, time.monotonic(), {"error": "not registered"})
+            inflight = asyncio.ensure_future(self._probe(agent_name, metadata))
+            self._health_inflight[agent_name] = inflight
+            inflight.add_done_callback(lambda _: self._health_inflight.pop(agent_name, None))
+        return await asyncio.shield(inflight)
+
+    async def _probe(self, agent_name: str, metadata: AgentPluginMetadata) -> HealthEntry:
+        """Run one health check and cache its outcome."""
+        try:
+            detail = await asyncio.wait_for(
+                metadata.agent.health_check(),
+                timeout=self.health_check_timeout_seconds
+            )
+            healthy = bool(detail.get("healthy", False))
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.error("Health check failed for %s: %s", agent_name, e)
+            detail = {"healthy": False, "status": "error", "error": str(e) or type(e).__name__}
+            healthy = False
+
+        entry = HealthEntry(healthy=healthy, checked_at=time.monotonic(), detail=detail)
+        if agent_name in self._agents:
+            self._health[agent_name] = entry
+        return entry
+
+    def start_health_prober(self) -> None:
+        """Start refreshing every agent's cached health in the background."""
+        if self._prober_task is None or self._prober_task.done():
+            self._prober_task = asyncio.create_task(self._probe_loop())
             logger.info(
-                "Selected agent %s for task %s (score=%.2f)",
-                best_metadata.agent.name, task.task_id, candidate_agents[0][0]
+                "Health prober started (interval=%.1fs)", self.health_probe_interval_seconds
             )
 
-            return best_metadata.agent
+    async def stop_health_prober(self) -> None:
+        """Stop the background health prober."""
+        if self._prober_task is not None:
+            self._prober_task.cancel()
+            try:
+                await self._prober_task
+            except asyncio.CancelledError:
+                pass
+            self._prober_task = None
+
+    async def _probe_loop(self) -> None:
+        while True:
+            await asyncio.gather(
+                *(self.get_health(name, max_age=0.0) for name in list(self._agents))
+            )
+            await asyncio.sleep(self.health_probe_interval_seconds)
+
+    def get_selection_stats(self) -> Dict[str, Any]:
+        """
+        Health cache and index statistics.
+
+        Returns:
+            Cache hits/misses, indexed task types and prober state
+        """
+        return {
+            "health_cache_hits": self._health_cache_hits,
+            "health_cache_misses": self._health_cache_misses,
+            "cached_health_entries": len(self._health),
+            "indexed_task_types": len(self._capability_index),
+            "prober_running": self._prober_task is not None and not self._prober_task.done(),
+        }
+
+    def _rebuild_indexes(self) -> None:
+        """Recompute the capability and tag indexes from the agent table."""
+        capability_index: Dict[str, List[str]] = {}
+        tag_index: Dict[str, List[str]] = {}
+        wildcard: List[str] = []
+        for agent_name, metadata in self._agents.items():
+            capabilities = list(metadata.agent.capabilities or [])
+            if not capabilities:
+                wildcard.append(agent_name)
+            for capability in dict.fromkeys(capabilities):
+                capability_index.setdefault(capability, []).append(agent_name)
+            for tag in dict.fromkeys(metadata.tags):
+                tag_index.setdefault(tag, []).append(agent_name)
+
+        self._capability_index = {k: tuple(v) for k, v in capability_index.items()}
+        self._tag_index = {k: tuple(v) for k, v in tag_index.items()}
+        self._wildcard_agents = tuple(wildcard)
 
     async def get_agent(self, agent_name: str) -> Optional[AgentPlugin]:
         """
@@ -223,11 +390,14 @@ class AgentRegistry:
         async with self._lock:
             result = []
 
-            for agent_name, metadata in self._agents.items():
-                if enabled_only and not metadata.enabled:
-                    continue
+            names: List[str] = list(self._agents)
+            if tags:
+                tagged = {name for tag in tags for name in self._tag_index.get(tag, ())}
+                names = [name for name in names if name in tagged]
 
-                if tags and not set(metadata.tags).intersection(tags):
+            for agent_name in names:
+                metadata = self._agents[agent_name]
+                if enabled_only and not metadata.enabled:
                     continue
 
                 result.append({
@@ -315,12 +485,17 @@ class AgentRegistry:
 
     async def _check_agent_health(
         self,
-        _: str,
+        agent_name: str,
         metadata: AgentPluginMetadata
     ) -> Dict[str, Any]:
-        """Helper to check single agent health."""
+        """Helper to check single agent health (also refreshes the cache)."""
         try:
             health = await metadata.agent.health_check()
+            self._health[agent_name] = HealthEntry(
+                healthy=bool(health.get("healthy", False)),
+                checked_at=time.monotonic(),
+                detail=health
+            )
             health["enabled"] = metadata.enabled
             return health
         except Exception as e:  # pylint: disable=broad-exception-caught
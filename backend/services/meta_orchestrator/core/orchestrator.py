@@ -12,8 +12,13 @@ Inspiration: Kubernetes Controller, Google's agent orchestration
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import heapq
 import time
-from typing import List, Dict
+from collections import OrderedDict
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, AsyncContextManager, Callable, List, Dict, Optional, Set, Tuple
 import logging
 
 
@@ -24,9 +29,85 @@ from .task_decomposer import TaskDecomposer
 
 logger = logging.getLogger(__name__)
 
+# Smoothing factor for the per-type duration estimates
+DURATION_EMA_ALPHA = 0.3
 
+# (started, finished) callbacks of the subtask running in this context;
+# atomic tasks start once they hold an agent slot and finish on release
+_subtask_hooks: ContextVar[Optional[Tuple[Callable[[], None], Callable[[], None]]]] = ContextVar(
+    "subtask_hooks", default=None
+)
 
 
+@dataclass
+class SubtaskTiming:
+    """
+    Scheduling timeline of one subtask, in ms since the mission started.
+
+    Attributes:
+        task_id: Subtask ID
+        type: Subtask type
+        critical_path_ms: Estimated length of the longest chain it starts
+        ready_ms: When its dependencies were all complete
+        start_ms: When it was launched
+        end_ms: When it finished
+        status: Final status
+    """
+    task_id: str
+    type: str
+    critical_path_ms: float
+    ready_ms: float = 0.0
+    start_ms: float = 0.0
+    end_ms: float = 0.0
+    status: str = TaskStatus.PENDING.value
+
+    @property
+    def wait_ms(self) -> float:
+        """Time spent ready but not running (waiting for an agent slot)."""
+        return self.start_ms - self.ready_ms
+
+
+@dataclass
+class MissionTrace:
+    """
+    Timing trace of one subtask graph execution.
+
+    Attributes:
+        mission_id: ID of the decomposed task
+        subtasks: Per-subtask timelines, in launch order
+        unscheduled: Subtasks never run (cycle or unknown dependency)
+        makespan_ms: Wall time from first launch to last completion
+        max_parallelism: Most subtasks running at once (excluding those
+            waiting for an agent slot)
+    """
+    mission_id: str
+    subtasks: List[SubtaskTiming] = field(default_factory=list)
+    unscheduled: List[str] = field(default_factory=list)
+    makespan_ms: float = 0.0
+    max_parallelism: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for logging/API responses."""
+        return {
+            "mission_id": self.mission_id,
+            "makespan_ms": round(self.makespan_ms, 2),
+            "max_parallelism": self.max_parallelism,
+            "unscheduled": list(self.unscheduled),
+            "subtasks": [
+                {
+                    "task_id": t.task_id,
+                    "type": t.type,
+                    "critical_path_ms": round(t.critical_path_ms, 2),
+                    "ready_ms": round(t.ready_ms, 2),
+                    "start_ms": round(t.start_ms, 2),
+                    "end_ms": round(t.end_ms, 2),
+                    "wait_ms": round(t.wait_ms, 2),
+                    "status": t.status,
+                }
+                for t in self.subtasks
+            ],
+        }
+
 
 class Orchestrator:  # pylint: disable=too-few-public-methods
     """
@@ -41,7 +122,10 @@ class Orchestrator:  # pylint: disable=too-few-public-methods
     Features:
         - ROMA-style recursive decomposition
         - Intelligent agent selection
-        - Parallel execution with dependency resolution
+        - Dependency-graph scheduling: each subtask starts as soon as its
+          dependencies finish, longest critical path first
+        - Per-agent concurrency limits shared by every mission and
+          recursion level
         - Result synthesis
         - Error recovery
     """
@@ -51,7 +135,11 @@ class Orchestrator:  # pylint: disable=too-few-public-methods
         registry: AgentRegistry,
         decomposer: TaskDecomposer,
         max_depth: int = 3,
-        timeout_seconds: int = 300
+        timeout_seconds: int = 300,
+        concurrency_limits: Optional[Dict[str, int]] = None,
+        default_concurrency: Optional[int] = None,
+        default_duration_ms: float = 1000.0,
+        trace_history: int = 100
     ):
         """
         Initialize orchestrator.
@@ -61,11 +149,23 @@ class Orchestrator:  # pylint: disable=too-few-public-methods
             decomposer: Task decomposer for hierarchical splitting
             max_depth: Maximum recursion depth
             timeout_seconds: Global timeout for mission execution
+            concurrency_limits: Max concurrent executions per agent name,
+                across all missions and recursion levels
+            default_concurrency: Limit for agents not listed (None = unlimited)
+            default_duration_ms: Duration estimate for task types never seen
+            trace_history: Number of mission traces kept
         """
         self.registry = registry
         self.decomposer = decomposer
         self.max_depth = max_depth
         self.timeout_seconds = timeout_seconds
+        self.concurrency_limits: Dict[str, int] = dict(concurrency_limits or {})
+        self.default_concurrency = default_concurrency
+        self.default_duration_ms = default_duration_ms
+        self.trace_history = trace_history
+        self._duration_estimates: Dict[str, float] = {}
+        self._traces: OrderedDict[str, MissionTrace] = OrderedDict()
+        self._agent_slots: Dict[str, asyncio.Semaphore] = {}
         logger.info("Orchestrator initialized")
 
     async def execute_mission(
@@ -104,6 +204,7 @@ class Orchestrator:  # pylint: disable=too-few-public-methods
 
             else:
                 # Recursive case: decompose and execute
+                self._notify_subtask_start()
                 result = await self._execute_complex_task(mission, depth)
 
             # Update timing
@@ -161,7 +262,60 @@ class Orchestrator:  # pylint: disable=too-few-public-methods
 
         logger.info("Task %s assigned to agent: %s", task.task_id, agent.name)
 
-        # Execute via agent
+        async with self._agent_slot(agent.name):
+            self._notify_subtask_start()
+            try:
+                return await self._run_agent(agent, task)
+            finally:
+                self._notify_subtask_finish()
+
+    def _agent_slot(self, agent_name: str) -> AsyncContextManager[Any]:
+        """
+        Concurrency slot for one execution on the named agent.
+
+        One semaphore per agent, shared by every mission and recursion
+        level, so nested missions cannot exceed the agent's limit.
+
+        Args:
+            agent_name: Name of the selected agent
+
+        Returns:
+            Semaphore for limited agents, a no-op context otherwise
+        """
+        limit = self.concurrency_limits.get(agent_name, self.default_concurrency)
+        if limit is None:
+            return contextlib.nullcontext()
+        slot = self._agent_slots.get(agent_name)
+        if slot is None:
+            slot = self._agent_slots[agent_name] = asyncio.Semaphore(limit)
+        return slot
+
+    @staticmethod
+    def _notify_subtask_start() -> None:
+        """Tell the enclosing subtask graph (if any) that this subtask started."""
+        hooks = _subtask_hooks.get()
+        if hooks is not None:
+            hooks[0]()
+
+    @staticmethod
+    def _notify_subtask_finish() -> None:
+        """Tell the enclosing subtask graph (if any) that this subtask released its slot."""
+        hooks = _subtask_hooks.get()
+        if hooks is not None:
+            _subtask_hooks.set(None)
+            hooks[1]()
+
+    async def _run_agent(self, agent: Any, task: Task) -> TaskResult:
+        """
+        Run a task on an agent with the global timeout and record its stats.
+
+        Args:
+            agent: Selected agent
+            task: Atomic task to execute
+
+        Returns:
+            Task execution result
+        """
         start_time = time.time()
 
         try:
@@ -230,60 +384,212 @@ class Orchestrator:  # pylint: disable=too-few-public-methods
         )
 
         # Execute subtasks with dependency resolution
-        results = await self._execute_with_dependencies(subtasks, depth + 1)
+        results = await self._execute_with_dependencies(
+            subtasks, depth + 1, mission_id=task.task_id
+        )
 
         # Synthesize results
         synthesized = self._synthesize_results(task, results)
 
         return synthesized
 
-    async def _execute_with_dependencies(
+    async def _execute_with_dependencies(  # pylint: disable=too-many-locals
         self,
         tasks: List[Task],
-        depth: int
+        depth: int,
+        mission_id: Optional[str] = None
     ) -> Dict[str, TaskResult]:
         """
         Execute tasks respecting dependency order.
 
+        Event-driven: a subtask is launched the moment its last dependency
+        finishes, not when the slowest task of its "wave" does. Subtasks
+        launched together are started longest estimated chain of remaining
+        work first (then higher priority), which is also the order they
+        queue in for an agent at its concurrency limit. Subtasks in a
+        dependency cycle, or depending on an unknown task, are never run.
+
         Args:
             tasks: List of tasks to execute
             depth: Current recursion depth
+            mission_id: ID the timing trace is stored under (see get_trace)
 
         Returns:
             Dictionary mapping task IDs to results
         """
         results: Dict[str, TaskResult] = {}
-        pending_tasks = {task.task_id: task for task in tasks}
-
-        while pending_tasks:
-            # Find tasks with all dependencies satisfied
-            ready_tasks = []
-            for _, task in pending_tasks.items():
-                deps_satisfied = all(
-                    dep_id in results for dep_id in task.dependencies
-                )
-                if deps_satisfied:
-                    ready_tasks.append(task)
-
-            if not ready_tasks:
-                # Circular dependency or deadlock
-                logger.error("No ready tasks - possible circular dependency")
-                break
-
-            # Execute ready tasks in parallel
-            task_futures = [
-                self.execute_mission(task, depth)
-                for task in ready_tasks
-            ]
-
-            task_results = await asyncio.gather(*task_futures)
-
-            # Store results and remove from pending
-            for task, result in zip(ready_tasks, task_results):
-                results[task.task_id] = result
-                del pending_tasks[task.task_id]
-
-        return results
+        by_id = {task.task_id: task for task in tasks}
+        order = {task_id: index for index, task_id in enumerate(by_id)}
+
+        dependents: Dict[str, List[str]] = {task_id: [] for task_id in by_id}
+        remaining: Dict[str, int] = {}
+        for task in by_id.values():
+            # Unknown dependencies are never satisfied
+            remaining[task.task_id] = len(set(task.dependencies))
+            for dep_id in set(task.dependencies):
+                if dep_id in dependents:
+                    dependents[dep_id].append(task.task_id)
+
+        critical_path = self._critical_paths(by_id, dependents)
+        trace = MissionTrace(mission_id=mission_id or f"graph_{id(tasks)}")
+        timings = {
+            task_id: SubtaskTiming(task_id, task.type, critical_path[task_id])
+            for task_id, task in by_id.items()
+        }
+
+        ready: List[Tuple[float, int, int, str]] = []
+        started = time.perf_counter()
+
+        def now_ms() -> float:
+            return (time.perf_counter() - started) * 1000
+
+        def mark_ready(task_id: str) -> None:
+            timings[task_id].ready_ms = now_ms()
+            heapq.heappush(ready, (
+                -critical_path[task_id],
+                -by_id[task_id].priority.value,
+                order[task_id],
+                task_id,
+            ))
+
+        for task_id, count in remaining.items():
+            if count == 0:
+                mark_ready(task_id)
+
+        running: Dict[asyncio.Future, str] = {}
+        started_ids: Set[str] = set()
+        active: Set[str] = set()
+
+        def mark_started(task_id: str) -> None:
+            timings[task_id].start_ms = now_ms()
+            started_ids.add(task_id)
+            active.add(task_id)
+            trace.max_parallelism = max(trace.max_parallelism, len(active))
+
+        try:
+            while True:
+                # Launch every ready task, best first; agent slots are
+                # granted in launch order
+                while ready:
+                    task = by_id[heapq.heappop(ready)[3]]
+                    trace.subtasks.append(timings[task.task_id])
+                    token = _subtask_hooks.set((
+                        lambda task_id=task.task_id: mark_started(task_id),
+                        lambda task_id=task.task_id: active.discard(task_id),
+                    ))
+                    try:
+                        future = asyncio.ensure_future(self.execute_mission(task, depth))
+                    finally:
+                        _subtask_hooks.reset(token)
+                    running[future] = task.task_id
+
+                if not running:
+                    break
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    task_id = running.pop(future)
+                    task = by_id[task_id]
+                    result = future.result()
+                    results[task_id] = result
+
+                    timing = timings[task_id]
+                    timing.end_ms = now_ms()
+                    if task_id not in started_ids:  # Never got an agent
+                        timing.start_ms = timing.end_ms
+                    active.discard(task_id)
+                    timing.status = result.status.value
+                    self._record_duration(task.type, timing.end_ms - timing.start_ms)
+
+                    for dependent_id in dependents[task_id]:
+                        remaining[dependent_id] -= 1
+                        if remaining[dependent_id] == 0:
+                            mark_ready(dependent_id)
+        finally:
+            for future in running:
+                future.cancel()
+
+        if len(results) < len(by_id):
+            # Circular dependency or deadlock
+            trace.unscheduled = [task_id for task_id in by_id if task_id not in results]
+            logger.error(
+                "No ready tasks - possible circular dependency: %s", trace.unscheduled
+            )
+
+        trace.makespan_ms = max((t.end_ms for t in trace.subtasks), default=0.0)
+        self._store_trace(trace)
+        logger.info(
+            "Subtask graph %s finished: %d/%d tasks in %.1fms (max parallelism %d)",
+            trace.mission_id, len(results), len(by_id), trace.makespan_ms, trace.max_parallelism
+        )
+        # Input order, not completion order, so synthesis is deterministic
+        return {task_id: results[task_id] for task_id in by_id if task_id in results}
+
+    def _critical_paths(
+        self,
+        by_id: Dict[str, Task],
+        dependents: Dict[str, List[str]]
+    ) -> Dict[str, float]:
+        """
+        Estimated duration of the longest chain starting at each task.
+
+        Args:
+            by_id: Tasks by ID
+            dependents: Task ID -> IDs of tasks depending on it
+
+        Returns:
+            Task ID -> own estimate plus the longest dependent chain
+        """
+        lengths: Dict[str, float] = {}
+        visiting: Set[str] = set()
+
+        def visit(task_id: str) -> float:
+            if task_id in lengths:
+                return lengths[task_id]
+            if task_id in visiting:  # Cycle: these tasks never run anyway
+                return 0.0
+            visiting.add(task_id)
+            tail = max((visit(d) for d in dependents[task_id]), default=0.0)
+            visiting.discard(task_id)
+            lengths[task_id] = self._estimate_duration(by_id[task_id]) + tail
+            return lengths[task_id]
+
+        for task_id in by_id:
+            visit(task_id)
+        return lengths
+
+    def _estimate_duration(self, task: Task) -> float:
+        """Expected duration in ms: context hint, else observed average for the type."""
+        hint = task.context.get("estimated_duration_ms") if task.context else None
+        if isinstance(hint, (int, float)):
+            return float(hint)
+        return self._duration_estimates.get(task.type, self.default_duration_ms)
+
+    def _record_duration(self, task_type: str, duration_ms: float) -> None:
+        """Fold an observed duration into the type's moving average."""
+        previous = self._duration_estimates.get(task_type)
+        self._duration_estimates[task_type] = (
+            duration_ms if previous is None
+            else previous + DURATION_EMA_ALPHA * (duration_ms - previous)
+        )
+
+    def _store_trace(self, trace: MissionTrace) -> None:
+        self._traces[trace.mission_id] = trace
+        self._traces.move_to_end(trace.mission_id)
+        while len(self._traces) > self.trace_history:
+            self._traces.popitem(last=False)
+
+    def get_trace(self, mission_id: str) -> Optional[MissionTrace]:
+        """
+        Timing trace of a decomposed mission's subtask graph.
+
+        Args:
+            mission_id: ID of the decomposed task
+
+        Returns:
+            Trace if still in the history, None otherwise
+        """
+        return self._traces.get(mission_id)
 
     def _synthesize_results(
         self,
@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import pytest
 import asyncio
+import time
 from typing import Dict, Any, List
 from unittest.mock import MagicMock, AsyncMock, patch
 
@@ -525,3 +526,158 @@ class TestAgentRegistry:
 
         # Access internal to check timestamp
         assert registry._agents["agent1"].registration_timestamp is not None
+
+
+class SlowHealthAgent(MockAgent):
+    """Mock agent whose health check takes a while and is counted."""
+
+    def __init__(self, name: str, capabilities: List[str], delay: float = 0.01, healthy: bool = True):
+        super().__init__(name, capabilities, healthy=healthy)
+        self.delay = delay
+        self.health_calls = 0
+
+    async def health_check(self) -> Dict[str, Any]:
+        self.health_calls += 1
+        await asyncio.sleep(self.delay)
+        return {"healthy": self._healthy, "status": "operational"}
+
+
+class TestCachedSelection:
+    """Tests for indexed, health-cached agent selection."""
+
+    @pytest.mark.asyncio
+    async def test_only_indexed_agents_consulted(self):
+        """Agents not declaring the task type are never asked."""
+        registry = AgentRegistry()
+        target = SlowHealthAgent("target", ["scan"])
+        others = [SlowHealthAgent(f"other{i}", [f"type{i}"]) for i in range(20)]
+        for agent in [target, *others]:
+            await registry.register(agent)
+
+        task = Task(task_id="1", type="scan", description="test", context={})
+        selected = await registry.select_agent(task)
+
+        assert selected is target
+        assert all(agent.health_calls == 0 for agent in others)
+
+    @pytest.mark.asyncio
+    async def test_agent_without_capabilities_is_wildcard(self):
+        """Agents declaring no capabilities are still offered every task."""
+        registry = AgentRegistry()
+        generalist = MockAgent("generalist", [])
+        generalist.can_handle = AsyncMock(return_value=True)
+        await registry.register(generalist)
+
+        task = Task(task_id="1", type="anything", description="test", context={})
+
+        assert await registry.select_agent(task) is generalist
+
+    @pytest.mark.asyncio
+    async def test_health_cached_within_max_age(self):
+        """Repeated selections reuse one health check until it goes stale."""
+        registry = AgentRegistry(health_max_age_seconds=0.05)
+        agent = SlowHealthAgent("agent", ["scan"], delay=0.0)
+        await registry.register(agent)
+        task = Task(task_id="1", type="scan", description="test", context={})
+
+        for _ in range(5):
+            await registry.select_agent(task)
+        assert agent.health_calls == 1
+
+        await asyncio.sleep(0.06)
+        await registry.select_agent(task)
+        assert agent.health_calls == 2
+        stats = registry.get_selection_stats()
+        assert stats["health_cache_hits"] == 4
+        assert stats["health_cache_misses"] == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_cold_checks_coalesce(self):
+        """Many simultaneous selections trigger a single health check."""
+        registry = AgentRegistry()
+        agent = SlowHealthAgent("agent", ["scan"], delay=0.05)
+        await registry.register(agent)
+        task = Task(task_id="1", type="scan", description="test", context={})
+
+        selected = await asyncio.gather(*(registry.select_agent(task) for _ in range(20)))
+
+        assert all(s is agent for s in selected)
+        assert agent.health_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_health_check_timeout_is_unhealthy(self):
+        """A hanging health check marks the agent unhealthy."""
+        registry = AgentRegistry(health_check_timeout_seconds=0.01)
+        await registry.register(SlowHealthAgent("agent", ["scan"], delay=1.0))
+
+        task = Task(task_id="1", type="scan", description="test", context={})
+
+        assert await registry.select_agent(task) is None
+        assert (await registry.get_health("agent")).healthy is False
+
+    @pytest.mark.asyncio
+    async def test_prober_refreshes_health(self):
+        """The background prober notices an agent turning unhealthy."""
+        registry = AgentRegistry(health_probe_interval_seconds=0.01, health_max_age_seconds=60)
+        agent = SlowHealthAgent("agent", ["scan"], delay=0.0)
+        await registry.register(agent)
+        task = Task(task_id="1", type="scan", description="test", context={})
+
+        registry.start_health_prober()
+        try:
+            await asyncio.sleep(0.02)
+            assert await registry.select_agent(task) is agent
+            agent._healthy = False
+            await asyncio.sleep(0.03)
+            assert await registry.select_agent(task) is None
+        finally:
+            await registry.stop_health_prober()
+        assert registry.get_selection_stats()["prober_running"] is False
+
+    @pytest.mark.asyncio
+    async def test_unregister_updates_index(self):
+        """Unregistered agents drop out of the index and health cache."""
+        registry = AgentRegistry()
+        await registry.register(MockAgent("agent", ["scan"]))
+        task = Task(task_id="1", type="scan", description="test", context={})
+        await registry.select_agent(task)
+
+        await registry.unregister("agent")
+
+        assert await registry.select_agent(task) is None
+        assert registry.get_selection_stats()["cached_health_entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_selection_benchmark(self):
+        """Benchmark: selection cost with many plugins and slow health checks."""
+        registry = AgentRegistry()
+        for i in range(200):
+            await registry.register(SlowHealthAgent(f"agent{i}", [f"type{i % 20}"], delay=0.002))
+        tasks = [
+            Task(task_id=str(i), type=f"type{i % 20}", description="test", context={})
+            for i in range(200)
+        ]
+
+        start = time.perf_counter()
+        await asyncio.gather(*(registry.select_agent(t) for t in tasks))
+        cold = time.perf_counter() - start
+        before = registry.get_selection_stats()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(registry.select_agent(t) for t in tasks))
+        warm = time.perf_counter() - start
+        after = registry.get_selection_stats()
+
+        # Previous behaviour: every selection serially checked every plugin
+        # under the lock: 200 selections * 200 plugins * 2ms.
+        serial_estimate = 200 * 200 * 0.002
+        print(
+            f"\nselect_agent x200 (200 plugins): cold={cold * 1000:.1f}ms "
+            f"warm={warm * 1000:.1f}ms (previously ~{serial_estimate:.0f}s)"
+        )
+        # Each task consults only the 10 agents indexed for its type, and the
+        # warm pass answers every one of those health lookups from the cache
+        assert after["health_cache_hits"] - before["health_cache_hits"] == 200 * 10
+        assert after["health_cache_misses"] == before["health_cache_misses"]
+        assert sum(metadata.agent.health_calls for metadata in registry._agents.values()) == 200
+        assert cold < 1.0
@@ -5,9 +5,10 @@ Unit tests for Orchestrator.
 from __future__ import annotations
 
 import pytest
+import time
 import asyncio
 from unittest.mock import AsyncMock, MagicMock
-from typing import List
+from typing import Dict, List, Optional
 
 from core.orchestrator import Orchestrator
 from core.agent_registry import AgentRegistry
@@ -490,3 +491,184 @@ class TestOrchestrator:
         result = await orchestrator.execute_mission(mission)
 
         assert result.execution_time_ms >= 0
+
+
+def _timed_task(task_id: str, seconds: float, deps: Optional[List[str]] = None, task_type: str = "test") -> Task:
+    """Atomic task whose agent run sleeps for the given time."""
+    return Task(
+        task_id=task_id,
+        type=task_type,
+        description=task_id,
+        context={"sleep": seconds, "estimated_duration_ms": seconds * 1000},
+        is_atomic=True,
+        dependencies=deps or []
+    )
+
+
+class TestDependencyScheduler:
+    """Tests for event-driven subtask scheduling."""
+
+    @pytest.fixture
+    def events(self) -> List[tuple]:
+        """(event, task_id, time) log shared with the agent."""
+        return []
+
+    @pytest.fixture
+    def orchestrator_factory(self, events):
+        """Build orchestrators with one "<type>_agent" per task type that sleeps and logs start/end."""
+        async def execute(task):
+            events.append(("start", task.task_id, time.perf_counter()))
+            await asyncio.sleep(task.context["sleep"])
+            events.append(("end", task.task_id, time.perf_counter()))
+            return TaskResult(task_id=task.task_id, status=TaskStatus.COMPLETED, output={})
+
+        agents: Dict[str, AgentPlugin] = {}
+
+        async def select_agent(task):
+            if task.type not in agents:
+                agent = MagicMock(spec=AgentPlugin)
+                agent.name = f"{task.type}_agent"
+                agent.execute = execute
+                agents[task.type] = agent
+            return agents[task.type]
+
+        registry = MagicMock(spec=AgentRegistry)
+        registry.select_agent = select_agent
+        registry.update_stats = AsyncMock()
+
+        def build(decomposer=None, **kwargs) -> Orchestrator:
+            return Orchestrator(registry, decomposer or MagicMock(spec=TaskDecomposer), **kwargs)
+        return build
+
+    @staticmethod
+    def _peak_running(events, prefix: str) -> int:
+        """Most tasks whose id starts with prefix running at once."""
+        running, peak = set(), 0
+        for kind, task_id, _ in sorted(events, key=lambda e: (e[2], e[0] == "start")):
+            if not task_id.startswith(prefix):
+                continue
+            if kind == "start":
+                running.add(task_id)
+            else:
+                running.discard(task_id)
+            peak = max(peak, len(running))
+        return peak
+
+    @pytest.mark.asyncio
+    async def test_dependent_starts_when_its_dependency_ends(self, orchestrator_factory, events):
+        """A dependent must not wait for unrelated slow tasks."""
+        orchestrator = orchestrator_factory()
+        tasks = [
+            _timed_task("slow", 0.3),
+            _timed_task("fast", 0.01),
+            _timed_task("after_fast", 0.01, deps=["fast"]),
+        ]
+
+        results = await orchestrator._execute_with_dependencies(tasks, depth=1, mission_id="m")
+
+        assert list(results) == ["slow", "fast", "after_fast"]
+        times = {(kind, task_id): at for kind, task_id, at in events}
+        assert times[("start", "after_fast")] < times[("end", "slow")]
+        assert times[("start", "after_fast")] >= times[("end", "fast")]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit_per_agent(self, orchestrator_factory, events):
+        """No more than the limit runs on one agent at once; other agents are unaffected."""
+        orchestrator = orchestrator_factory(concurrency_limits={"scan_agent": 2})
+        tasks = [_timed_task(f"scan{i}", 0.02, task_type="scan") for i in range(6)]
+        tasks.append(_timed_task("other", 0.02, task_type="report"))
+
+        await orchestrator._execute_with_dependencies(tasks, depth=1, mission_id="m")
+
+        assert self._peak_running(events, "scan") == 2
+        trace = orchestrator.get_trace("m")
+        assert trace.max_parallelism == 3
+        assert max(t.wait_ms for t in trace.subtasks) > 0
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit_spans_nested_missions(self, orchestrator_factory, events):
+        """Sibling sub-missions share the agent's limit instead of getting one each."""
+        async def decompose(task):
+            return [
+                _timed_task(f"scan_{task.task_id}_{i}", 0.02, task_type="scan")
+                for i in range(3)
+            ]
+
+        decomposer = MagicMock(spec=TaskDecomposer)
+        decomposer.decompose = decompose
+        orchestrator = orchestrator_factory(
+            decomposer=decomposer, concurrency_limits={"scan_agent": 2}
+        )
+        missions = [
+            Task(task_id=f"m{i}", type="mission", description="sweep", context={})
+            for i in range(3)
+        ]
+
+        results = await orchestrator._execute_with_dependencies(missions, depth=1, mission_id="root")
+
+        assert all(r.status == TaskStatus.COMPLETED for r in results.values())
+        assert len([e for e in events if e[0] == "end"]) == 9
+        assert self._peak_running(events, "scan") == 2
+
+    @pytest.mark.asyncio
+    async def test_critical_path_first(self, orchestrator_factory, events):
+        """With one slot, the head of the longest chain runs before short leaves."""
+        orchestrator = orchestrator_factory(default_concurrency=1)
+        tasks = [
+            _timed_task("leaf1", 0.01),
+            _timed_task("leaf2", 0.01),
+            _timed_task("head", 0.01),
+            _timed_task("tail", 0.05, deps=["head"]),
+        ]
+
+        await orchestrator._execute_with_dependencies(tasks, depth=1, mission_id="m")
+
+        starts = [task_id for kind, task_id, _ in events if kind == "start"]
+        assert starts[0] == "head"
+        trace = orchestrator.get_trace("m")
+        by_id = {t.task_id: t for t in trace.subtasks}
+        assert by_id["head"].critical_path_ms == pytest.approx(60.0)
+
+    @pytest.mark.asyncio
+    async def test_unknown_dependency_not_run(self, orchestrator_factory):
+        """Tasks depending on an unknown task are reported as unscheduled."""
+        orchestrator = orchestrator_factory()
+        tasks = [_timed_task("ok", 0.0), _timed_task("orphan", 0.0, deps=["missing"])]
+
+        results = await orchestrator._execute_with_dependencies(tasks, depth=1, mission_id="m")
+
+        assert list(results) == ["ok"]
+        assert orchestrator.get_trace("m").unscheduled == ["orphan"]
+
+    @pytest.mark.asyncio
+    async def test_trace_history_bounded(self, orchestrator_factory):
+        """Only the most recent traces are kept."""
+        orchestrator = orchestrator_factory(trace_history=2)
+        for i in range(3):
+            await orchestrator._execute_with_dependencies(
+                [_timed_task("t", 0.0)], depth=1, mission_id=f"m{i}"
+            )
+
+        assert orchestrator.get_trace("m0") is None
+        assert orchestrator.get_trace("m2").to_dict()["subtasks"][0]["status"] == "completed"
+
+    @pytest.mark.asyncio
+    async def test_uneven_durations_benchmark(self, orchestrator_factory):
+        """Benchmark: makespan vs wave-by-wave execution of the same graph."""
+        # One long task beside a chain of short ones; waves would serialize
+        # the chain behind the long task: 0.4 + 4 * 0.1 = 0.8s.
+        tasks = [_timed_task("long", 0.4)]
+        tasks += [
+            _timed_task(f"chain{i}", 0.1, deps=[f"chain{i - 1}"] if i else [])
+            for i in range(5)
+        ]
+        wave_estimate = 0.4 + 4 * 0.1
+
+        orchestrator = orchestrator_factory()
+        start = time.perf_counter()
+        results = await orchestrator._execute_with_dependencies(tasks, depth=1, mission_id="m")
+        elapsed = time.perf_counter() - start
+
+        print(f"\nmakespan: graph scheduler={elapsed:.2f}s waves~{wave_estimate:.2f}s")
+        assert len(results) == 6
+        assert elapsed < 0.65
@@ -0,0 +1,256 @@
+"""
+MAXIMUS 2.0 - EmbeddingIndex
+============================
+
+In-memory nearest-neighbour index for the L2 tier of TieredSemanticCache.
+
+Embeddings live in one contiguous float32 matrix with unit-norm rows, so
+cosine similarity against every cached text is a single matrix-vector
+product. Removal swaps the last row into the freed slot, keeping the
+matrix dense with no tombstones.
+
+Above ``ivf_threshold`` rows an IVF (inverted file) layer is trained:
+k-means centroids split the matrix into one contiguous block per
+partition, and a query only scores the blocks of its ``nprobe`` closest
+centroids. Partitions are retrained when the index has doubled since the
+last training, and merged back into one matrix when it shrinks below half
+the threshold.
+
+Requires numpy; TieredSemanticCache falls back to pairwise scoring
+without it.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+class _Block:
+    """Growable float32 matrix of unit rows plus the key of each row."""
+
+    __slots__ = ("vectors", "keys")
+
+    def __init__(self, dim: int, capacity: int):
+        self.vectors = np.zeros((max(capacity, 1), dim), dtype=np.float32)
+        self.keys: List[Hashable] = []
+
+    @property
+    def matrix(self) -> np.ndarray:
+        return self.vectors[: len(self.keys)]
+
+    def append(self, key: Hashable, vector: np.ndarray) -> int:
+        row = len(self.keys)
+        if row == len(self.vectors):
+            grown = np.zeros((2 * row, self.vectors.shape[1]), dtype=np.float32)
+            grown[:row] = self.vectors
+            self.vectors = grown
+        self.vectors[row] = vector
+        self.keys.append(key)
+        return row
+
+    def pop_row(self, row: int) -> Optional[Hashable]:
+        """Remove a row by moving the last row into it. Returns the moved key."""
+        last = len(self.keys) - 1
+        moved = None
+        if row != last:
+            moved = self.keys[last]
+            self.vectors[row] = self.vectors[last]
+            self.keys[row] = moved
+        self.keys.pop()
+        return moved
+
+
+class EmbeddingIndex:  # pylint: disable=too-many-instance-attributes
+    """
+    Cosine-similarity top-k index over compact float32 matrices.
+
+    Usage:
+        index = EmbeddingIndex(dim=384)
+        index.add("key-1", embedding)
+        matches = index.search(query_embedding, k=5)  # [(key, similarity)]
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        dim: Optional[int] = None,
+        initial_capacity: int = 1024,
+        ivf_threshold: int = 20_000,
+        nprobe: int = 8,
+        seed: int = 0,
+    ):
+        """
+        Initialize empty index.
+
+        Args:
+            dim: Embedding dimension (inferred from the first add if None)
+            initial_capacity: Rows preallocated before the first resize
+            ivf_threshold: Size above which queries use the IVF partitions
+            nprobe: Partitions scored per query in IVF mode
+            seed: RNG seed for k-means initialization
+        """
+        self._dim = dim
+        self._initial_capacity = initial_capacity
+        self._ivf_threshold = ivf_threshold
+        self._nprobe = nprobe
+        self._rng = np.random.default_rng(seed)
+
+        # One block in exact mode, one per centroid in IVF mode
+        self._blocks: List[_Block] = []
+        self._where: Dict[Hashable, Tuple[int, int]] = {}  # key -> (block, row)
+        self._centroids: Optional[np.ndarray] = None
+        self._trained_size = 0
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._where
+
+    @property
+    def uses_ivf(self) -> bool:
+        """Whether queries currently go through the IVF partitions."""
+        return self._centroids is not None
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the embedding matrices."""
+        return sum(block.vectors.nbytes for block in self._blocks)
+
+    def add(self, key: Hashable, embedding: Sequence[float]) -> None:
+        """Insert or replace the embedding for key."""
+        vector = self._normalize(embedding)
+        if key in self._where:
+            self._detach(key)
+
+        if not self._blocks:
+            self._blocks = [_Block(self._dim or len(vector), self._initial_capacity)]
+        b = 0 if self._centroids is None else int(np.argmax(self._centroids @ vector))
+        self._where[key] = (b, self._blocks[b].append(key, vector))
+        self._maybe_train()
+
+    def remove(self, key: Hashable) -> bool:
+        """Delete key, moving the last row of its block into its slot. False if absent."""
+        if key not in self._where:
+            return False
+        self._detach(key)
+
+        if self._centroids is not None and len(self._where) < self._ivf_threshold // 2:
+            self._rebuild(None)  # Small again: exact scan is cheaper
+        return True
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._blocks = []
+        self._where.clear()
+        self._centroids = None
+        self._trained_size = 0
+
+    def search(self, query: Sequence[float], k: int = 1) -> List[Tuple[Hashable, float]]:
+        """Top-k (key, cosine similarity) pairs, most similar first."""
+        if not self._where or k <= 0:
+            return []
+        vector = self._normalize(query)
+
+        if self._centroids is None:
+            probes = [0]
+        else:
+            nprobe = min(self._nprobe, len(self._centroids))
+            probes = np.argpartition(-(self._centroids @ vector), nprobe - 1)[:nprobe].tolist()
+
+        blocks = [self._blocks[b] for b in probes if self._blocks[b].keys]
+        if not blocks:
+            return []
+        scores = np.concatenate([block.matrix @ vector for block in blocks])
+        offsets = np.cumsum([0] + [len(block.keys) for block in blocks])
+
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        owners = np.searchsorted(offsets, top, side="right") - 1
+        return [
+            (blocks[o].keys[t - offsets[o]], float(scores[t]))
+            for t, o in zip(top.tolist(), owners.tolist())
+        ]
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _normalize(self, embedding: Sequence[float]) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32).ravel()
+        if self._dim is None:
+            self._dim = len(vector)
+        if len(vector) != self._dim:
+            raise ValueError(f"Expected embedding of dimension {self._dim}, got {len(vector)}")
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm > 0 else vector
+
+    def _detach(self, key: Hashable) -> None:
+        b, row = self._where.pop(key)
+        moved = self._blocks[b].pop_row(row)
+        if moved is not None:
+            self._where[moved] = (b, row)
+
+    def _all_vectors(self) -> Tuple[np.ndarray, List[Hashable]]:
+        keys = [key for block in self._blocks for key in block.keys]
+        return np.concatenate([block.matrix for block in self._blocks]), keys
+
+    def _maybe_train(self) -> None:
+        n = len(self._where)
+        if n < self._ivf_threshold:
+            return
+        if self._centroids is not None and n < 2 * self._trained_size:
+            return
+        self._rebuild(self._train_centroids())
+
+    def _train_centroids(self, iterations: int = 10) -> np.ndarray:
+        """Spherical k-means with nlist ≈ sqrt(n) on a sample of rows."""
+        vectors, _ = self._all_vectors()
+        n = len(vectors)
+        nlist = max(1, int(np.sqrt(n)))
+
+        sample_size = min(n, 64 * nlist)
+        sample = vectors[self._rng.choice(n, size=sample_size, replace=False)]
+        centroids = sample[self._rng.choice(sample_size, size=nlist, replace=False)].copy()
+
+        for _ in range(iterations):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, sample)
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            filled = norms[:, 0] > 0
+            centroids[filled] = sums[filled] / norms[filled]
+        return centroids
+
+    def _rebuild(self, centroids: Optional[np.ndarray]) -> None:
+        """Re-lay rows out as one block (centroids None) or one block per centroid."""
+        vectors, keys = self._all_vectors()
+        if centroids is None:
+            labels = np.zeros(len(vectors), dtype=np.int64)
+            nblocks = 1
+        else:
+            # Assign in chunks to bound the n x nlist score matrix
+            labels = np.concatenate([
+                np.argmax(vectors[start : start + 8192] @ centroids.T, axis=1)
+                for start in range(0, len(vectors), 8192)
+            ])
+            nblocks = len(centroids)
+
+        order = np.argsort(labels, kind="stable")
+        bounds = np.searchsorted(labels[order], np.arange(nblocks + 1))
+        self._blocks = []
+        self._where = {}
+        for b in range(nblocks):
+            rows = order[bounds[b] : bounds[b + 1]]
+            min_capacity = self._initial_capacity if centroids is None else 16
+            block = _Block(vectors.shape[1], max(len(rows), min_capacity))
+            block.vectors[: len(rows)] = vectors[rows]
+            block.keys = [keys[r] for r in rows.tolist()]
+            for row, key in enumerate(block.keys):
+                self._where[key] = (b, row)
+            self._blocks.append(block)
+
+        self._centroids = centroids
+        self._trained_size = len(vectors) if centroids is not None else 0
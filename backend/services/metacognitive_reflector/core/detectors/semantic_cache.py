@@ -4,7 +4,7 @@ MAXIMUS 2.0 - TieredSemanticCache
 
 Three-tier semantic cache for VERITAS entropy computation:
 - L1: Exact hash match (<1ms)
-- L2: Semantic similarity via embeddings (~50ms)
+- L2: Semantic similarity via embeddings (EmbeddingIndex top-k, <1ms)
 - L3: Full entropy computation (5-15s)
 
 Operation Modes:
@@ -14,6 +14,10 @@ Operation Modes:
 
 Based on GPTCache (100x speedup) and Portkey (20% hit rate @ 99% accuracy).
 Flow: Request → Hash → L1 → (miss) → L2 → (miss) → L3 Compute
+
+Concurrent L3 misses for the same text are coalesced (single-flight): the
+first caller starts the computation, later callers await the same result,
+each bounded by its own mode timeout.
 """
 
 from __future__ import annotations
@@ -21,11 +25,12 @@ from __future__ import annotations
 import asyncio
 import hashlib
 import time
+from collections import OrderedDict
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Hashable, List, Optional, Tuple
 
 try:
     import numpy as np
@@ -33,6 +38,9 @@ try:
 except ImportError:
     HAS_NUMPY = False
 
+if HAS_NUMPY:
+    from .embedding_index import EmbeddingIndex
+
 try:
     from sentence_transformers import SentenceTransformer
     HAS_SENTENCE_TRANSFORMERS = True
@@ -74,6 +82,13 @@ class CacheEntry:  # pylint: disable=too-many-instance-attributes
         return age > self.ttl_seconds
 
 
+@dataclass
+class _InFlight:
+    """An L3 computation shared by all concurrent callers for one key."""
+    deadline: float  # Loop time; extended by callers with longer timeouts
+    task: Optional["asyncio.Task[float]"] = None
+
+
 @dataclass
 class CacheResult:
     """Result from cache lookup."""
@@ -91,6 +106,15 @@ class EmbeddingProvider(ABC):
     async def encode(self, text: str) -> List[float]:
         """Encode text to embedding vector."""
 
+    async def encode_batch(self, texts: List[str]) -> List[List[float]]:
+        """
+        Encode several texts.
+
+        Default runs encode() concurrently; providers backed by a model
+        should override this with a single batched forward pass.
+        """
+        return list(await asyncio.gather(*[self.encode(t) for t in texts]))
+
     @abstractmethod
     async def similarity(self, vec1: List[float], vec2: List[float]) -> float:
         """Compute cosine similarity between vectors."""
@@ -126,6 +150,18 @@ class LocalEmbeddingProvider(EmbeddingProvider):
         )
         return embedding.tolist()
 
+    async def encode_batch(self, texts: List[str]) -> List[List[float]]:
+        """Encode all texts in one sentence-transformers forward pass."""
+        if not texts:
+            return []
+        model = self._get_model()
+        loop = asyncio.get_event_loop()
+        embeddings = await loop.run_in_executor(
+            None,
+            lambda: model.encode(texts, batch_size=len(texts), convert_to_numpy=True)
+        )
+        return embeddings.tolist()
+
     async def similarity(self, vec1: List[float], vec2: List[float]) -> float:
         """Compute cosine similarity."""
         if not HAS_NUMPY:
@@ -155,6 +191,10 @@ class MockEmbeddingProvider(EmbeddingProvider):
         h = hashlib.md5(text.encode()).hexdigest()
         return [int(c, 16) / 15.0 for c in h[:16]]
 
+    async def encode_batch(self, texts: List[str]) -> List[List[float]]:
+        """Return hash-based mock embeddings for all texts."""
+        return [await self.encode(t) for t in texts]
+
     async def similarity(self, vec1: List[float], vec2: List[float]) -> float:
         """Compute cosine similarity."""
         if not vec1 or not vec2:
@@ -210,6 +250,8 @@ class TieredSemanticCache:  # pylint: disable=too-many-instance-attributes
         l2_max_size: int = 5000,
         similarity_threshold: float = 0.92,
         ttl_seconds: int = 3600,
+        l2_ivf_threshold: int = 20_000,
+        l2_top_k: int = 4,
     ):
         """
         Initialize tiered cache.
@@ -220,24 +262,35 @@ class TieredSemanticCache:  # pylint: disable=too-many-instance-attributes
             l2_max_size: Maximum entries in L2 cache
             similarity_threshold: Minimum similarity for L2 match
             ttl_seconds: Time-to-live for cache entries
+            l2_ivf_threshold: L2 size above which lookups use IVF partitions
+            l2_top_k: Nearest neighbours checked per L2 lookup (skips expired)
         """
         self._embedding_provider = embedding_provider or MockEmbeddingProvider()
         self._l1_max_size = l1_max_size
         self._l2_max_size = l2_max_size
         self._similarity_threshold = similarity_threshold
         self._ttl_seconds = ttl_seconds
+        self._l2_top_k = l2_top_k
+
+        # L1: Hash-keyed exact match cache (LRU order, oldest first)
+        self._l1_cache: OrderedDict[str, CacheEntry] = OrderedDict()
 
-        # L1: Hash-keyed exact match cache
-        self._l1_cache: Dict[str, CacheEntry] = {}
+        # L2: Semantic similarity cache (LRU order, oldest first). Embeddings
+        # are searched through a float32 matrix index when numpy is available.
+        self._l2_cache: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._l2_index: Optional[EmbeddingIndex] = (
+            EmbeddingIndex(ivf_threshold=l2_ivf_threshold) if HAS_NUMPY else None
+        )
 
-        # L2: Semantic similarity cache (stores embeddings)
-        self._l2_cache: Dict[str, CacheEntry] = {}
+        # L3: In-flight computations by hash key (single-flight)
+        self._inflight: Dict[Tuple[str, Hashable], _InFlight] = {}
 
         # Statistics
         self._stats = {
             "l1_hits": 0,
             "l2_hits": 0,
             "l3_computes": 0,
+            "l3_coalesced": 0,
             "misses": 0,
             "total_requests": 0,
         }
@@ -252,6 +305,7 @@ class TieredSemanticCache:  # pylint: disable=too-many-instance-attributes
         text: str,
         compute_fn: Any,
         mode: CacheMode = CacheMode.NORMAL,
+        compute_key: Hashable = None,
     ) -> CacheResult:
         """
         Get entropy from cache or compute it.
@@ -260,6 +314,8 @@ class TieredSemanticCache:  # pylint: disable=too-many-instance-attributes
             text: Text to compute entropy for
             compute_fn: Async function to compute entropy
             mode: Operation mode (FAST, NORMAL, DEEP)
+            compute_key: Settings baked into compute_fn (e.g. sample count);
+                only callers with equal keys share an in-flight computation
 
         Returns:
             CacheResult with entropy and cache level
@@ -290,18 +346,14 @@ class TieredSemanticCache:  # pylint: disable=too-many-instance-attributes
                 confidence=0.0,
             )
 
-        # Compute with timeout
+        # Compute with timeout, sharing any in-flight computation
         timeout_s = config["timeout_ms"] / 1000
+        flight = self._join_flight(text, compute_fn, timeout_s, compute_key)
         try:
             entropy = await asyncio.wait_for(
-                compute_fn(text),
+                asyncio.shield(flight.task),
                 timeout=timeout_s
             )
-
-            # Store in both caches
-            await self._store(text, entropy)
-
-            self._stats["l3_computes"] += 1
             latency = (time.time() - start_time) * 1000
 
             return CacheResult(
@@ -312,16 +364,82 @@ class TieredSemanticCache:  # pylint: disable=too-many-instance-attributes
                 confidence=1.0,
             )
 
+        except asyncio.CancelledError:
+            if not flight.task.cancelled():
+                raise  # This caller was cancelled, not the shared computation
+            # Flight dropped by clear()
+            return self._l3_miss(start_time)
+
         except asyncio.TimeoutError:
-            self._stats["misses"] += 1
-            latency = (time.time() - start_time) * 1000
-            return CacheResult(
-                hit=False,
-                level=CacheLevel.MISS,
-                entropy=None,
-                latency_ms=latency,
-                confidence=0.0,
-            )
+            return self._l3_miss(start_time)
+
+    def _l3_miss(self, start_time: float) -> CacheResult:
+        """Record and build a MISS for a computation that did not finish."""
+        self._stats["misses"] += 1
+        latency = (time.time() - start_time) * 1000
+        return CacheResult(
+            hit=False,
+            level=CacheLevel.MISS,
+            entropy=None,
+            latency_ms=latency,
+            confidence=0.0,
+        )
+
+    def _join_flight(
+        self,
+        text: str,
+        compute_fn: Any,
+        timeout_s: float,
+        compute_key: Hashable = None,
+    ) -> _InFlight:
+        """Return the in-flight computation for text and settings, starting one if needed."""
+        key = (self._compute_hash(text), compute_key)
+        deadline = asyncio.get_running_loop().time() + timeout_s
+
+        flight = self._inflight.get(key)
+        if flight is not None:
+            self._stats["l3_coalesced"] += 1
+            flight.deadline = max(flight.deadline, deadline)
+            return flight
+
+        flight = _InFlight(deadline=deadline)
+        flight.task = asyncio.ensure_future(self._run_flight(key, flight, text, compute_fn))
+        # Waiters that time out leave the result unobserved
+        flight.task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        self._inflight[key] = flight
+        return flight
+
+    async def _run_flight(
+        self,
+        key: Tuple[str, Hashable],
+        flight: _InFlight,
+        text: str,
+        compute_fn: Any,
+    ) -> float:
+        """
+        Compute and store entropy for an in-flight key.
+
+        Runs until the latest deadline of its waiters; once every waiter
+        has timed out the computation is cancelled.
+        """
+        loop = asyncio.get_running_loop()
+        compute = asyncio.ensure_future(compute_fn(text))
+        try:
+            while not compute.done():
+                remaining = flight.deadline - loop.time()
+                if remaining <= 0:
+                    raise asyncio.TimeoutError
+                await asyncio.wait({compute}, timeout=remaining)
+
+            entropy = compute.result()
+            await self._store(text, entropy)
+            self._stats["l3_computes"] += 1
+            return entropy
+        finally:
+            compute.cancel()
+            # clear() may have dropped this flight and a new one taken its key
+            if self._inflight.get(key) is flight:
+                del self._inflight[key]
 
     async def _check_l1(self, text: str) -> CacheResult:
         """Check L1 exact match cache."""
@@ -333,6 +451,7 @@ class TieredSemanticCache:  # pylint: disable=too-many-instance-attributes
             if not entry.is_expired:
                 entry.access_count += 1
                 entry.last_accessed = datetime.now()
+                self._l1_cache.move_to_end(key)
                 self._stats["l1_hits"] += 1
 
                 return CacheResult(
@@ -368,27 +487,16 @@ class TieredSemanticCache:  # pylint: disable=too-many-instance-attributes
         query_embedding = await self._embedding_provider.encode(text)
 
         # Find most similar entry
-        best_similarity = 0.0
-        best_entry: Optional[CacheEntry] = None
-
-        for entry in self._l2_cache.values():
-            if entry.is_expired:
-                continue
-            if entry.embedding is None:
-                continue
-
-            similarity = await self._embedding_provider.similarity(
-                query_embedding, entry.embedding
-            )
-
-            if similarity > best_similarity:
-                best_similarity = similarity
-                best_entry = entry
+        if self._l2_index is not None:
+            best_entry, best_similarity = self._search_l2_index(query_embedding)
+        else:
+            best_entry, best_similarity = await self._scan_l2(query_embedding)
 
         # Check threshold
         if best_entry and best_similarity >= self._similarity_threshold:
             best_entry.access_count += 1
             best_entry.last_accessed = datetime.now()
+            self._l2_cache.move_to_end(best_entry.key)
             self._stats["l2_hits"] += 1
 
             return CacheResult(
@@ -406,6 +514,50 @@ class TieredSemanticCache:  # pylint: disable=too-many-instance-attributes
             latency_ms=(time.time() - start) * 1000,
         )
 
+    def _search_l2_index(
+        self, query_embedding: List[float]
+    ) -> Tuple[Optional[CacheEntry], float]:
+        """Best live entry among the index's top-k cosine matches."""
+        assert self._l2_index is not None
+        for key, similarity in self._l2_index.search(query_embedding, self._l2_top_k):
+            entry = self._l2_cache.get(key)
+            if entry is None or entry.embedding is None:
+                continue
+            if entry.is_expired:
+                self._remove_l2(key)
+                continue
+            return entry, similarity
+        return None, 0.0
+
+    async def _scan_l2(
+        self, query_embedding: List[float]
+    ) -> Tuple[Optional[CacheEntry], float]:
+        """Pairwise fallback when numpy is unavailable."""
+        best_similarity = 0.0
+        best_entry: Optional[CacheEntry] = None
+
+        for entry in self._l2_cache.values():
+            if entry.is_expired:
+                continue
+            if entry.embedding is None:
+                continue
+
+            similarity = await self._embedding_provider.similarity(
+                query_embedding, entry.embedding
+            )
+
+            if similarity > best_similarity:
+                best_similarity = similarity
+                best_entry = entry
+
+        return best_entry, best_similarity
+
+    def _remove_l2(self, key: str) -> None:
+        """Drop an entry from the L2 dict and its index row."""
+        self._l2_cache.pop(key, None)
+        if self._l2_index is not None:
+            self._l2_index.remove(key)
+
     async def _store(self, text: str, entropy: float) -> None:
         """Store result in L1 and L2 caches."""
         key = self._compute_hash(text)
@@ -421,40 +573,27 @@ class TieredSemanticCache:  # pylint: disable=too-many-instance-attributes
 
         # L1: Store with hash key
         self._l1_cache[key] = entry
+        self._l1_cache.move_to_end(key)
         self._evict_l1_if_needed()
 
         # L2: Store for semantic lookup
         self._l2_cache[key] = entry
+        self._l2_cache.move_to_end(key)
+        if self._l2_index is not None:
+            self._l2_index.add(key, embedding)
         self._evict_l2_if_needed()
 
     def _evict_l1_if_needed(self) -> None:
         """Evict least recently used entries from L1."""
-        if len(self._l1_cache) <= self._l1_max_size:
-            return
-
-        # Sort by last_accessed and remove oldest
-        sorted_entries = sorted(
-            self._l1_cache.items(),
-            key=lambda x: x[1].last_accessed
-        )
-
-        entries_to_remove = len(self._l1_cache) - self._l1_max_size
-        for key, _ in sorted_entries[:entries_to_remove]:
-            del self._l1_cache[key]
+        while len(self._l1_cache) > self._l1_max_size:
+            self._l1_cache.popitem(last=False)
 
     def _evict_l2_if_needed(self) -> None:
-        """Evict least recently used entries from L2."""
-        if len(self._l2_cache) <= self._l2_max_size:
-            return
-
-        sorted_entries = sorted(
-            self._l2_cache.items(),
-            key=lambda x: x[1].last_accessed
-        )
-
-        entries_to_remove = len(self._l2_cache) - self._l2_max_size
-        for key, _ in sorted_entries[:entries_to_remove]:
-            del self._l2_cache[key]
+        """Evict least recently used entries from L2 (and their index rows)."""
+        while len(self._l2_cache) > self._l2_max_size:
+            key, _ = self._l2_cache.popitem(last=False)
+            if self._l2_index is not None:
+                self._l2_index.remove(key)
 
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
@@ -469,20 +608,41 @@ class TieredSemanticCache:  # pylint: disable=too-many-instance-attributes
             **self._stats,
             "l1_size": len(self._l1_cache),
             "l2_size": len(self._l2_cache),
+            "l2_index": (
+                "none" if self._l2_index is None
+                else "ivf" if self._l2_index.uses_ivf
+                else "exact"
+            ),
+            "l3_inflight": len(self._inflight),
             "hit_rate": hit_rate,
         }
 
     def clear(self) -> None:
-        """Clear all caches and reset statistics."""
+        """Clear all caches, cancel in-flight computes and reset statistics."""
+        # Cancelled flights cannot store stale results into the cleared tiers
+        for flight in self._inflight.values():
+            if flight.task is not None:
+                flight.task.cancel()
+        self._inflight.clear()
         self._l1_cache.clear()
         self._l2_cache.clear()
+        if self._l2_index is not None:
+            self._l2_index.clear()
         for key in self._stats:
             self._stats[key] = 0
 
     async def health_check(self) -> Dict[str, Any]:
         """Check cache health."""
+        stats = self.get_stats()
+        coalesced = stats["l3_coalesced"]
         return {
             "healthy": True,
-            "stats": self.get_stats(),
+            "stats": stats,
+            "single_flight": {
+                "computes": stats["l3_computes"],
+                "coalesced": coalesced,
+                "inflight": stats["l3_inflight"],
+                "coalesce_rate": coalesced / max(1, coalesced + stats["l3_computes"]),
+            },
             "embedding_provider": type(self._embedding_provider).__name__,
         }
@@ -176,15 +176,19 @@ class SemanticEntropyDetector:
         Returns:
             EntropyResult with entropy score and hallucination likelihood
         """
+        samples = num_samples or self._num_samples
+
         # Try cache first - use a wrapper that returns just the entropy float
         async def compute_entropy_value(t: str) -> float:
-            result = await self._compute_entropy(t, num_samples or self._num_samples)
+            result = await self._compute_entropy(t, samples)
             return result.entropy
 
         cache_result = await self._cache.get_or_compute(
             text=text,
             compute_fn=compute_entropy_value,
             mode=mode,
+            # A DEEP caller must not join a FAST caller's lower-sample compute
+            compute_key=(mode.value, samples),
         )
 
         if cache_result.hit and cache_result.entropy is not None:
@@ -200,7 +204,7 @@ class SemanticEntropyDetector:
             )
 
         # Cache miss - compute fresh (this shouldn't happen after get_or_compute)
-        return await self._compute_entropy(text, num_samples or self._num_samples)
+        return await self._compute_entropy(text, samples)
 
     async def _compute_entropy(
         self,
@@ -222,19 +226,20 @@ class SemanticEntropyDetector:
                 confidence=0.3,
             )
 
-        # Embed all samples
-        embeddings = await asyncio.gather(*[
-            self._embedder.encode(s) for s in samples
-        ])
+        # Embed all samples (one batched call)
+        embeddings = await self._embedder.encode_batch(samples)
+
+        # Pairwise similarities, shared by clustering and mean similarity
+        similarities = self._compute_similarity_matrix(embeddings)
 
         # Cluster by semantic similarity
-        clusters = self._cluster_responses(embeddings)
+        clusters = self._cluster_responses(embeddings, similarities)
 
         # Compute entropy over clusters
         entropy = self._compute_cluster_entropy(clusters, len(samples))
 
         # Compute mean similarity
-        mean_sim = self._compute_mean_similarity(embeddings)
+        mean_sim = self._compute_mean_similarity(embeddings, similarities)
 
         return EntropyResult(
             entropy=entropy,
@@ -281,6 +286,7 @@ Analysis:"""
     def _cluster_responses(
         self,
         embeddings: List[List[float]],
+        similarities: Optional[Any] = None,
     ) -> List[List[int]]:
         """
         Cluster responses by semantic similarity.
@@ -292,7 +298,11 @@ Analysis:"""
             return []
 
         # Compute pairwise similarities
-        similarities = self._compute_similarity_matrix(embeddings)
+        if similarities is None:
+            similarities = self._compute_similarity_matrix(embeddings)
+
+        if HAS_NUMPY:
+            return self._cluster_greedy_numpy(np.asarray(similarities))
 
         # Simple clustering: greedy assignment
         clusters: List[List[int]] = []
@@ -325,12 +335,58 @@ Analysis:"""
 
         return clusters
 
+    def _cluster_greedy_numpy(self, similarities: Any) -> List[List[int]]:
+        """
+        Same greedy assignment as the pure-Python path on a boolean matrix.
+
+        A candidate must be similar to every member already in the cluster,
+        so the admissible set is narrowed with one row AND per accepted member.
+        """
+        n = len(similarities)
+        similar = similarities >= self.SIMILARITY_THRESHOLD
+        unassigned = np.ones(n, dtype=bool)
+        clusters: List[List[int]] = []
+
+        for i in range(n):
+            if not unassigned[i]:
+                continue
+            unassigned[i] = False
+            cluster = [i]
+
+            admissible = similar[i] & unassigned
+            admissible[: i + 1] = False
+            candidates = np.flatnonzero(admissible)
+            while len(candidates):
+                j = int(candidates[0])
+                cluster.append(j)
+                unassigned[j] = False
+                admissible &= similar[j]
+                admissible[: j + 1] = False
+                candidates = np.flatnonzero(admissible)
+
+            clusters.append(cluster)
+
+        return clusters
+
     def _compute_similarity_matrix(
         self,
         embeddings: List[List[float]],
-    ) -> List[List[float]]:
-        """Compute pairwise cosine similarities."""
+    ) -> Any:
+        """
+        Compute pairwise cosine similarities.
+
+        With numpy this is one normalized Gram matrix (BLAS); diagonal is 1.0
+        and zero vectors have similarity 0.0 to everything else.
+        """
         n = len(embeddings)
+        if HAS_NUMPY and n:
+            vectors = np.asarray(embeddings, dtype=np.float64)
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            unit = np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+            matrix = unit @ unit.T
+            np.fill_diagonal(matrix, 1.0)
+            return matrix
+
         matrix = [[0.0] * n for _ in range(n)]
 
         for i in range(n):
@@ -397,12 +453,20 @@ Analysis:"""
     def _compute_mean_similarity(
         self,
         embeddings: List[List[float]],
+        similarities: Optional[Any] = None,
     ) -> float:
         """Compute mean pairwise similarity."""
         n = len(embeddings)
         if n < 2:
             return 1.0
 
+        if HAS_NUMPY:
+            if similarities is None:
+                similarities = self._compute_similarity_matrix(embeddings)
+            matrix = np.asarray(similarities)
+            off_diagonal = matrix.sum() - np.trace(matrix)
+            return float(off_diagonal / (n * (n - 1)))
+
         total_sim = 0.0
         count = 0
 
@@ -20,6 +20,7 @@ from .penal_registry import (
     PenalStatus,
     check_agent_punishment,
 )
+from .near_cache import NearCacheBackend
 from .storage_backends import (
     InMemoryBackend,
     RedisBackend,
@@ -47,6 +48,7 @@ __all__ = [
     "check_agent_punishment",
     # Backends
     "InMemoryBackend",
+    "NearCacheBackend",
     "RedisBackend",
     "StorageBackend",
     # Handlers
@@ -0,0 +1,201 @@
+"""
+MAXIMUS 2.0 - Penal Registry Near-Cache
+=======================================
+
+Process-local TTL cache in front of a StorageBackend, so the punishment
+gate on every orchestrated action is a dictionary lookup instead of a
+network round trip.
+
+Invalidation:
+- Local writes (set/delete) update the cache immediately
+- If the wrapped backend exposes ``invalidations()`` (RedisBackend pub/sub),
+  writes from other processes drop the affected entry
+- While the subscription is down, entries are trusted for at most
+  ``ttl_seconds`` and the whole cache is dropped on reconnect
+- Cached records past their ``until`` are never served as active
+
+"Clear" answers (no record) are cached as well, since most agents are
+not punished and those lookups dominate.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from .storage_backends import StorageBackend
+
+if TYPE_CHECKING:
+    from .penal_registry import PenalRecord
+
+
+class NearCacheBackend(StorageBackend):  # pylint: disable=too-many-instance-attributes
+    """
+    TTL near-cache wrapping another storage backend.
+
+    Usage:
+        backend = NearCacheBackend(RedisBackend(redis_url), ttl_seconds=5.0)
+        registry = PenalRegistry(primary_backend=backend)
+    """
+
+    def __init__(
+        self,
+        backend: StorageBackend,
+        ttl_seconds: float = 5.0,
+        max_entries: int = 10_000,
+        resubscribe_delay: float = 1.0,
+    ) -> None:
+        """
+        Initialize near-cache.
+
+        Args:
+            backend: Backend that owns the records
+            ttl_seconds: Maximum age of a cached answer
+            max_entries: LRU bound on cached agent ids
+            resubscribe_delay: Wait before re-subscribing after a lost connection
+        """
+        self._backend = backend
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._resubscribe_delay = resubscribe_delay
+
+        # agent_id -> (expires_at monotonic, record or None for "clear")
+        self._entries: OrderedDict[str, Tuple[float, Optional["PenalRecord"]]] = OrderedDict()
+
+        # Invalidation epochs guard against filling the cache with a value
+        # fetched before an invalidation that arrived mid-fetch
+        self._epoch = 0
+        self._invalidated_epoch: Dict[str, int] = {}
+        self._cleared_epoch = -1
+        self._loads_in_flight = 0
+
+        self._listener: Optional[asyncio.Task[None]] = None
+        self._subscribed = False
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "invalidations": 0,
+        }
+
+    @property
+    def backend(self) -> StorageBackend:
+        """The wrapped backend."""
+        return self._backend
+
+    async def get(self, agent_id: str) -> Optional["PenalRecord"]:
+        """Get penal record, serving from the near-cache when fresh."""
+        self._ensure_listener()
+
+        entry = self._entries.get(agent_id)
+        if entry is not None and entry[0] > time.monotonic():
+            record = entry[1]
+            if record is None or record.is_active:
+                self._entries.move_to_end(agent_id)
+                self._stats["hits"] += 1
+                return record
+        self._stats["misses"] += 1
+
+        epoch = self._epoch
+        self._loads_in_flight += 1
+        try:
+            record = await self._backend.get(agent_id)
+        finally:
+            self._loads_in_flight -= 1
+
+        if max(self._invalidated_epoch.get(agent_id, -1), self._cleared_epoch) < epoch:
+            self._put(agent_id, record)
+        if not self._loads_in_flight:
+            self._invalidated_epoch.clear()
+        return record
+
+    async def set(self, record: "PenalRecord") -> bool:
+        """Store penal record through to the backend."""
+        self.invalidate(record.agent_id)
+        stored = await self._backend.set(record)
+        if stored:
+            self._put(record.agent_id, record)
+        return stored
+
+    async def delete(self, agent_id: str) -> bool:
+        """Delete penal record from the backend."""
+        self.invalidate(agent_id)
+        deleted = await self._backend.delete(agent_id)
+        self._put(agent_id, None)
+        return deleted
+
+    async def list_active(self) -> List["PenalRecord"]:
+        """List active punishments from the backend (not cached)."""
+        return await self._backend.list_active()
+
+    def invalidate(self, agent_id: Optional[str] = None) -> None:
+        """
+        Drop cached entries.
+
+        Args:
+            agent_id: Agent to drop (None = everything)
+        """
+        self._epoch += 1
+        self._stats["invalidations"] += 1
+        if agent_id is None:
+            self._entries.clear()
+            self._cleared_epoch = self._epoch
+            return
+        self._entries.pop(agent_id, None)
+        if self._loads_in_flight:
+            self._invalidated_epoch[agent_id] = self._epoch
+
+    async def close(self) -> None:
+        """Stop the invalidation listener."""
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        self._subscribed = False
+
+    async def health_check(self) -> Dict[str, Any]:
+        """Check wrapped backend health and report near-cache stats."""
+        health = await self._backend.health_check()
+        lookups = self._stats["hits"] + self._stats["misses"]
+        return {
+            **health,
+            "near_cache": {
+                **self._stats,
+                "size": len(self._entries),
+                "hit_rate": self._stats["hits"] / lookups if lookups else 0.0,
+                "ttl_seconds": self._ttl_seconds,
+                "subscribed": self._subscribed,
+            },
+        }
+
+    def _put(self, agent_id: str, record: Optional["PenalRecord"]) -> None:
+        self._entries[agent_id] = (time.monotonic() + self._ttl_seconds, record)
+        self._entries.move_to_end(agent_id)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def _ensure_listener(self) -> None:
+        if self._listener is None and hasattr(self._backend, "invalidations"):
+            self._listener = asyncio.create_task(self._listen())
+
+    async def _listen(self) -> None:
+        """Apply remote invalidations, re-subscribing after connection loss."""
+        while True:
+            try:
+                self._subscribed = True
+                async for agent_id in self._backend.invalidations():  # type: ignore[attr-defined]
+                    self.invalidate(agent_id)
+            except ImportError:
+                # No pub/sub client available: rely on TTL alone
+                self._subscribed = False
+                return
+            except (ConnectionError, TimeoutError, OSError):
+                pass
+            self._subscribed = False
+            # Messages may have been missed while disconnected
+            self.invalidate()
+            await asyncio.sleep(self._resubscribe_delay)
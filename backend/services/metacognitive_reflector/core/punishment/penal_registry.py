@@ -32,6 +32,7 @@ from datetime import datetime, timedelta
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
+from .near_cache import NearCacheBackend
 from .storage_backends import InMemoryBackend, StorageBackend
 
 
@@ -181,6 +182,7 @@ class PenalRegistry:
         primary_backend: Optional[StorageBackend] = None,
         fallback_backend: Optional[StorageBackend] = None,
         enable_audit_log: bool = True,
+        near_cache_ttl_seconds: Optional[float] = None,
     ) -> None:
         """
         Initialize registry.
@@ -189,8 +191,16 @@ class PenalRegistry:
             primary_backend: Primary storage (Redis by default)
             fallback_backend: Fallback storage (in-memory)
             enable_audit_log: Enable audit logging
+            near_cache_ttl_seconds: Wrap the primary in a NearCacheBackend
+                with this TTL (None = no near-cache)
         """
         self._primary = primary_backend or InMemoryBackend()
+        if near_cache_ttl_seconds is not None and not isinstance(
+            self._primary, NearCacheBackend
+        ):
+            self._primary = NearCacheBackend(
+                self._primary, ttl_seconds=near_cache_ttl_seconds
+            )
         self._fallback = fallback_backend or InMemoryBackend()
         self._enable_audit = enable_audit_log
         self._audit_log: List[Dict[str, Any]] = []
@@ -457,6 +467,12 @@ class PenalRegistry:
             "audit_log_size": len(self._audit_log),
         }
 
+    async def close(self) -> None:
+        """Stop background work owned by the backends (near-cache listener)."""
+        for backend in (self._primary, self._fallback):
+            if isinstance(backend, NearCacheBackend):
+                await backend.close()
+
 
 # Convenience functions for startup hooks
 async def check_agent_punishment(
@@ -9,6 +9,8 @@ Contains:
 - StorageBackend: Abstract base class
 - InMemoryBackend: For testing/development
 - RedisBackend: Production storage
+
+Wrap either in NearCacheBackend (near_cache.py) for a process-local cache.
 """
 
 from __future__ import annotations
@@ -16,7 +18,7 @@ from __future__ import annotations
 import json
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional
 
 try:
     import redis.asyncio as aioredis
@@ -152,7 +154,8 @@ class RedisBackend(StorageBackend):
 
     Features:
     - TTL-based expiration
-    - Index for listing active punishments
+    - Index for listing active punishments, read with pipelined MGET
+    - Invalidation pub/sub channel for near-caches (published on set/delete)
     - Connection pooling via aioredis
 
     Requires:
@@ -161,6 +164,8 @@ class RedisBackend(StorageBackend):
 
     KEY_PREFIX = "maximus:penal:"
     INDEX_KEY = "maximus:penal:index"
+    INVALIDATION_CHANNEL = "maximus:penal:invalidate"
+    MGET_CHUNK_SIZE = 500
 
     def __init__(
         self,
@@ -231,6 +236,7 @@ class RedisBackend(StorageBackend):
         # Add to index
         await client.sadd(self.INDEX_KEY, record.agent_id)
 
+        await client.publish(self.INVALIDATION_CHANNEL, record.agent_id)
         return True
 
     async def delete(self, agent_id: str) -> bool:
@@ -238,21 +244,62 @@ class RedisBackend(StorageBackend):
         client = await self._get_client()
         await client.delete(self._key(agent_id))
         await client.srem(self.INDEX_KEY, agent_id)
+        await client.publish(self.INVALIDATION_CHANNEL, agent_id)
         return True
 
     async def list_active(self) -> List["PenalRecord"]:
-        """List all active punishments from Redis."""
+        """
+        List all active punishments from Redis.
+
+        Reads every indexed record in one round trip (MGET chunks in a
+        pipeline) and prunes index entries whose records expired.
+        """
         client = await self._get_client()
-        agent_ids = await client.smembers(self.INDEX_KEY)
+        agent_ids = sorted(await client.smembers(self.INDEX_KEY))
+        if not agent_ids:
+            return []
+
+        async with client.pipeline(transaction=False) as pipe:
+            for start in range(0, len(agent_ids), self.MGET_CHUNK_SIZE):
+                chunk = agent_ids[start:start + self.MGET_CHUNK_SIZE]
+                pipe.mget([self._key(agent_id) for agent_id in chunk])
+            values = [value for chunk in await pipe.execute() for value in chunk]
 
         records = []
-        for agent_id in agent_ids:
-            record = await self.get(agent_id)
-            if record:
+        stale = []
+        for agent_id, data in zip(agent_ids, values):
+            record = self._record_class.from_dict(json.loads(data)) if data else None
+            if record and record.is_active:
                 records.append(record)
+            else:
+                stale.append(agent_id)
+
+        if stale:
+            await client.delete(*[self._key(agent_id) for agent_id in stale])
+            await client.srem(self.INDEX_KEY, *stale)
 
         return records
 
+    async def invalidations(self) -> AsyncIterator[str]:
+        """
+        Yield agent ids as records are set or deleted by any process.
+
+        Used by NearCacheBackend to drop local entries. Runs until the
+        consumer stops iterating; connection failures are raised as
+        ConnectionError.
+        """
+        client = await self._get_client()
+        pubsub = client.pubsub()
+        try:
+            await pubsub.subscribe(self.INVALIDATION_CHANNEL)
+            async for message in pubsub.listen():
+                if message.get("type") == "message":
+                    yield message["data"]
+        except aioredis.RedisError as e:
+            raise ConnectionError(str(e)) from e
+        finally:
+            await pubsub.aclose()
+
     async def health_check(self) -> Dict[str, Any]:
         """Check Redis health."""
         try:
@@ -0,0 +1,183 @@
+"""
+Tests for single-flight coalescing of TieredSemanticCache L3 computes.
+"""
+
+from __future__ import annotations
+
+
+import asyncio
+
+import pytest
+
+from metacognitive_reflector.core.detectors.semantic_cache import (
+    CacheLevel,
+    CacheMode,
+    TieredSemanticCache,
+)
+
+
+class SlowCompute:
+    """Counts calls and finishes after a fixed delay."""
+
+    def __init__(self, delay: float, entropy: float = 0.4):
+        self.delay = delay
+        self.entropy = entropy
+        self.calls = 0
+        self.cancelled = False
+
+    async def __call__(self, text: str) -> float:
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return self.entropy
+
+
+class TestSingleFlight:
+    """Concurrent callers for the same text share one L3 computation."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_compute(self):
+        cache = TieredSemanticCache()
+        compute = SlowCompute(0.05)
+
+        results = await asyncio.gather(*[
+            cache.get_or_compute("The sky is blue", compute) for _ in range(5)
+        ])
+
+        assert compute.calls == 1
+        assert all(r.level == CacheLevel.L3_COMPUTED for r in results)
+        assert {r.entropy for r in results} == {0.4}
+
+        stats = cache.get_stats()
+        assert stats["l3_computes"] == 1
+        assert stats["l3_coalesced"] == 4
+        assert stats["l3_inflight"] == 0
+
+        # Normalized text hits L1 after the flight lands
+        again = await cache.get_or_compute("the  sky is BLUE", compute)
+        assert again.level == CacheLevel.L1_EXACT
+        assert compute.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_different_texts_compute_independently(self):
+        cache = TieredSemanticCache()
+        compute = SlowCompute(0.01)
+
+        await asyncio.gather(
+            cache.get_or_compute("first claim", compute),
+            cache.get_or_compute("second claim", compute),
+        )
+
+        assert compute.calls == 2
+        assert cache.get_stats()["l3_coalesced"] == 0
+
+    @pytest.mark.asyncio
+    async def test_short_waiter_times_out_long_waiter_gets_result(self, monkeypatch):
+        monkeypatch.setitem(
+            TieredSemanticCache.MODE_CONFIG,
+            CacheMode.NORMAL,
+            {**TieredSemanticCache.MODE_CONFIG[CacheMode.NORMAL], "timeout_ms": 20},
+        )
+        cache = TieredSemanticCache()
+        compute = SlowCompute(0.1)
+
+        normal, deep = await asyncio.gather(
+            cache.get_or_compute("claim", compute, CacheMode.NORMAL),
+            cache.get_or_compute("claim", compute, CacheMode.DEEP),
+        )
+
+        assert normal.level == CacheLevel.MISS
+        assert deep.level == CacheLevel.L3_COMPUTED
+        assert deep.entropy == 0.4
+        assert compute.calls == 1
+        assert not compute.cancelled
+
+    @pytest.mark.asyncio
+    async def test_compute_cancelled_when_all_waiters_time_out(self, monkeypatch):
+        monkeypatch.setitem(
+            TieredSemanticCache.MODE_CONFIG,
+            CacheMode.NORMAL,
+            {**TieredSemanticCache.MODE_CONFIG[CacheMode.NORMAL], "timeout_ms": 20},
+        )
+        cache = TieredSemanticCache()
+        compute = SlowCompute(1.0)
+
+        results = await asyncio.gather(*[
+            cache.get_or_compute("claim", compute) for _ in range(3)
+        ])
+        await asyncio.sleep(0.01)
+
+        assert all(r.level == CacheLevel.MISS for r in results)
+        assert compute.cancelled
+        assert cache.get_stats()["l3_inflight"] == 0
+        assert cache.get_stats()["misses"] == 3
+
+    @pytest.mark.asyncio
+    async def test_different_compute_keys_do_not_share(self):
+        cache = TieredSemanticCache()
+        fast = SlowCompute(0.05, entropy=0.9)
+        deep = SlowCompute(0.05, entropy=0.3)
+
+        shallow, thorough = await asyncio.gather(
+            cache.get_or_compute("claim", fast, CacheMode.NORMAL, compute_key=("normal", 3)),
+            cache.get_or_compute("claim", deep, CacheMode.DEEP, compute_key=("deep", 10)),
+        )
+
+        assert fast.calls == 1
+        assert deep.calls == 1
+        assert thorough.entropy == 0.3
+        assert cache.get_stats()["l3_coalesced"] == 0
+
+    @pytest.mark.asyncio
+    async def test_clear_cancels_inflight_compute(self):
+        cache = TieredSemanticCache()
+        compute = SlowCompute(0.2)
+
+        waiter = asyncio.ensure_future(cache.get_or_compute("claim", compute))
+        await asyncio.sleep(0.01)
+        cache.clear()
+        result = await waiter
+
+        assert result.level == CacheLevel.MISS
+        assert compute.cancelled
+        assert cache.get_stats()["l3_inflight"] == 0
+
+        # Nothing stale was stored; the next caller computes afresh
+        again = await cache.get_or_compute("claim", SlowCompute(0.01, entropy=0.7))
+        assert again.level == CacheLevel.L3_COMPUTED
+        assert again.entropy == 0.7
+
+    @pytest.mark.asyncio
+    async def test_compute_error_reaches_every_waiter(self):
+        cache = TieredSemanticCache()
+
+        async def failing(text: str) -> float:
+            await asyncio.sleep(0.01)
+            raise RuntimeError("llm unavailable")
+
+        results = await asyncio.gather(
+            cache.get_or_compute("claim", failing),
+            cache.get_or_compute("claim", failing),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert cache.get_stats()["l3_inflight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_health_check_reports_coalescing(self):
+        cache = TieredSemanticCache()
+        compute = SlowCompute(0.01)
+        await asyncio.gather(*[cache.get_or_compute("claim", compute) for _ in range(4)])
+
+        health = await cache.health_check()
+
+        assert health["single_flight"] == {
+            "computes": 1,
+            "coalesced": 3,
+            "inflight": 0,
+            "coalesce_rate": 0.75,
+        }
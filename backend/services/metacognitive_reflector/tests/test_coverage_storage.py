@@ -317,17 +317,29 @@ class TestRedisBackend:
         )
 
         import json
-        mock_client = AsyncMock()
-        mock_client.smembers = AsyncMock(return_value={"agent_001", "agent_002"})
-        mock_client.get = AsyncMock(side_effect=[
+        pipe = MagicMock()
+        pipe.__aenter__ = AsyncMock(return_value=pipe)
+        pipe.__aexit__ = AsyncMock(return_value=False)
+        pipe.execute = AsyncMock(return_value=[[
             json.dumps(record1.to_dict()),
             json.dumps(record2.to_dict()),
-        ])
+            None,  # Record key expired, index entry left behind
+        ]])
+        mock_client = AsyncMock()
+        mock_client.smembers = AsyncMock(return_value={"agent_001", "agent_002", "agent_003"})
+        mock_client.pipeline = MagicMock(return_value=pipe)
         backend._client = mock_client
 
         records = await backend.list_active()
 
-        assert len(records) == 2
+        assert [r.agent_id for r in records] == ["agent_001", "agent_002"]
+        pipe.mget.assert_called_once_with([
+            "maximus:penal:agent_001",
+            "maximus:penal:agent_002",
+            "maximus:penal:agent_003",
+        ])
+        mock_client.get.assert_not_called()
+        mock_client.srem.assert_called_once_with("maximus:penal:index", "agent_003")
 
     @pytest.mark.asyncio
     async def test_health_check_success(self):
@@ -0,0 +1,169 @@
+"""
+Tests for EmbeddingIndex and its use as the TieredSemanticCache L2 tier.
+"""
+
+from __future__ import annotations
+
+
+from datetime import datetime, timedelta
+from typing import List
+
+import numpy as np
+import pytest
+
+from metacognitive_reflector.core.detectors.embedding_index import EmbeddingIndex
+from metacognitive_reflector.core.detectors.semantic_cache import (
+    CacheLevel,
+    CacheMode,
+    EmbeddingProvider,
+    TieredSemanticCache,
+)
+
+
+def _unit(rows: np.ndarray) -> np.ndarray:
+    return rows / np.linalg.norm(rows, axis=1, keepdims=True)
+
+
+class TestEmbeddingIndex:
+    """Exact and IVF search behaviour."""
+
+    def test_search_matches_brute_force(self):
+        rng = np.random.default_rng(1)
+        vectors = rng.normal(size=(500, 32))
+        index = EmbeddingIndex()
+        for i, vector in enumerate(vectors):
+            index.add(i, vector)
+
+        query = rng.normal(size=32)
+        expected = np.argsort(-(_unit(vectors) @ (query / np.linalg.norm(query))))[:5]
+
+        result = index.search(query, k=5)
+        assert [key for key, _ in result] == list(expected)
+        assert result[0][1] >= result[-1][1]
+
+    def test_remove_keeps_matrix_compact(self):
+        index = EmbeddingIndex(initial_capacity=4)
+        for i in range(10):
+            index.add(f"k{i}", [1.0, float(i)])
+
+        assert index.remove("k3") is True
+        assert index.remove("k3") is False
+        assert len(index) == 9
+        assert "k3" not in index
+        # The moved row is still findable by its own vector
+        assert index.search([1.0, 9.0], k=1)[0][0] == "k9"
+
+    def test_add_replaces_existing_key(self):
+        index = EmbeddingIndex()
+        index.add("a", [1.0, 0.0])
+        index.add("a", [0.0, 1.0])
+
+        assert len(index) == 1
+        assert index.search([0.0, 1.0], k=1)[0][1] == pytest.approx(1.0)
+
+    def test_dimension_mismatch(self):
+        index = EmbeddingIndex()
+        index.add("a", [1.0, 0.0])
+        with pytest.raises(ValueError):
+            index.add("b", [1.0, 0.0, 0.0])
+
+    def test_ivf_finds_near_duplicates(self):
+        rng = np.random.default_rng(2)
+        vectors = rng.normal(size=(3000, 32)).astype(np.float32)
+        index = EmbeddingIndex(ivf_threshold=1000, nprobe=4)
+        for i, vector in enumerate(vectors):
+            index.add(i, vector)
+
+        assert index.uses_ivf
+        for i in range(0, 3000, 150):
+            noisy = vectors[i] + rng.normal(scale=0.05, size=32)
+            key, similarity = index.search(noisy, k=1)[0]
+            assert key == i
+            assert similarity > 0.95
+
+    def test_ivf_dropped_when_index_shrinks(self):
+        index = EmbeddingIndex(ivf_threshold=100)
+        for i in range(120):
+            index.add(i, np.random.default_rng(i).normal(size=8))
+        assert index.uses_ivf
+
+        for i in range(80):
+            index.remove(i)
+        assert not index.uses_ivf
+
+
+class VectorProvider(EmbeddingProvider):
+    """Maps texts to fixed vectors so similarity is controlled by the test."""
+
+    def __init__(self):
+        self.vectors = {}
+
+    async def encode(self, text: str) -> List[float]:
+        return self.vectors[text]
+
+    async def similarity(self, vec1: List[float], vec2: List[float]) -> float:
+        raise AssertionError("L2 lookups should go through the index")
+
+
+class TestCacheL2Index:
+    """TieredSemanticCache L2 tier backed by EmbeddingIndex."""
+
+    @pytest.fixture
+    def provider(self):
+        provider = VectorProvider()
+        provider.vectors = {
+            "paris is the capital": [1.0, 0.0, 0.0],
+            "capital of france is paris": [0.99, 0.05, 0.0],
+            "unrelated": [0.0, 0.0, 1.0],
+            "other": [0.0, 1.0, 0.0],
+        }
+        return provider
+
+    @staticmethod
+    async def _compute(text):
+        return 0.25
+
+    @pytest.mark.asyncio
+    async def test_l2_hit_through_index(self, provider):
+        cache = TieredSemanticCache(embedding_provider=provider)
+        await cache.get_or_compute("paris is the capital", self._compute)
+
+        result = await cache.get_or_compute("capital of france is paris", self._compute)
+
+        assert result.level == CacheLevel.L2_SEMANTIC
+        assert result.entropy == 0.25
+        assert result.confidence > 0.99
+        assert cache.get_stats()["l2_index"] == "exact"
+
+    @pytest.mark.asyncio
+    async def test_expired_match_removed(self, provider):
+        cache = TieredSemanticCache(embedding_provider=provider)
+        await cache.get_or_compute("paris is the capital", self._compute)
+        for entry in cache._l2_cache.values():
+            entry.created_at = datetime.now() - timedelta(hours=2)
+
+        result = await cache._check_l2("capital of france is paris")
+
+        assert result.hit is False
+        assert len(cache._l2_cache) == 0
+        assert len(cache._l2_index) == 0
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_keeps_index_in_sync(self, provider):
+        cache = TieredSemanticCache(embedding_provider=provider, l2_max_size=2)
+        await cache.get_or_compute("paris is the capital", self._compute)
+        await cache.get_or_compute("unrelated", self._compute)
+        # Touch the first entry so "unrelated" becomes least recently used
+        await cache.get_or_compute("capital of france is paris", self._compute, CacheMode.FAST)
+        await cache.get_or_compute("other", self._compute)
+
+        remaining = {entry.text for entry in cache._l2_cache.values()}
+        assert remaining == {"paris is the capital", "other"}
+        assert len(cache._l2_index) == 2
+
+    @pytest.mark.asyncio
+    async def test_clear_empties_index(self, provider):
+        cache = TieredSemanticCache(embedding_provider=provider)
+        await cache.get_or_compute("paris is the capital", self._compute)
+        cache.clear()
+        assert len(cache._l2_index) == 0
@@ -0,0 +1,206 @@
+"""
+Tests for the PenalRegistry near-cache backend.
+"""
+
+from __future__ import annotations
+
+
+import asyncio
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Optional
+
+import pytest
+
+from metacognitive_reflector.core.punishment import (
+    InMemoryBackend,
+    NearCacheBackend,
+    OffenseType,
+    PenalRecord,
+    PenalRegistry,
+    PenalStatus,
+)
+
+
+def _record(agent_id: str = "agent_001", until: Optional[datetime] = None) -> PenalRecord:
+    return PenalRecord(
+        agent_id=agent_id,
+        status=PenalStatus.QUARANTINE,
+        offense=OffenseType.ROLE_VIOLATION,
+        until=until or datetime.now() + timedelta(hours=1),
+    )
+
+
+class CountingBackend(InMemoryBackend):
+    """In-memory backend counting get round trips."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.gets = 0
+
+    async def get(self, agent_id: str) -> Optional[PenalRecord]:
+        self.gets += 1
+        return await super().get(agent_id)
+
+
+class PubSubBackend(CountingBackend):
+    """Backend with an invalidation stream fed by the test."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.channel: asyncio.Queue = asyncio.Queue()
+        self.subscriptions = 0
+
+    async def invalidations(self) -> AsyncIterator[str]:
+        self.subscriptions += 1
+        while True:
+            message = await self.channel.get()
+            if isinstance(message, Exception):
+                raise message
+            yield message
+
+
+class TestNearCache:
+    """Caching and local invalidation."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_gets_hit_cache(self):
+        inner = CountingBackend()
+        await inner.set(_record())
+        cache = NearCacheBackend(inner)
+
+        for _ in range(5):
+            assert (await cache.get("agent_001")).status == PenalStatus.QUARANTINE
+        # Clear agents are cached too
+        assert await cache.get("agent_clean") is None
+        assert await cache.get("agent_clean") is None
+
+        assert inner.gets == 2
+        health = await cache.health_check()
+        assert health["near_cache"]["hits"] == 5
+
+    @pytest.mark.asyncio
+    async def test_ttl_expiry_refetches(self):
+        inner = CountingBackend()
+        cache = NearCacheBackend(inner, ttl_seconds=0.01)
+
+        await cache.get("agent_001")
+        await asyncio.sleep(0.02)
+        await cache.get("agent_001")
+
+        assert inner.gets == 2
+
+    @pytest.mark.asyncio
+    async def test_writes_update_cache(self):
+        cache = NearCacheBackend(CountingBackend())
+        assert await cache.get("agent_001") is None
+
+        await cache.set(_record())
+        assert (await cache.get("agent_001")).status == PenalStatus.QUARANTINE
+
+        await cache.delete("agent_001")
+        assert await cache.get("agent_001") is None
+
+    @pytest.mark.asyncio
+    async def test_expired_record_not_served(self):
+        inner = CountingBackend()
+        cache = NearCacheBackend(inner)
+        await cache.set(_record(until=datetime.now() + timedelta(milliseconds=10)))
+
+        await asyncio.sleep(0.02)
+
+        assert await cache.get("agent_001") is None
+        assert inner.gets == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidation_during_fetch_is_not_cached(self):
+        release = asyncio.Event()
+
+        class SlowBackend(CountingBackend):
+            async def get(self, agent_id):
+                record = await super().get(agent_id)
+                await release.wait()
+                return record
+
+        inner = SlowBackend()
+        cache = NearCacheBackend(inner)
+        pending = asyncio.create_task(cache.get("agent_001"))
+        await asyncio.sleep(0)
+
+        # Another writer punishes the agent while the stale read is in flight
+        await inner.set(_record())
+        cache.invalidate("agent_001")
+        release.set()
+        assert await pending is None
+
+        assert (await cache.get("agent_001")).status == PenalStatus.QUARANTINE
+
+    @pytest.mark.asyncio
+    async def test_lru_bound(self):
+        cache = NearCacheBackend(CountingBackend(), max_entries=2)
+        for agent_id in ("a", "b", "c"):
+            await cache.get(agent_id)
+
+        assert (await cache.health_check())["near_cache"]["size"] == 2
+
+
+class TestRemoteInvalidation:
+    """Invalidations published by other processes."""
+
+    @pytest.mark.asyncio
+    async def test_remote_write_drops_entry(self):
+        inner = PubSubBackend()
+        cache = NearCacheBackend(inner)
+        assert await cache.get("agent_001") is None
+        await asyncio.sleep(0)
+        assert (await cache.health_check())["near_cache"]["subscribed"] is True
+
+        # Written by another pod, announced on the channel
+        await InMemoryBackend.set(inner, _record())
+        await inner.channel.put("agent_001")
+        await asyncio.sleep(0.01)
+
+        assert (await cache.get("agent_001")).status == PenalStatus.QUARANTINE
+        assert inner.gets == 2
+        await cache.close()
+
+    @pytest.mark.asyncio
+    async def test_connection_loss_clears_and_resubscribes(self):
+        inner = PubSubBackend()
+        cache = NearCacheBackend(inner, resubscribe_delay=0.01)
+        await cache.get("agent_001")
+        await asyncio.sleep(0)
+
+        await inner.channel.put(ConnectionError("lost"))
+        await asyncio.sleep(0.05)
+
+        assert inner.subscriptions == 2
+        await cache.get("agent_001")
+        assert inner.gets == 2
+        await cache.close()
+
+
+class TestRegistryIntegration:
+    """PenalRegistry with near_cache_ttl_seconds."""
+
+    @pytest.mark.asyncio
+    async def test_check_restrictions_served_from_cache(self):
+        inner = CountingBackend()
+        registry = PenalRegistry(primary_backend=inner, near_cache_ttl_seconds=60)
+
+        await registry.punish(
+            "agent_001", OffenseType.ROLE_VIOLATION, PenalStatus.QUARANTINE,
+            duration=timedelta(hours=1),
+        )
+        gets_after_punish = inner.gets
+        for _ in range(10):
+            result = await registry.check_restrictions("agent_001", "execute")
+            assert result["allowed"] is False
+
+        assert inner.gets == gets_after_punish
+
+        await registry.pardon("agent_001")
+        assert (await registry.check_restrictions("agent_001", "execute"))["allowed"] is True
+
+        health = await registry.health_check()
+        assert health["primary"]["near_cache"]["hits"] >= 10
+        await registry.close()
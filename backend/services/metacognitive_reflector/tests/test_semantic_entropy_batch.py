@@ -0,0 +1,126 @@
+"""
+Tests for batched embedding and NumPy similarity/clustering in
+SemanticEntropyDetector.
+"""
+
+from __future__ import annotations
+
+
+import asyncio
+from typing import List
+
+import numpy as np
+import pytest
+
+from metacognitive_reflector.core.detectors import semantic_entropy as entropy_module
+from metacognitive_reflector.core.detectors.semantic_cache import (
+    EmbeddingProvider,
+    MockEmbeddingProvider,
+)
+from metacognitive_reflector.core.detectors.semantic_entropy import (
+    MockLLMProvider,
+    SemanticEntropyDetector,
+)
+
+
+class CountingProvider(EmbeddingProvider):
+    """Encodes via a fixed table and counts encode/encode_batch calls."""
+
+    def __init__(self, table):
+        self.table = table
+        self.encode_calls = 0
+        self.batch_calls = 0
+
+    async def encode(self, text: str) -> List[float]:
+        self.encode_calls += 1
+        return self.table[text]
+
+    async def encode_batch(self, texts: List[str]) -> List[List[float]]:
+        self.batch_calls += 1
+        return [self.table[t] for t in texts]
+
+    async def similarity(self, vec1: List[float], vec2: List[float]) -> float:
+        return 0.0
+
+
+def _clustered_embeddings(n: int, seed: int) -> List[List[float]]:
+    """n noisy copies of a few directions, so clusters are non-trivial."""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(4, 24))
+    picks = rng.integers(0, 4, size=n)
+    return (centers[picks] + rng.normal(scale=0.35, size=(n, 24))).tolist()
+
+
+def _pure_python(monkeypatch):
+    monkeypatch.setattr(entropy_module, "HAS_NUMPY", False)
+
+
+class TestBatchEncode:
+    """encode_batch is used for all samples at once."""
+
+    @pytest.mark.asyncio
+    async def test_detector_uses_single_batch_call(self):
+        responses = ["alpha", "beta", "gamma"]
+        provider = CountingProvider({r: [float(i + 1), 1.0] for i, r in enumerate(responses)})
+        detector = SemanticEntropyDetector(
+            llm_provider=MockLLMProvider(responses), embedding_provider=provider
+        )
+
+        result = await detector._compute_entropy("claim", num_samples=3)
+
+        assert provider.batch_calls == 1
+        assert provider.encode_calls == 0
+        assert result.sample_count == 3
+
+    @pytest.mark.asyncio
+    async def test_default_encode_batch_falls_back_to_encode(self):
+        class SingleOnly(EmbeddingProvider):
+            async def encode(self, text: str) -> List[float]:
+                await asyncio.sleep(0)
+                return [float(len(text))]
+
+            async def similarity(self, vec1, vec2) -> float:
+                return 1.0
+
+        assert await SingleOnly().encode_batch(["a", "bbb"]) == [[1.0], [3.0]]
+
+    @pytest.mark.asyncio
+    async def test_mock_encode_batch_matches_encode(self):
+        provider = MockEmbeddingProvider()
+        batch = await provider.encode_batch(["x", "y"])
+        assert batch == [await provider.encode("x"), await provider.encode("y")]
+
+
+class TestNumpyMatchesPurePython:
+    """The vectorized path reproduces the pairwise implementation exactly."""
+
+    @pytest.mark.parametrize("n", [3, 10, 50])
+    def test_clusters_and_similarity(self, n, monkeypatch):
+        detector = SemanticEntropyDetector()
+        embeddings = _clustered_embeddings(n, seed=n)
+        embeddings[0] = [0.0] * 24  # Zero vector edge case
+
+        matrix = detector._compute_similarity_matrix(embeddings)
+        clusters = detector._cluster_responses(embeddings, matrix)
+        mean = detector._compute_mean_similarity(embeddings, matrix)
+
+        _pure_python(monkeypatch)
+        expected_matrix = detector._compute_similarity_matrix(embeddings)
+        expected_clusters = detector._cluster_responses(embeddings)
+        expected_mean = detector._compute_mean_similarity(embeddings)
+
+        np.testing.assert_allclose(matrix, expected_matrix, atol=1e-12)
+        assert clusters == expected_clusters
+        assert mean == pytest.approx(expected_mean)
+        if n >= 10:
+            assert 1 < len(clusters) < n
+
+    def test_cluster_requires_similarity_to_all_members(self):
+        detector = SemanticEntropyDetector()
+        # 0~1 and 0~2 but 1 !~ 2: greedy keeps 2 out of the first cluster
+        similarities = np.array([
+            [1.0, 0.9, 0.9],
+            [0.9, 1.0, 0.1],
+            [0.9, 0.1, 1.0],
+        ])
+        assert detector._cluster_responses([[0.0]] * 3, similarities) == [[0, 1], [2]]
@@ -0,0 +1,95 @@
+"""
+Benchmark: non-LLM cost of SemanticEntropyDetector for 3/10/50 samples.
+
+Compares the pairwise pure-Python similarity/clustering path with the
+NumPy Gram-matrix path on 384-d embeddings (sentence-transformers size),
+with sample generation and embedding served instantly so only the
+similarity, clustering and entropy work is measured.
+"""
+
+from __future__ import annotations
+
+
+import time
+from typing import List
+
+import numpy as np
+import pytest
+
+from metacognitive_reflector.core.detectors import semantic_entropy as entropy_module
+from metacognitive_reflector.core.detectors.semantic_cache import EmbeddingProvider
+from metacognitive_reflector.core.detectors.semantic_entropy import (
+    MockLLMProvider,
+    SemanticEntropyDetector,
+)
+
+SAMPLE_COUNTS = [3, 10, 50]
+DIM = 384
+ROUNDS = 20
+
+
+class TableProvider(EmbeddingProvider):
+    """Precomputed embeddings, returned without model cost."""
+
+    def __init__(self, table):
+        self.table = table
+
+    async def encode(self, text: str) -> List[float]:
+        return self.table[text]
+
+    async def encode_batch(self, texts: List[str]) -> List[List[float]]:
+        return [self.table[t] for t in texts]
+
+    async def similarity(self, vec1, vec2) -> float:
+        return 0.0
+
+
+def _detector(num_samples: int) -> SemanticEntropyDetector:
+    rng = np.random.default_rng(num_samples)
+    centers = rng.normal(size=(3, DIM))
+    responses = [f"response {i}" for i in range(num_samples)]
+    table = {
+        r: (centers[i % 3] + rng.normal(scale=0.3, size=DIM)).tolist()
+        for i, r in enumerate(responses)
+    }
+    return SemanticEntropyDetector(
+        llm_provider=MockLLMProvider(responses),
+        embedding_provider=TableProvider(table),
+    )
+
+
+async def _time_ms(detector: SemanticEntropyDetector, num_samples: int) -> float:
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        await detector._compute_entropy("claim", num_samples)
+    return (time.perf_counter() - start) * 1000 / ROUNDS
+
+
+@pytest.mark.asyncio
+async def test_entropy_scaling(monkeypatch):
+    """Per-verdict entropy time, pure Python vs NumPy."""
+    print("\n" + "=" * 60)
+    print("SEMANTIC ENTROPY (non-LLM) PER CALL")
+    print("=" * 60)
+    print(f"{'samples':>8} {'python (ms)':>12} {'numpy (ms)':>12} {'speedup':>9}")
+
+    results = {}
+    for n in SAMPLE_COUNTS:
+        detector = _detector(n)
+        numpy_ms = await _time_ms(detector, n)
+        numpy_result = await detector._compute_entropy("claim", n)
+
+        monkeypatch.setattr(entropy_module, "HAS_NUMPY", False)
+        python_ms = await _time_ms(detector, n)
+        python_result = await detector._compute_entropy("claim", n)
+        monkeypatch.setattr(entropy_module, "HAS_NUMPY", True)
+
+        results[n] = (python_ms, numpy_ms)
+        print(f"{n:>8} {python_ms:>12.2f} {numpy_ms:>12.2f} {python_ms / numpy_ms:>8.1f}x")
+
+        assert numpy_result.cluster_count == python_result.cluster_count
+        assert numpy_result.entropy == pytest.approx(python_result.entropy)
+
+    print("=" * 60)
+    python_ms, numpy_ms = results[50]
+    assert numpy_ms < python_ms
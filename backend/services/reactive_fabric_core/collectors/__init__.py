@@ -13,6 +13,7 @@ from __future__ import annotations
 
 from .base_collector import BaseCollector, CollectorHealth, CollectorMetrics
 from .log_aggregation_collector import LogAggregationCollector
+from .pipeline_sink import PipelineSink, PipelineSinkConfig, shutdown_pipeline_sink
 from .threat_intelligence_collector import (
     ThreatIndicator,
     ThreatIntelligenceCollector,
@@ -24,6 +25,9 @@ __all__ = [
     "CollectorHealth",
     "CollectorMetrics",
     "LogAggregationCollector",
+    "PipelineSink",
+    "PipelineSinkConfig",
+    "shutdown_pipeline_sink",
     "ThreatIndicator",
     "ThreatIntelligenceCollector",
     "ThreatIntelligenceConfig",
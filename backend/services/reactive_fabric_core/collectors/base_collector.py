@@ -17,7 +17,8 @@ from typing import Any, Dict, List, Optional, AsyncIterator
 from uuid import UUID, uuid4
 
 from pydantic import BaseModel, Field
-import os
+
+from .pipeline_sink import PipelineSink, get_pipeline_sink
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +44,14 @@ class CollectorMetrics(BaseModel):
     average_latency_ms: float = 0.0
     throughput_per_second: float = 0.0
     uptime_seconds: float = 0.0
+    # Event pipeline (shared sink, so delivery counters are process-wide)
+    events_submitted: int = 0
+    backpressure_wait_ms: float = 0.0
+    pipeline_backlog: int = 0
+    pipeline_batches: int = 0
+    pipeline_events_published: int = 0
+    pipeline_events_spilled: int = 0
+    pipeline_throughput_per_second: float = 0.0
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
 
@@ -81,14 +90,16 @@ class BaseCollector(ABC):
     No automated responses are allowed, only observation and reporting.
     """
 
-    def __init__(self, config: CollectorConfig):
+    def __init__(self, config: CollectorConfig, pipeline_sink: Optional[PipelineSink] = None):
         """
         Initialize the base collector.
 
         Args:
             config: Collector configuration
+            pipeline_sink: Event sink (defaults to the shared process-wide sink)
         """
         self.config = config
+        self.pipeline_sink = pipeline_sink
         self.metrics = CollectorMetrics(
             collector_type=self.__class__.__name__
         )
@@ -179,6 +190,11 @@ class BaseCollector(ABC):
             except asyncio.CancelledError:
                 pass
 
+        # Deliver (or spill) what this collector already handed off
+        if self.pipeline_sink is not None:
+            await self.pipeline_sink.flush()
+            self._update_pipeline_metrics()
+
         await self.cleanup()
         self.metrics.health = CollectorHealth.OFFLINE
         logger.info(f"{self.__class__.__name__} stopped")
@@ -206,6 +222,7 @@ class BaseCollector(ABC):
                 self.metrics.uptime_seconds = (
                     datetime.utcnow() - self._start_time
                 ).total_seconds()
+                self._update_pipeline_metrics()
 
                 # Wait for next collection interval
                 await asyncio.sleep(self.config.collection_interval_seconds)
@@ -242,52 +259,30 @@ class BaseCollector(ABC):
         # Send to event processing pipeline (Kafka/Redis)
         await self._send_to_pipeline(event)
     
-    async def _send_to_pipeline(self, event: SecurityEvent) -> None:
-        """Send event to processing pipeline (Kafka or Redis)."""
-        try:
-            # Try Kafka first
-            from kafka import KafkaProducer
-            import json
-            
-            kafka_broker = os.getenv("KAFKA_BROKER", "localhost:9092")
-            producer = KafkaProducer(
-                bootstrap_servers=[kafka_broker],
-                value_serializer=lambda v: json.dumps(v).encode('utf-8'),
-            )
-            
-            # Publish to Kafka topic
-            producer.send('security_events', {
-                "event_id": event.event_id,
-                "severity": event.severity.value,
-                "event_type": event.event_type,
-                "timestamp": event.timestamp.isoformat(),
-                "data": event.data,
-            })
-            producer.flush()
-            
-            logger.debug(f"Event {event.event_id} sent to Kafka")
-            
-        except Exception as kafka_error:
-            logger.debug(f"Kafka unavailable: {kafka_error}")
-            
-            # Fallback to Redis
-            try:
-                from vertice_db.redis_client import get_redis_client
-                import json
-                
-                redis = await get_redis_client()
-                await redis.lpush('security_events', json.dumps({
-                    "event_id": event.event_id,
-                    "severity": event.severity.value,
-                    "event_type": event.event_type,
-                    "timestamp": event.timestamp.isoformat(),
-                    "data": event.data,
-                }))
-                
-                logger.debug(f"Event {event.event_id} sent to Redis")
-                
-            except Exception as redis_error:
-                logger.warning(f"Event pipeline unavailable: {redis_error}")
+    async def _send_to_pipeline(self, event: CollectedEvent) -> None:
+        """
+        Hand an event to the shared pipeline sink (Kafka, Redis, spill file).
+
+        Returns as soon as the event is queued; waits only while the sink's
+        backlog is full, which throttles this collector's collection loop.
+        """
+        if self.pipeline_sink is None:
+            self.pipeline_sink = get_pipeline_sink()
+
+        waited_ms = await self.pipeline_sink.submit(event.model_dump(mode="json"))
+        self.metrics.events_submitted += 1
+        self.metrics.backpressure_wait_ms += waited_ms
+
+    def _update_pipeline_metrics(self) -> None:
+        """Copy shared sink counters into this collector's metrics."""
+        if self.pipeline_sink is None:
+            return
+        stats = self.pipeline_sink.stats
+        self.metrics.pipeline_backlog = self.pipeline_sink.backlog
+        self.metrics.pipeline_batches = stats.batches
+        self.metrics.pipeline_events_published = stats.events_published
+        self.metrics.pipeline_events_spilled = stats.events_spilled
+        self.metrics.pipeline_throughput_per_second = stats.throughput_per_second
 
     def get_metrics(self) -> CollectorMetrics:
         """
@@ -0,0 +1,394 @@
+"""
+Shared event pipeline sink for intelligence collectors.
+
+Collected events used to be published one at a time, with a new synchronous
+Kafka producer (and a flush) per event. PipelineSink keeps one long-lived
+connection per process and delivers events in batches:
+
+- Collectors enqueue events into a bounded in-memory backlog. When the
+  backlog is full, submit() waits, which slows the collection loop down
+  instead of growing memory without limit (backpressure).
+- A background flusher drains the backlog into batches of up to
+  ``batch_size`` events, waiting at most ``linger_ms`` for a batch to fill.
+- Each batch goes to Kafka (via the service KafkaProducer wrapper), falls
+  back to a single Redis LPUSH, and is appended to a local JSONL spill file
+  when both are down. The spill file is replayed once a backend recovers.
+
+Phase 1 compliance: the sink only forwards observations, it never acts on them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+logger = logging.getLogger(__name__)
+
+
+class PipelineSinkConfig(BaseModel):
+    """Configuration for the shared pipeline sink."""
+
+    kafka_bootstrap_servers: str = Field(
+        default_factory=lambda: os.getenv("KAFKA_BROKER", "localhost:9092")
+    )
+    topic: str = "security_events"
+    redis_key: str = "security_events"
+    batch_size: int = Field(default=500, ge=1)
+    linger_ms: int = Field(default=50, ge=0)
+    max_backlog: int = Field(default=10_000, ge=1)
+    connect_timeout_seconds: float = 5.0
+    reconnect_interval_seconds: float = 30.0
+    spill_path: str = Field(
+        default_factory=lambda: os.getenv(
+            "PIPELINE_SPILL_PATH",
+            os.path.join(tempfile.gettempdir(), "reactive_fabric_pipeline_spill.jsonl"),
+        )
+    )
+
+
+class PipelineStats(BaseModel):
+    """Delivery counters for a pipeline sink."""
+
+    events_submitted: int = 0
+    events_published_kafka: int = 0
+    events_published_redis: int = 0
+    events_spilled: int = 0
+    events_replayed: int = 0
+    events_lost: int = 0
+    batches: int = 0
+    publish_seconds: float = 0.0
+
+    @property
+    def events_published(self) -> int:
+        return self.events_published_kafka + self.events_published_redis
+
+    @property
+    def throughput_per_second(self) -> float:
+        """Events delivered (or spilled) per second spent publishing."""
+        delivered = self.events_published + self.events_spilled
+        return delivered / self.publish_seconds if self.publish_seconds > 0 else 0.0
+
+
+class PipelineSink:
+    """
+    Batched, backpressured event sink shared by all collectors.
+
+    Kafka and Redis clients are created lazily on the flusher task and reused
+    for the lifetime of the sink; pass them in to override (e.g. in tests).
+    """
+
+    def __init__(
+        self,
+        config: Optional[PipelineSinkConfig] = None,
+        kafka: Any = None,
+        redis: Any = None,
+    ):
+        self.config = config or PipelineSinkConfig()
+        self.stats = PipelineStats()
+        self._kafka = kafka
+        self._redis = redis
+        self._kafka_injected = kafka is not None
+        self._redis_injected = redis is not None
+        self._last_connect_attempt = float("-inf")
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._flusher: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    @property
+    def running(self) -> bool:
+        return self._flusher is not None and not self._flusher.done()
+
+    @property
+    def backlog(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def start(self) -> None:
+        """Start the background flusher (idempotent)."""
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(maxsize=self.config.max_backlog)
+        self._flusher = asyncio.create_task(self._flush_loop())
+
+    async def flush(self) -> None:
+        """Wait until every submitted event has been delivered or spilled."""
+        if self._queue is not None and self.running:
+            await self._queue.join()
+
+    async def close(self) -> None:
+        """Flush the backlog, stop the flusher and release connections."""
+        await self.flush()
+        if self._flusher is not None:
+            self._flusher.cancel()
+            try:
+                await self._flusher
+            except asyncio.CancelledError:
+                pass
+            self._flusher = None
+
+        if self._kafka is not None and not self._kafka_injected:
+            try:
+                await self._kafka.disconnect()
+            except Exception as e:
+                logger.debug(f"Kafka disconnect failed: {e}")
+            self._kafka = None
+
+    # ------------------------------------------------------------------
+    # Producer side
+    # ------------------------------------------------------------------
+
+    async def submit(self, payload: Dict[str, Any]) -> float:
+        """
+        Enqueue one event payload.
+
+        Blocks while the backlog is full. Returns the time spent waiting for
+        backlog space in milliseconds (0.0 when there was room).
+        """
+        await self.start()
+        assert self._queue is not None
+
+        self.stats.events_submitted += 1
+        try:
+            self._queue.put_nowait(payload)
+            return 0.0
+        except asyncio.QueueFull:
+            start = time.perf_counter()
+            await self._queue.put(payload)
+            return (time.perf_counter() - start) * 1000
+
+    # ------------------------------------------------------------------
+    # Flusher
+    # ------------------------------------------------------------------
+
+    async def _flush_loop(self) -> None:
+        assert self._queue is not None
+        while True:
+            batch = await self._next_batch()
+            try:
+                try:
+                    delivered = await self._deliver(batch)
+                except Exception as e:  # Never let the flusher die
+                    logger.error(f"Pipeline delivery failed, {len(batch)} events lost: {e}")
+                    self.stats.events_lost += len(batch)
+                    delivered = False
+
+                # The batch is accounted for at this point; a failing replay
+                # must not count it as lost
+                if delivered:
+                    try:
+                        await self._replay_spill()
+                    except Exception as e:
+                        logger.error(f"Spill replay failed: {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _next_batch(self) -> List[Dict[str, Any]]:
+        """First available event plus whatever arrives within linger_ms."""
+        assert self._queue is not None
+        batch = [await self._queue.get()]
+        deadline = time.monotonic() + self.config.linger_ms / 1000
+
+        while len(batch) < self.config.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _deliver(self, batch: List[Dict[str, Any]]) -> bool:
+        """Publish a batch, spilling whatever no backend took. True if all was published."""
+        start = time.perf_counter()
+        self.stats.batches += 1
+
+        remaining = await self._publish(batch)
+        if remaining:
+            await self._spill(remaining)
+
+        self.stats.publish_seconds += time.perf_counter() - start
+        return not remaining
+
+    async def _publish(self, batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Send a batch to Kafka, falling back to Redis. Returns the events neither took."""
+        await self._ensure_kafka()
+
+        remaining = batch
+        if self._kafka is not None:
+            remaining = await self._kafka.publish_batch(self.config.topic, batch, key_field="event_id")
+            self.stats.events_published_kafka += len(batch) - len(remaining)
+            if not remaining:
+                return []
+            logger.debug(f"Kafka rejected {len(remaining)} events, falling back to Redis")
+            await self._drop_kafka()
+
+        redis = await self._get_redis()
+        if redis is None:
+            return list(remaining)
+        try:
+            await redis.lpush(self.config.redis_key, *(json.dumps(p, default=str) for p in remaining))
+        except Exception as e:
+            logger.warning(f"Redis unavailable for event pipeline: {e}")
+            if not self._redis_injected:
+                self._redis = None
+            return list(remaining)
+
+        self.stats.events_published_redis += len(remaining)
+        return []
+
+    async def _ensure_kafka(self) -> None:
+        """Connect the Kafka wrapper once, retrying at most every reconnect interval."""
+        if self._kafka is not None:
+            return
+        now = time.monotonic()
+        if now - self._last_connect_attempt < self.config.reconnect_interval_seconds:
+            return
+        self._last_connect_attempt = now
+
+        try:
+            from kafka_producer import KafkaProducer
+
+            kafka = KafkaProducer(
+                self.config.kafka_bootstrap_servers,
+                linger_ms=self.config.linger_ms,
+            )
+            await asyncio.wait_for(kafka.connect(), self.config.connect_timeout_seconds)
+            self._kafka = kafka
+        except Exception as e:
+            logger.debug(f"Kafka unavailable: {e}")
+
+    async def _drop_kafka(self) -> None:
+        """Forget a failing producer so the next batch goes through reconnect backoff."""
+        if self._kafka_injected:
+            return
+        kafka, self._kafka = self._kafka, None
+        self._last_connect_attempt = time.monotonic()
+        try:
+            await kafka.disconnect()
+        except Exception as e:
+            logger.debug(f"Kafka disconnect failed: {e}")
+
+    async def _get_redis(self) -> Any:
+        if self._redis is None and not self._redis_injected:
+            try:
+                from vertice_db.redis_client import get_redis_client
+
+                self._redis = await get_redis_client()
+            except Exception as e:
+                logger.debug(f"Redis unavailable: {e}")
+        return self._redis
+
+    # ------------------------------------------------------------------
+    # Spill file (only touched by the flusher task, so no locking)
+    # ------------------------------------------------------------------
+
+    async def _spill(self, batch: List[Dict[str, Any]]) -> None:
+        lines = "".join(json.dumps(p, default=str) + "\n" for p in batch)
+        try:
+            await asyncio.to_thread(_append_text, Path(self.config.spill_path), lines)
+        except OSError as e:
+            logger.error(f"Event pipeline down and spill failed, {len(batch)} events lost: {e}")
+            self.stats.events_lost += len(batch)
+            return
+        self.stats.events_spilled += len(batch)
+        logger.warning(f"Event pipeline unavailable, spilled {len(batch)} events to {self.config.spill_path}")
+
+    async def _replay_spill(self) -> None:
+        """Re-publish spilled events after a backend has accepted a batch."""
+        path = Path(self.config.spill_path)
+        replaying = path.with_suffix(path.suffix + ".replay")
+        if not path.exists() and not replaying.exists():
+            return
+
+        try:
+            # A leftover .replay file means a previous replay was interrupted
+            if path.exists():
+                text = await asyncio.to_thread(path.read_text)
+                await asyncio.to_thread(_append_text, replaying, text)
+                path.unlink()
+            lines = (await asyncio.to_thread(replaying.read_text)).splitlines()
+        except OSError as e:
+            logger.warning(f"Could not read spill file {path}: {e}")
+            return
+
+        payloads = []
+        corrupt = []
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                payloads.append(json.loads(line))
+            except ValueError:
+                # e.g. a line truncated by a crash mid-append
+                corrupt.append(line + "\n")
+        if corrupt:
+            quarantine = path.with_suffix(path.suffix + ".corrupt")
+            logger.warning(f"Skipping {len(corrupt)} unreadable spill lines, moved to {quarantine}")
+            try:
+                await asyncio.to_thread(_append_text, quarantine, "".join(corrupt))
+            except OSError as e:
+                logger.error(f"Could not quarantine spill lines, {len(corrupt)} events lost: {e}")
+                self.stats.events_lost += len(corrupt)
+
+        size = self.config.batch_size
+        for start in range(0, len(payloads), size):
+            chunk = payloads[start : start + size]
+            remaining = await self._publish(chunk)
+            self.stats.events_replayed += len(chunk) - len(remaining)
+            if remaining:
+                # Backend went away again; keep the rest for next time
+                rest = remaining + payloads[start + size :]
+                text = "".join(json.dumps(p, default=str) + "\n" for p in rest)
+                await asyncio.to_thread(_append_text, path, text)
+                break
+        replaying.unlink(missing_ok=True)
+
+
+def _append_text(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a", encoding="utf-8") as f:
+        f.write(text)
+
+
+# ============================================================================
+# SHARED INSTANCE
+# ============================================================================
+
+_shared_sink: Optional[PipelineSink] = None
+
+
+def get_pipeline_sink() -> PipelineSink:
+    """Process-wide sink for the running event loop."""
+    global _shared_sink
+    loop = asyncio.get_running_loop()
+    if _shared_sink is None or (_shared_sink._loop not in (None, loop)):
+        _shared_sink = PipelineSink()
+    return _shared_sink
+
+
+async def shutdown_pipeline_sink() -> None:
+    """Flush and close the shared sink (call on service shutdown)."""
+    global _shared_sink
+    if _shared_sink is not None:
+        await _shared_sink.close()
+        _shared_sink = None
@@ -0,0 +1,227 @@
+"""
+Tests for the shared, batched collector pipeline sink.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any, AsyncIterator, Dict, List
+
+import pytest
+
+from ..base_collector import BaseCollector, CollectedEvent, CollectorConfig
+from ..pipeline_sink import PipelineSink, PipelineSinkConfig
+
+
+class FakeKafka:
+    """Stands in for kafka_producer.KafkaProducer.publish_batch."""
+
+    def __init__(self, available: bool = True):
+        self.available = available
+        self.batches: List[List[Dict[str, Any]]] = []
+
+    async def publish_batch(self, topic, messages, key_field=None):
+        if not self.available:
+            return list(messages)
+        self.batches.append(list(messages))
+        return []
+
+
+class FakeRedis:
+    def __init__(self, available: bool = True):
+        self.available = available
+        self.pushed: List[str] = []
+
+    async def lpush(self, key, *values):
+        if not self.available:
+            raise ConnectionError("redis down")
+        self.pushed.extend(values)
+
+
+class ListCollector(BaseCollector):
+    """Minimal collector yielding a fixed number of events."""
+
+    def __init__(self, config: CollectorConfig, count: int):
+        super().__init__(config)
+        self.count = count
+
+    async def initialize(self) -> None:
+        pass
+
+    async def collect(self) -> AsyncIterator[CollectedEvent]:
+        for i in range(self.count):
+            yield CollectedEvent(collector_type="list", source=f"source-{i}")
+
+    async def validate_source(self) -> bool:
+        return True
+
+    async def cleanup(self) -> None:
+        pass
+
+
+def _sink(tmp_path, kafka=None, redis=None, **overrides) -> PipelineSink:
+    config = PipelineSinkConfig(
+        spill_path=str(tmp_path / "spill.jsonl"),
+        linger_ms=overrides.pop("linger_ms", 20),
+        **overrides,
+    )
+    return PipelineSink(config, kafka=kafka or FakeKafka(), redis=redis or FakeRedis())
+
+
+class TestBatching:
+    @pytest.mark.asyncio
+    async def test_events_are_batched(self, tmp_path):
+        kafka = FakeKafka()
+        sink = _sink(tmp_path, kafka=kafka, batch_size=50)
+
+        for i in range(120):
+            await sink.submit({"event_id": str(i)})
+        await sink.close()
+
+        assert sum(len(b) for b in kafka.batches) == 120
+        assert len(kafka.batches) == 3
+        assert sink.stats.events_published_kafka == 120
+        assert sink.stats.throughput_per_second > 0
+
+    @pytest.mark.asyncio
+    async def test_linger_flushes_partial_batch(self, tmp_path):
+        kafka = FakeKafka()
+        sink = _sink(tmp_path, kafka=kafka, batch_size=1000, linger_ms=10)
+
+        await sink.submit({"event_id": "a"})
+        await sink.flush()
+
+        assert kafka.batches == [[{"event_id": "a"}]]
+        await sink.close()
+
+
+class TestFallbacks:
+    @pytest.mark.asyncio
+    async def test_redis_fallback_single_push_per_batch(self, tmp_path):
+        redis = FakeRedis()
+        sink = _sink(tmp_path, kafka=FakeKafka(available=False), redis=redis, batch_size=10)
+
+        for i in range(10):
+            await sink.submit({"event_id": str(i)})
+        await sink.close()
+
+        assert len(redis.pushed) == 10
+        assert sink.stats.events_published_redis == 10
+
+    @pytest.mark.asyncio
+    async def test_spill_and_replay(self, tmp_path):
+        kafka = FakeKafka(available=False)
+        redis = FakeRedis(available=False)
+        sink = _sink(tmp_path, kafka=kafka, redis=redis)
+
+        for i in range(5):
+            await sink.submit({"event_id": str(i)})
+        await sink.flush()
+
+        spill = tmp_path / "spill.jsonl"
+        assert [json.loads(line)["event_id"] for line in spill.read_text().splitlines()] == [
+            "0", "1", "2", "3", "4",
+        ]
+        assert sink.stats.events_spilled == 5
+
+        # Kafka recovers: the next batch also drains the spill file
+        kafka.available = True
+        await sink.submit({"event_id": "5"})
+        await sink.close()
+
+        published = [m["event_id"] for batch in kafka.batches for m in batch]
+        assert sorted(published) == ["0", "1", "2", "3", "4", "5"]
+        assert sink.stats.events_replayed == 5
+        assert not spill.exists()
+
+    @pytest.mark.asyncio
+    async def test_partial_kafka_failure_spills_only_undelivered(self, tmp_path):
+        class PartialKafka(FakeKafka):
+            async def publish_batch(self, topic, messages, key_field=None):
+                self.batches.append(list(messages[:3]))
+                return list(messages[3:])
+
+        kafka = PartialKafka()
+        sink = _sink(tmp_path, kafka=kafka, redis=FakeRedis(available=False), batch_size=5)
+
+        for i in range(5):
+            await sink.submit({"event_id": str(i)})
+        await sink.close()
+
+        spill = tmp_path / "spill.jsonl"
+        assert [json.loads(line)["event_id"] for line in spill.read_text().splitlines()] == ["3", "4"]
+        assert sink.stats.events_published_kafka == 3
+        assert sink.stats.events_spilled == 2
+
+    @pytest.mark.asyncio
+    async def test_replay_skips_truncated_spill_line(self, tmp_path):
+        spill = tmp_path / "spill.jsonl"
+        spill.write_text('{"event_id": "0"}\n{"event_id": "1"}\n{"event_id": "2", "sou')
+
+        kafka = FakeKafka()
+        sink = _sink(tmp_path, kafka=kafka)
+        await sink.submit({"event_id": "3"})
+        await sink.close()
+
+        published = [m["event_id"] for batch in kafka.batches for m in batch]
+        assert sorted(published) == ["0", "1", "3"]
+        assert sink.stats.events_replayed == 2
+        assert sink.stats.events_lost == 0
+        assert not spill.exists()
+        assert not (tmp_path / "spill.jsonl.replay").exists()
+        assert (tmp_path / "spill.jsonl.corrupt").read_text() == '{"event_id": "2", "sou\n'
+
+
+class TestBackpressure:
+    @pytest.mark.asyncio
+    async def test_submit_waits_when_backlog_full(self, tmp_path):
+        release = asyncio.Event()
+
+        class SlowKafka(FakeKafka):
+            async def publish_batch(self, topic, messages, key_field=None):
+                await release.wait()
+                return await super().publish_batch(topic, messages, key_field)
+
+        sink = _sink(tmp_path, kafka=SlowKafka(), batch_size=1, max_backlog=2, linger_ms=0)
+
+        # One event in flight in the flusher, two in the backlog
+        for i in range(3):
+            await sink.submit({"event_id": str(i)})
+            await asyncio.sleep(0)
+
+        blocked = asyncio.create_task(sink.submit({"event_id": "3"}))
+        await asyncio.sleep(0.05)
+        assert not blocked.done()
+        assert sink.backlog == 2
+
+        release.set()
+        waited_ms = await asyncio.wait_for(blocked, 1.0)
+        assert waited_ms > 0
+        await sink.close()
+
+
+class TestCollectorIntegration:
+    @pytest.mark.asyncio
+    async def test_collector_uses_sink_and_reports_metrics(self, tmp_path):
+        kafka = FakeKafka()
+        collector = ListCollector(
+            CollectorConfig(collection_interval_seconds=3600, batch_size=25), count=25
+        )
+        collector.pipeline_sink = _sink(tmp_path, kafka=kafka)
+
+        await collector.start()
+        for _ in range(100):
+            if collector.metrics.events_collected:
+                break
+            await asyncio.sleep(0.01)
+        await collector.stop()
+
+        metrics = collector.get_metrics()
+        assert metrics.events_submitted == 25
+        assert metrics.pipeline_events_published == 25
+        assert metrics.pipeline_backlog == 0
+        payload = kafka.batches[0][0]
+        assert payload["collector_type"] == "list"
+        assert "collector_id" in payload["metadata"]
+        await collector.pipeline_sink.close()
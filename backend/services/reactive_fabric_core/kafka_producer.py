@@ -8,6 +8,8 @@ Sprint 1: Real implementation
 from __future__ import annotations
 
 
+import asyncio
+
 import structlog
 from aiokafka import AIOKafkaProducer
 from aiokafka.errors import KafkaError
@@ -30,8 +32,10 @@ class KafkaProducer:
     TOPIC_THREAT_DETECTED = "reactive_fabric.threat_detected"
     TOPIC_HONEYPOT_STATUS = "reactive_fabric.honeypot_status"
     
-    def __init__(self, bootstrap_servers: str):
+    def __init__(self, bootstrap_servers: str, linger_ms: int = 10, max_batch_size: int = 16384):
         self.bootstrap_servers = bootstrap_servers
+        self.linger_ms = linger_ms
+        self.max_batch_size = max_batch_size
         self.producer: Optional[AIOKafkaProducer] = None
         self._connected = False
     
@@ -42,8 +46,8 @@ class KafkaProducer:
                 bootstrap_servers=self.bootstrap_servers,
                 value_serializer=lambda v: json.dumps(v, default=str).encode('utf-8'),
                 compression_type='gzip',
-                max_batch_size=16384,
-                linger_ms=10
+                max_batch_size=self.max_batch_size,
+                linger_ms=self.linger_ms
             )
             await self.producer.start()
             self._connected = True
@@ -211,6 +215,62 @@ class KafkaProducer:
             logger.error("raw_publish_failed", error=str(e), topic=topic)
             return False
 
+    async def publish_batch(
+        self,
+        topic: str,
+        messages: List[Dict[str, Any]],
+        key_field: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Publish many messages, waiting once for the whole batch.
+        
+        send() only appends to the producer's per-partition batches
+        (max_batch_size / linger_ms); the delivery futures are awaited
+        together instead of one send_and_wait round trip per message.
+        
+        Args:
+            topic: Kafka topic name
+            messages: Message payloads (dicts)
+            key_field: Optional payload field used as message key
+        
+        Returns:
+            Messages that were not acknowledged (empty on success)
+        """
+        if not self.producer:
+            logger.warning("kafka_producer_not_initialized")
+            return list(messages)
+        
+        futures = []
+        try:
+            for message in messages:
+                key = message.get(key_field) if key_field else None
+                futures.append(
+                    await self.producer.send(
+                        topic,
+                        value=message,
+                        key=str(key).encode('utf-8') if key is not None else None
+                    )
+                )
+        except Exception as e:
+            # Messages queued before the error may still be delivered, so only
+            # the unsent tail (plus queued sends that fail) is reported back
+            logger.error("batch_publish_failed", error=str(e), topic=topic, queued=len(futures))
+        
+        results = await asyncio.gather(*futures, return_exceptions=True)
+        failed = [m for m, r in zip(messages, results) if isinstance(r, BaseException)]
+        failed.extend(messages[len(futures):])
+        
+        if failed:
+            logger.error(
+                "batch_publish_partial_failure",
+                topic=topic,
+                failed=len(failed),
+                total=len(messages)
+            )
+        else:
+            logger.debug("batch_published", topic=topic, count=len(messages))
+        return failed
+
 
 # ============================================================================
 # UTILITY FUNCTIONS
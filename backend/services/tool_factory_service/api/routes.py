@@ -53,6 +53,13 @@ def get_factory() -> ToolFactory:
     return _factory
 
 
+@app.on_event("shutdown")
+async def shutdown_event() -> None:
+    """Stop sandbox worker processes."""
+    if _factory is not None:
+        await _factory.close()
+
+
 # Response Models
 
 
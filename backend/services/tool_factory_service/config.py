@@ -26,6 +26,10 @@ class ToolFactoryConfig(BaseSettings):
         max_output_tokens: Maximum tokens for LLM generation
         sandbox_timeout: Timeout for sandbox execution (seconds)
         sandbox_max_memory_mb: Maximum memory for sandbox (MB)
+        sandbox_pool_enabled: Run test batches on warm pooled workers
+        sandbox_pool_size: Number of pooled sandbox workers
+        sandbox_worker_max_runs: Test batches before a worker is replaced
+        sandbox_min_cases_per_batch: Smallest slice of test cases sent to a worker
         max_tool_size_lines: Maximum lines per generated tool
         allowed_imports: Python imports allowed in generated tools
         blocked_imports: Python imports blocked in generated tools
@@ -46,6 +50,10 @@ class ToolFactoryConfig(BaseSettings):
     # Sandbox configuration
     sandbox_timeout: float = Field(default=30.0)
     sandbox_max_memory_mb: int = Field(default=512)
+    sandbox_pool_enabled: bool = Field(default=True)
+    sandbox_pool_size: int = Field(default=4)
+    sandbox_worker_max_runs: int = Field(default=50)
+    sandbox_min_cases_per_batch: int = Field(default=5)
     max_output_size: int = Field(default=100000)
     max_tool_size_lines: int = Field(default=100)
 
@@ -9,11 +9,14 @@ from __future__ import annotations
 
 from .factory import ToolFactory, ToolGenerationError
 from .sandbox import SandboxExecutor, SandboxResult
+from .sandbox_pool import SandboxPool, SandboxWorkerError
 from .validator import ToolValidator
 
 __all__ = [
     "SandboxExecutor",
+    "SandboxPool",
     "SandboxResult",
+    "SandboxWorkerError",
     "ToolFactory",
     "ToolGenerationError",
     "ToolValidator",
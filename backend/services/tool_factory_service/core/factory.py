@@ -304,6 +304,10 @@ class ToolFactory:
         self._log_generation(spec, test_results, success=True)
         return spec
 
+    async def close(self) -> None:
+        """Release sandbox worker processes."""
+        await self.sandbox.close()
+
     def get_tool_spec(self, name: str) -> Optional[ToolSpec]:
         """Get tool specification by name.
 
@@ -7,12 +7,17 @@ Secure Python code execution environment for tool testing.
 Follows CODE_CONSTITUTION pillars:
 - Safety First: Isolated execution, timeout protection, resource limits
 - Clarity Over Cleverness: Simple subprocess-based sandboxing
+
+Test cases run in batches on warm pooled worker processes (see
+sandbox_pool); with sandbox_pool_enabled off, each case gets its own
+interpreter as before.
 """
 
 from __future__ import annotations
 
 import asyncio
 import json
+import math
 import os
 import sys
 import tempfile
@@ -23,6 +28,8 @@ from pydantic import BaseModel, Field
 
 from config import ToolFactoryConfig
 
+from .sandbox_pool import SandboxPool, SandboxWorkerError
+
 
 class SandboxResult(BaseModel):
     """Result of sandbox code execution.
@@ -62,19 +69,22 @@ class SandboxExecutor:
     - Output capture and truncation
     - Security validation
     - Return value extraction
-    - Test case execution
+    - Test case execution (batched on a warm worker pool)
 
     Follows CODE_CONSTITUTION: Safety First
     """
 
-    def __init__(self, config: ToolFactoryConfig):
+    def __init__(self, config: ToolFactoryConfig, pool: Optional[SandboxPool] = None):
         """Initialize sandbox executor.
 
         Args:
             config: Tool factory configuration with sandbox settings
+            pool: Worker pool for test batches (created on first use if None)
         """
         self.config = config
         self.execution_history: List[SandboxResult] = []
+        self.pool = pool
+        self._pool_lock = asyncio.Lock()
 
     async def execute(
         self,
@@ -243,6 +253,128 @@ print(f"__SANDBOX_RETURN__:{{_json.dumps(__result__)}}")
     ) -> Dict[str, Any]:
         """Test code against multiple test cases.
 
+        The cases are split into batches (at least
+        sandbox_min_cases_per_batch cases each, at most one per pooled
+        worker) that run in parallel, each in a single warm worker process
+        with a per-case timeout.
+
+        Args:
+            code: Function code to test
+            test_cases: List of test cases with "input" and "expected" keys
+            function_name: Name of function to test
+
+        Returns:
+            Dictionary with pass/fail statistics and detailed results
+        """
+        if not self.config.sandbox_pool_enabled:
+            return await self._test_code_per_process(code, test_cases, function_name)
+
+        total = len(test_cases)
+        validation_error = self._validate_security(code)
+        if validation_error:
+            outcomes = [{"passed": False, "error": validation_error} for _ in test_cases]
+        else:
+            outcomes = await self._run_batches(code, test_cases, function_name)
+
+        results = []
+        passed = 0
+        for i, outcome in enumerate(outcomes):
+            self.execution_history.append(
+                SandboxResult(
+                    success=outcome.get("error") is None,
+                    stdout=outcome.get("stdout", ""),
+                    stderr=outcome.get("error") or "",
+                    return_value=outcome.get("result"),
+                    execution_time=outcome.get("execution_time", 0.0),
+                    error_type="RuntimeError" if outcome.get("error") else None,
+                    error_message=outcome.get("error"),
+                )
+            )
+            if outcome.get("error") is not None:
+                results.append({"test_case": i + 1, "passed": False, "error": outcome["error"]})
+                continue
+
+            passed += int(outcome["passed"])
+            results.append(
+                {
+                    "test_case": i + 1,
+                    "passed": outcome["passed"],
+                    "result": outcome.get("result"),
+                    "expected": outcome.get("expected"),
+                }
+            )
+
+        return {
+            "passed": passed,
+            "failed": total - passed,
+            "total": total,
+            "success_rate": passed / max(total, 1),
+            "results": results,
+        }
+
+    async def close(self) -> None:
+        """Stop the worker pool."""
+        if self.pool is not None:
+            await self.pool.close()
+            self.pool = None
+
+    async def _run_batches(
+        self,
+        code: str,
+        test_cases: List[Dict[str, Any]],
+        function_name: str,
+    ) -> List[Dict[str, Any]]:
+        """Run test cases as parallel batches on the pool.
+
+        Args:
+            code: Function code to test
+            test_cases: Test cases with "input" and "expected" keys
+            function_name: Name of function to test
+
+        Returns:
+            One outcome dict per test case, in order
+        """
+        async with self._pool_lock:
+            # Concurrent first calls must not spawn on demand during start()
+            if self.pool is None:
+                pool = SandboxPool(self.config)
+                await pool.start()
+                self.pool = pool
+
+        cases = [
+            {"input": repr(test.get("input", {})), "expected": repr(test.get("expected"))}
+            for test in test_cases
+        ]
+        n_batches = max(1, min(
+            self.pool.size,
+            math.ceil(len(cases) / max(self.config.sandbox_min_cases_per_batch, 1)),
+        ))
+        batch_size = math.ceil(len(cases) / n_batches) if cases else 0
+        batches = [cases[i:i + batch_size] for i in range(0, len(cases), batch_size or 1)]
+
+        replies = await asyncio.gather(
+            *(self.pool.run_batch(code, function_name, batch) for batch in batches),
+            return_exceptions=True,
+        )
+
+        outcomes: List[Dict[str, Any]] = []
+        for batch, reply in zip(batches, replies):
+            if isinstance(reply, SandboxWorkerError):
+                outcomes.extend({"passed": False, "error": str(reply)} for _ in batch)
+            elif isinstance(reply, BaseException):
+                raise reply
+            else:
+                outcomes.extend(reply)
+        return outcomes
+
+    async def _test_code_per_process(
+        self,
+        code: str,
+        test_cases: List[Dict[str, Any]],
+        function_name: str = "test_function",
+    ) -> Dict[str, Any]:
+        """Test code with one fresh interpreter per test case.
+
         Args:
             code: Function code to test
             test_cases: List of test cases with "input" and "expected" keys
@@ -0,0 +1,287 @@
+"""
+Sandbox Pool
+============
+
+Pool of pre-spawned sandbox worker interpreters for running test batches.
+
+A tool's code and all its test cases travel to one warm worker over a pipe
+and run in a child forked from it, with a per-case timeout, instead of one
+cold interpreter per case. The fork keeps the warm imports but discards
+whatever the tool changed once the batch is done. Workers are recycled after a number of batches,
+and replaced when they crash or overrun their batch deadline. Separate
+batches run on separate workers in parallel.
+
+Follows CODE_CONSTITUTION pillars:
+- Safety First: Process isolation, memory limit, per-case and batch timeouts
+- Clarity Over Cleverness: One JSON line per request and per reply
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from config import ToolFactoryConfig
+
+logger = logging.getLogger(__name__)
+
+WORKER_SCRIPT = Path(__file__).with_name("sandbox_worker.py")
+
+# Largest reply line accepted from a worker
+MAX_REPLY_BYTES = 16 * 1024 * 1024
+
+# Slack on top of the summed per-case timeouts before a worker is killed
+BATCH_DEADLINE_MARGIN = 2.0
+
+
+class SandboxWorkerError(Exception):
+    """Worker crashed, overran its deadline, or sent an invalid reply."""
+
+
+class SandboxWorker:
+    """One sandbox interpreter process and its pipes."""
+
+    def __init__(self, process: asyncio.subprocess.Process):
+        """Wrap a started worker process.
+
+        Args:
+            process: Process running sandbox_worker.py
+        """
+        self.process = process
+        self.runs = 0
+
+    @classmethod
+    async def spawn(cls, max_memory_mb: int, startup_timeout: float = 10.0) -> "SandboxWorker":
+        """Start a worker and wait until it is ready.
+
+        Args:
+            max_memory_mb: Address-space limit for the worker
+            startup_timeout: Seconds to wait for the ready line
+
+        Returns:
+            Ready worker
+
+        Raises:
+            SandboxWorkerError: If the worker does not come up
+        """
+        process = await asyncio.create_subprocess_exec(
+            sys.executable,
+            "-I",
+            str(WORKER_SCRIPT),
+            str(max_memory_mb),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            cwd=tempfile.gettempdir(),
+            limit=MAX_REPLY_BYTES,
+        )
+        worker = cls(process)
+        try:
+            ready = await asyncio.wait_for(worker._read_reply(), timeout=startup_timeout)
+        except (asyncio.TimeoutError, SandboxWorkerError) as e:
+            await worker.kill()
+            raise SandboxWorkerError(f"Sandbox worker failed to start: {e}") from e
+        if not ready.get("ready"):
+            await worker.kill()
+            raise SandboxWorkerError("Sandbox worker sent an unexpected greeting")
+        return worker
+
+    @property
+    def alive(self) -> bool:
+        """Whether the process is still running."""
+        return self.process.returncode is None
+
+    async def run(self, request: Dict[str, Any], deadline: float) -> List[Dict[str, Any]]:
+        """Send one batch and wait for its results.
+
+        Args:
+            request: Batch request (see sandbox_worker)
+            deadline: Seconds before the worker is considered hung
+
+        Returns:
+            Per-case results
+
+        Raises:
+            SandboxWorkerError: On crash, timeout or invalid reply
+        """
+        self.runs += 1
+        assert self.process.stdin is not None
+        try:
+            self.process.stdin.write(json.dumps(request).encode("utf-8") + b"\n")
+            await self.process.stdin.drain()
+            reply = await asyncio.wait_for(self._read_reply(), timeout=deadline)
+        except asyncio.TimeoutError as e:
+            raise SandboxWorkerError(f"Batch exceeded {deadline:.1f}s") from e
+        except (BrokenPipeError, ConnectionResetError) as e:
+            raise SandboxWorkerError("Sandbox worker exited") from e
+
+        if "results" not in reply:
+            raise SandboxWorkerError(reply.get("error", "Invalid worker reply"))
+        return reply["results"]
+
+    async def _read_reply(self) -> Dict[str, Any]:
+        assert self.process.stdout is not None
+        try:
+            line = await self.process.stdout.readline()
+        except (asyncio.LimitOverrunError, ValueError) as e:
+            raise SandboxWorkerError("Worker reply too large") from e
+        if not line:
+            raise SandboxWorkerError("Sandbox worker exited")
+        try:
+            return json.loads(line)
+        except json.JSONDecodeError as e:
+            raise SandboxWorkerError("Invalid worker reply") from e
+
+    async def kill(self) -> None:
+        """Terminate the process."""
+        if self.alive:
+            self.process.kill()
+        await self.process.wait()
+
+    async def close(self) -> None:
+        """Ask the worker to exit by closing its stdin, then make sure it has."""
+        if self.alive and self.process.stdin is not None:
+            self.process.stdin.close()
+            try:
+                await asyncio.wait_for(self.process.wait(), timeout=1.0)
+            except asyncio.TimeoutError:
+                pass
+        await self.kill()
+
+
+class SandboxPool:
+    """Pool of warm sandbox workers.
+
+    Example:
+        >>> pool = SandboxPool(config)
+        >>> await pool.start()
+        >>> results = await pool.run_batch(code, "double", [{"input": "{'x': 2}", "expected": "4"}])
+        >>> await pool.close()
+    """
+
+    def __init__(
+        self,
+        config: ToolFactoryConfig,
+        size: Optional[int] = None,
+        max_runs_per_worker: Optional[int] = None,
+    ):
+        """Initialize pool (workers are spawned by start() or on demand).
+
+        Args:
+            config: Tool factory configuration
+            size: Maximum number of workers (default: config.sandbox_pool_size)
+            max_runs_per_worker: Batches before a worker is replaced
+                (default: config.sandbox_worker_max_runs)
+        """
+        self.config = config
+        self.size = size or config.sandbox_pool_size
+        self.max_runs_per_worker = max_runs_per_worker or config.sandbox_worker_max_runs
+
+        self._idle: asyncio.Queue = asyncio.Queue()
+        self._slots = asyncio.Semaphore(self.size)
+        self._spawned = 0
+        self._closed = False
+        self.stats: Dict[str, int] = {
+            "batches": 0,
+            "spawned": 0,
+            "recycled": 0,
+            "crashed": 0,
+        }
+
+    async def start(self) -> None:
+        """Pre-spawn every worker so the first batches skip interpreter start-up."""
+        missing = self.size - self._spawned
+        workers = await asyncio.gather(*(self._spawn() for _ in range(missing)))
+        for worker in workers:
+            self._idle.put_nowait(worker)
+
+    async def run_batch(
+        self,
+        code: str,
+        function_name: str,
+        cases: List[Dict[str, str]],
+        timeout: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """Run a batch of test cases against code on one worker.
+
+        Args:
+            code: Tool code defining function_name
+            function_name: Function to call for each case
+            cases: {"input": repr-str, "expected": repr-str} per case
+            timeout: Per-case timeout (default: config.sandbox_timeout)
+
+        Returns:
+            One result dict per case (passed/result/expected/error/stdout)
+
+        Raises:
+            SandboxWorkerError: If the worker crashed or hung (it is replaced)
+        """
+        if self._closed:
+            raise RuntimeError("Sandbox pool is closed")
+
+        timeout = timeout or self.config.sandbox_timeout
+        request = {
+            "code": code,
+            "function_name": function_name,
+            "timeout": timeout,
+            "cases": cases,
+        }
+        deadline = timeout * (len(cases) + 1) + BATCH_DEADLINE_MARGIN
+
+        async with self._slots:
+            worker = await self._acquire()
+            try:
+                results = await worker.run(request, deadline)
+            except SandboxWorkerError:
+                self.stats["crashed"] += 1
+                await self._retire(worker)
+                raise
+            except BaseException:
+                # Cancelled mid-batch: the worker may still be busy
+                await self._retire(worker)
+                raise
+
+            self.stats["batches"] += 1
+            if worker.runs >= self.max_runs_per_worker:
+                self.stats["recycled"] += 1
+                await self._retire(worker)
+            else:
+                self._idle.put_nowait(worker)
+        return results
+
+    async def close(self) -> None:
+        """Stop all idle workers; the pool cannot be used afterwards."""
+        self._closed = True
+        while not self._idle.empty():
+            worker = self._idle.get_nowait()
+            await worker.close()
+            self._spawned -= 1
+
+    def get_stats(self) -> Dict[str, int]:
+        """Pool statistics: batches run, workers spawned/recycled/crashed, idle."""
+        return {**self.stats, "idle": self._idle.qsize(), "workers": self._spawned}
+
+    async def _acquire(self) -> SandboxWorker:
+        """Idle live worker, or a new one (the slot semaphore bounds the count)."""
+        while not self._idle.empty():
+            worker = self._idle.get_nowait()
+            if worker.alive:
+                return worker
+            self.stats["crashed"] += 1
+            await self._retire(worker)
+        return await self._spawn()
+
+    async def _spawn(self) -> SandboxWorker:
+        worker = await SandboxWorker.spawn(self.config.sandbox_max_memory_mb)
+        self._spawned += 1
+        self.stats["spawned"] += 1
+        return worker
+
+    async def _retire(self, worker: SandboxWorker) -> None:
+        self._spawned -= 1
+        await worker.kill()
@@ -0,0 +1,235 @@
+"""
+Sandbox Worker
+==============
+
+Long-lived test runner started by SandboxPool as a separate interpreter
+(``python -I sandbox_worker.py <max_memory_mb>``). Standalone on purpose: it
+imports nothing from the service.
+
+Protocol: one JSON request per line on stdin, one JSON reply per line on the
+original stdout. File descriptor 1 is pointed at /dev/null so tool code
+cannot corrupt the channel; its ``print`` output is captured per case.
+
+Fork server: the worker never runs tool code itself. Each batch runs in a
+child forked from the warm worker, so preloaded modules are shared but any
+state the tool changes (globals, monkeypatched modules) dies with the child.
+
+Request: {"code": str, "function_name": str, "timeout": float,
+          "cases": [{"input": repr-str, "expected": repr-str}, ...]}
+Reply:   {"results": [{"passed": bool, "result": ..., "expected": ...,
+                       "error": str | None, "stdout": str,
+                       "execution_time": float}, ...]}
+
+Follows CODE_CONSTITUTION: Safety First
+"""
+
+from __future__ import annotations
+
+import ast
+import contextlib
+import importlib
+import io
+import json
+import os
+import select
+import signal
+import sys
+import time
+import traceback
+from typing import Any, Dict, List
+
+MAX_ERROR_CHARS = 2000
+MAX_STDOUT_CHARS = 10000
+
+# Imported once in the worker so forked batch children start with them loaded
+PRELOAD_MODULES = (
+    "collections",
+    "datetime",
+    "decimal",
+    "fractions",
+    "functools",
+    "hashlib",
+    "itertools",
+    "math",
+    "random",
+    "re",
+    "statistics",
+    "string",
+)
+
+# Slack on top of the summed per-case timeouts before a batch child is killed
+CHILD_DEADLINE_MARGIN = 1.0
+
+
+class CaseTimeout(Exception):
+    """Raised inside tool code when a case exceeds its time budget."""
+
+
+def _on_alarm(signum: int, frame: Any) -> None:
+    raise CaseTimeout()
+
+
+def _limit_memory(max_memory_mb: int) -> None:
+    """Cap the address space of this process (best effort, POSIX only)."""
+    try:
+        import resource  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return
+    limit = max_memory_mb * 1024 * 1024
+    try:
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    except (ValueError, OSError):
+        pass
+
+
+def _jsonable(value: Any) -> Any:
+    """Value itself if JSON-serializable, else its repr."""
+    try:
+        json.dumps(value)
+        return value
+    except (TypeError, ValueError):
+        return repr(value)
+
+
+def _error_text() -> str:
+    return traceback.format_exc()[-MAX_ERROR_CHARS:]
+
+
+def _run_case(func: Any, case: Dict[str, str], timeout: float) -> Dict[str, Any]:
+    """Run one test case with an interval-timer timeout."""
+    captured = io.StringIO()
+    outcome: Dict[str, Any] = {"passed": False, "result": None, "expected": None, "error": None}
+    try:
+        test_input = ast.literal_eval(case["input"])
+        expected = ast.literal_eval(case["expected"])
+    except (ValueError, SyntaxError):
+        outcome["error"] = "Test case is not a Python literal"
+        outcome["stdout"] = ""
+        return outcome
+
+    outcome["expected"] = _jsonable(expected)
+    start = time.perf_counter()
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        with contextlib.redirect_stdout(captured):
+            if isinstance(test_input, dict):
+                result = func(**test_input)
+            else:
+                result = func(test_input)
+        outcome["passed"] = bool(result == expected)
+        outcome["result"] = _jsonable(result)
+    except CaseTimeout:
+        outcome["error"] = f"Execution timed out after {timeout} seconds"
+    except BaseException:  # pylint: disable=broad-exception-caught
+        outcome["error"] = _error_text()
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+    outcome["execution_time"] = time.perf_counter() - start
+    outcome["stdout"] = captured.getvalue()[:MAX_STDOUT_CHARS]
+    return outcome
+
+
+def _run_batch(request: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Define the tool once, then run every case against it."""
+    cases = request["cases"]
+    timeout = float(request["timeout"])
+    namespace: Dict[str, Any] = {"__name__": "__sandbox__"}
+
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            exec(compile(request["code"], "<tool>", "exec"), namespace)  # pylint: disable=exec-used
+        func = namespace[request["function_name"]]
+    except CaseTimeout:
+        error = f"Execution timed out after {timeout} seconds"
+        return [{"passed": False, "error": error, "stdout": ""} for _ in cases]
+    except BaseException:  # pylint: disable=broad-exception-caught
+        error = _error_text()
+        return [{"passed": False, "error": error, "stdout": ""} for _ in cases]
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+
+    return [_run_case(func, case, timeout) for case in cases]
+
+
+def _run_batch_in_child(request: Dict[str, Any]) -> Dict[str, Any]:
+    """Fork a child for one batch and collect its reply.
+
+    The child inherits the warm interpreter, runs the batch, writes one JSON
+    reply to a pipe and exits without cleanup. The child is killed if it
+    overruns the batch deadline.
+    """
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        status = 0
+        try:
+            try:
+                reply = {"results": _run_batch(request)}
+            except MemoryError:
+                reply = {"error": "MemoryError"}
+            with os.fdopen(write_fd, "w", encoding="utf-8") as pipe:
+                pipe.write(json.dumps(reply))
+        except BaseException:  # pylint: disable=broad-exception-caught
+            status = 1
+        finally:
+            os._exit(status)  # pylint: disable=protected-access
+
+    os.close(write_fd)
+    budget = float(request["timeout"]) * (len(request["cases"]) + 1)
+    deadline = time.monotonic() + budget + CHILD_DEADLINE_MARGIN
+    chunks: List[bytes] = []
+    timed_out = False
+    try:
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                timed_out = True
+                break
+            ready, _, _ = select.select([read_fd], [], [], remaining)
+            if not ready:
+                continue
+            chunk = os.read(read_fd, 65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(read_fd)
+
+    if timed_out:
+        os.kill(pid, signal.SIGKILL)
+    _, status = os.waitpid(pid, 0)
+
+    if timed_out:
+        return {"error": "Batch exceeded its deadline"}
+    try:
+        return json.loads(b"".join(chunks))
+    except ValueError:
+        return {"error": f"Sandbox batch process exited (status {status})"}
+
+
+def main() -> None:
+    """Serve batches until stdin closes."""
+    _limit_memory(int(sys.argv[1]) if len(sys.argv) > 1 else 512)
+    signal.signal(signal.SIGALRM, _on_alarm)
+    for name in PRELOAD_MODULES:
+        importlib.import_module(name)
+
+    channel = os.fdopen(os.dup(1), "w", encoding="utf-8")
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, 1)
+    sys.stdout = open(os.devnull, "w", encoding="utf-8")  # pylint: disable=consider-using-with
+
+    channel.write(json.dumps({"ready": True}) + "\n")
+    channel.flush()
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        reply = _run_batch_in_child(json.loads(line))
+        channel.write(json.dumps(reply) + "\n")
+        channel.flush()
+
+
+if __name__ == "__main__":
+    main()
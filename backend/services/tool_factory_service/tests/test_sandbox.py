@@ -9,17 +9,24 @@ Follows CODE_CONSTITUTION: ≥80% coverage, clear test names.
 
 from __future__ import annotations
 
+import asyncio
+import time
+
 import pytest
+import pytest_asyncio
 
 from config import ToolFactoryConfig
 from core.sandbox import SandboxExecutor, SandboxResult
+from core.sandbox_pool import SandboxPool, SandboxWorkerError
 
 
-@pytest.fixture
-def sandbox():
+@pytest_asyncio.fixture
+async def sandbox():
     """Create SandboxExecutor instance."""
     config = ToolFactoryConfig()
-    return SandboxExecutor(config)
+    executor = SandboxExecutor(config)
+    yield executor
+    await executor.close()
 
 
 @pytest.mark.asyncio
@@ -227,3 +234,181 @@ class TestStats:
 
         stats = sandbox.get_stats()
         assert stats["total"] == 0
+
+
+@pytest.mark.asyncio
+class TestWorkerPool:
+    """Tests for pooled test batches."""
+
+    async def test_workers_reused_across_batches(self, sandbox):
+        """Repeated test runs reuse warm workers."""
+        code = "def inc(x):\n    return x + 1\n"
+        cases = [{"input": {"x": i}, "expected": i + 1} for i in range(3)]
+
+        for _ in range(4):
+            results = await sandbox.test_code(code, cases, "inc")
+            assert results["passed"] == 3
+
+        stats = sandbox.pool.get_stats()
+        assert stats["batches"] == 4
+        assert stats["spawned"] == sandbox.pool.size
+
+    async def test_tool_state_does_not_leak_between_batches(self):
+        """A tool monkeypatching a stdlib module does not affect the next tool."""
+        executor = SandboxExecutor(ToolFactoryConfig(sandbox_pool_size=1))
+        patcher = "import math\n\ndef patch(x):\n    math.sqrt = lambda v: 42\n    return x\n"
+        user = "import math\n\ndef root(x):\n    return math.sqrt(x)\n"
+
+        try:
+            await executor.test_code(patcher, [{"input": {"x": 1}, "expected": 1}], "patch")
+            results = await executor.test_code(user, [{"input": {"x": 16}, "expected": 4.0}], "root")
+            stats = executor.pool.get_stats()
+        finally:
+            await executor.close()
+
+        assert stats["spawned"] == 1  # Same warm worker served both tools
+        assert results["passed"] == 1
+        assert results["results"][0]["result"] == 4.0
+
+    async def test_concurrent_first_use_starts_pool_once(self):
+        """Concurrent first calls do not grow the pool past its size."""
+        executor = SandboxExecutor(ToolFactoryConfig(sandbox_pool_size=2))
+        code = "def inc(x):\n    return x + 1\n"
+        cases = [{"input": {"x": 1}, "expected": 2}]
+
+        try:
+            await asyncio.gather(*(executor.test_code(code, cases, "inc") for _ in range(4)))
+            stats = executor.pool.get_stats()
+        finally:
+            await executor.close()
+
+        assert stats["spawned"] == 2
+        assert stats["workers"] == 2
+
+    async def test_cases_split_across_workers(self):
+        """Large case lists run as parallel batches, results in order."""
+        config = ToolFactoryConfig(sandbox_pool_size=3, sandbox_min_cases_per_batch=2)
+        executor = SandboxExecutor(config)
+        code = "def square(x):\n    return x * x\n"
+        cases = [{"input": {"x": i}, "expected": i * i} for i in range(9)]
+
+        try:
+            results = await executor.test_code(code, cases, "square")
+        finally:
+            stats = executor.pool.get_stats()
+            await executor.close()
+
+        assert results["passed"] == 9
+        assert [r["result"] for r in results["results"]] == [i * i for i in range(9)]
+        assert stats["batches"] == 3
+
+    async def test_per_case_timeout(self, sandbox):
+        """A hanging case times out without failing the rest of the batch."""
+        code = """
+def maybe_hang(x):
+    while x < 0:
+        pass
+    return x
+"""
+        sandbox.config.sandbox_timeout = 0.2
+        cases = [
+            {"input": {"x": 1}, "expected": 1},
+            {"input": {"x": -1}, "expected": -1},
+            {"input": {"x": 2}, "expected": 2},
+        ]
+
+        results = await sandbox.test_code(code, cases, "maybe_hang")
+
+        assert results["passed"] == 2
+        assert "timed out" in results["results"][1]["error"]
+
+    async def test_print_does_not_break_protocol(self, sandbox):
+        """Tool output is captured, not mixed into the worker channel."""
+        code = """
+def noisy(x):
+    print("__SANDBOX_RETURN__: not json")
+    print("{" * 10)
+    return x
+"""
+        results = await sandbox.test_code(code, [{"input": {"x": 1}, "expected": 1}], "noisy")
+
+        assert results["passed"] == 1
+        assert "not json" in sandbox.execution_history[-1].stdout
+
+    async def test_crashed_worker_replaced(self):
+        """A worker that dies mid-batch is replaced for the next batch."""
+        pool = SandboxPool(ToolFactoryConfig(), size=1)
+        code = "def boom(x):\n    raise SystemExit(1)\n"
+        crash = "import signal\ndef die(x):\n    signal.raise_signal(signal.SIGKILL)\n"
+        cases = [{"input": "{'x': 1}", "expected": "1"}]
+
+        try:
+            results = await pool.run_batch(code, "boom", cases)
+            assert results[0]["passed"] is False  # SystemExit is caught
+
+            with pytest.raises(SandboxWorkerError):
+                await pool.run_batch(crash, "die", cases)
+
+            ok = await pool.run_batch("def f(x):\n    return x\n", "f", cases)
+            assert ok[0]["passed"] is True
+            assert pool.get_stats()["crashed"] == 1
+            assert pool.get_stats()["spawned"] == 2
+        finally:
+            await pool.close()
+
+    async def test_worker_recycled_after_max_runs(self):
+        """Workers are replaced after max_runs_per_worker batches."""
+        pool = SandboxPool(ToolFactoryConfig(), size=1, max_runs_per_worker=2)
+        cases = [{"input": "{'x': 1}", "expected": "1"}]
+
+        try:
+            for _ in range(5):
+                await pool.run_batch("def f(x):\n    return x\n", "f", cases)
+            stats = pool.get_stats()
+        finally:
+            await pool.close()
+
+        assert stats["recycled"] == 2
+        assert stats["spawned"] == 3
+
+    async def test_security_check_still_applies(self, sandbox):
+        """Blocked imports fail every case without reaching a worker."""
+        code = "import subprocess\ndef f(x):\n    return x\n"
+
+        results = await sandbox.test_code(code, [{"input": {"x": 1}, "expected": 1}], "f")
+
+        assert results["failed"] == 1
+        assert "Blocked import" in results["results"][0]["error"]
+        assert sandbox.pool is None
+
+    async def test_generation_latency_benchmark(self):
+        """Benchmark: 3 improvement attempts x 20 examples, per-process vs pooled."""
+        code = """
+def slugify(text):
+    return "-".join(text.lower().split())
+"""
+        cases = [
+            {"input": {"text": f"Hello World {i}"}, "expected": f"hello-world-{i}"}
+            for i in range(20)
+        ]
+
+        async def generation(executor: SandboxExecutor) -> float:
+            start = time.perf_counter()
+            for _ in range(3):
+                results = await executor.test_code(code, cases, "slugify")
+                assert results["passed"] == 20
+            return time.perf_counter() - start
+
+        cold = SandboxExecutor(ToolFactoryConfig(sandbox_pool_enabled=False))
+        per_process = await generation(cold)
+
+        warm = SandboxExecutor(ToolFactoryConfig())
+        warm.pool = SandboxPool(warm.config)
+        await warm.pool.start()  # Service start-up, not part of generation
+        try:
+            pooled = await generation(warm)
+        finally:
+            await warm.close()
+
+        print(f"\n3 attempts x 20 cases: per-process={per_process:.2f}s pooled={pooled:.3f}s")
+        assert pooled < per_process / 5